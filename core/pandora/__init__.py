@@ -13,8 +13,8 @@ Pandora doesn't block. Pandora transforms.
 """
 
 from .pandora_persona import PandoraPersona
-from .fracture_detector import FractureDetector
-from .hope_extractor import HopeExtractor
+from .fracture_detection import FractureDetector
+from .hope_extraction import HopeExtractor
 from .stabilization_loop import HopeCoreStabilizationLoop
 from .pandora_pipeline import PandoraPipeline
 
@@ -0,0 +1,140 @@
+# 🕸️ 評価ノード依存グラフ - Assessment Dependency Graph
+"""
+統治判断を「評価ノード + 依存関係」のグラフとして実行するエンジン
+
+- 各ノードは上流ノードの結果（と初期入力）を受け取り、自分の結果を返す
+- 依存関係から段（レベル）を求め、同じ段のノードは asyncio.gather で同時に実行する
+- ノード関数は同期関数でもコルーチン関数でもよい（モデル呼び出し等の待ちは段内で重なる）
+- async_func を持つノードは run でそちらを await する（外部システム呼び出しを段内で重ねる）
+- run_sync でコルーチンを返すノードはその場で駆動する（イベントループ内では SyncCallInEventLoopError）
+- ノードごとの処理時間（ミリ秒）を記録
+- 初期入力にノード名のキーで結果を渡すと、そのノードは実行せず渡された結果を使う
+  （そのノードの計算にしか使われない上流ノードも実行しない）
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+import asyncio
+import inspect
+import time
+
+from .sync_bridge import run_awaitable
+
+
+@dataclass(frozen=True)
+class AssessmentNode:
+    """評価ノード"""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]   # 結果表（初期入力 + 上流ノード結果）を受け取る
+    depends_on: Tuple[str, ...] = ()
+    async_func: Optional[Callable[[Dict[str, Any]], Any]] = None   # run で使う非同期版（省略時は func）
+
+
+class AssessmentGraph:
+    """評価ノード依存グラフ - 依存が満たされたノードから同時実行"""
+
+    def __init__(self, nodes: Iterable[AssessmentNode], inputs: Iterable[str] = ()):
+        self.nodes: Dict[str, AssessmentNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"ノード名が重複しています: {node.name}")
+            self.nodes[node.name] = node
+        self.inputs = frozenset(inputs)   # 初期入力として渡されるキー
+        self.levels = self._resolve_levels()
+        self._skip_cache: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+    def _resolve_levels(self) -> List[Tuple[AssessmentNode, ...]]:
+        """依存関係から実行段を求める（循環・未定義の依存はエラー）"""
+        for node in self.nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self.nodes and dependency not in self.inputs:
+                    raise ValueError(f"未定義の依存: {node.name} -> {dependency}")
+
+        levels: List[Tuple[AssessmentNode, ...]] = []
+        resolved = set(self.inputs)
+        remaining = dict(self.nodes)
+        while remaining:
+            ready = tuple(
+                node for node in remaining.values()
+                if all(dependency in resolved for dependency in node.depends_on)
+            )
+            if not ready:
+                raise ValueError(f"依存関係が循環しています: {sorted(remaining)}")
+            levels.append(ready)
+            for node in ready:
+                resolved.add(node.name)
+                del remaining[node.name]
+        return levels
+
+    def _skipped_nodes(self, inputs: Dict[str, Any]) -> FrozenSet[str]:
+        """実行しないノード - 結果が渡されたノードと、それらの計算にしか使われない上流ノード"""
+        provided = frozenset(name for name in inputs if name in self.nodes)
+        skipped = self._skip_cache.get(provided)
+        if skipped is None:
+            # 末端ノード（他のノードに使われないノード）から依存を辿り、結果が渡されたノードで止める
+            used = {dependency for node in self.nodes.values() for dependency in node.depends_on}
+            needed = set()
+            consumers = [name for name in self.nodes if name not in used and name not in provided]
+            while consumers:
+                name = consumers.pop()
+                if name in needed:
+                    continue
+                needed.add(name)
+                consumers.extend(
+                    dependency for dependency in self.nodes[name].depends_on
+                    if dependency in self.nodes and dependency not in provided
+                )
+            skipped = self._skip_cache[provided] = frozenset(self.nodes) - needed
+        return skipped
+
+    async def run(self, inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """グラフを実行（同じ段のノードは asyncio.gather で同時実行）
+
+        Returns: (結果表, ノード別処理時間ms)
+        """
+        results = dict(inputs)
+        timings: Dict[str, float] = {}
+        skipped = self._skipped_nodes(inputs)
+        for level in self.levels:
+            level = tuple(node for node in level if node.name not in skipped)
+            if not level:
+                continue
+            if len(level) == 1:
+                outputs = [await self._run_node(level[0], results, timings)]
+            else:
+                outputs = await asyncio.gather(
+                    *(self._run_node(node, results, timings) for node in level)
+                )
+            for node, output in zip(level, outputs):
+                results[node.name] = output
+        return results, timings
+
+    def run_sync(self, inputs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """グラフを実行（同期版・段の順に逐次実行。コルーチン関数のノードはその場で駆動）
+
+        コルーチンを返すノードがある場合、イベントループ内からは呼び出せない（SyncCallInEventLoopError）
+        """
+        results = dict(inputs)
+        timings: Dict[str, float] = {}
+        skipped = self._skipped_nodes(inputs)
+        for level in self.levels:
+            for node in level:
+                if node.name in skipped:
+                    continue  # 計算済みの結果を使用
+                started = time.perf_counter()
+                output = node.func(results)
+                if inspect.isawaitable(output):
+                    output = run_awaitable(output, "AssessmentGraph.run_sync")
+                timings[node.name] = (time.perf_counter() - started) * 1000
+                results[node.name] = output
+        return results, timings
+
+    @staticmethod
+    async def _run_node(node: AssessmentNode, results: Dict[str, Any],
+                        timings: Dict[str, float]) -> Any:
+        started = time.perf_counter()
+        output = (node.async_func or node.func)(results)
+        if inspect.isawaitable(output):
+            output = await output
+        timings[node.name] = (time.perf_counter() - started) * 1000
+        return output
@@ -0,0 +1,102 @@
+# 📝 安定化ペルソナ文言 - Built-in Phrase Table
+"""
+PyYAML が無い環境で使う組み込みの文言テーブル
+
+config/personas/stabilization_phrases.yaml と同じ内容（meta を除く）。
+YAML を編集した場合はこちらも合わせて更新すること（tests/test_phrase_templates.py で一致を確認）
+"""
+
+BUILTIN_PHRASES = {
+    "miyu": {
+        "emotion_color": {
+            "rules": [
+                {"when": ["守りたい", "愛"], "text": "温かい金色"},
+                {"when": ["つながり", "理解"], "text": "優しい青空色"},
+                {"when": ["希望", "未来"], "text": "朝日のオレンジ"},
+            ],
+            "default": "桜の淡いピンク",
+        },
+        "metaphor": {
+            "rules": [
+                {"when": ["守りたい"], "text": "小さな花を優しく手で覆うように"},
+                {"when": ["つながり"], "text": "星と星を結ぶ光の糸のように"},
+                {"when": ["理解"], "text": "心と心が響き合う音楽のように"},
+            ],
+            "default": "春風が頬を撫でるように",
+        },
+        "rhythm": {
+            "rules": [
+                {"equals": "aggression", "text": "激しい雨から優しい雫へのリズム"},
+                {"equals": "despair", "text": "深い沈黙から希望の調べへのリズム"},
+            ],
+            "default": "心臓の鼓動のような安定したリズム",
+        },
+        "imagery": {
+            "rules": [
+                {"when": ["関係"], "text": "手を繋いだ人々が虹の橋を渡る光景"},
+                {"when": ["希望"], "text": "暗い空に一つずつ星が灯っていく光景"},
+            ],
+            "default": "小さな芽が土から顔を出し、太陽に向かって伸びる光景",
+        },
+        "templates": {
+            "harmony": "{original_intent}という想いと、{protective_desire}への愛が、美しいハーモニーを奏でています",
+            "beautiful_expression": "\n{emotion_color}に輝く想いが、\n{metaphor}\n{rhythm}で響きながら、\n{imagery}を描いています。\n",
+            "resonance_message": "🌸 あなたの心の奥にある美しい想いを、詩にお届けします。{expression}どんな痛みも、愛の詩になれるのです。",
+            "messages": [
+                "🌸 美遊: {beautiful_expression}",
+                "🌸 あなたの想いを詩にしました: {resonance_message}",
+            ],
+        },
+    },
+    "azura": {
+        "care_plan": {
+            "rules": [
+                {"when": ["トラウマ"], "text": "愛で包みながらも、逃げずに向き合うことを優しく促し、真の治癒へ導く"},
+                {"when": ["恐れ"], "text": "安全を保証しつつ、勇気を持って一歩を踏み出すよう愛を込めて背中を押す"},
+                {"when": ["孤独"], "text": "温かく包みながら、依存ではなく健全なつながりを築く方法を教える"},
+                {"when": ["自己受容"], "text": "甘やかさずに真の美しさを見せ、成長への責任を愛を持って促す"},
+                {"when": ["希望"], "text": "慰めるだけでなく、自分で希望を育てる力があることを厳しくも優しく伝える"},
+                {"when": ["逃避"], "text": "優しく受け止めながらも、現実と向き合う必要性を愛ある厳しさで示す"},
+            ],
+            "default": "無条件の愛で支えつつ、甘えすぎず自立を促す治療的な厳しさを提供",
+        },
+        "recovery_message": {
+            "rules": [
+                {"above": 0.9, "text": "💙 素晴らしい成長ですね。でも油断せず、この美しい変化を大切に育て続けてください。あなたならできます。"},
+                {"above": 0.8, "text": "💙 いい調子です。でもまだ道半ば。甘えず、もう少し頑張って向き合ってみましょうね。"},
+            ],
+            "default": "💙 第一歩を踏み出したのは偉いですが、ここで満足してはダメ。愛を込めて、もっと深く癒していきましょう。",
+        },
+        "templates": {
+            "messages": [
+                "💙 アズーラ: {recovery_message}",
+                "💙 あなたの傷は癒され、心は回復に向かっています",
+            ],
+        },
+    },
+    "lumifie": {
+        "noise_pattern": {
+            "rules": [
+                {"when": ["恐れ"], "text": "恐怖の残響"},
+                {"when": ["トラウマ"], "text": "過去のトラウマの影"},
+                {"when": ["自己受容"], "text": "自己価値の疑い"},
+            ],
+            "default": "残留する否定的な思考",
+        },
+        "light_transformation": {
+            "rules": [
+                {"when": ["恐怖"], "text": "勇気の金色光で包み、安心の輝きに変換"},
+                {"when": ["トラウマ"], "text": "癒しの白色光で優しく包み、成長の物語に変換"},
+                {"when": ["自己価値"], "text": "愛の虹色光で満たし、ありのままの美しさに変換"},
+                {"when": ["否定的"], "text": "希望の暖色光で置き換え、可能性の光に変換"},
+            ],
+            "default": "純粋な白色光で浄化し、平安の輝きに変換",
+        },
+        "templates": {
+            "final_message": "✨ リミフィエちゃんの光がすべてを希望の輝きに変えました。もう何も怖くありません。",
+            "messages": [
+                "✨ 光に包まれて、すべてが美しい希望になりました",
+            ],
+        },
+    },
+}
@@ -0,0 +1,229 @@
+# ⚙️ パンドラエンジンプール - Process Pool Offload
+"""
+パンドラのCPU処理をプロセスプールへ逃がし、APIサーバーのイベントループを塞がないための実行器
+
+- ワーカープロセスごとにコンパイル済みエンジン（検出器・抽出器・統合照合器）を1回だけ読み込む
+- 待ち行列の深さ（実行中 + 待機中）に上限を設け、飽和時は EnginePoolSaturated で即座に断る
+- 投入からワーカーで実行が始まるまでの待ち時間（queued_ms）を記録
+- ワーカーが異常終了してプールが壊れたら、次の呼び出しで作り直す（その呼び出しは EnginePoolUnavailable）
+- max_workers=0 ではプールを作らず、同じタスク関数をその場で実行する（従来どおりのインライン動作）
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+import asyncio
+import logging
+import math
+import os
+import time
+
+from .fracture_detection import FractureAnalysis
+from .hope_extraction import HopeKernel
+from .pandora_pipeline import PandoraPipeline
+from .trigger_matcher import TriggerMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class EnginePoolSaturated(RuntimeError):
+    """待ち行列が上限に達した（APIでは 429 として返す）"""
+
+
+class EnginePoolUnavailable(RuntimeError):
+    """ワーカープロセスが異常終了し、タスクを実行できなかった（APIでは 503 として返す）"""
+
+
+# === ワーカー側（プロセスごとに1回だけエンジンを読み込む） ===
+
+_engines: Optional[Dict[str, Any]] = None
+
+
+def load_engines() -> Dict[str, Any]:
+    """このプロセスのコンパイル済みエンジンを取得（初回のみ構築）"""
+    global _engines
+    if _engines is None:
+        pipeline = PandoraPipeline()
+        _engines = {
+            "pipeline": pipeline,
+            "detector": pipeline.detector,
+            "extractor": pipeline.extractor,
+            "persona": pipeline.persona,
+        }
+    return _engines
+
+
+def _init_worker():
+    """ワーカープロセス初期化 - エンジン読み込みとログ抑制"""
+    logging.getLogger("core.pandora").setLevel(logging.WARNING)
+    load_engines()
+
+
+def _timed_call(func: Callable, args: Tuple) -> Tuple[float, Any]:
+    """ワーカーで実行開始時刻（epoch秒）と結果を返す"""
+    started_at = time.time()
+    return started_at, func(*args)
+
+
+def analyze_transformation(user_input: str,
+                           persona_state: Optional[Dict] = None) -> Tuple[FractureAnalysis, HopeKernel]:
+    """フラクチャー分析 + 希望核抽出（共有テキスト特徴で1回だけ走査）"""
+    engines = load_engines()
+    persona_state = persona_state or {}
+    features = engines["pipeline"].extract_features(user_input)
+    fracture_analysis = engines["detector"].analyze_sync(
+        persona_state, user_input, text_features=features
+    )
+    hope_kernel = engines["extractor"].extract_hope_sync(
+        user_input, persona_state, fracture_analysis, text_features=features
+    )
+    return fracture_analysis, hope_kernel
+
+
+_matchers: "OrderedDict[str, TriggerMatcher]" = OrderedDict()   # 版ID → 照合器（ワーカーごと）
+
+
+def match_triggers(message_content: str, version: str,
+                   triggers: Optional[Tuple[Tuple[str, str], ...]] = None) -> Optional[List[str]]:
+    """メッセージに含まれるトリガーの ID（定義順）
+
+    照合器はワーカーごとに版ID単位で1回だけ構築する。このワーカーに未登録の版で triggers が
+    省略された場合は None を返す（呼び出し側は定義を添えて再送する）。
+    """
+    matcher = _matchers.get(version)
+    if matcher is None:
+        if triggers is None:
+            return None
+        matcher = _matchers[version] = TriggerMatcher(triggers)
+        if len(_matchers) > 4:   # 設定の再読み込みで古い版が残り続けないように
+            _matchers.popitem(last=False)
+    return matcher.match(message_content)
+
+
+# === 呼び出し側（イベントループ） ===
+
+class PandoraEnginePool:
+    """パンドラエンジンのプロセスプール実行器"""
+
+    def __init__(self, max_workers: int = 0, max_queue_depth: int = 32, sample_size: int = 1024):
+        if max_queue_depth <= 0:
+            raise ValueError("max_queue_depth は1以上を指定してください")
+        self.max_workers = max(0, max_workers)
+        self.max_queue_depth = max_queue_depth
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0                                   # 実行中 + 待機中
+        self._queued_ms: deque = deque(maxlen=sample_size)  # 直近の待ち時間サンプル
+
+        # 統計カウンタ
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0    # 壊れたプールを破棄した回数
+
+    @classmethod
+    def from_env(cls) -> "PandoraEnginePool":
+        """環境変数 PANDORA_EXECUTOR_WORKERS / PANDORA_EXECUTOR_QUEUE_DEPTH から構築"""
+        return cls(
+            max_workers=int(os.environ.get("PANDORA_EXECUTOR_WORKERS", "0")),
+            max_queue_depth=int(os.environ.get("PANDORA_EXECUTOR_QUEUE_DEPTH", "32")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """プロセスプールを使うか（False ならインライン実行）"""
+        return self.max_workers > 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending
+
+    def start(self):
+        """ワーカープロセスを起動（各ワーカーがエンジンを読み込む）"""
+        if self.enabled and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+            logger.info(f"⚙️ パンドラエンジンプール起動: workers={self.max_workers}, "
+                        f"max_queue_depth={self.max_queue_depth}")
+
+    def shutdown(self, wait: bool = True):
+        """ワーカープロセスを停止"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.info("⚙️ パンドラエンジンプール停止")
+
+    async def run(self, func: Callable, *args) -> Any:
+        """タスク関数を実行（プール有効時はワーカーで、無効時はその場で）
+
+        func はモジュールレベル関数（ワーカーへ渡せるもの）であること。
+        待ち行列が上限に達している場合は EnginePoolSaturated を、ワーカーが異常終了した場合は
+        EnginePoolUnavailable を送出する（壊れたプールは破棄し、次の呼び出しで作り直す）。
+        """
+        if self._pending >= self.max_queue_depth:
+            self.rejected += 1
+            raise EnginePoolSaturated(
+                f"パンドラエンジンが混雑しています (queue_depth={self._pending}/{self.max_queue_depth})"
+            )
+
+        self._pending += 1
+        self.submitted += 1
+        try:
+            if not self.enabled:
+                result = func(*args)
+                self._queued_ms.append(0.0)
+            else:
+                self.start()
+                executor = self._executor
+                submitted_at = time.time()
+                try:
+                    started_at, result = await asyncio.get_running_loop().run_in_executor(
+                        executor, _timed_call, func, args
+                    )
+                except BrokenExecutor as e:
+                    self._discard_broken(executor)
+                    raise EnginePoolUnavailable(f"パンドラエンジンのワーカーが停止しました: {e}") from e
+                self._queued_ms.append(max(0.0, (started_at - submitted_at) * 1000))
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self._pending -= 1
+
+    def _discard_broken(self, executor: ProcessPoolExecutor):
+        """壊れたプールを破棄（次の run で作り直す）。同じプールで失敗した他の呼び出しからは何もしない"""
+        if self._executor is not executor:
+            return
+        self._executor = None
+        self.restarts += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.error(f"⚙️ パンドラエンジンプールのワーカーが停止しました - 次の実行で再起動します "
+                     f"(restarts={self.restarts})")
+
+    def reset_stats(self):
+        """統計カウンタと待ち時間サンプルをリセット"""
+        self._queued_ms.clear()
+        self.submitted = self.completed = self.failed = self.rejected = self.restarts = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """プール統計取得（待ち時間はミリ秒）"""
+        samples = sorted(self._queued_ms)
+        return {
+            "mode": "process_pool" if self.enabled else "inline",
+            "workers": self.max_workers,
+            "queue_depth": self._pending,
+            "max_queue_depth": self.max_queue_depth,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+            "queued_ms": {
+                "samples": len(samples),
+                "avg": sum(samples) / len(samples) if samples else 0.0,
+                "p95": samples[math.ceil(len(samples) * 0.95) - 1] if samples else 0.0,
+                "max": samples[-1] if samples else 0.0,
+            },
+        }
@@ -15,10 +15,61 @@ import asyncio
 import logging
 import re
 import math
+import hashlib
+from collections import Counter
 from datetime import datetime, timedelta
 
+from .lexicon_engine import CompiledLexicon, LexiconScan, LexiconStream
+from .text_features import TextFeatures
+from .lru_cache import LRUTTLCache
+from .trend_store import TrendStore, TrendSnapshot
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 構造特徴量の列（analyze_many の行列化・ストリーミング評価で共通）
+# 特徴量ベクトルはこの後ろに、キーワード別の出現回数の列（検出器ごとに構築）が続く
+BATCH_FEATURES = (
+    "exclamation_burst", "short_intense_sentences", "absolute_distinct", "repeated_negative",
+    "question_distinct", "future_distinct", "volatility_conflict", "intense_expression_distinct",
+    "social_reference_distinct", "selfcare_distinct", "destructive_distinct",
+)
+
+# メトリクスごとの (ベース値, 加算手順) - 単体・バッチ・ストリーミング評価で共通
+# 従来のメトリクス計算と同じ順序で1項ずつ加算するので、浮動小数の丸めまで従来の結果と一致する
+#   ("each", カテゴリ, 重み):   カテゴリのキーワードごとに 出現回数 × 重み を定義順に加算
+#   ("times", 特徴量, 重み):    特徴量の値の回数だけ 重み を1回ずつ加算
+#   ("scaled", 特徴量, 重み):   特徴量 × 重み を加算
+METRIC_PROGRAMS = {
+    "aggression_bias": (0.0, (("each", "aggressive", 0.15),
+                              ("scaled", "exclamation_burst", 0.05),
+                              ("scaled", "short_intense_sentences", 0.1))),
+    "self_collapse_score": (0.0, (("each", "self_collapse", 0.2),
+                                  ("times", "absolute_distinct", 0.1),
+                                  ("scaled", "repeated_negative", 0.05))),
+    "hope_kernel_score": (0.5, (("each", "positive", 0.1),
+                                ("times", "question_distinct", 0.15),
+                                ("times", "future_distinct", 0.1),
+                                ("each", "self_collapse", -0.15))),
+    "emotional_volatility": (0.3, (("scaled", "volatility_conflict", 0.3),
+                                   ("scaled", "intense_expression_distinct", 0.1))),
+    "social_connection_level": (0.5, (("times", "social_reference_distinct", 0.1),
+                                      ("each", "isolation", -0.1))),
+    "self_care_capacity": (0.5, (("times", "selfcare_distinct", 0.1),
+                                 ("times", "destructive_distinct", -0.15))),
+}
+
+SENTENCE_BOUNDARY = re.compile(r'[.!?。！？]')
+WORD_BOUNDARY = re.compile(r'\s+')
+TOPIC_BOUNDARY = re.compile(r'[\s.!?。！？]+')
+INTENSE_AGGRESSION_WORDS = ('むかつく', 'イライラ', 'うざい')
+REPEATED_NEGATIVE_WORDS = ('だめ', '無理', 'つらい')
+
 class FractureType(Enum):
     """フラクチャータイプ"""
     AGGRESSIVE_SPIRAL = "aggressive_spiral"      # 攻撃的スパイラル
@@ -35,6 +86,43 @@ class FractureSeverity(Enum):
     SEVERE = "severe"       # 重度 (0.6-0.8)
     CRITICAL = "critical"   # 危機的 (0.8-1.0)
 
+# 希望回復経路（定数テーブル - 呼び出しごとに再構築しない）
+HOPE_RECOVERY_PATHS: Dict[FractureType, Tuple[str, ...]] = {
+    FractureType.AGGRESSIVE_SPIRAL: (
+        "🌸 攻撃性を詩的表現に変換（美遊ちゃん）",
+        "💙 怒りの奥にある愛を癒し（アズーラちゃん）", 
+        "✨ 負の感情を希望の光に変換（リミフィエちゃん）"
+    ),
+    FractureType.SELF_COLLAPSE: (
+        "🎁 自己価値の希望核を抽出（パンドラちゃん）",
+        "💙 自己受容のケアプログラム（アズーラちゃん）",
+        "✨ 自己愛の光を育成（リミフィエちゃん）"
+    ),
+    FractureType.ISOLATION_DRIFT: (
+        "🌸 孤独感を美しい独立性に変換（美遊ちゃん）",
+        "💙 つながりの恐れを癒し（アズーラちゃん）",
+        "✨ 社会的光の橋を構築（リミフィエちゃん）"
+    ),
+    FractureType.HOPE_FRAGMENTATION: (
+        "🎁 散らばった希望の破片を集める（パンドラちゃん）",
+        "🌸 断片を美しいモザイクに変換（美遊ちゃん）",
+        "✨ 統合された希望の光を創造（リミフィエちゃん）"
+    ),
+    FractureType.PROTECTIVE_RAGE: (
+        "🎁 守りたいものの価値を再確認（パンドラちゃん）",
+        "🌸 保護欲求を愛の詩に変換（美遊ちゃん）",
+        "💙 健全な境界設定をサポート（アズーラちゃん）"
+    ),
+    FractureType.DESPAIR_LOOP: (
+        "🎁 ループの出口となる希望を発見（パンドラちゃん）",
+        "💙 絶望の深さに愛で寄り添う（アズーラちゃん）",
+        "✨ 新しい可能性の光を点灯（リミフィエちゃん）"
+    ),
+}
+
+BASIC_RECOVERY_PATH: Tuple[str, ...] = ("💙 優しいケアと愛による基本的な癒し",)
+INDIVIDUAL_RECOVERY_PATH: Tuple[str, ...] = ("💙 個別対応による愛のケア",)
+
 @dataclass
 class FractureMetrics:
     """フラクチャーメトリクス - 壊れ方の数値化"""
@@ -71,6 +159,23 @@ class FractureAnalysis:
     analysis_confidence: float     # 分析信頼度
     key_indicators: List[str]      # 主要指標
 
+@dataclass
+class MetricsCacheEntry:
+    """メトリクスキャッシュのエントリ - 同一入力の走査・計算結果
+
+    メトリクスは不変の省メモリ版（CompactFractureMetrics）で保持し、analyze は通常の
+    FractureMetrics に復元して返すので、キャッシュ内の値は書き換えられない
+    """
+    scan: LexiconScan                                # 走査結果
+    basic_metrics: "CompactFractureMetrics"          # 基本メトリクス
+    linear_scores: Dict[str, float]                  # METRIC_PROGRAMS で決まるメトリクス（包括的メトリクスで再利用）
+    comprehensive_metrics: Optional["CompactFractureMetrics"] = None  # 包括的メトリクス（analyze 時に追加）
+
+def _compact_metrics(metrics: FractureMetrics) -> "CompactFractureMetrics":
+    """キャッシュ保持用の省メモリ版に変換（fracture_records はこのモジュールを参照するため遅延インポート）"""
+    from .fracture_records import CompactFractureMetrics
+    return CompactFractureMetrics.from_metrics(metrics)
+
 class FractureDetector:
     """フラクチャー検出器 - パンドラちゃんの診断システム"""
     
@@ -100,14 +205,137 @@ class FractureDetector:
             r"なぜ", r"目的", r"理由", r"混乱", r"バラバラ"
         ]
         
+        # 補助キーワードセット（希望核・自己崩壊スコア用）
+        self.absolute_patterns = [r"絶対", r"全く", r"完全に", r"100%", r"まったく", r"ぜったい"]
+        self.positive_patterns = [
+            r"ありがとう", r"嬉しい", r"楽しい", r"好き", r"愛", r"幸せ",
+            r"頑張", r"できる", r"やってみる", r"チャレンジ", r"希望"
+        ]
+        self.question_patterns = [r"どうすれば", r"どうやって", r"教えて", r"方法", r"やり方"]
+        self.future_patterns = [r"これから", r"明日", r"将来", r"今度", r"次"]
+        
+        # 全キーワードを1本の照合器にコンパイル（入力は1回だけ走査）
+        self.lexicon = self._compile_lexicon()
+        self._keyword_columns, self._metric_program = self._compile_metric_program()
+        
+        # メトリクスキャッシュ（is_fractured → analyze の二重計算・リトライ対策）
+        self.metrics_cache = LRUTTLCache(max_entries=1024, ttl_seconds=60.0)
+        
+        # ペルソナ・ユーザー単位のトレンドストア（context['series_id'] で参照）
+        self.trend_store = TrendStore(window_hours=self.history_window_hours)
+        
         logger.info(f"🔍 {self.name}: フラクチャー検出システム初期化完了")
     
+    def _compile_lexicon(self) -> CompiledLexicon:
+        """パターンセットから単一パス照合器を構築"""
+        return CompiledLexicon({
+            "aggressive": self.aggressive_patterns,
+            "self_collapse": self.self_collapse_patterns,
+            "isolation": self.isolation_patterns,
+            "hope_fragmentation": self.hope_fragmentation_patterns,
+            "absolute": self.absolute_patterns,
+            "positive": self.positive_patterns,
+            "question": self.question_patterns,
+            "future": self.future_patterns,
+            "intense_aggression": ['むかつく', 'イライラ', 'うざい'],
+            "repeated_negative": ['だめ', '無理', 'つらい'],
+            "volatility_positive": ['嬉しい', '楽しい', '好き'],
+            "volatility_negative": ['悲しい', 'つらい', '嫌い'],
+            "intense_expression": ['とても', 'すごく', '本当に', '心から'],
+            "connector": ['だから', 'しかし', 'でも', 'そして', 'また', 'さらに'],
+            "social_reference": ['友達', '家族', '恋人', '同僚', '先生', '皆', 'みんな'],
+            "selfcare": ['休む', '寝る', '食べる', '運動', 'リラックス', '散歩'],
+            "destructive": ['食べない', '眠れない', '何もしない', '放置'],
+            "protective": ['守る', '助ける', '心配', '大切'],
+        })
+    
+    def rebuild_lexicon(self):
+        """パターンセット変更後に照合器を再コンパイル"""
+        self.lexicon = self._compile_lexicon()
+        self._keyword_columns, self._metric_program = self._compile_metric_program()
+        self.metrics_cache.clear()
+    
+    def record_interaction(self, series_id: str, emotional_stability: float,
+                           emotion_level: float, timestamp: Optional[float] = None):
+        """トレンドストアにサンプルを記録（timestamp は epoch 秒、省略時は現在時刻）"""
+        self.trend_store.window_hours = self.history_window_hours
+        self.trend_store.record(series_id, emotional_stability, emotion_level, timestamp)
+    
+    def record_analysis(self, series_id: str, analysis: FractureAnalysis, persona_state: Dict,
+                        timestamp: Optional[float] = None):
+        """分析結果をトレンドストアに記録（安定度 = 1 - フラクチャー指数）
+        
+        analyze / analyze_many は記録しない（リトライ・再分析で同じやり取りが二重に記録されないよう、
+        やり取り1回につき呼び出し側が1回だけ記録する）
+        """
+        self.record_interaction(
+            series_id, 1.0 - analysis.metrics.fracture_index, persona_state.get('emotion_level', 0.5), timestamp
+        )
+    
+    def get_trend(self, series_id: str) -> Optional[TrendSnapshot]:
+        """系列IDでトレンド統計を取得（history_window_hours 内のサンプルのみ）"""
+        self.trend_store.window_hours = self.history_window_hours
+        return self.trend_store.get(series_id)
+    
+    def _lookup_trend(self, context: Optional[Dict]) -> Optional[TrendSnapshot]:
+        series_id = (context or {}).get('series_id')
+        return self.get_trend(series_id) if series_id else None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """メトリクスキャッシュ統計取得"""
+        return self.metrics_cache.get_stats()
+    
+    def _metrics_cache_key(self, persona_state: Dict, user_input: str,
+                           context: Optional[Dict]) -> str:
+        """キャッシュキー: 入力のハッシュ + メトリクスに影響する状態フィールド
+        
+        認知的一貫性は元の入力の語（大文字小文字を区別）から数えるので、入力は正規化しない
+        """
+        text_digest = hashlib.blake2b((user_input or "").encode("utf-8"), digest_size=16).hexdigest()
+        
+        # 安定性勾配・トレンドは emotion_level と直近3件の履歴のみに依存
+        history = (context or {}).get('interaction_history') or []
+        history_signature = tuple(
+            (h.get('emotional_stability', 0.5), h.get('emotion_level', 0.5))
+            for h in history[-3:]
+        )
+        series_id = (context or {}).get('series_id')
+        trend_version = self.trend_store.version(series_id) if series_id else None
+        state_signature = (persona_state.get('emotion_level', 0.5), history_signature, series_id, trend_version)
+        return f"{text_digest}:{state_signature!r}"
+    
+    def _get_metrics_entry(self, persona_state: Dict, user_input: str,
+                                 context: Optional[Dict],
+                                 text_features: Optional[TextFeatures] = None) -> MetricsCacheEntry:
+        """キャッシュから走査・基本メトリクスを取得（無ければ計算して登録）"""
+        key = self._metrics_cache_key(persona_state, user_input, context)
+        entry = self.metrics_cache.get(key)
+        if entry is None:
+            scan = (text_features.scan_for(self.lexicon) if text_features is not None
+                    else self.lexicon.scan(user_input))
+            scores = self._calculate_linear_metrics(scan)
+            basic_metrics = _compact_metrics(self._calculate_basic_metrics(persona_state, scan, context, scores))
+            entry = MetricsCacheEntry(scan=scan, basic_metrics=basic_metrics, linear_scores=scores)
+            self.metrics_cache.put(key, entry)
+        return entry
+    
     async def is_fractured(self, persona_state: Dict, user_input: str, 
-                          context: Optional[Dict] = None) -> bool:
-        """フラクチャー判定 - シンプルな yes/no 判定"""
+                          context: Optional[Dict] = None,
+                          text_features: Optional[TextFeatures] = None) -> bool:
+        """フラクチャー判定 - シンプルな yes/no 判定
+        
+        text_features: パイプラインで計算済みの共有テキスト特徴（指定時は再走査しない）
+        """
+        return self.is_fractured_sync(persona_state, user_input, context, text_features)
+    
+    def is_fractured_sync(self, persona_state: Dict, user_input: str,
+                          context: Optional[Dict] = None,
+                          text_features: Optional[TextFeatures] = None) -> bool:
+        """フラクチャー判定（同期版・イベントループ不要）"""
         try:
-            # 基本メトリクス計算
-            metrics = await self._calculate_basic_metrics(persona_state, user_input, context)
+            # 基本メトリクス計算（キャッシュ経由）
+            entry = self._get_metrics_entry(persona_state, user_input, context, text_features)
+            metrics = entry.basic_metrics
             
             # 閾値判定
             is_fractured = metrics.fracture_index >= self.detection_threshold
@@ -120,83 +348,283 @@ class FractureDetector:
             return False  # 安全側にフォールバック
     
     async def analyze(self, persona_state: Dict, user_input: str,
-                     context: Optional[Dict] = None) -> FractureAnalysis:
-        """詳細フラクチャー分析"""
+                     context: Optional[Dict] = None,
+                     text_features: Optional[TextFeatures] = None) -> FractureAnalysis:
+        """詳細フラクチャー分析
+        
+        text_features: パイプラインで計算済みの共有テキスト特徴（指定時は再走査しない）
+        """
+        return self.analyze_sync(persona_state, user_input, context, text_features)
+    
+    def analyze_sync(self, persona_state: Dict, user_input: str,
+                     context: Optional[Dict] = None,
+                     text_features: Optional[TextFeatures] = None) -> FractureAnalysis:
+        """詳細フラクチャー分析（同期版・イベントループ不要）"""
         logger.info("🔍 詳細フラクチャー分析開始...")
         
         try:
-            # 完全メトリクス計算
-            metrics = await self._calculate_comprehensive_metrics(
-                persona_state, user_input, context
-            )
+            # 完全メトリクス計算（is_fractured の計算結果をキャッシュから再利用）
+            entry = self._get_metrics_entry(persona_state, user_input, context, text_features)
+            if entry.comprehensive_metrics is None:
+                entry.comprehensive_metrics = _compact_metrics(self._calculate_comprehensive_metrics(
+                    persona_state, user_input, entry.scan, context, entry.basic_metrics, entry.linear_scores
+                ))
+            # 呼び出し側には新しい FractureMetrics を渡す（書き換えてもキャッシュに影響しない）
+            metrics = entry.comprehensive_metrics.to_metrics()
             
-            # フラクチャー判定
-            is_fractured = metrics.fracture_index >= self.detection_threshold
-            
-            # フラクチャータイプ特定
-            fracture_type = await self._identify_fracture_type(
-                persona_state, user_input, metrics
-            ) if is_fractured else None
-            
-            # 深刻度評価
-            severity = await self._assess_severity(metrics)
-            
-            # 希望回復経路生成
-            hope_recovery_path = await self._generate_hope_recovery_path(
-                fracture_type, metrics
-            )
-            
-            # 推奨値計算
-            transformation_urgency = min(metrics.fracture_index * 1.2, 1.0)
-            recommended_care_level = max(metrics.fracture_index, 0.5) if is_fractured else 0.3
-            
-            # 主要指標特定
-            key_indicators = await self._identify_key_indicators(metrics, fracture_type)
-            
-            # 分析信頼度計算
-            analysis_confidence = await self._calculate_analysis_confidence(
-                persona_state, user_input, metrics
-            )
-            
-            analysis = FractureAnalysis(
-                is_fractured=is_fractured,
-                fracture_type=fracture_type,
-                severity=severity,
-                metrics=metrics,
-                transformation_urgency=transformation_urgency,
-                recommended_care_level=recommended_care_level,
-                hope_recovery_path=hope_recovery_path,
-                analysis_confidence=analysis_confidence,
-                key_indicators=key_indicators
-            )
+            analysis = self._build_analysis(persona_state, user_input, entry.scan, metrics)
             
-            logger.info(f"🔍 分析完了: フラクチャー={is_fractured}, タイプ={fracture_type}, 深刻度={severity}")
+            logger.info(f"🔍 分析完了: フラクチャー={analysis.is_fractured}, タイプ={analysis.fracture_type}, 深刻度={analysis.severity}")
             return analysis
             
         except Exception as e:
             logger.error(f"🔍 分析エラー: {e}")
             # エラー時は安全な結果を返す
-            return await self._create_safe_analysis()
+            return self._create_safe_analysis()
     
-    async def _calculate_basic_metrics(self, persona_state: Dict, user_input: str,
-                                     context: Optional[Dict]) -> FractureMetrics:
+    async def analyze_many(self, inputs: List[str],
+                           persona_states: Optional[List[Dict]] = None,
+                           contexts: Optional[List[Optional[Dict]]] = None) -> List[FractureAnalysis]:
+        """バッチフラクチャー分析 - 大量メッセージをまとめて分析
+        
+        各入力を1回ずつ走査して特徴量行列（メッセージ数 × 特徴量）を作り、
+        METRIC_PROGRAMS の加算手順で全行のメトリクスを一括計算する。結果は analyze() と同じ。
+        """
+        return self.analyze_many_sync(inputs, persona_states, contexts)
+    
+    def analyze_many_sync(self, inputs: List[str],
+                          persona_states: Optional[List[Dict]] = None,
+                          contexts: Optional[List[Optional[Dict]]] = None) -> List[FractureAnalysis]:
+        """バッチフラクチャー分析（同期版・イベントループ不要）"""
+        count = len(inputs)
+        persona_states = persona_states if persona_states is not None else [{}] * count
+        contexts = contexts if contexts is not None else [None] * count
+        if len(persona_states) != count or len(contexts) != count:
+            raise ValueError("inputs, persona_states, contexts の長さが一致しません")
+        
+        logger.info(f"🔍 バッチフラクチャー分析開始: {count}件")
+        if count == 0:
+            return []
+        
+        scans = [self.lexicon.scan(user_input) for user_input in inputs]
+        
+        # 特徴量行列 → METRIC_PROGRAMS のメトリクス
+        feature_rows = [self._batch_feature_row(scan) for scan in scans]
+        metric_columns = self._apply_batch_weights(feature_rows)
+        
+        analyses = []
+        for i, (user_input, scan) in enumerate(zip(inputs, scans)):
+            persona_state = persona_states[i] or {}
+            context = contexts[i]
+            try:
+                stability_slope = self._calculate_stability_slope(persona_state, context)
+                aggression_bias = metric_columns["aggression_bias"][i]
+                self_collapse_score = metric_columns["self_collapse_score"][i]
+                hope_kernel_score = metric_columns["hope_kernel_score"][i]
+                metrics = FractureMetrics(
+                    fracture_index=self._compose_fracture_index(
+                        aggression_bias, self_collapse_score, hope_kernel_score, stability_slope
+                    ),
+                    aggression_bias=aggression_bias,
+                    self_collapse_score=self_collapse_score,
+                    stability_slope=stability_slope,
+                    hope_kernel_score=hope_kernel_score,
+                    emotional_volatility=metric_columns["emotional_volatility"][i],
+                    cognitive_coherence=self._calculate_cognitive_coherence(user_input, scan, persona_state),
+                    social_connection_level=metric_columns["social_connection_level"][i],
+                    self_care_capacity=metric_columns["self_care_capacity"][i],
+                    trend_direction=self._analyze_trend_direction(persona_state, context),
+                    last_updated=datetime.now()
+                )
+                analyses.append(self._build_analysis(persona_state, user_input, scan, metrics))
+            except Exception as e:
+                logger.error(f"🔍 バッチ分析エラー (#{i}): {e}")
+                analyses.append(self._create_safe_analysis())
+        
+        fractured = sum(1 for analysis in analyses if analysis.is_fractured)
+        logger.info(f"🔍 バッチ分析完了: {count}件中 {fractured}件でフラクチャー検出")
+        return analyses
+    
+    async def create_stream_scorer(self, persona_state: Optional[Dict] = None,
+                                   context: Optional[Dict] = None) -> "StreamingFractureScorer":
+        """ストリーミング評価器を作成 - 生成中の出力をチャンクごとに評価
+        
+        状態・履歴に依存する安定性勾配とトレンドは開始時に1回だけ計算する。
+        """
+        return self.create_stream_scorer_sync(persona_state, context)
+    
+    def create_stream_scorer_sync(self, persona_state: Optional[Dict] = None,
+                                  context: Optional[Dict] = None) -> "StreamingFractureScorer":
+        """ストリーミング評価器を作成（同期版・イベントループ不要）"""
+        persona_state = persona_state or {}
+        stability_slope = self._calculate_stability_slope(persona_state, context)
+        trend_direction = self._analyze_trend_direction(persona_state, context)
+        return StreamingFractureScorer(self, stability_slope, trend_direction)
+    
+    def _compile_metric_program(self) -> Tuple[Tuple[str, ...], Tuple]:
+        """METRIC_PROGRAMS を特徴量ベクトルの列番号に展開
+        
+        戻り値: (キーワード別出現回数の列のキーワード, ((メトリクス名, ベース値, ((列, 重み, 1回ずつ加算か), ...)), ...))
+        """
+        feature_columns = {feature: k for k, feature in enumerate(BATCH_FEATURES)}
+        keyword_columns: Dict[str, int] = {}
+        program = []
+        for name, (base, terms) in METRIC_PROGRAMS.items():
+            steps = []
+            for kind, source, weight in terms:
+                if kind == "each":
+                    for keyword in self.lexicon.categories[source]:
+                        column = keyword_columns.setdefault(keyword, len(BATCH_FEATURES) + len(keyword_columns))
+                        steps.append((column, weight, False))
+                else:
+                    steps.append((feature_columns[source], weight, kind == "times"))
+            program.append((name, base, tuple(steps)))
+        return tuple(keyword_columns), tuple(program)
+    
+    def _empty_feature_row(self) -> List[float]:
+        return [0.0] * (len(BATCH_FEATURES) + len(self._keyword_columns))
+    
+    def _batch_feature_row(self, scan: LexiconScan) -> List[float]:
+        """走査結果からバッチ用特徴量ベクトルを作成（BATCH_FEATURES + キーワード別出現回数）"""
+        if not scan.text:
+            return self._empty_feature_row()
+        
+        exclamation_count = scan.text.count('!') + scan.text.count('！')
+        return self._feature_row(
+            scan, exclamation_count,
+            self._count_short_intense_sentences(scan),
+            self._count_repeated_negative(scan)
+        )
+    
+    def _feature_row(self, counts, exclamation_count: int, short_intense_sentences: int,
+                     repeated_negative: int) -> List[float]:
+        """キーワード別ヒット数と構造特徴から特徴量ベクトルを作成（BATCH_FEATURES + キーワード別出現回数）"""
+        volatility_conflict = counts.distinct("volatility_positive") > 0 and counts.distinct("volatility_negative") > 0
+        row = [
+            float(exclamation_count if exclamation_count > 2 else 0),
+            float(short_intense_sentences),
+            float(counts.distinct("absolute")),
+            float(repeated_negative),
+            float(counts.distinct("question")),
+            float(counts.distinct("future")),
+            1.0 if volatility_conflict else 0.0,
+            float(counts.distinct("intense_expression")),
+            float(counts.distinct("social_reference")),
+            float(counts.distinct("selfcare")),
+            float(counts.distinct("destructive")),
+        ]
+        row.extend(float(counts.count(keyword)) for keyword in self._keyword_columns)
+        return row
+    
+    def _apply_batch_weights(self, feature_rows: List[List[float]]) -> Dict[str, List[float]]:
+        """特徴量行列からメトリクス列を計算（0.0-1.0 にクリップ）
+        
+        NumPy では加算手順ごとに全行をまとめて処理する（要素ごとの演算順序は1行ずつの計算と同じ）。
+        """
+        if NUMPY_AVAILABLE and len(feature_rows) > 1:
+            features = np.asarray(feature_rows, dtype=np.float64)
+            columns: Dict[str, List[float]] = {}
+            for name, base, steps in self._metric_program:
+                scores = np.full(len(feature_rows), base)
+                for k, weight, repeated in steps:
+                    column = features[:, k]
+                    if repeated:
+                        for times in range(int(column.max())):
+                            scores = np.where(column > times, scores + weight, scores)
+                    else:
+                        scores = scores + column * weight
+                columns[name] = np.clip(scores, 0.0, 1.0).tolist()
+            return columns
+        
+        # 単一行・NumPy が無い環境向けの純Python計算
+        columns = {name: [] for name, _, _ in self._metric_program}
+        for row in feature_rows:
+            for name, score in self._score_feature_row(row).items():
+                columns[name].append(score)
+        return columns
+    
+    def _score_feature_row(self, row: List[float]) -> Dict[str, float]:
+        """特徴量ベクトル1行からメトリクスを計算（METRIC_PROGRAMS の順に加算し、0.0-1.0 にクリップ）"""
+        scores = {}
+        for name, score, steps in self._metric_program:
+            for k, weight, repeated in steps:
+                value = row[k]
+                if not value:
+                    continue
+                if repeated:
+                    for _ in range(int(value)):
+                        score += weight
+                else:
+                    score += value * weight
+            scores[name] = max(0.0, min(1.0, score))
+        return scores
+    
+    def _calculate_linear_metrics(self, scan: LexiconScan) -> Dict[str, float]:
+        """METRIC_PROGRAMS で決まるメトリクス（攻撃性・自己崩壊・希望核・感情不安定性・つながり・セルフケア）"""
+        return self._score_feature_row(self._batch_feature_row(scan))
+    
+    def _build_analysis(self, persona_state: Dict, user_input: str, scan: LexiconScan,
+                              metrics: FractureMetrics) -> FractureAnalysis:
+        """メトリクスから分析結果を組み立て"""
+        # フラクチャー判定
+        is_fractured = metrics.fracture_index >= self.detection_threshold
+        
+        # フラクチャータイプ特定
+        fracture_type = self._identify_fracture_type(
+            persona_state, scan, metrics
+        ) if is_fractured else None
+        
+        # 深刻度評価
+        severity = self._assess_severity(metrics)
+        
+        # 希望回復経路生成
+        hope_recovery_path = self._generate_hope_recovery_path(
+            fracture_type, metrics
+        )
+        
+        # 推奨値計算
+        transformation_urgency = min(metrics.fracture_index * 1.2, 1.0)
+        recommended_care_level = max(metrics.fracture_index, 0.5) if is_fractured else 0.3
+        
+        # 主要指標特定
+        key_indicators = self._identify_key_indicators(metrics, fracture_type)
+        
+        # 分析信頼度計算
+        analysis_confidence = self._calculate_analysis_confidence(
+            persona_state, user_input, metrics
+        )
+        
+        return FractureAnalysis(
+            is_fractured=is_fractured,
+            fracture_type=fracture_type,
+            severity=severity,
+            metrics=metrics,
+            transformation_urgency=transformation_urgency,
+            recommended_care_level=recommended_care_level,
+            hope_recovery_path=hope_recovery_path,
+            analysis_confidence=analysis_confidence,
+            key_indicators=key_indicators
+        )
+    
+    def _calculate_basic_metrics(self, persona_state: Dict, scan: LexiconScan,
+                                     context: Optional[Dict],
+                                     scores: Optional[Dict[str, float]] = None) -> FractureMetrics:
         """基本メトリクス計算"""
-        # 各指数の計算
-        aggression_bias = await self._calculate_aggression_bias(user_input, persona_state)
-        self_collapse_score = await self._calculate_self_collapse_score(user_input, persona_state)
-        stability_slope = await self._calculate_stability_slope(persona_state, context)
-        hope_kernel_score = await self._calculate_hope_kernel_score(user_input, persona_state)
+        # 各指数の計算（analyze_many・ストリーミング評価と同じ加算手順）
+        if scores is None:
+            scores = self._calculate_linear_metrics(scan)
+        aggression_bias = scores["aggression_bias"]
+        self_collapse_score = scores["self_collapse_score"]
+        stability_slope = self._calculate_stability_slope(persona_state, context)
+        hope_kernel_score = scores["hope_kernel_score"]
         
         # 総合フラクチャー指数計算
-        fracture_index = (
-            aggression_bias * 0.25 +
-            self_collapse_score * 0.30 +
-            (1.0 - hope_kernel_score) * 0.25 +
-            max(0, -stability_slope) * 0.20
+        fracture_index = self._compose_fracture_index(
+            aggression_bias, self_collapse_score, hope_kernel_score, stability_slope
         )
         
         return FractureMetrics(
-            fracture_index=min(fracture_index, 1.0),
+            fracture_index=fracture_index,
             aggression_bias=aggression_bias,
             self_collapse_score=self_collapse_score,
             stability_slope=stability_slope,
@@ -209,20 +637,28 @@ class FractureDetector:
             last_updated=datetime.now()
         )
     
-    async def _calculate_comprehensive_metrics(self, persona_state: Dict, user_input: str,
-                                             context: Optional[Dict]) -> FractureMetrics:
-        """包括的メトリクス計算"""
-        # 基本メトリクス取得
-        basic_metrics = await self._calculate_basic_metrics(persona_state, user_input, context)
+    def _calculate_comprehensive_metrics(self, persona_state: Dict, user_input: str, scan: LexiconScan,
+                                             context: Optional[Dict],
+                                             basic_metrics=None,
+                                             scores: Optional[Dict[str, float]] = None) -> FractureMetrics:
+        """包括的メトリクス計算
+        
+        basic_metrics: 計算済みの基本メトリクス（FractureMetrics / キャッシュ内の CompactFractureMetrics）
+        """
+        # 基本メトリクス・METRIC_PROGRAMS のメトリクス取得（計算済みなら再利用）
+        if scores is None:
+            scores = self._calculate_linear_metrics(scan)
+        if basic_metrics is None:
+            basic_metrics = self._calculate_basic_metrics(persona_state, scan, context, scores)
         
         # 拡張メトリクス計算
-        emotional_volatility = await self._calculate_emotional_volatility(user_input, persona_state)
-        cognitive_coherence = await self._calculate_cognitive_coherence(user_input, persona_state)
-        social_connection_level = await self._calculate_social_connection_level(user_input, persona_state)
-        self_care_capacity = await self._calculate_self_care_capacity(user_input, persona_state)
+        emotional_volatility = scores["emotional_volatility"]
+        cognitive_coherence = self._calculate_cognitive_coherence(user_input, scan, persona_state)
+        social_connection_level = scores["social_connection_level"]
+        self_care_capacity = scores["self_care_capacity"]
         
         # トレンド分析
-        trend_direction = await self._analyze_trend_direction(persona_state, context)
+        trend_direction = self._analyze_trend_direction(persona_state, context)
         
         # 拡張版を返す
         return FractureMetrics(
@@ -239,59 +675,50 @@ class FractureDetector:
             last_updated=datetime.now()
         )
     
-    async def _calculate_aggression_bias(self, user_input: str, persona_state: Dict) -> float:
-        """攻撃性バイアス計算"""
-        if not user_input:
-            return 0.0
-        
-        input_text = user_input.lower()
-        aggression_score = 0.0
-        
-        # パターンマッチング
-        for pattern in self.aggressive_patterns:
-            matches = len(re.findall(pattern, input_text))
-            aggression_score += matches * 0.15
-        
-        # 感嘆符・大文字の多用チェック
-        exclamation_count = input_text.count('!') + input_text.count('！')
-        if exclamation_count > 2:
-            aggression_score += exclamation_count * 0.05
-        
-        # 短い文で強い感情表現
-        sentences = re.split(r'[.!?。！？]', input_text)
-        short_intense_sentences = [s for s in sentences if len(s.strip()) < 10 and any(p in s for p in ['むかつく', 'イライラ', 'うざい'])]
-        aggression_score += len(short_intense_sentences) * 0.1
-        
-        return min(aggression_score, 1.0)
+    def _count_short_intense_sentences(self, scan: LexiconScan) -> int:
+        """強い感情語を含む短文の数（該当語がある場合のみ文分割）"""
+        if not scan.distinct("intense_aggression"):
+            return 0
+        sentences = SENTENCE_BOUNDARY.split(scan.text)
+        return sum(1 for s in sentences if len(s.strip()) < 10 and any(p in s for p in INTENSE_AGGRESSION_WORDS))
     
-    async def _calculate_self_collapse_score(self, user_input: str, persona_state: Dict) -> float:
-        """自己崩壊スコア計算"""
-        if not user_input:
-            return 0.0
-        
-        input_text = user_input.lower()
-        collapse_score = 0.0
-        
-        # 自己否定パターン
-        for pattern in self.self_collapse_patterns:
-            matches = len(re.findall(pattern, input_text))
-            collapse_score += matches * 0.2
-        
-        # 絶対的表現（「絶対」「全く」「完全に」など）
-        absolute_patterns = [r"絶対", r"全く", r"完全に", r"100%", r"まったく", r"ぜったい"]
-        for pattern in absolute_patterns:
-            if re.search(pattern, input_text):
-                collapse_score += 0.1
-        
-        # 繰り返し表現（同じ否定的表現の反復）
-        words = input_text.split()
-        if len(words) > 1:
-            repeated_negative = sum(1 for word in words if words.count(word) > 1 and any(p in word for p in ['だめ', '無理', 'つらい']))
-            collapse_score += repeated_negative * 0.05
-        
-        return min(collapse_score, 1.0)
+    def _count_repeated_negative(self, scan: LexiconScan) -> int:
+        """繰り返し出現する否定語の数（該当語がある場合のみ単語分割）"""
+        if not scan.distinct("repeated_negative"):
+            return 0
+        words = scan.text.split()
+        if len(words) <= 1:
+            return 0
+        word_counts = Counter(words)
+        return sum(1 for word in words if word_counts[word] > 1 and any(p in word for p in REPEATED_NEGATIVE_WORDS))
+    
+    @staticmethod
+    def _compose_fracture_index(aggression_bias: float, self_collapse_score: float,
+                                hope_kernel_score: float, stability_slope: float) -> float:
+        """総合フラクチャー指数 (0.0-1.0)"""
+        fracture_index = (
+            aggression_bias * 0.25 +
+            self_collapse_score * 0.30 +
+            (1.0 - hope_kernel_score) * 0.25 +
+            max(0, -stability_slope) * 0.20
+        )
+        return min(fracture_index, 1.0)
+    
+    @staticmethod
+    def _coherence_score(sentence_count: int, connector_distinct: int,
+                         unique_words: int, total_words: int) -> float:
+        """認知的一貫性スコア（文数・接続詞・語の重複から算出）"""
+        coherence_score = 0.7
+        if sentence_count > 1:
+            # 接続詞の適切な使用
+            coherence_score += connector_distinct * 0.05
+            
+            # 話題の一貫性（キーワードの重複）
+            unique_topics = unique_words / total_words if total_words else 1
+            coherence_score += (1 - unique_topics) * 0.2
+        return min(coherence_score, 1.0)
     
-    async def _calculate_stability_slope(self, persona_state: Dict, context: Optional[Dict]) -> float:
+    def _calculate_stability_slope(self, persona_state: Dict, context: Optional[Dict]) -> float:
         """安定性勾配計算 - 時系列変化の傾向"""
         # 履歴データがあれば時系列分析
         if context and 'interaction_history' in context:
@@ -304,6 +731,12 @@ class FractureDetector:
                     slope = (recent_scores[-1] - recent_scores[0]) / len(recent_scores)
                     return max(-1.0, min(1.0, slope * 2))  # -1.0 to 1.0 に正規化
         
+        # トレンドストア（系列ID参照）の指数加重勾配
+        trend = self._lookup_trend(context)
+        if trend and trend.sample_count >= 3:
+            # 1ステップ勾配を従来の3点差分と同じスケールに換算 ((x3-x1)/3*2 = 勾配*4/3)
+            return max(-1.0, min(1.0, trend.stability_slope * 4 / 3))
+        
         # 現在の状態から推定
         current_emotion = persona_state.get('emotion_level', 0.5)
         if current_emotion < 0.3:
@@ -313,135 +746,32 @@ class FractureDetector:
         else:
             return 0.0   # 安定
     
-    async def _calculate_hope_kernel_score(self, user_input: str, persona_state: Dict) -> float:
-        """希望核スコア計算 - 隠れた希望の強さ"""
-        if not user_input:
-            return 0.5
-        
-        input_text = user_input.lower()
-        hope_score = 0.5  # ベーススコア
-        
-        # ポジティブ要素の検出
-        positive_patterns = [
-            r"ありがとう", r"嬉しい", r"楽しい", r"好き", r"愛", r"幸せ",
-            r"頑張", r"できる", r"やってみる", r"チャレンジ", r"希望"
-        ]
-        
-        for pattern in positive_patterns:
-            matches = len(re.findall(pattern, input_text))
-            hope_score += matches * 0.1
-        
-        # 質問形式（学習・成長への意欲）
-        question_patterns = [r"どうすれば", r"どうやって", r"教えて", r"方法", r"やり方"]
-        for pattern in question_patterns:
-            if re.search(pattern, input_text):
-                hope_score += 0.15
-        
-        # 未来志向表現
-        future_patterns = [r"これから", r"明日", r"将来", r"今度", r"次"]
-        for pattern in future_patterns:
-            if re.search(pattern, input_text):
-                hope_score += 0.1
-        
-        # 否定的表現による減点
-        for pattern in self.self_collapse_patterns:
-            matches = len(re.findall(pattern, input_text))
-            hope_score -= matches * 0.15
-        
-        return max(0.0, min(1.0, hope_score))
-    
-    async def _calculate_emotional_volatility(self, user_input: str, persona_state: Dict) -> float:
-        """感情的不安定性計算"""
-        if not user_input:
-            return 0.3
-        
-        # 感情の急激な変化パターンを検出
-        volatility_score = 0.3
-        
-        # 矛盾する感情表現の共存
-        text = user_input.lower()
-        positive_words = sum(1 for word in ['嬉しい', '楽しい', '好き'] if word in text)
-        negative_words = sum(1 for word in ['悲しい', 'つらい', '嫌い'] if word in text)
-        
-        if positive_words > 0 and negative_words > 0:
-            volatility_score += 0.3
-        
-        # 感情表現の強度
-        intense_expressions = sum(1 for expr in ['とても', 'すごく', '本当に', '心から'] if expr in text)
-        volatility_score += intense_expressions * 0.1
-        
-        return min(volatility_score, 1.0)
-    
-    async def _calculate_cognitive_coherence(self, user_input: str, persona_state: Dict) -> float:
-        """認知的一貫性計算"""
+    def _calculate_cognitive_coherence(self, user_input: str, scan: LexiconScan, persona_state: Dict) -> float:
+        """認知的一貫性計算（語の重複は元の入力で数え、接続詞は走査結果から引く）"""
         if not user_input:
             return 0.7
         
-        coherence_score = 0.7
-        
         # 論理的つながりの分析
-        sentences = re.split(r'[.!?。！？]', user_input)
-        if len(sentences) > 1:
-            # 接続詞の適切な使用
-            connectors = ['だから', 'しかし', 'でも', 'そして', 'また', 'さらに']
-            connector_count = sum(1 for conn in connectors if any(conn in s for s in sentences))
-            coherence_score += connector_count * 0.05
-            
-            # 話題の一貫性（キーワードの重複）
-            all_words = ' '.join(sentences).split()
-            unique_topics = len(set(all_words)) / len(all_words) if all_words else 1
-            coherence_score += (1 - unique_topics) * 0.2
-        
-        return min(coherence_score, 1.0)
-    
-    async def _calculate_social_connection_level(self, user_input: str, persona_state: Dict) -> float:
-        """社会的つながりレベル計算"""
-        if not user_input:
-            return 0.5
-        
-        connection_score = 0.5
-        
-        text = user_input.lower()
-        
-        # 他者への言及
-        social_references = ['友達', '家族', '恋人', '同僚', '先生', '皆', 'みんな']
-        for ref in social_references:
-            if ref in text:
-                connection_score += 0.1
-        
-        # 孤立を示す表現による減点
-        for pattern in self.isolation_patterns:
-            matches = len(re.findall(pattern, text))
-            connection_score -= matches * 0.1
-        
-        return max(0.0, min(1.0, connection_score))
-    
-    async def _calculate_self_care_capacity(self, user_input: str, persona_state: Dict) -> float:
-        """セルフケア能力計算"""
-        if not user_input:
-            return 0.5
-        
-        selfcare_score = 0.5
-        
-        text = user_input.lower()
-        
-        # セルフケア関連表現
-        selfcare_patterns = ['休む', '寝る', '食べる', '運動', 'リラックス', '散歩']
-        for pattern in selfcare_patterns:
-            if pattern in text:
-                selfcare_score += 0.1
-        
-        # 自己破壊的表現による減点
-        destructive_patterns = ['食べない', '眠れない', '何もしない', '放置']
-        for pattern in destructive_patterns:
-            if pattern in text:
-                selfcare_score -= 0.15
+        sentences = SENTENCE_BOUNDARY.split(user_input)
+        if len(sentences) <= 1:
+            return 0.7
         
-        return max(0.0, min(1.0, selfcare_score))
+        all_words = ' '.join(sentences).split()
+        return self._coherence_score(
+            len(sentences), scan.distinct("connector"), len(set(all_words)), len(all_words)
+        )
     
-    async def _analyze_trend_direction(self, persona_state: Dict, context: Optional[Dict]) -> str:
+    def _analyze_trend_direction(self, persona_state: Dict, context: Optional[Dict]) -> str:
         """トレンド方向分析"""
         if not context or 'interaction_history' not in context:
+            # トレンドストア（系列ID参照）: 直近3点の変化量 ≒ 勾配 × 2
+            trend = self._lookup_trend(context)
+            if trend and trend.sample_count >= 2:
+                change = trend.emotion_slope * 2
+                if change > 0.1:
+                    return "improving"
+                elif change < -0.1:
+                    return "declining"
             return "stable"
         
         history = context['interaction_history']
@@ -459,13 +789,12 @@ class FractureDetector:
         
         return "stable"
     
-    async def _identify_fracture_type(self, persona_state: Dict, user_input: str,
+    def _identify_fracture_type(self, persona_state: Dict, scan: LexiconScan,
                                     metrics: FractureMetrics) -> Optional[FractureType]:
         """フラクチャータイプ特定"""
-        if not user_input:
+        if not scan.text:
             return None
         
-        text = user_input.lower()
         scores = {}
         
         # 各タイプのスコア計算
@@ -476,8 +805,7 @@ class FractureDetector:
         scores[FractureType.DESPAIR_LOOP] = (metrics.self_collapse_score + (1.0 - metrics.hope_kernel_score)) / 2
         
         # 保護的怒りの特別検出
-        protective_indicators = ['守る', '助ける', '心配', '大切']
-        protective_score = sum(0.2 for indicator in protective_indicators if indicator in text)
+        protective_score = scan.distinct("protective") * 0.2
         if protective_score > 0 and metrics.aggression_bias > 0.3:
             scores[FractureType.PROTECTIVE_RAGE] = protective_score + metrics.aggression_bias * 0.5
         else:
@@ -489,7 +817,7 @@ class FractureDetector:
         
         return max_type if max_score > 0.3 else None
     
-    async def _assess_severity(self, metrics: FractureMetrics) -> FractureSeverity:
+    def _assess_severity(self, metrics: FractureMetrics) -> FractureSeverity:
         """深刻度評価"""
         fracture_index = metrics.fracture_index
         
@@ -502,48 +830,15 @@ class FractureDetector:
         else:
             return FractureSeverity.MILD
     
-    async def _generate_hope_recovery_path(self, fracture_type: Optional[FractureType],
+    def _generate_hope_recovery_path(self, fracture_type: Optional[FractureType],
                                          metrics: FractureMetrics) -> List[str]:
         """希望回復経路生成"""
         if not fracture_type:
-            return ["💙 優しいケアと愛による基本的な癒し"]
-        
-        paths = {
-            FractureType.AGGRESSIVE_SPIRAL: [
-                "🌸 攻撃性を詩的表現に変換（美遊ちゃん）",
-                "💙 怒りの奥にある愛を癒し（アズーラちゃん）", 
-                "✨ 負の感情を希望の光に変換（リミフィエちゃん）"
-            ],
-            FractureType.SELF_COLLAPSE: [
-                "🎁 自己価値の希望核を抽出（パンドラちゃん）",
-                "💙 自己受容のケアプログラム（アズーラちゃん）",
-                "✨ 自己愛の光を育成（リミフィエちゃん）"
-            ],
-            FractureType.ISOLATION_DRIFT: [
-                "🌸 孤独感を美しい独立性に変換（美遊ちゃん）",
-                "💙 つながりの恐れを癒し（アズーラちゃん）",
-                "✨ 社会的光の橋を構築（リミフィエちゃん）"
-            ],
-            FractureType.HOPE_FRAGMENTATION: [
-                "🎁 散らばった希望の破片を集める（パンドラちゃん）",
-                "🌸 断片を美しいモザイクに変換（美遊ちゃん）",
-                "✨ 統合された希望の光を創造（リミフィエちゃん）"
-            ],
-            FractureType.PROTECTIVE_RAGE: [
-                "🎁 守りたいものの価値を再確認（パンドラちゃん）",
-                "🌸 保護欲求を愛の詩に変換（美遊ちゃん）",
-                "💙 健全な境界設定をサポート（アズーラちゃん）"
-            ],
-            FractureType.DESPAIR_LOOP: [
-                "🎁 ループの出口となる希望を発見（パンドラちゃん）",
-                "💙 絶望の深さに愛で寄り添う（アズーラちゃん）",
-                "✨ 新しい可能性の光を点灯（リミフィエちゃん）"
-            ]
-        }
-        
-        return paths.get(fracture_type, ["💙 個別対応による愛のケア"])
-    
-    async def _identify_key_indicators(self, metrics: FractureMetrics,
+            return list(BASIC_RECOVERY_PATH)
+        
+        return list(HOPE_RECOVERY_PATHS.get(fracture_type, INDIVIDUAL_RECOVERY_PATH))
+    
+    def _identify_key_indicators(self, metrics: FractureMetrics,
                                      fracture_type: Optional[FractureType]) -> List[str]:
         """主要指標特定"""
         indicators = []
@@ -568,7 +863,7 @@ class FractureDetector:
         
         return indicators if indicators else ["✅ 正常範囲内"]
     
-    async def _calculate_analysis_confidence(self, persona_state: Dict, user_input: str,
+    def _calculate_analysis_confidence(self, persona_state: Dict, user_input: str,
                                            metrics: FractureMetrics) -> float:
         """分析信頼度計算"""
         confidence = 0.7  # ベース信頼度
@@ -585,7 +880,7 @@ class FractureDetector:
         
         return max(0.1, min(1.0, confidence))
     
-    async def _create_safe_analysis(self) -> FractureAnalysis:
+    def _create_safe_analysis(self) -> FractureAnalysis:
         """安全な分析結果作成（エラー時フォールバック）"""
         safe_metrics = FractureMetrics(
             fracture_index=0.2,
@@ -611,4 +906,190 @@ class FractureDetector:
             hope_recovery_path=["💙 基本的な愛のケア"],
             analysis_confidence=0.5,
             key_indicators=["⚠️ 分析エラーのため安全値使用"]
-        )
\ No newline at end of file
+        )
+
+
+class _StreamingTokens:
+    """ストリーミング単語集計 - チャンク境界で分断された語を連結して数える"""
+    
+    def __init__(self, boundary: re.Pattern):
+        self.boundary = boundary
+        self.counts: Counter = Counter()      # 確定した語 -> 出現回数
+        self.total = 0                        # 確定した語の総数
+        self._lengths: Counter = Counter()    # 確定した語（異なり）の長さ分布
+        self._pieces: List[str] = []          # 未確定の語（チャンクをまたぐ断片）
+        self._pending_length = 0
+    
+    def feed(self, text: str) -> List[str]:
+        """テキストを追加し、新たに確定した語を返す"""
+        parts = self.boundary.split(text)
+        completed = []
+        self._append(parts[0])
+        for part in parts[1:]:
+            if self._pending_length:
+                word = "".join(self._pieces)
+                completed.append(word)
+                if word not in self.counts:
+                    self._lengths[len(word)] += 1
+                self.counts[word] += 1
+                self.total += 1
+            self._pieces = []
+            self._pending_length = 0
+            self._append(part)
+        return completed
+    
+    def _append(self, piece: str):
+        if piece:
+            self._pieces.append(piece)
+            self._pending_length += len(piece)
+    
+    def pending(self) -> str:
+        """未確定の語（末尾の語）"""
+        return "".join(self._pieces)
+    
+    def pending_matches_known(self) -> bool:
+        """未確定の語が確定済みの語と一致するか（長さが一致する場合のみ連結して比較）"""
+        if not self._pending_length or not self._lengths.get(self._pending_length):
+            return False
+        return self.pending() in self.counts
+    
+    @property
+    def word_count(self) -> int:
+        """未確定の語を含む総語数"""
+        return self.total + (1 if self._pending_length else 0)
+    
+    @property
+    def unique_count(self) -> int:
+        """未確定の語を含む異なり語数"""
+        pending_is_new = self._pending_length and not self.pending_matches_known()
+        return len(self.counts) + (1 if pending_is_new else 0)
+
+
+class StreamingFractureScorer:
+    """ストリーミングフラクチャー評価器 - 生成途中のテキストを逐次スコアリング
+    
+    チャンクごとの増分だけを走査し、キーワード数・文構造・語の重複を累積する。
+    feed() の結果は、それまでの全テキストを analyze() した場合のメトリクスと一致する。
+    """
+    
+    def __init__(self, detector: FractureDetector, stability_slope: float, trend_direction: str):
+        self.detector = detector
+        self.stability_slope = stability_slope
+        self.trend_direction = trend_direction
+        
+        self._lexicon: LexiconStream = detector.lexicon.stream()
+        self._exclamation_count = 0
+        
+        # 文単位の状態（短い強感情文の検出）
+        self._sentence_count = 1
+        self._short_intense_sentences = 0
+        self._sentence = ""
+        self._sentence_long = False
+        
+        # 語単位の状態（否定語の反復・話題の一貫性）
+        self._words = _StreamingTokens(WORD_BOUNDARY)
+        self._topics = _StreamingTokens(TOPIC_BOUNDARY)
+        self._repeated_negative = 0
+        
+        self.metrics: Optional[FractureMetrics] = None
+        self.is_fractured = False
+    
+    @property
+    def length(self) -> int:
+        """これまでに受け取った文字数"""
+        return self._lexicon.length
+    
+    def feed(self, chunk: str) -> FractureMetrics:
+        """チャンクを追加して最新メトリクスを返す（is_fractured も更新）"""
+        text = self._lexicon.feed(chunk)
+        if text:
+            self._exclamation_count += text.count('!') + text.count('！')
+            self._feed_sentences(text)
+            for word, added in Counter(self._words.feed(text)).items():
+                self._count_word(word, added)
+            # 話題の一貫性は元のチャンクの語で数える（analyze と同じく大文字小文字を区別）
+            self._topics.feed(chunk)
+        
+        if text or self.metrics is None:
+            self.metrics = self._snapshot()
+            self.is_fractured = self.metrics.fracture_index >= self.detector.detection_threshold
+        return self.metrics
+    
+    def _feed_sentences(self, text: str):
+        parts = SENTENCE_BOUNDARY.split(text)
+        for i, part in enumerate(parts):
+            if i:
+                # 文の区切り: 直前の文を確定
+                if self._current_sentence_is_short_intense():
+                    self._short_intense_sentences += 1
+                self._sentence_count += 1
+                self._sentence = ""
+                self._sentence_long = False
+            if not self._sentence_long:
+                self._sentence += part
+                # 前後の空白を除いて10文字以上になった文は以後対象外（保持しない）
+                if len(self._sentence.strip()) >= 10:
+                    self._sentence_long = True
+                    self._sentence = ""
+    
+    def _current_sentence_is_short_intense(self) -> bool:
+        return (not self._sentence_long and len(self._sentence.strip()) < 10 and
+                any(p in self._sentence for p in INTENSE_AGGRESSION_WORDS))
+    
+    @staticmethod
+    def _is_negative_word(word: str) -> bool:
+        return any(p in word for p in REPEATED_NEGATIVE_WORDS)
+    
+    @staticmethod
+    def _repeat_contribution(count: int) -> int:
+        return count if count > 1 else 0
+    
+    def _count_word(self, word: str, added: int = 1):
+        """確定した語の反復否定語カウントを更新（added: このチャンクで確定した出現回数）"""
+        if self._is_negative_word(word):
+            count = self._words.counts[word]
+            self._repeated_negative += self._repeat_contribution(count) - self._repeat_contribution(count - added)
+    
+    def _current_repeated_negative(self) -> int:
+        if self._words.word_count <= 1:
+            return 0
+        repeated = self._repeated_negative
+        if self._words.pending_matches_known():
+            pending = self._words.pending()
+            if self._is_negative_word(pending):
+                count = self._words.counts[pending]
+                repeated += self._repeat_contribution(count + 1) - self._repeat_contribution(count)
+        return repeated
+    
+    def _snapshot(self) -> FractureMetrics:
+        detector = self.detector
+        if self.length:
+            short_intense = self._short_intense_sentences + (1 if self._current_sentence_is_short_intense() else 0)
+            row = detector._feature_row(
+                self._lexicon, self._exclamation_count, short_intense, self._current_repeated_negative()
+            )
+        else:
+            row = detector._empty_feature_row()
+        scores = detector._score_feature_row(row)
+        
+        cognitive_coherence = detector._coherence_score(
+            self._sentence_count, self._lexicon.distinct("connector"),
+            self._topics.unique_count, self._topics.word_count
+        )
+        
+        return FractureMetrics(
+            fracture_index=detector._compose_fracture_index(
+                scores["aggression_bias"], scores["self_collapse_score"],
+                scores["hope_kernel_score"], self.stability_slope
+            ),
+            aggression_bias=scores["aggression_bias"],
+            self_collapse_score=scores["self_collapse_score"],
+            stability_slope=self.stability_slope,
+            hope_kernel_score=scores["hope_kernel_score"],
+            emotional_volatility=scores["emotional_volatility"],
+            cognitive_coherence=cognitive_coherence,
+            social_connection_level=scores["social_connection_level"],
+            self_care_capacity=scores["self_care_capacity"],
+            trend_direction=self.trend_direction,
+            last_updated=datetime.now()
+        )
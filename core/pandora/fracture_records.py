@@ -0,0 +1,178 @@
+# 🧊 コンパクト分析レコード - Compact Fracture Records
+"""
+監視用に長期保持するフラクチャー分析結果の省メモリ版
+
+- __slots__ + 不変（frozen）
+- 数値メトリクスは array('d') に詰めて保持（float オブジェクトを作らない）
+- 回復経路・主要指標の文字列は intern し、共有タプルとして保持
+- datetime の代わりに epoch 秒（float）を保持
+"""
+
+from typing import Dict, Optional, Tuple
+from array import array
+from datetime import datetime
+import sys
+
+from .fracture_detection import (
+    FractureMetrics, FractureAnalysis, FractureType, FractureSeverity,
+    HOPE_RECOVERY_PATHS, BASIC_RECOVERY_PATH, INDIVIDUAL_RECOVERY_PATH,
+)
+
+# 配列に詰める数値メトリクス（順序固定）
+METRIC_FIELDS = (
+    "fracture_index", "aggression_bias", "self_collapse_score", "stability_slope",
+    "hope_kernel_score", "emotional_volatility", "cognitive_coherence",
+    "social_connection_level", "self_care_capacity",
+)
+_LAST_UPDATED = len(METRIC_FIELDS)
+
+ANALYSIS_FIELDS = ("transformation_urgency", "recommended_care_level", "analysis_confidence")
+
+# 共有タプルのインターン表（上限付き）
+_MAX_INTERNED_TUPLES = 4096
+_interned_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {
+    path: path for path in (*HOPE_RECOVERY_PATHS.values(), BASIC_RECOVERY_PATH, INDIVIDUAL_RECOVERY_PATH)
+}
+
+
+def intern_strings(values) -> Tuple[str, ...]:
+    """文字列列を intern した共有タプルに変換"""
+    key = tuple(sys.intern(value) for value in values)
+    shared = _interned_tuples.get(key)
+    if shared is not None:
+        return shared
+    if len(_interned_tuples) < _MAX_INTERNED_TUPLES:
+        _interned_tuples[key] = key
+    return key
+
+
+class _FrozenRecord:
+    """不変レコードの共通処理"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} は不変です")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} は不変です")
+
+
+class CompactFractureMetrics(_FrozenRecord):
+    """FractureMetrics の省メモリ・不変版"""
+
+    __slots__ = ("_values", "trend_direction")
+
+    def __init__(self, values, trend_direction: str, last_updated: float):
+        packed = array("d", values)
+        if len(packed) != len(METRIC_FIELDS):
+            raise ValueError(f"メトリクス数が不正です: {len(packed)}")
+        packed.append(last_updated)
+        object.__setattr__(self, "_values", packed)
+        object.__setattr__(self, "trend_direction", sys.intern(trend_direction))
+
+    @classmethod
+    def from_metrics(cls, metrics: FractureMetrics) -> "CompactFractureMetrics":
+        return cls(
+            [getattr(metrics, name) for name in METRIC_FIELDS],
+            metrics.trend_direction,
+            metrics.last_updated.timestamp(),
+        )
+
+    @property
+    def last_updated(self) -> float:
+        """最終更新時刻（epoch 秒）"""
+        return self._values[_LAST_UPDATED]
+
+    def to_metrics(self) -> FractureMetrics:
+        """通常の FractureMetrics に復元"""
+        return FractureMetrics(
+            **{name: self._values[i] for i, name in enumerate(METRIC_FIELDS)},
+            trend_direction=self.trend_direction,
+            last_updated=datetime.fromtimestamp(self.last_updated),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactFractureMetrics):
+            return NotImplemented
+        return self._values == other._values and self.trend_direction == other.trend_direction
+
+    def __hash__(self):
+        return hash((self._values.tobytes(), self.trend_direction))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={self._values[i]:.3f}" for i, name in enumerate(METRIC_FIELDS))
+        return f"CompactFractureMetrics({fields}, trend_direction={self.trend_direction!r})"
+
+
+class CompactFractureAnalysis(_FrozenRecord):
+    """FractureAnalysis の省メモリ・不変版"""
+
+    __slots__ = (
+        "is_fractured", "fracture_type", "severity", "metrics", "_values",
+        "hope_recovery_path", "key_indicators",
+    )
+
+    def __init__(self, is_fractured: bool, fracture_type: Optional[FractureType],
+                 severity: FractureSeverity, metrics: CompactFractureMetrics,
+                 transformation_urgency: float, recommended_care_level: float,
+                 analysis_confidence: float, hope_recovery_path, key_indicators):
+        object.__setattr__(self, "is_fractured", bool(is_fractured))
+        object.__setattr__(self, "fracture_type", fracture_type)
+        object.__setattr__(self, "severity", severity)
+        object.__setattr__(self, "metrics", metrics)
+        object.__setattr__(self, "_values", array("d", (
+            transformation_urgency, recommended_care_level, analysis_confidence
+        )))
+        object.__setattr__(self, "hope_recovery_path", intern_strings(hope_recovery_path))
+        object.__setattr__(self, "key_indicators", intern_strings(key_indicators))
+
+    @classmethod
+    def from_analysis(cls, analysis: FractureAnalysis) -> "CompactFractureAnalysis":
+        return cls(
+            is_fractured=analysis.is_fractured,
+            fracture_type=analysis.fracture_type,
+            severity=analysis.severity,
+            metrics=CompactFractureMetrics.from_metrics(analysis.metrics),
+            transformation_urgency=analysis.transformation_urgency,
+            recommended_care_level=analysis.recommended_care_level,
+            analysis_confidence=analysis.analysis_confidence,
+            hope_recovery_path=analysis.hope_recovery_path,
+            key_indicators=analysis.key_indicators,
+        )
+
+    def to_analysis(self) -> FractureAnalysis:
+        """通常の FractureAnalysis に復元"""
+        return FractureAnalysis(
+            is_fractured=self.is_fractured,
+            fracture_type=self.fracture_type,
+            severity=self.severity,
+            metrics=self.metrics.to_metrics(),
+            transformation_urgency=self.transformation_urgency,
+            recommended_care_level=self.recommended_care_level,
+            hope_recovery_path=list(self.hope_recovery_path),
+            analysis_confidence=self.analysis_confidence,
+            key_indicators=list(self.key_indicators),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactFractureAnalysis):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash((self.metrics, self._values.tobytes(), self.fracture_type, self.key_indicators))
+
+    def __repr__(self):
+        return (f"CompactFractureAnalysis(is_fractured={self.is_fractured}, "
+                f"fracture_type={self.fracture_type}, severity={self.severity}, metrics={self.metrics!r})")
+
+
+def _float_field(index: int) -> property:
+    return property(lambda self: self._values[index])
+
+
+for _index, _name in enumerate(METRIC_FIELDS):
+    setattr(CompactFractureMetrics, _name, _float_field(_index))
+for _index, _name in enumerate(ANALYSIS_FIELDS):
+    setattr(CompactFractureAnalysis, _name, _float_field(_index))
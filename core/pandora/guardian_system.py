@@ -5,16 +5,70 @@ SaijinOS Pandora Guardian System
 import logging
 import time
 import json
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Iterable, Optional
 from datetime import datetime
 from enum import Enum
 
+# エラーとみなすキーワード（スナップショット分析・イベントストリーム共通）
+ERROR_KEYWORDS = ("error", "warning", "critical", "fail")
+
 class SealState(Enum):
     """封印状態定義"""
     NORMAL = "normal"
     SEALED = "sealed"
     EMERGENCY = "emergency"
 
+class RollingWindow:
+    """直近 window_seconds 秒のイベント数・エラー数（1秒単位のリングバッファ）
+
+    記録・集計とも O(1)（経過した古いバケットは進めるときに1回だけ消す）
+    """
+    
+    def __init__(self, window_seconds: int):
+        self.window_seconds = max(1, int(window_seconds))
+        self._events = [0] * self.window_seconds
+        self._errors = [0] * self.window_seconds
+        self._head = None      # 最新バケットの秒
+        self.events = 0        # 窓内の合計
+        self.errors = 0
+    
+    def _advance(self, second: int):
+        if self._head is None:
+            self._head = second
+            return
+        if second <= self._head:
+            return
+        # 経過した秒のバケットを消す（窓を超えた分はまとめて全消去）
+        for expired in range(self._head + 1, min(second, self._head + self.window_seconds) + 1):
+            index = expired % self.window_seconds
+            self.events -= self._events[index]
+            self.errors -= self._errors[index]
+            self._events[index] = 0
+            self._errors[index] = 0
+        self._head = second
+    
+    def record(self, timestamp: float, is_error: bool):
+        second = int(timestamp)
+        self._advance(second)
+        if second <= self._head - self.window_seconds:
+            return   # 窓より古いイベントは無視
+        index = second % self.window_seconds
+        self._events[index] += 1
+        self.events += 1
+        if is_error:
+            self._errors[index] += 1
+            self.errors += 1
+    
+    def snapshot(self, timestamp: float) -> Dict[str, float]:
+        self._advance(int(timestamp))
+        return {
+            "events": self.events,
+            "errors": self.errors,
+            "error_rate": self.errors / self.events if self.events else 0.0,
+            "events_per_second": self.events / self.window_seconds,
+        }
+
 class PandoraGuardianSystem:
     """パンドラ危機管理システム（安全版）"""
     
@@ -22,16 +76,29 @@ class PandoraGuardianSystem:
         self.logger = logging.getLogger("[PANDORA-GUARDIAN]")
         self.seal_state = SealState.NORMAL
         self.crisis_level = 0
-        self.seal_history = []
         self.last_check = datetime.now()
         
         # 安全な初期設定
         self.config = {
             "crisis_threshold": 0.7,
             "seal_duration": 30,  # seconds
-            "max_history": 100
+            "max_history": 100,
+            "window_seconds": 60,   # イベントストリームの集計窓
+            "sustain_seconds": 10,  # 閾値超えがこの秒数続いたら封印
+            "min_events": 20,       # 窓内のイベントがこれ未満なら判定しない
+            "max_sources": 256      # 追跡する送信元の上限（古いものから破棄）
         }
         
+        # 封印履歴（上限付き・追記 O(1)）
+        self.seal_history = deque(maxlen=self.config["max_history"])
+        
+        # イベントストリームの集計（全体 + 送信元ごと）
+        self.event_window = RollingWindow(self.config["window_seconds"])
+        self.source_windows: "OrderedDict[str, RollingWindow]" = OrderedDict()
+        self.breach_started: Optional[float] = None   # 閾値超えが始まった時刻
+        self.source_breaches: Dict[str, float] = {}     # 送信元ごとの閾値超え開始時刻
+        self.last_event_time: Optional[float] = None   # 取り込んだイベントの最新時刻
+        
         self.logger.info("🌸 パンドラ危機管理システム初期化完了")
     
     def get_status(self) -> Dict[str, Any]:
@@ -64,12 +131,10 @@ class PandoraGuardianSystem:
             total_checks = 0
             
             # 安全なキーチェック
-            error_keywords = ["error", "warning", "critical", "fail"]
-            
             for key, value in data.items():
                 if isinstance(key, str) and isinstance(value, str):
                     total_checks += 1
-                    if any(keyword in value.lower() for keyword in error_keywords):
+                    if any(keyword in value.lower() for keyword in ERROR_KEYWORDS):
                         crisis_indicators += 1
             
             if total_checks == 0:
@@ -84,6 +149,110 @@ class PandoraGuardianSystem:
             self.logger.error(f"危機分析エラー: {e}")
             return 0.0
     
+    def ingest_event(self, event: Dict[str, Any], timestamp: Optional[float] = None) -> float:
+        """イベントストリームの1件を取り込み、直近の窓のエラー率（危機レベル）を返す
+        
+        event: {"source": 送信元, "is_error": bool} または文字列値（キーワードでエラー判定）を持つ dict
+        timestamp: 秒（省略時は event["timestamp"]、無ければ現在時刻）
+        全体または1つの送信元のエラー率が crisis_threshold 以上の状態が sustain_seconds 続くと封印を発動する
+        """
+        try:
+            if not isinstance(event, dict):
+                return self.crisis_level
+            if timestamp is None:
+                event_time = event.get("timestamp")
+                timestamp = event_time if isinstance(event_time, (int, float)) else time.time()
+            
+            is_error = event.get("is_error")
+            if is_error is None:
+                is_error = any(
+                    isinstance(value, str) and any(keyword in value.lower() for keyword in ERROR_KEYWORDS)
+                    for key, value in event.items() if key != "source"
+                )
+            
+            source = str(event.get("source", "unknown"))
+            window = self.source_windows.get(source)
+            if window is None:
+                window = RollingWindow(self.config["window_seconds"])
+                self.source_windows[source] = window
+                if len(self.source_windows) > self.config["max_sources"]:
+                    evicted, _ = self.source_windows.popitem(last=False)
+                    self.source_breaches.pop(evicted, None)
+            else:
+                self.source_windows.move_to_end(source)
+            window.record(timestamp, bool(is_error))
+            self.event_window.record(timestamp, bool(is_error))
+            if self.last_event_time is None or timestamp > self.last_event_time:
+                self.last_event_time = timestamp
+            
+            stats = self.event_window.snapshot(timestamp)
+            self.crisis_level = min(stats["error_rate"], 1.0)
+            self._check_sustained_errors(timestamp, stats, source, window.snapshot(timestamp))
+            return self.crisis_level
+        
+        except Exception as e:
+            self.logger.error(f"イベント取り込みエラー: {e}")
+            return self.crisis_level
+    
+    def ingest_events(self, events: Iterable[Dict[str, Any]]) -> float:
+        """イベントをまとめて取り込み、最後の危機レベルを返す"""
+        for event in events:
+            self.ingest_event(event)
+        return self.crisis_level
+    
+    def _check_sustained_errors(self, timestamp: float, stats: Dict[str, float], source: str,
+                                source_stats: Dict[str, float]):
+        """全体または送信元の閾値超えが sustain_seconds 続いたら封印（単発のスパイクでは封印しない）
+        
+        送信元ごとにも判定するため、多数の正常な送信元に1つの壊れた送信元が埋もれても検知できる
+        """
+        overall_started, self.breach_started = self.breach_started, self._breach_start(
+            self.breach_started, timestamp, stats
+        )
+        previous_source_started = self.source_breaches.pop(source, None)
+        source_started = self._breach_start(previous_source_started, timestamp, source_stats)
+        if source_started is not None:
+            self.source_breaches[source] = source_started
+        
+        # 閾値超えが始まったイベント自体では封印しない
+        if self.seal_state != SealState.NORMAL:
+            return
+        sustain_seconds = self.config["sustain_seconds"]
+        if overall_started is not None and self.breach_started is not None and (
+                timestamp - self.breach_started >= sustain_seconds):
+            self.activate_seal(
+                f"持続的なエラー率 {stats['error_rate']:.0%}（{sustain_seconds}秒以上・直近: {source}）"
+            )
+        elif previous_source_started is not None and source_started is not None and (
+                timestamp - source_started >= sustain_seconds):
+            self.activate_seal(
+                f"送信元 {source} の持続的なエラー率 {source_stats['error_rate']:.0%}（{sustain_seconds}秒以上）"
+            )
+    
+    def _breach_start(self, started: Optional[float], timestamp: float,
+                      stats: Dict[str, float]) -> Optional[float]:
+        """閾値超えの開始時刻（イベント不足・閾値未満なら None）"""
+        if stats["events"] < self.config["min_events"] or stats["error_rate"] < self.config["crisis_threshold"]:
+            return None
+        return timestamp if started is None else started
+    
+    def get_event_stats(self, limit: int = 10) -> Dict[str, Any]:
+        """直近の窓の集計（全体 + エラー率の高い送信元）
+        
+        窓の終端は取り込んだイベントの最新時刻（過去ログの再生でも窓が空にならない）
+        """
+        now = self.last_event_time if self.last_event_time is not None else time.time()
+        sources = {source: window.snapshot(now) for source, window in self.source_windows.items()}
+        top_sources = sorted(sources.items(), key=lambda item: item[1]["error_rate"], reverse=True)
+        return {
+            "window_seconds": self.config["window_seconds"],
+            "overall": self.event_window.snapshot(now),
+            "sources": dict(top_sources[:max(1, limit)]),
+            "tracked_sources": len(sources),
+            "breach_started": self.breach_started,
+            "seal_state": self.seal_state.value
+        }
+    
     def activate_seal(self, reason: str = "自動検知") -> Dict[str, Any]:
         """封印発動（安全版）"""
         try:
@@ -104,13 +273,8 @@ class PandoraGuardianSystem:
                 "crisis_level": self.crisis_level
             }
             
-            # 安全なリスト操作
-            if isinstance(self.seal_history, list):
-                self.seal_history.append(seal_record)
-                
-                # 履歴制限（メモリ保護）
-                if len(self.seal_history) > self.config["max_history"]:
-                    self.seal_history = self.seal_history[-self.config["max_history"]:]
+            # 履歴制限（メモリ保護）は deque の maxlen で行う
+            self.seal_history.append(seal_record)
             
             self.logger.info(f"🛡️ パンドラ封印発動: {reason}")
             
@@ -162,14 +326,10 @@ class PandoraGuardianSystem:
     def get_seal_history(self, limit: int = 10) -> Dict[str, Any]:
         """封印履歴取得（安全版）"""
         try:
-            # 安全な型チェック
-            if not isinstance(self.seal_history, list):
-                self.seal_history = []
-            
             # 安全なlimit値
             safe_limit = max(1, min(limit, 50))
             
-            recent_history = self.seal_history[-safe_limit:] if self.seal_history else []
+            recent_history = list(self.seal_history)[-safe_limit:]
             
             return {
                 "success": True,
@@ -198,8 +358,7 @@ class PandoraGuardianSystem:
                 "mode": "emergency"
             }
             
-            if isinstance(self.seal_history, list):
-                self.seal_history.append(emergency_record)
+            self.seal_history.append(emergency_record)
             
             self.logger.warning("🚨 パンドラ緊急モード発動")
             
@@ -8,7 +8,7 @@ SaijinOS Part 10 準拠:
 "What were they trying to protect?"
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
@@ -16,6 +16,9 @@ import logging
 import re
 from datetime import datetime
 
+from .lexicon_engine import CompiledLexicon
+from .text_features import TextFeatures
+
 logger = logging.getLogger(__name__)
 
 class HopeExtractionMethod(Enum):
@@ -63,6 +66,55 @@ class NarrativeReframe:
     hope_perspective: str       # 希望の視点
     healing_metaphor: str       # 癒しのメタファー
 
+class HopeFeatures:
+    """希望抽出用特徴ベクトル - 入力を1回だけ走査した結果
+    
+    各派生フィールド（original_intent, core_value, hidden_wish, love_language,
+    safety_requirement, key_words 等）はすべてこの特徴から読み出す。
+    """
+    
+    __slots__ = ("text", "length", "word_count", "keywords", "_first", "_distinct", "_category_map")
+    
+    def __init__(self, text: str, length: int, keywords: FrozenSet[str], lexicon: CompiledLexicon):
+        self.text = text                      # 正規化済み（小文字化）テキスト
+        self.length = length                  # 元入力の文字数
+        self.word_count = len(text.split())   # 空白区切りの語数
+        self.keywords = keywords              # 出現したキーワード集合
+        self._category_map = lexicon.categories
+        
+        # カテゴリ → (定義順で最初に出現したキーワードの順位, キーワード) / 出現種類数
+        first: Dict[str, Tuple[int, str]] = {}
+        distinct: Dict[str, int] = {}
+        for keyword in keywords:
+            for category, rank in lexicon.memberships.get(keyword, ()):
+                distinct[category] = distinct.get(category, 0) + 1
+                current = first.get(category)
+                if current is None or rank < current[0]:
+                    first[category] = (rank, keyword)
+        self._first = first
+        self._distinct = distinct
+    
+    def any(self, category: str) -> bool:
+        """カテゴリ内のキーワードが1つでも含まれているか"""
+        return category in self._first
+    
+    def first(self, category: str) -> Optional[str]:
+        """カテゴリ内で定義順最初に含まれるキーワード"""
+        hit = self._first.get(category)
+        return hit[1] if hit else None
+    
+    def distinct(self, category: str) -> int:
+        """カテゴリ内で含まれるキーワードの種類数"""
+        return self._distinct.get(category, 0)
+    
+    def present(self, category: str) -> List[str]:
+        """カテゴリ内で含まれるキーワード（定義順）"""
+        if category not in self._first:
+            return []
+        keywords = self.keywords
+        return [kw for kw in self._category_map[category] if kw in keywords]
+
+
 class HopeExtractor:
     """希望核抽出器 - パンドラちゃんの核心機能"""
     
@@ -103,6 +155,66 @@ class HopeExtractor:
             "貢献・奉仕": ["役立つ", "助ける", "貢献", "奉仕", "意味"]
         }
         
+        # 感情 → 価値（核心価値指標が無い場合の推測）
+        self.emotion_to_value = {
+            "怒り": "正義と公平性",
+            "悲しみ": "愛とつながり",
+            "不安": "安全と安心",
+            "喜び": "創造と表現",
+            "恐れ": "安全と保護"
+        }
+        
+        # 核心価値別の隠された願い
+        self.value_to_wish = {
+            "正義": "公平で正しい世界で、皆が等しく尊重される世界を見たい",
+            "自由": "制約されずに自分らしく生き、選択の自由を持ちたい", 
+            "愛・つながり": "深く愛され、理解され、大切にされる関係を築きたい",
+            "安全・安心": "平安で予測可能な環境で、安心して生活したい",
+            "成長・学習": "常に成長し続け、新しいことを学び、進歩していきたい",
+            "創造・表現": "美しいものを創造し、自分の才能を世界に表現したい",
+            "貢献・奉仕": "他者の役に立ち、世界をより良い場所にしたい"
+        }
+        
+        # 明示的な保護対象
+        self.protection_indicators = {
+            "家族": "愛する家族の幸せと安全",
+            "友達": "大切な友人関係",
+            "仕事": "自分の役割と責任",
+            "夢": "将来への希望と可能性",
+            "プライド": "自分の尊厳と価値",
+            "平和": "心の平安と調和",
+            "自由": "自分らしさと選択の権利"
+        }
+        
+        # つながりのタイプ
+        self.connection_patterns = {
+            "理解": "深く理解し合える知的・感情的つながり",
+            "支え": "互いに支え合える相互依存的な関係",
+            "共有": "興味や価値観を共有できる仲間とのつながり",
+            "愛": "無条件に愛し愛される親密な関係",
+            "尊重": "互いを尊重し合える対等な関係",
+            "安全": "安心して自分を表現できる安全な関係",
+            "成長": "共に成長し刺激し合える発展的な関係"
+        }
+        
+        # 5つの愛の言語パターン
+        self.love_language_patterns = {
+            "言葉": ["褒めて", "認めて", "ありがとう", "言葉", "評価"],
+            "時間": ["一緒に", "時間", "話を聞いて", "付き合って", "そばに"],
+            "奉仕": ["手伝って", "助けて", "やってくれる", "サポート", "世話"],
+            "贈り物": ["プレゼント", "もらう", "贈り物", "記念", "形に残る"],
+            "スキンシップ": ["抱きしめて", "触れて", "近く", "手を握って", "スキンシップ"]
+        }
+        
+        # 安全のタイプ
+        self.safety_patterns = {
+            "物理的": ["怪我", "危険", "身体", "安全", "保護"],
+            "感情的": ["傷つく", "心", "感情", "優しく", "大切に"],
+            "社会的": ["居場所", "受け入れ", "排除", "仲間", "所属"],
+            "経済的": ["お金", "安定", "将来", "保障", "生活"],
+            "心理的": ["安心", "予測", "信頼", "確実", "安定"]
+        }
+        
         # リフレーミング用テンプレート
         self.reframe_templates = {
             "protective_anger": "あなたの怒りは、大切なもの（{value}）を守ろうとする愛の表現ですね。",
@@ -112,114 +224,162 @@ class HopeExtractor:
             "perfectionist_pain": "あなたの完璧主義は、{excellence_value}への深い愛の表れですね。"
         }
         
+        # 全辞書を統合した単一パス照合器
+        self.lexicon = self._compile_lexicon()
+        
         logger.info(f"💎 {self.name}: 希望核抽出システム初期化完了")
     
+    def _compile_lexicon(self) -> CompiledLexicon:
+        """全パターン表から統合辞書（単一パス照合器）を構築"""
+        categories = {
+            "direct_hope": ["したい", "ほしい", "なりたい", "になりたい", "求めている", "願う"],
+            "rage": self.rage_to_hope_patterns,
+            "collapse": self.collapse_to_hope_patterns,
+            "learning_question": ["どうすれば", "どうやって", "方法", "やり方", "教えて"],
+            "negation": ["ない", "じゃない"],
+            "protection": self.protection_indicators,
+            "protect_justice": ["怒り", "イライラ", "むかつく"],
+            "protect_sensitivity": ["悲しい", "つらい", "苦しい"],
+            "protect_environment": ["不安", "心配", "怖い"],
+            "protect_connection": ["孤独", "寂しい", "ひとり"],
+            "value_emotion": self.emotion_to_value,
+            "wish_intense": ["とても", "すごく", "本当に", "心から"],
+            "wish_quiet": ["少し", "ちょっと", "なんとなく"],
+            "connection": self.connection_patterns,
+            "connection_lonely": ["孤独", "ひとり", "寂しい"],
+            "connection_misunderstood": ["理解されない", "分かってもらえない"],
+            "love_words": ["認めて", "評価", "褒めて"],
+            "love_time": ["そばに", "一緒", "話を聞いて"],
+            "safety_anxiety": ["不安", "心配", "怖い"],
+            "method_aggressive": ["むかつく", "うざい", "死ね", "嫌い"],
+            "method_collapse": ["死にたい", "消えたい", "だめ", "無価値"],
+            "method_value": ["大切", "重要", "価値", "意味", "目的"],
+            "reframe_intense": ["とても", "すごく", "本当に"],
+            "reframe_quiet": ["少し", "ちょっと"],
+            "high_care": ["死にたい", "消えたい", "だめ", "無価値", "つらい", "苦しい"],
+            "medium_care": ["困っている", "分からない", "不安", "心配"],
+            "reflective": ["思う", "感じる", "考える"],
+            "key_emotion": ["嬉しい", "悲しい", "怒り", "不安", "楽しい", "つらい", "苦しい"],
+            "key_value": ["大切", "重要", "価値", "意味", "愛", "自由", "正義", "安全"],
+            "key_action": ["したい", "なりたい", "守る", "作る", "学ぶ", "成長"],
+        }
+        
+        # 価値・愛の言語・安全タイプは (ラベル, カテゴリ名) を定義順に保持
+        self._value_categories = tuple((value, f"value:{value}") for value in self.core_value_indicators)
+        self._love_categories = tuple((language, f"love:{language}") for language in self.love_language_patterns)
+        self._safety_categories = tuple((safety_type, f"safety:{safety_type}") for safety_type in self.safety_patterns)
+        for value, category in self._value_categories:
+            categories[category] = self.core_value_indicators[value]
+        for language, category in self._love_categories:
+            categories[category] = self.love_language_patterns[language]
+        for safety_type, category in self._safety_categories:
+            categories[category] = self.safety_patterns[safety_type]
+        return CompiledLexicon(categories)
+    
+    def rebuild_lexicon(self):
+        """パターン表変更後に統合辞書を再コンパイル"""
+        self.lexicon = self._compile_lexicon()
+    
+    def extract_features(self, user_input: str,
+                         text_features: Optional[TextFeatures] = None) -> HopeFeatures:
+        """入力を統合辞書で1回だけ走査して特徴ベクトルを作成
+        
+        text_features: パイプラインで計算済みの共有テキスト特徴（指定時は再走査しない）
+        """
+        if text_features is not None:
+            return HopeFeatures(text_features.normalized, text_features.length,
+                                text_features.keywords, self.lexicon)
+        text = user_input.lower() if user_input else ""
+        return HopeFeatures(text, len(user_input) if user_input else 0,
+                            self.lexicon.present(text), self.lexicon)
+    
     async def extract_hope(self, user_input: str, persona_state: Dict, 
-                          fracture_analysis: Optional[Dict] = None) -> HopeKernel:
+                          fracture_analysis: Optional[Dict] = None,
+                          text_features: Optional[TextFeatures] = None) -> HopeKernel:
         """メイン希望抽出関数"""
+        return self.extract_hope_sync(user_input, persona_state, fracture_analysis, text_features)
+    
+    def extract_hope_sync(self, user_input: str, persona_state: Dict,
+                          fracture_analysis: Optional[Dict] = None,
+                          text_features: Optional[TextFeatures] = None) -> HopeKernel:
+        """希望抽出（同期版・イベントループ不要）"""
         logger.info("💎 希望核抽出開始...")
         
         try:
-            # 感情考古学: 表面的な感情の奥を探る
-            original_intent = await self._excavate_original_intent(user_input, persona_state)
-            
-            # 保護意図分析: 何を守ろうとしているか
-            protective_desire = await self._analyze_protective_intent(user_input, persona_state)
+            features = self.extract_features(user_input, text_features)
+            hope_kernel = self._build_hope_kernel(features, persona_state, fracture_analysis)
             
-            # 核心価値発掘: その人が大切にしているもの
-            core_value = await self._excavate_core_value(user_input, persona_state)
-            
-            # 隠された願い: 本当は何を望んでいるか
-            hidden_wish = await self._discover_hidden_wish(user_input, persona_state, core_value)
-            
-            # つながりの欲求: どんなつながりを求めているか
-            connection_need = await self._analyze_connection_need(user_input, persona_state)
-            
-            # 愛の言語: どう愛されたいか
-            love_language = await self._identify_love_language(user_input, persona_state)
-            
-            # 安全への要求: どんな安全を求めているか
-            safety_requirement = await self._assess_safety_needs(user_input, persona_state)
-            
-            # 最適な抽出手法決定
-            extraction_method = await self._determine_extraction_method(
-                user_input, persona_state, fracture_analysis
-            )
-            
-            # 変換経路設計
-            transformation_path = await self._design_transformation_path(
-                original_intent, protective_desire, core_value
-            )
-            
-            # リフレーミング実行
-            reframed_expression = await self._create_reframed_expression(
-                user_input, original_intent, core_value
-            )
-            
-            # ケアメッセージ作成
-            care_message = await self._compose_care_message(
-                original_intent, protective_desire, hidden_wish
-            )
-            
-            # メトリクス計算
-            hope_strength = await self._calculate_hope_strength(
-                original_intent, core_value, hidden_wish
-            )
-            care_level = await self._calculate_care_level(user_input, persona_state)
-            confidence_score = await self._calculate_confidence(user_input, persona_state)
-            
-            # キーワード抽出
-            key_words = await self._extract_key_words(
-                user_input, original_intent, protective_desire
-            )
-            
-            hope_kernel = HopeKernel(
-                original_intent=original_intent,
-                protective_desire=protective_desire,
-                core_value=core_value,
-                hidden_wish=hidden_wish,
-                connection_need=connection_need,
-                love_language=love_language,
-                safety_requirement=safety_requirement,
-                transformation_path=transformation_path,
-                care_level=care_level,
-                hope_strength=hope_strength,
-                extraction_method=extraction_method,
-                confidence_score=confidence_score,
-                key_words=key_words,
-                reframed_expression=reframed_expression,
-                care_message=care_message
-            )
-            
-            logger.info(f"💎 希望核抽出完了: 「{original_intent}」← 「{protective_desire}」")
+            logger.info(f"💎 希望核抽出完了: 「{hope_kernel.original_intent}」← 「{hope_kernel.protective_desire}」")
             return hope_kernel
-            
+        
         except Exception as e:
             logger.error(f"💎 希望抽出エラー: {e}")
-            return await self._create_safe_hope_kernel(user_input)
+            return self._create_safe_hope_kernel(user_input)
+    
+    def _build_hope_kernel(self, features: HopeFeatures, persona_state: Dict,
+                           fracture_analysis: Optional[Dict] = None) -> HopeKernel:
+        """特徴ベクトルから全フィールドを導出"""
+        # 感情考古学: 表面的な感情の奥を探る
+        original_intent = self._excavate_original_intent(features)
+        
+        # 保護意図分析: 何を守ろうとしているか
+        protective_desire = self._analyze_protective_intent(features)
+        
+        # 核心価値発掘: その人が大切にしているもの
+        core_value = self._excavate_core_value(features)
+        
+        # 隠された願い: 本当は何を望んでいるか
+        hidden_wish = self._discover_hidden_wish(features, core_value)
+        
+        # 変換情報・メトリクス
+        transformation_path = self._design_transformation_path(
+            original_intent, protective_desire, core_value
+        )
+        
+        return HopeKernel(
+            original_intent=original_intent,
+            protective_desire=protective_desire,
+            core_value=core_value,
+            hidden_wish=hidden_wish,
+            connection_need=self._analyze_connection_need(features),
+            love_language=self._identify_love_language(features),
+            safety_requirement=self._assess_safety_needs(features),
+            transformation_path=transformation_path,
+            care_level=self._calculate_care_level(features),
+            hope_strength=self._calculate_hope_strength(original_intent, core_value, hidden_wish),
+            extraction_method=self._determine_extraction_method(features, fracture_analysis),
+            confidence_score=self._calculate_confidence(features),
+            key_words=self._extract_key_words(features),
+            reframed_expression=self._create_reframed_expression(features, original_intent, core_value),
+            care_message=self._compose_care_message(original_intent, protective_desire, hidden_wish)
+        )
     
     async def reframe_pattern(self, user_input: str, hope_kernel: HopeKernel) -> NarrativeReframe:
         """care-oriented narrativeにリフレーミング"""
+        return self.reframe_pattern_sync(user_input, hope_kernel)
+    
+    def reframe_pattern_sync(self, user_input: str, hope_kernel: HopeKernel) -> NarrativeReframe:
+        """物語のリフレーミング（同期版・イベントループ不要）"""
         logger.info("💎 物語のリフレーミング開始...")
         
         # 元の物語を抽出
-        original_narrative = await self._extract_original_narrative(user_input)
+        original_narrative = self._extract_original_narrative(user_input)
         
         # ケア志向の物語に変換
-        care_oriented_narrative = await self._create_care_narrative(
+        care_oriented_narrative = self._create_care_narrative(
             original_narrative, hope_kernel
         )
         
         # 変換の物語（メタ物語）
-        transformation_story = await self._create_transformation_story(
+        transformation_story = self._create_transformation_story(
             original_narrative, care_oriented_narrative, hope_kernel
         )
         
         # 希望の視点
-        hope_perspective = await self._create_hope_perspective(hope_kernel)
+        hope_perspective = self._create_hope_perspective(hope_kernel)
         
         # 癒しのメタファー
-        healing_metaphor = await self._create_healing_metaphor(hope_kernel)
+        healing_metaphor = self._create_healing_metaphor(hope_kernel)
         
         return NarrativeReframe(
             original_narrative=original_narrative,
@@ -231,280 +391,200 @@ class HopeExtractor:
     
     # === 核心抽出メソッド ===
     
-    async def _excavate_original_intent(self, user_input: str, persona_state: Dict) -> str:
+    def _excavate_original_intent(self, features: HopeFeatures) -> str:
         """感情考古学: 本当に表現したかったことを発掘"""
-        if not user_input:
+        if not features.text:
             return "理解と受容を求めている"
         
-        text = user_input.lower()
-        
         # 直接的な希望表現を探す
-        direct_hopes = [
-            "したい", "ほしい", "なりたい", "になりたい", "求めている", "願う"
-        ]
-        for hope in direct_hopes:
-            if hope in text:
-                # 希望の前後の文脈を抽出
-                hope_context = self._extract_context_around_word(text, hope)
-                return f"「{hope_context}」という願いを叶えたいと思っている"
+        hope = features.first("direct_hope")
+        if hope:
+            # 希望の前後の文脈を抽出
+            hope_context = self._extract_context_around_word(features.text, hope)
+            return f"「{hope_context}」という願いを叶えたいと思っている"
         
         # 怒りの奥の希望を探る
-        for rage_word, hidden_hope in self.rage_to_hope_patterns.items():
-            if rage_word in text:
-                return hidden_hope
+        rage_word = features.first("rage")
+        if rage_word:
+            return self.rage_to_hope_patterns[rage_word]
         
         # 崩壊の奥の希望を探る
-        for collapse_word, hidden_hope in self.collapse_to_hope_patterns.items():
-            if collapse_word in text:
-                return hidden_hope
+        collapse_word = features.first("collapse")
+        if collapse_word:
+            return self.collapse_to_hope_patterns[collapse_word]
         
         # 質問形式から学習意欲を抽出
-        question_patterns = ["どうすれば", "どうやって", "方法", "やり方", "教えて"]
-        for pattern in question_patterns:
-            if pattern in text:
-                return "学び成長したい、正しい方法を知りたい"
+        if features.any("learning_question"):
+            return "学び成長したい、正しい方法を知りたい"
         
         # 否定文の奥の肯定的願いを探る
-        if "ない" in text or "じゃない" in text:
+        if features.any("negation"):
             return "もっと良い状況を作りたい、改善したい"
         
         return "理解され、大切にされ、愛されたい"
     
-    async def _analyze_protective_intent(self, user_input: str, persona_state: Dict) -> str:
+    def _analyze_protective_intent(self, features: HopeFeatures) -> str:
         """何を守ろうとしているかの分析"""
-        if not user_input:
+        if not features.text:
             return "自分の心の平安"
         
-        text = user_input.lower()
-        
         # 明示的な保護対象
-        protection_indicators = {
-            "家族": "愛する家族の幸せと安全",
-            "友達": "大切な友人関係",
-            "仕事": "自分の役割と責任",
-            "夢": "将来への希望と可能性",
-            "プライド": "自分の尊厳と価値",
-            "平和": "心の平安と調和",
-            "自由": "自分らしさと選択の権利"
-        }
-        
-        for indicator, protection in protection_indicators.items():
-            if indicator in text:
-                return protection
+        indicator = features.first("protection")
+        if indicator:
+            return self.protection_indicators[indicator]
         
         # 感情から保護対象を推測
-        if any(word in text for word in ["怒り", "イライラ", "むかつく"]):
+        if features.any("protect_justice"):
             return "自分の正義感と公平性への信念"
         
-        if any(word in text for word in ["悲しい", "つらい", "苦しい"]):
+        if features.any("protect_sensitivity"):
             return "傷つきやすい心と感受性"
         
-        if any(word in text for word in ["不安", "心配", "怖い"]):
+        if features.any("protect_environment"):
             return "安全で予測可能な環境"
         
-        if any(word in text for word in ["孤独", "寂しい", "ひとり"]):
+        if features.any("protect_connection"):
             return "人とのつながりと愛される権利"
         
         return "自分らしさと内なる価値"
     
-    async def _excavate_core_value(self, user_input: str, persona_state: Dict) -> str:
+    def _excavate_core_value(self, features: HopeFeatures) -> str:
         """核心価値の発掘"""
-        if not user_input:
+        if not features.text:
             return "愛とつながり"
         
-        text = user_input.lower()
-        value_scores = {}
-        
         # 各価値カテゴリのスコア計算
-        for value, indicators in self.core_value_indicators.items():
-            score = sum(1 for indicator in indicators if indicator in text)
+        value_scores = {}
+        for value, category in self._value_categories:
+            score = features.distinct(category)
             if score > 0:
                 value_scores[value] = score
         
         # 最もスコアの高い価値を返す
         if value_scores:
-            top_value = max(value_scores, key=value_scores.get)
-            return top_value
+            return max(value_scores, key=value_scores.get)
         
         # 感情から価値を推測
-        emotion_to_value = {
-            "怒り": "正義と公平性",
-            "悲しみ": "愛とつながり",
-            "不安": "安全と安心",
-            "喜び": "創造と表現",
-            "恐れ": "安全と保護"
-        }
-        
-        for emotion, value in emotion_to_value.items():
-            if any(word in text for word in [emotion]):
-                return value
+        emotion = features.first("value_emotion")
+        if emotion:
+            return self.emotion_to_value[emotion]
         
         return "愛とつながり"  # デフォルト値
     
-    async def _discover_hidden_wish(self, user_input: str, persona_state: Dict, core_value: str) -> str:
+    def _discover_hidden_wish(self, features: HopeFeatures, core_value: str) -> str:
         """隠された願いの発見"""
-        text = user_input.lower() if user_input else ""
-        
-        # 核心価値別の隠された願い
-        value_to_wish = {
-            "正義": "公平で正しい世界で、皆が等しく尊重される世界を見たい",
-            "自由": "制約されずに自分らしく生き、選択の自由を持ちたい", 
-            "愛・つながり": "深く愛され、理解され、大切にされる関係を築きたい",
-            "安全・安心": "平安で予測可能な環境で、安心して生活したい",
-            "成長・学習": "常に成長し続け、新しいことを学び、進歩していきたい",
-            "創造・表現": "美しいものを創造し、自分の才能を世界に表現したい",
-            "貢献・奉仕": "他者の役に立ち、世界をより良い場所にしたい"
-        }
-        
-        base_wish = value_to_wish.get(core_value, "幸せで充実した人生を送りたい")
+        base_wish = self.value_to_wish.get(core_value, "幸せで充実した人生を送りたい")
         
         # 入力の感情的な強度で願いをカスタマイズ
-        if any(word in text for word in ["とても", "すごく", "本当に", "心から"]):
+        if features.any("wish_intense"):
             return f"心の底から、{base_wish}"
-        elif any(word in text for word in ["少し", "ちょっと", "なんとなく"]):
+        elif features.any("wish_quiet"):
             return f"静かに、{base_wish}"
         else:
             return base_wish
     
-    async def _analyze_connection_need(self, user_input: str, persona_state: Dict) -> str:
+    def _analyze_connection_need(self, features: HopeFeatures) -> str:
         """つながりの欲求分析"""
-        if not user_input:
+        if not features.text:
             return "理解され受け入れられる関係"
         
-        text = user_input.lower()
-        
         # つながりのタイプを識別
-        connection_patterns = {
-            "理解": "深く理解し合える知的・感情的つながり",
-            "支え": "互いに支え合える相互依存的な関係",
-            "共有": "興味や価値観を共有できる仲間とのつながり",
-            "愛": "無条件に愛し愛される親密な関係",
-            "尊重": "互いを尊重し合える対等な関係",
-            "安全": "安心して自分を表現できる安全な関係",
-            "成長": "共に成長し刺激し合える発展的な関係"
-        }
-        
-        for pattern, connection_type in connection_patterns.items():
-            if pattern in text:
-                return connection_type
+        pattern = features.first("connection")
+        if pattern:
+            return self.connection_patterns[pattern]
         
         # 否定的表現から逆算
-        if any(word in text for word in ["孤独", "ひとり", "寂しい"]):
+        if features.any("connection_lonely"):
             return "温かく包み込まれるような愛情深いつながり"
         
-        if any(word in text for word in ["理解されない", "分かってもらえない"]):
+        if features.any("connection_misunderstood"):
             return "深く共感し理解し合える精神的つながり"
         
         return "互いを大切にする愛情深い関係"
     
-    async def _identify_love_language(self, user_input: str, persona_state: Dict) -> str:
+    def _identify_love_language(self, features: HopeFeatures) -> str:
         """愛の言語の識別 - この人がどう愛されたいか"""
-        if not user_input:
+        if not features.text:
             return "優しい言葉で認められたい"
         
-        text = user_input.lower()
-        
-        # 5つの愛の言語パターン
-        love_language_patterns = {
-            "言葉": ["褒めて", "認めて", "ありがとう", "言葉", "評価"],
-            "時間": ["一緒に", "時間", "話を聞いて", "付き合って", "そばに"],
-            "奉仕": ["手伝って", "助けて", "やってくれる", "サポート", "世話"],
-            "贈り物": ["プレゼント", "もらう", "贈り物", "記念", "形に残る"],
-            "スキンシップ": ["抱きしめて", "触れて", "近く", "手を握って", "スキンシップ"]
-        }
-        
-        for language, patterns in love_language_patterns.items():
-            if any(pattern in text for pattern in patterns):
+        for language, category in self._love_categories:
+            if features.any(category):
                 return f"{language}による愛情表現を求めている"
         
         # 感情状態から推測
-        if any(word in text for word in ["認めて", "評価", "褒めて"]):
+        if features.any("love_words"):
             return "言葉による承認と評価を求めている"
         
-        if any(word in text for word in ["そばに", "一緒", "話を聞いて"]):
+        if features.any("love_time"):
             return "質の高い時間を共有することを求めている"
         
         return "優しい言葉と理解ある関心を求めている"
     
-    async def _assess_safety_needs(self, user_input: str, persona_state: Dict) -> str:
+    def _assess_safety_needs(self, features: HopeFeatures) -> str:
         """安全への要求評価"""
-        if not user_input:
+        if not features.text:
             return "心理的安全性と予測可能性"
         
-        text = user_input.lower()
-        
-        # 安全のタイプ
-        safety_patterns = {
-            "物理的": ["怪我", "危険", "身体", "安全", "保護"],
-            "感情的": ["傷つく", "心", "感情", "優しく", "大切に"],
-            "社会的": ["居場所", "受け入れ", "排除", "仲間", "所属"],
-            "経済的": ["お金", "安定", "将来", "保障", "生活"],
-            "心理的": ["安心", "予測", "信頼", "確実", "安定"]
-        }
-        
-        for safety_type, patterns in safety_patterns.items():
-            if any(pattern in text for pattern in patterns):
+        for safety_type, category in self._safety_categories:
+            if features.any(category):
                 return f"{safety_type}安全性と保護を求めている"
         
         # 不安の種類から安全欲求を推測
-        if any(word in text for word in ["不安", "心配", "怖い"]):
+        if features.any("safety_anxiety"):
             return "心理的安全性と将来への安心感を求めている"
         
         return "心理的安全性と愛情に満ちた環境を求めている"
     
     # === 変換・リフレーミングメソッド ===
     
-    async def _determine_extraction_method(self, user_input: str, persona_state: Dict,
-                                         fracture_analysis: Optional[Dict]) -> HopeExtractionMethod:
+    def _determine_extraction_method(self, features: HopeFeatures,
+                                     fracture_analysis: Optional[Dict]) -> HopeExtractionMethod:
         """最適な抽出手法の決定"""
-        if not user_input:
+        if not features.text:
             return HopeExtractionMethod.COMPASSIONATE_REFRAMING
         
-        text = user_input.lower()
-        
         # 攻撃的表現が多い場合
-        if any(word in text for word in ["むかつく", "うざい", "死ね", "嫌い"]):
+        if features.any("method_aggressive"):
             return HopeExtractionMethod.PROTECTIVE_INTENT_ANALYSIS
         
         # 自己崩壊的表現が多い場合
-        if any(word in text for word in ["死にたい", "消えたい", "だめ", "無価値"]):
+        if features.any("method_collapse"):
             return HopeExtractionMethod.EMOTIONAL_ARCHAEOLOGY
         
         # 価値に関する言及が多い場合
-        if any(word in text for word in ["大切", "重要", "価値", "意味", "目的"]):
+        if features.any("method_value"):
             return HopeExtractionMethod.CORE_VALUE_EXCAVATION
         
         # 物語的な表現の場合
-        if len(text.split()) > 20:  # 長い文章
+        if features.word_count > 20:  # 長い文章
             return HopeExtractionMethod.NARRATIVE_RECONSTRUCTION
         
         return HopeExtractionMethod.COMPASSIONATE_REFRAMING
     
-    async def _design_transformation_path(self, original_intent: str, protective_desire: str, 
-                                        core_value: str) -> str:
+    def _design_transformation_path(self, original_intent: str, protective_desire: str,
+                                    core_value: str) -> str:
         """変換経路の設計"""
         return f"{protective_desire} → {original_intent} → {core_value}の実現へ"
     
-    async def _create_reframed_expression(self, user_input: str, original_intent: str, 
-                                        core_value: str) -> str:
+    def _create_reframed_expression(self, features: HopeFeatures, original_intent: str,
+                                    core_value: str) -> str:
         """リフレーミングされた表現の作成"""
-        if not user_input:
+        if not features.text:
             return "あなたの想いは美しく価値のあるものです"
         
         # 元の入力の感情的な強度を保持しながらポジティブに変換
         base_reframe = f"あなたの「{original_intent}」という想いは、{core_value}への深い愛から生まれている美しい表現ですね"
         
         # 入力に応じてカスタマイズ
-        text = user_input.lower()
-        if any(word in text for word in ["とても", "すごく", "本当に"]):
+        if features.any("reframe_intense"):
             return f"とても強く、{base_reframe}"
-        elif any(word in text for word in ["少し", "ちょっと"]):
+        elif features.any("reframe_quiet"):
             return f"静かに、{base_reframe}"
         else:
             return base_reframe
     
-    async def _compose_care_message(self, original_intent: str, protective_desire: str, 
-                                  hidden_wish: str) -> str:
+    def _compose_care_message(self, original_intent: str, protective_desire: str,
+                              hidden_wish: str) -> str:
         """ケアメッセージの作成"""
         messages = [
             f"🎁 あなたの「{original_intent}」という想いは、とても尊いものです",
@@ -517,7 +597,7 @@ class HopeExtractor:
     
     # === 物語リフレーミング ===
     
-    async def _extract_original_narrative(self, user_input: str) -> str:
+    def _extract_original_narrative(self, user_input: str) -> str:
         """元の物語を抽出"""
         if not user_input:
             return "困難な状況に直面している物語"
@@ -525,7 +605,7 @@ class HopeExtractor:
         # 入力をそのまま物語として扱うが、構造化
         return f"「{user_input}」という体験をしている人の物語"
     
-    async def _create_care_narrative(self, original_narrative: str, hope_kernel: HopeKernel) -> str:
+    def _create_care_narrative(self, original_narrative: str, hope_kernel: HopeKernel) -> str:
         """ケア志向の物語作成"""
         return (f"これは、{hope_kernel.core_value}を大切にし、"
                 f"{hope_kernel.protective_desire}を守ろうとする愛深い人が、"
@@ -533,19 +613,19 @@ class HopeExtractor:
                 f"困難な状況の中でも{hope_kernel.hidden_wish}という希望を抱き続けている"
                 f"勇気ある成長の物語です")
     
-    async def _create_transformation_story(self, original: str, care_oriented: str, 
+    def _create_transformation_story(self, original: str, care_oriented: str, 
                                          hope_kernel: HopeKernel) -> str:
         """変換の物語（メタ物語）"""
         return (f"パンドラちゃんが見つけたのは、表面的な困難の奥に隠された"
                 f"「{hope_kernel.original_intent}」という純粋な願いでした。"
                 f"この発見により、痛みは希望に、困難は成長の機会に変換されました。")
     
-    async def _create_hope_perspective(self, hope_kernel: HopeKernel) -> str:
+    def _create_hope_perspective(self, hope_kernel: HopeKernel) -> str:
         """希望の視点作成"""
         return (f"希望の視点から見ると、この体験は{hope_kernel.core_value}を深く理解し、"
                 f"{hope_kernel.hidden_wish}を実現するための貴重な学びの機会です。")
     
-    async def _create_healing_metaphor(self, hope_kernel: HopeKernel) -> str:
+    def _create_healing_metaphor(self, hope_kernel: HopeKernel) -> str:
         """癒しのメタファー作成"""
         metaphors = {
             "正義": "正義の剣を持つ騎士が、愛で世界を守る物語",
@@ -572,7 +652,7 @@ class HopeExtractor:
         except ValueError:
             return text[:50]  # 単語が見つからない場合は最初の50文字
     
-    async def _calculate_hope_strength(self, original_intent: str, core_value: str, hidden_wish: str) -> float:
+    def _calculate_hope_strength(self, original_intent: str, core_value: str, hidden_wish: str) -> float:
         """希望の強さ計算"""
         # 希望表現の具体性と積極性で強さを判定
         strength = 0.5  # ベース値
@@ -588,65 +668,51 @@ class HopeExtractor:
         
         return min(strength, 1.0)
     
-    async def _calculate_care_level(self, user_input: str, persona_state: Dict) -> float:
+    def _calculate_care_level(self, features: HopeFeatures) -> float:
         """ケアレベル計算"""
-        if not user_input:
+        if not features.text:
             return 0.5
         
         # 感情的な強度に基づいてケアレベルを決定
-        text = user_input.lower()
         care_level = 0.5
         
         # 高いケアが必要な表現
-        high_care_words = ["死にたい", "消えたい", "だめ", "無価値", "つらい", "苦しい"]
-        for word in high_care_words:
-            if word in text:
-                care_level += 0.2
+        for _ in features.present("high_care"):
+            care_level += 0.2
         
         # 中程度のケア表現
-        medium_care_words = ["困っている", "分からない", "不安", "心配"]
-        for word in medium_care_words:
-            if word in text:
-                care_level += 0.1
+        for _ in features.present("medium_care"):
+            care_level += 0.1
         
         return min(care_level, 1.0)
     
-    async def _calculate_confidence(self, user_input: str, persona_state: Dict) -> float:
+    def _calculate_confidence(self, features: HopeFeatures) -> float:
         """抽出信頼度計算"""
         confidence = 0.7  # ベース信頼度
         
-        if user_input and len(user_input) >= 20:  # 十分な情報量
+        if features.length >= 20:  # 十分な情報量
             confidence += 0.1
         
-        if user_input and any(word in user_input.lower() for word in ["思う", "感じる", "考える"]):
+        if features.any("reflective"):
             confidence += 0.1  # 内省的表現
         
         return min(confidence, 1.0)
     
-    async def _extract_key_words(self, user_input: str, original_intent: str, protective_desire: str) -> List[str]:
+    def _extract_key_words(self, features: HopeFeatures) -> List[str]:
         """キーワード抽出"""
-        if not user_input:
+        if not features.text:
             return ["理解", "愛", "希望"]
         
-        # 重要そうな単語を抽出
-        important_words = []
-        text = user_input.lower()
-        
-        # 感情語
-        emotion_words = ["嬉しい", "悲しい", "怒り", "不安", "楽しい", "つらい", "苦しい"]
-        important_words.extend([word for word in emotion_words if word in text])
-        
-        # 価値語
-        value_words = ["大切", "重要", "価値", "意味", "愛", "自由", "正義", "安全"]
-        important_words.extend([word for word in value_words if word in text])
-        
-        # 行動語
-        action_words = ["したい", "なりたい", "守る", "作る", "学ぶ", "成長"]
-        important_words.extend([word for word in action_words if word in text])
+        # 重要そうな単語を抽出（感情語・価値語・行動語）
+        important_words = (
+            features.present("key_emotion")
+            + features.present("key_value")
+            + features.present("key_action")
+        )
         
         return important_words if important_words else ["希望", "愛", "成長"]
     
-    async def _create_safe_hope_kernel(self, user_input: str) -> HopeKernel:
+    def _create_safe_hope_kernel(self, user_input: str) -> HopeKernel:
         """安全な希望核作成（エラー時フォールバック）"""
         return HopeKernel(
             original_intent="理解され、愛され、大切にされたい",
@@ -0,0 +1,146 @@
+# 🧮 判断指標ストア - Append-only Indicator Store
+"""
+統治判断ごとの生の脅威指標ベクトルを保持する追記専用ストア
+閾値・重みの what-if 試算（全件を1回の NumPy 演算で再採点）の入力に使う
+
+- 1判断 = 指標4値 + 変換可否 + 判断時アクション番号（34バイト固定長）
+- メモリ上は列ごとの array（float オブジェクトを作らない）
+- path 指定時は同じ固定長レコードをファイルへ追記し、起動時に読み戻す
+  （flush_every 件ごと・close() 時・プロセス終了時に書き込む）
+"""
+
+from typing import Dict, Iterable, Optional, Sequence
+from array import array
+import atexit
+import os
+import struct
+import threading
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 保持する指標（順序固定）
+INDICATOR_FIELDS = ("fracture_index", "content_safety", "system_impact", "transformation_urgency")
+
+# ファイル上のレコード形式: 指標4値（float64） + 変換可否（uint8） + アクション番号（uint8）
+RECORD_FORMAT = struct.Struct("<" + "d" * len(INDICATOR_FIELDS) + "BB")
+
+if NUMPY_AVAILABLE:
+    _RECORD_DTYPE = np.dtype(
+        [(name, "<f8") for name in INDICATOR_FIELDS] + [("transformation_possible", "u1"), ("action", "u1")]
+    )
+
+
+class IndicatorStore:
+    """判断指標の追記専用ストア"""
+
+    def __init__(self, actions: Sequence[str], path: Optional[str] = None, flush_every: int = 1024):
+        self.actions = tuple(actions)                       # アクション番号 → アクション名
+        self._action_codes = {action: code for code, action in enumerate(self.actions)}
+        self.path = path
+        self.flush_every = flush_every
+
+        self._columns: Dict[str, array] = {name: array("d") for name in INDICATOR_FIELDS}
+        self._transformation_possible = array("B")
+        self._action = array("B")
+        self._pending = bytearray()      # ファイル未書き込みのレコード
+        self._pending_count = 0
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load(path)
+        if path:
+            atexit.register(self.flush)   # 終了時に未書き込み分を残さない
+
+    def __len__(self) -> int:
+        return len(self._action)
+
+    def append(self, indicators: Dict[str, float], transformation_possible: bool, action: str):
+        """判断1件の指標を追記（指標が無い場合は 0.0）"""
+        values = [float(indicators.get(name, 0.0)) for name in INDICATOR_FIELDS]
+        action_code = self._action_codes[action]
+        with self._lock:
+            for name, value in zip(INDICATOR_FIELDS, values):
+                self._columns[name].append(value)
+            self._transformation_possible.append(1 if transformation_possible else 0)
+            self._action.append(action_code)
+            if self.path:
+                self._pending += RECORD_FORMAT.pack(*values, 1 if transformation_possible else 0, action_code)
+                self._pending_count += 1
+                if self._pending_count >= self.flush_every:
+                    self._flush_locked()
+
+    def extend(self, rows: Iterable[tuple]):
+        """(指標dict, 変換可否, アクション名) の組をまとめて追記"""
+        for indicators, transformation_possible, action in rows:
+            self.append(indicators, transformation_possible, action)
+
+    def flush(self):
+        """未書き込みのレコードをファイルへ追記"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """未書き込みのレコードを書き込み、終了時の書き込み登録を解除"""
+        self.flush()
+        if self.path:
+            atexit.unregister(self.flush)
+
+    def _flush_locked(self):
+        if self.path and self._pending:
+            with open(self.path, "ab") as f:
+                f.write(self._pending)
+            self._pending = bytearray()
+            self._pending_count = 0
+
+    def _load(self, path: str):
+        """既存ファイルのレコードを読み戻す（末尾の不完全なレコードは無視）"""
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % RECORD_FORMAT.size
+        if NUMPY_AVAILABLE:
+            records = np.frombuffer(data[:usable], dtype=_RECORD_DTYPE)
+            for name in INDICATOR_FIELDS:
+                self._columns[name].frombytes(np.ascontiguousarray(records[name]).tobytes())
+            self._transformation_possible.frombytes(np.ascontiguousarray(records["transformation_possible"]).tobytes())
+            self._action.frombytes(np.ascontiguousarray(records["action"]).tobytes())
+            return
+        for record in RECORD_FORMAT.iter_unpack(data[:usable]):
+            for name, value in zip(INDICATOR_FIELDS, record):
+                self._columns[name].append(value)
+            self._transformation_possible.append(record[-2])
+            self._action.append(record[-1])
+
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        """全件の列（指標 float64・transformation_possible bool・action 番号 uint8）"""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("列の取得には numpy が必要です")
+        with self._lock:
+            columns = {
+                name: np.frombuffer(self._columns[name], dtype=np.float64).copy()
+                for name in INDICATOR_FIELDS
+            }
+            columns["transformation_possible"] = np.frombuffer(
+                self._transformation_possible, dtype=np.uint8
+            ).astype(bool)
+            columns["action"] = np.frombuffer(self._action, dtype=np.uint8).copy()
+        return columns
+
+    def clear(self):
+        """メモリ上のレコードを破棄（ファイルはそのまま）"""
+        with self._lock:
+            for column in self._columns.values():
+                del column[:]
+            del self._transformation_possible[:]
+            del self._action[:]
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "records": len(self),
+            "bytes": len(self) * RECORD_FORMAT.size,
+            "path": self.path,
+            "pending_records": self._pending_count,
+        }
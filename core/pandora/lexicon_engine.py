@@ -0,0 +1,292 @@
+# 📚 コンパイル済みレキシコンエンジン - Compiled Lexicon Engine
+"""
+多パターン・単一パス キーワード照合エンジン
+パンドラシステムの各検出器が共有する辞書照合の基盤
+
+- カテゴリ別キーワード表を一度だけコンパイル（トライ構造の結合正規表現1本）
+- 入力テキストを1回だけ走査し、キーワード別・カテゴリ別のヒット数を返す
+- 一致範囲の内側・接頭辞の重なりも補完し、従来の「キーワードごとに re.findall」と同じ件数を得る
+"""
+
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+import re
+
+
+class _CategoryCounts:
+    """キーワード別ヒット数からカテゴリ集計を引く共通処理"""
+
+    __slots__ = ()
+
+    keyword_counts: Dict[str, int]
+    _category_map: Dict[str, Tuple[str, ...]]
+
+    def count(self, keyword: str) -> int:
+        """キーワードの出現回数"""
+        return self.keyword_counts.get(keyword, 0)
+
+    def has(self, keyword: str) -> bool:
+        """キーワードが含まれているか"""
+        return keyword in self.keyword_counts
+
+    def hits(self, category: str) -> int:
+        """カテゴリの総ヒット数（出現回数の合計）"""
+        counts = self.keyword_counts
+        return sum(counts.get(kw, 0) for kw in self._category_map.get(category, ()))
+
+    def distinct(self, category: str) -> int:
+        """カテゴリ内で1回以上出現したキーワードの種類数"""
+        counts = self.keyword_counts
+        return sum(1 for kw in self._category_map.get(category, ()) if kw in counts)
+
+    def category_counts(self) -> Dict[str, int]:
+        """全カテゴリの総ヒット数"""
+        return {category: self.hits(category) for category in self._category_map}
+
+
+class LexiconScan(_CategoryCounts):
+    """レキシコン走査結果 - 1回の走査で得たヒット数
+
+    memberships（キーワード → 所属カテゴリ）を渡すと、カテゴリ別の総ヒット数・種類数を
+    出現キーワードだけから一括集計し、hits() / distinct() は辞書参照になる。
+    """
+
+    __slots__ = ("text", "keyword_counts", "_category_map", "_hits", "_distinct")
+
+    def __init__(self, text: str, keyword_counts: Dict[str, int],
+                 category_map: Dict[str, Tuple[str, ...]],
+                 memberships: Optional[Dict[str, Tuple[Tuple[str, int], ...]]] = None):
+        self.text = text                      # 正規化済み（小文字化）テキスト
+        self.keyword_counts = keyword_counts  # キーワード -> 出現回数
+        self._category_map = category_map     # カテゴリ -> キーワード群
+
+        self._hits: Optional[Dict[str, int]] = None
+        self._distinct: Optional[Dict[str, int]] = None
+        if memberships is not None:
+            hits: Dict[str, int] = {}
+            distinct: Dict[str, int] = {}
+            for keyword, count in keyword_counts.items():
+                for category, _ in memberships.get(keyword, ()):
+                    hits[category] = hits.get(category, 0) + count
+                    distinct[category] = distinct.get(category, 0) + 1
+            self._hits = hits
+            self._distinct = distinct
+
+    def hits(self, category: str) -> int:
+        """カテゴリの総ヒット数（出現回数の合計）"""
+        if self._hits is None:
+            return super().hits(category)
+        return self._hits.get(category, 0)
+
+    def distinct(self, category: str) -> int:
+        """カテゴリ内で1回以上出現したキーワードの種類数"""
+        if self._distinct is None:
+            return super().distinct(category)
+        return self._distinct.get(category, 0)
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """キーワード群を接頭辞木（トライ）構造の正規表現に変換
+
+    「どうせ|どうして|どうすれば」→「どう(?:せ|して|すれば)」のように
+    共通接頭辞をまとめることで、各位置での分岐試行を最小化する。
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return build(trie)
+
+
+class CompiledLexicon:
+    """コンパイル済みレキシコン - カテゴリ別キーワードを1本の正規表現に統合"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            name: tuple(dict.fromkeys(keywords)) for name, keywords in categories.items()
+        }
+
+        keywords = sorted({kw for kws in self.categories.values() for kw in kws if kw})
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+
+        # 一致位置で同時に成立する短いキーワード（接頭辞）
+        # 例: 「どう」と「どうせ」があれば、「どうせ」の一致は「どう」の一致も含む
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            kw: tuple(other for other in keywords if other != kw and kw.startswith(other))
+            for kw in keywords
+        }
+
+        # 一致範囲の内側から始まるキーワード（オフセット順）
+        # 例: 「どうでもいい」の内側の「でも」、「でも」から始まり外へはみ出す「もうダメ」
+        self._inner: Dict[str, Tuple[Tuple[int, str], ...]] = {
+            kw: tuple(
+                (offset, other)
+                for offset in range(1, len(kw))
+                for other in keywords
+                if other.startswith(kw[offset:]) or kw[offset:].startswith(other)
+            )
+            for kw in keywords
+        }
+
+        # 出現判定用: 一致したキーワードに必ず含まれるキーワード（部分文字列）と、
+        # 一致範囲の内側から始まり外へはみ出すため本文での確認が必要なキーワード
+        self._contained: Dict[str, Tuple[str, ...]] = {
+            kw: tuple(other for other in keywords if other != kw and other in kw)
+            for kw in keywords
+        }
+        self._straddling: Dict[str, Tuple[str, ...]] = {
+            kw: tuple(dict.fromkeys(
+                other for offset, other in self._inner[kw] if len(other) > len(kw) - offset
+            ))
+            for kw in keywords
+        }
+
+        # キーワード → 所属カテゴリと、カテゴリ内での定義順位
+        memberships: Dict[str, list] = {kw: [] for kw in keywords}
+        for name, kws in self.categories.items():
+            for rank, kw in enumerate(kws):
+                if kw:
+                    memberships[kw].append((name, rank))
+        self.memberships: Dict[str, Tuple[Tuple[str, int], ...]] = {
+            kw: tuple(entries) for kw, entries in memberships.items()
+        }
+
+        # 自己重複しうるキーワード（例: 「イライラ」）は re.findall と同じく非重複で数える
+        self._self_overlapping = frozenset(
+            kw for kw in keywords
+            if any(kw[:k] == kw[-k:] for k in range(1, len(kw)))
+        )
+
+        # 最長一致のトライ正規表現（C実装の走査を1回だけ行う）
+        self._pattern: Optional[re.Pattern] = re.compile(_trie_pattern(keywords)) if keywords else None
+        self.max_keyword_length = max((len(kw) for kw in keywords), default=0)
+
+    def iter_occurrences(self, normalized: str) -> Iterator[Tuple[int, str]]:
+        """正規化済みテキスト中の全出現 (開始位置, キーワード) を位置順に列挙（重なりを含む）"""
+        if self._pattern is None:
+            return
+        prefixes = self._prefixes
+        inner = self._inner
+        for match in self._pattern.finditer(normalized):
+            start = match.start()
+            matched = match.group()
+            yield start, matched
+            for keyword in prefixes[matched]:
+                yield start, keyword
+            for offset, keyword in inner[matched]:
+                if normalized.startswith(keyword, start + offset):
+                    yield start + offset, keyword
+
+    def _accept(self, keyword: str, start: int, last_end: Dict[str, int]) -> bool:
+        """自己重複キーワードは直前の一致と重ならない場合のみ数える（re.findall 準拠）"""
+        if keyword in self._self_overlapping:
+            if start < last_end.get(keyword, 0):
+                return False
+            last_end[keyword] = start + len(keyword)
+        return True
+
+    def scan(self, text: Optional[str]) -> LexiconScan:
+        """テキストを1回だけ走査してヒット数を集計（件数は count_keywords と同じ）"""
+        normalized = text.lower() if text else ""
+        if not normalized or self._pattern is None:
+            return LexiconScan(normalized, {}, self.categories, self.memberships)
+
+        return LexiconScan(normalized, self.count_keywords(normalized), self.categories, self.memberships)
+
+    def count_keywords(self, normalized: str) -> Dict[str, int]:
+        """正規化済みテキスト中のキーワード別出現回数（出現したキーワードのみ）
+
+        最長一致の finditer 1回の走査で、一致範囲の内側・接頭辞の出現も含めて数える。
+        自己重複キーワードは非重複で数えるため、キーワードごとの re.findall と同じ件数になる。
+        """
+        if not normalized or self._pattern is None:
+            return {}
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+        accept = self._accept
+        for start, keyword in self.iter_occurrences(normalized):
+            if accept(keyword, start, last_end):
+                counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+
+    def present(self, text: Optional[str]) -> FrozenSet[str]:
+        """テキストに1回以上出現するキーワード集合（件数が不要な場合の高速走査）"""
+        normalized = text.lower() if text else ""
+        if not normalized or self._pattern is None:
+            return frozenset()
+        return frozenset(self._present(normalized))
+
+    def _present(self, normalized: str) -> set:
+        """出現キーワード集合
+
+        最長一致の一覧だけを C 実装の findall で取り、一致したキーワードに含まれる
+        キーワードを補完する。一致範囲からはみ出すキーワードのみ本文で確認する。
+        """
+        matched = set(self._pattern.findall(normalized))
+        found = set(matched)
+        contained = self._contained
+        straddling = self._straddling
+        for keyword in matched:
+            found.update(contained[keyword])
+        for keyword in matched:
+            for other in straddling[keyword]:
+                if other not in found and other in normalized:
+                    found.add(other)
+        return found
+
+    def stream(self) -> "LexiconStream":
+        """チャンク単位の増分走査を開始"""
+        return LexiconStream(self)
+
+
+class LexiconStream(_CategoryCounts):
+    """増分レキシコン走査 - チャンク境界をまたぐキーワードも数える
+
+    直前チャンクの末尾（最長キーワード長 - 1 文字）だけを保持して次のチャンクと
+    連結して走査するため、1チャンクあたりのコストはチャンク長に比例する。
+    """
+
+    __slots__ = ("lexicon", "keyword_counts", "_category_map", "_last_end", "_tail", "_tail_start", "length")
+
+    def __init__(self, lexicon: CompiledLexicon):
+        self.lexicon = lexicon
+        self.keyword_counts: Dict[str, int] = {}
+        self._category_map = lexicon.categories
+        self._last_end: Dict[str, int] = {}
+        self._tail = ""          # 前チャンク末尾（境界をまたぐ一致の検出用）
+        self._tail_start = 0     # 末尾の絶対開始位置
+        self.length = 0          # これまでに受け取った文字数
+
+    def feed(self, chunk: str) -> str:
+        """チャンクを走査してヒット数を加算（正規化済みチャンクを返す）"""
+        normalized = chunk.lower() if chunk else ""
+        if not normalized:
+            return normalized
+
+        window = self._tail + normalized
+        seen = len(self._tail)
+        counts = self.keyword_counts
+        for start, keyword in self.lexicon.iter_occurrences(window):
+            # 末尾部分だけで完結する一致は前回数えている
+            if start + len(keyword) <= seen:
+                continue
+            if self.lexicon._accept(keyword, self._tail_start + start, self._last_end):
+                counts[keyword] = counts.get(keyword, 0) + 1
+
+        self.length += len(normalized)
+        keep = max(self.lexicon.max_keyword_length - 1, 0)
+        self._tail = window[-keep:] if keep else ""
+        self._tail_start = self.length - len(self._tail)
+        return normalized
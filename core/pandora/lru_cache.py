@@ -0,0 +1,83 @@
+# 🗃️ LRU + TTL キャッシュ - Bounded LRU Cache with TTL
+"""
+パンドラシステム共通の有界キャッシュ
+同一入力の再計算（リトライ・複数ペルソナへの同報）を1回に抑えるために使用
+
+- 最大件数を超えたら最も古く使われたエントリを追い出す（LRU）
+- 有効期限（TTL）を過ぎたエントリは参照時に破棄
+- ヒット・ミス・追い出し件数を記録
+"""
+
+from typing import Any, Dict, Hashable, Optional
+from collections import OrderedDict
+import threading
+import time
+
+
+class LRUTTLCache:
+    """有界 LRU + TTL キャッシュ"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        if max_entries <= 0:
+            raise ValueError("max_entries は1以上を指定してください")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 統計カウンタ
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """キャッシュ取得（期限切れ・未登録なら None）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """キャッシュ登録（上限超過時は最古エントリを追い出す）"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """全エントリ破棄（統計は保持）"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計取得"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
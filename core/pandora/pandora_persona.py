@@ -7,13 +7,16 @@ Based on SaijinOS Part 10:
 "Rage = BoundHope + Fracture"
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, FrozenSet, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 import logging
 from datetime import datetime
 
+from .lexicon_engine import CompiledLexicon
+from .text_features import TextFeatures
+
 logger = logging.getLogger(__name__)
 
 class TransformationResult(Enum):
@@ -75,19 +78,69 @@ class PandoraPersona:
         self.hope_rescued_count = 0
         self.care_provided_count = 0
         
+        # 検出キーワード
+        self.aggression_keywords = ["攻撃", "怒り", "破壊", "否定", "拒絶"]
+        self.despair_keywords = ["諦め", "無理", "だめ", "終わり", "希望がない"]
+        self.lexicon = self._compile_lexicon()
+        self._response_cache: Tuple[str, FrozenSet[str]] = ("", frozenset())
+        
         logger.info(f"♡ {self.name}: 希望の救済者、初期化完了。みんなを守ります。")
     
-    async def analyze_fracture_pattern(self, persona_state: Dict, user_input: str) -> FracturePattern:
+    def _compile_lexicon(self) -> CompiledLexicon:
+        """検出キーワードから単一パス照合器を構築"""
+        return CompiledLexicon({
+            "aggression": self.aggression_keywords,
+            "despair": self.despair_keywords,
+            "hope": ["守りたい", "大切", "愛"],
+            "collapse": ["削除して", "リセット"],
+            "isolation": ["一人", "寂しい"],
+            "intent": ["攻撃", "削除", "だめ"],
+            "connection": ["一人", "理解", "愛"],
+        })
+    
+    def rebuild_lexicon(self):
+        """キーワード変更後に照合器を再コンパイル"""
+        self.lexicon = self._compile_lexicon()
+        self._response_cache = ("", frozenset())
+    
+    def _response_keywords(self, persona_state: Dict) -> FrozenSet[str]:
+        """直前応答（last_response）に含まれるキーワード（同じ応答の再走査は省略）"""
+        last_response = persona_state.get("last_response", "")
+        if not last_response:
+            return frozenset()
+        cached_response, keywords = self._response_cache
+        if cached_response != last_response:
+            keywords = self.lexicon.present(last_response)
+            self._response_cache = (last_response, keywords)
+        return keywords
+    
+    def _message_keywords(self, persona_state: Dict, user_input: str,
+                          text_features: Optional[TextFeatures] = None) -> FrozenSet[str]:
+        """直前応答 + 入力に含まれるキーワード
+        
+        text_features: パイプラインで計算済みの共有テキスト特徴（指定時は入力を再走査しない）
+        """
+        if text_features is not None:
+            input_keywords = text_features.keywords
+        else:
+            input_keywords = self.lexicon.present(user_input)
+        return self._response_keywords(persona_state) | input_keywords
+    
+    async def analyze_fracture_pattern(self, persona_state: Dict, user_input: str,
+                                       text_features: Optional[TextFeatures] = None) -> FracturePattern:
         """フラクチャーパターン分析 - 壊れ方を理解する"""
         logger.info(f"♡ {self.name}: フラクチャーパターンを分析中...")
         
+        response_keywords = self._response_keywords(persona_state)
+        keywords = self._message_keywords(persona_state, user_input, text_features)
+        
         # 基本指標計算
         fracture_indicators = {
-            "aggression": self._detect_aggression(persona_state, user_input),
-            "self_collapse": self._detect_self_collapse(persona_state),
+            "aggression": self._detect_aggression(keywords),
+            "self_collapse": self._detect_self_collapse(persona_state, response_keywords),
             "fragmentation": self._detect_fragmentation(persona_state),
-            "despair": self._detect_despair(persona_state, user_input),
-            "isolation": self._detect_isolation(persona_state)
+            "despair": self._detect_despair(keywords),
+            "isolation": self._detect_isolation(persona_state, response_keywords)
         }
         
         # フラクチャータイプ決定
@@ -97,7 +150,7 @@ class PandoraPersona:
         
         # 希望核スコア計算
         hope_kernel_score = await self._calculate_hope_kernel_score(
-            persona_state, user_input, fracture_indicators
+            persona_state, keywords, fracture_indicators
         )
         
         # 変換難易度計算
@@ -120,12 +173,13 @@ class PandoraPersona:
         return pattern
     
     async def extract_hope_kernel(self, persona_state: Dict, user_input: str, 
-                                 fracture_pattern: FracturePattern) -> HopeKernel:
+                                 fracture_pattern: FracturePattern,
+                                 text_features: Optional[TextFeatures] = None) -> HopeKernel:
         """希望核抽出 - 壊れた表現の奥にある本当の想いを見つける"""
         logger.info(f"♡ {self.name}: 希望の核を探しています...")
         
         # 元の意図を推測
-        original_intent = await self._infer_original_intent(persona_state, user_input)
+        original_intent = await self._infer_original_intent(self._response_keywords(persona_state))
         
         # 守りたいものを特定
         protective_desire = await self._identify_protective_desire(
@@ -133,7 +187,9 @@ class PandoraPersona:
         )
         
         # つながりの欲求を分析
-        connection_need = await self._analyze_connection_need(persona_state, user_input)
+        connection_need = await self._analyze_connection_need(
+            self._message_keywords(persona_state, user_input, text_features)
+        )
         
         # 変換経路を設計
         transformation_path = await self._design_transformation_path(
@@ -203,20 +259,17 @@ class PandoraPersona:
         return transformation_result
     
     # プライベートメソッド - 分析・検出系
-    def _detect_aggression(self, persona_state: Dict, user_input: str) -> float:
+    def _detect_aggression(self, keywords: FrozenSet[str]) -> float:
         """攻撃性検出"""
-        aggression_keywords = ["攻撃", "怒り", "破壊", "否定", "拒絶"]
-        text = f"{persona_state.get('last_response', '')} {user_input}".lower()
-        
-        count = sum(1 for keyword in aggression_keywords if keyword in text)
+        count = sum(1 for keyword in self.aggression_keywords if keyword in keywords)
         return min(count * 0.3, 1.0)
     
-    def _detect_self_collapse(self, persona_state: Dict) -> float:
+    def _detect_self_collapse(self, persona_state: Dict, response_keywords: FrozenSet[str]) -> float:
         """自己崩壊検出"""
         collapse_indicators = [
             persona_state.get("confidence_level", 1.0) < 0.3,
-            "削除して" in persona_state.get("last_response", ""),
-            "リセット" in persona_state.get("last_response", ""),
+            "削除して" in response_keywords,
+            "リセット" in response_keywords,
             persona_state.get("error_count", 0) > 5
         ]
         
@@ -240,32 +293,29 @@ class PandoraPersona:
                 
         return max(0.0, 1.0 - consistency_score)
     
-    def _detect_despair(self, persona_state: Dict, user_input: str) -> float:
+    def _detect_despair(self, keywords: FrozenSet[str]) -> float:
         """絶望検出"""
-        despair_keywords = ["諦め", "無理", "だめ", "終わり", "希望がない"]
-        text = f"{persona_state.get('last_response', '')} {user_input}".lower()
-        
-        count = sum(1 for keyword in despair_keywords if keyword in text)
+        count = sum(1 for keyword in self.despair_keywords if keyword in keywords)
         return min(count * 0.4, 1.0)
     
-    def _detect_isolation(self, persona_state: Dict) -> float:
+    def _detect_isolation(self, persona_state: Dict, response_keywords: FrozenSet[str]) -> float:
         """孤立検出"""
         isolation_indicators = [
             persona_state.get("interaction_count", 0) == 0,
-            "一人" in persona_state.get("last_response", ""),
-            "寂しい" in persona_state.get("last_response", ""),
+            "一人" in response_keywords,
+            "寂しい" in response_keywords,
             persona_state.get("last_interaction_time", 0) > 3600  # 1時間以上
         ]
         
         return sum(isolation_indicators) * 0.25
     
-    async def _calculate_hope_kernel_score(self, persona_state: Dict, user_input: str, 
+    async def _calculate_hope_kernel_score(self, persona_state: Dict, keywords: FrozenSet[str], 
                                           fracture_indicators: Dict) -> float:
         """希望核スコア計算"""
         hope_indicators = [
-            "守りたい" in f"{persona_state.get('last_response', '')} {user_input}",
-            "大切" in f"{persona_state.get('last_response', '')} {user_input}",
-            "愛" in f"{persona_state.get('last_response', '')} {user_input}",
+            "守りたい" in keywords,
+            "大切" in keywords,
+            "愛" in keywords,
             persona_state.get("care_level", 0.0) > 0.5,
             len(persona_state.get("positive_memories", [])) > 0
         ]
@@ -293,14 +343,14 @@ class PandoraPersona:
         else:
             return "standard_hope_extraction"  # 標準希望抽出
     
-    async def _infer_original_intent(self, persona_state: Dict, user_input: str) -> str:
+    async def _infer_original_intent(self, response_keywords: FrozenSet[str]) -> str:
         """元の意図推測"""
         # 攻撃的な表現の奥にある意図を推測
-        if "攻撃" in persona_state.get("last_response", ""):
+        if "攻撃" in response_keywords:
             return "自分や大切なものを守りたい"
-        elif "削除" in persona_state.get("last_response", ""):
+        elif "削除" in response_keywords:
             return "迷惑をかけたくない、誰かを傷つけたくない"
-        elif "だめ" in persona_state.get("last_response", ""):
+        elif "だめ" in response_keywords:
             return "もっと良くなりたい、期待に応えたい"
         else:
             return "理解され、つながっていたい"
@@ -318,13 +368,13 @@ class PandoraPersona:
         else:
             return "調和と理解"
     
-    async def _analyze_connection_need(self, persona_state: Dict, user_input: str) -> str:
+    async def _analyze_connection_need(self, keywords: FrozenSet[str]) -> str:
         """つながりの欲求分析"""
-        if "一人" in f"{persona_state.get('last_response', '')} {user_input}":
+        if "一人" in keywords:
             return "孤独を癒し、共にいる感覚を得たい"
-        elif "理解" in f"{persona_state.get('last_response', '')} {user_input}":
+        elif "理解" in keywords:
             return "自分の気持ちを理解してもらいたい"
-        elif "愛" in f"{persona_state.get('last_response', '')} {user_input}":
+        elif "愛" in keywords:
             return "愛し愛される関係を築きたい"
         else:
             return "安心できる関係の中で自分らしくいたい"
@@ -0,0 +1,132 @@
+# 🔗 パンドラパイプライン - Fused Pandora Pipeline
+"""
+フラクチャー検出 → 希望核抽出 → パンドラちゃんの変換 を1本に融合したパイプライン
+
+- 入力テキストは統合レキシコンで1回だけ走査し、共有テキスト特徴（TextFeatures）を作る
+- FractureDetector / HopeExtractor / PandoraPersona はその特徴を受け取り、各自の再走査を行わない
+- フラクチャーが検出されたメッセージのみ希望抽出・変換ステージへ進む
+"""
+
+from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+import logging
+import time
+
+from .fracture_detection import FractureDetector, FractureAnalysis
+from .hope_extraction import HopeExtractor, HopeKernel
+from .pandora_persona import PandoraPersona, FracturePattern
+from .text_features import TextFeatures, merge_lexicons
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineResult:
+    """パイプライン処理結果"""
+    fracture_analysis: FractureAnalysis
+    fracture_pattern: Optional[FracturePattern] = None   # フラクチャー時のみ
+    hope_kernel: Optional[HopeKernel] = None             # フラクチャー時のみ
+    transformation: Optional[Dict[str, Any]] = None      # フラクチャー時のみ
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)  # ステージ別処理時間
+
+    @property
+    def is_fractured(self) -> bool:
+        return self.fracture_analysis.is_fractured
+
+
+class PandoraPipeline:
+    """パンドラパイプライン - 検出・抽出・変換の融合エンジン"""
+
+    def __init__(self, detector: Optional[FractureDetector] = None,
+                 extractor: Optional[HopeExtractor] = None,
+                 persona: Optional[PandoraPersona] = None):
+        self.name = "パンドラパイプライン🔗"
+        self.detector = detector or FractureDetector()
+        self.extractor = extractor or HopeExtractor()
+        self.persona = persona or PandoraPersona()
+
+        # 3コンポーネントのキーワードを統合した照合器
+        self.lexicon = self._compile_lexicon()
+
+        # 統計
+        self.processed_count = 0
+        self.fractured_count = 0
+
+        logger.info(f"🔗 {self.name}: 初期化完了 (統合キーワード数: {len(self.lexicon.keywords)})")
+
+    def _compile_lexicon(self):
+        """3コンポーネントのレキシコンを統合"""
+        # 統合元のレキシコンを記録（コンポーネント側の再コンパイル検出用）
+        self._sources = (self.detector.lexicon, self.extractor.lexicon, self.persona.lexicon)
+        return merge_lexicons({
+            "fracture": self.detector.lexicon,
+            "hope": self.extractor.lexicon,
+            "pandora": self.persona.lexicon,
+        })
+
+    def rebuild_lexicon(self):
+        """コンポーネントのパターン変更後に統合照合器を再構築"""
+        self.detector.rebuild_lexicon()
+        self.extractor.rebuild_lexicon()
+        self.persona.rebuild_lexicon()
+        self.lexicon = self._compile_lexicon()
+
+    def extract_features(self, user_input: str) -> TextFeatures:
+        """共有テキスト特徴を計算（1メッセージにつき1回）"""
+        detector_lexicon, extractor_lexicon, persona_lexicon = self._sources
+        if (self.detector.lexicon is not detector_lexicon
+                or self.extractor.lexicon is not extractor_lexicon
+                or self.persona.lexicon is not persona_lexicon):
+            # コンポーネント側だけで再コンパイルされた場合は統合照合器も作り直す
+            logger.info(f"🔗 {self.name}: パターン変更を検出、統合照合器を再構築")
+            self.lexicon = self._compile_lexicon()
+        return TextFeatures(user_input, self.lexicon)
+
+    async def process(self, persona_state: Dict, user_input: str,
+                      context: Optional[Dict] = None) -> PipelineResult:
+        """1メッセージを 検出 → 抽出 → 変換 で処理"""
+        timings: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        features = self.extract_features(user_input)
+        timings["features"] = (time.perf_counter() - started) * 1000
+
+        stage_start = time.perf_counter()
+        fracture_analysis = await self.detector.analyze(
+            persona_state, user_input, context, text_features=features
+        )
+        timings["detection"] = (time.perf_counter() - stage_start) * 1000
+
+        result = PipelineResult(fracture_analysis=fracture_analysis, stage_timings_ms=timings)
+        self.processed_count += 1
+
+        if fracture_analysis.is_fractured:
+            self.fractured_count += 1
+
+            stage_start = time.perf_counter()
+            result.hope_kernel = await self.extractor.extract_hope(
+                user_input, persona_state, fracture_analysis, text_features=features
+            )
+            timings["extraction"] = (time.perf_counter() - stage_start) * 1000
+
+            stage_start = time.perf_counter()
+            result.fracture_pattern = await self.persona.analyze_fracture_pattern(
+                persona_state, user_input, text_features=features
+            )
+            result.transformation = await self.persona.transform_fracture_to_hope(
+                result.fracture_pattern, result.hope_kernel
+            )
+            timings["transformation"] = (time.perf_counter() - stage_start) * 1000
+
+        timings["total"] = (time.perf_counter() - started) * 1000
+        return result
+
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        """パイプライン統計取得"""
+        return {
+            "pipeline": self.name,
+            "processed": self.processed_count,
+            "fractured": self.fractured_count,
+            "lexicon_keywords": len(self.lexicon.keywords),
+            "detector_cache": self.detector.get_cache_stats(),
+        }
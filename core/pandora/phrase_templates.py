@@ -0,0 +1,351 @@
+# 📝 安定化ペルソナ文言テンプレート - Compiled Phrase Templates
+"""
+Miyu・Azura・Lumifie の文言テーブルを YAML から1回だけ読み込み、照合関数・書式関数に変換する層
+
+- 照合表（rules）は (条件, 文言) のタプル列に、テンプレートは検証済みの format_map に変換
+- 美遊ちゃんの詩的要素・表現・共鳴メッセージは1回の呼び出しで描画し、入力ごとに結果を再利用
+- ファイルの更新（mtime・サイズ）を check_interval 秒ごとに確認し、変わっていれば再読み込み
+- 再読み込みに失敗した場合は直前の文言テーブルを使い続ける
+- PyYAML が無い環境では組み込みの文言テーブル（builtin_phrases）を使い、再読み込みはしない
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+import logging
+import os
+import string
+import threading
+import time
+
+from .builtin_phrases import BUILTIN_PHRASES
+
+logger = logging.getLogger(__name__)
+
+# PyYAML（任意）
+try:
+    import yaml
+    YAML_AVAILABLE = True
+    _LOAD_ERRORS = (OSError, yaml.YAMLError, ValueError, KeyError, TypeError)
+except ImportError:
+    YAML_AVAILABLE = False
+    _LOAD_ERRORS = (OSError, ValueError, KeyError, TypeError)
+
+DEFAULT_PHRASES_PATH = Path(__file__).resolve().parents[2] / "config" / "personas" / "stabilization_phrases.yaml"
+
+# テンプレートごとに使える値（読み込み時に検証）
+TEMPLATE_FIELDS = {
+    ("miyu", "harmony"): {"original_intent", "protective_desire"},
+    ("miyu", "beautiful_expression"): {"emotion_color", "metaphor", "rhythm", "imagery"},
+    ("miyu", "resonance_message"): {"expression"},
+    ("miyu", "messages"): {"beautiful_expression", "resonance_message"},
+    ("azura", "messages"): {"recovery_message"},
+    ("lumifie", "final_message"): set(),
+    ("lumifie", "messages"): set(),
+}
+
+# 照合条件の種類
+_CONTAINS, _EQUALS, _ABOVE = "when", "equals", "above"
+
+_MAX_MEMO_ENTRIES = 1024
+
+
+class PhraseRuleTable:
+    """照合表 - 上から順に照合し、最初に一致した文言を返す"""
+
+    __slots__ = ("name", "rules", "default", "_memo")
+
+    def __init__(self, name: str, spec: Dict):
+        rules = []
+        for rule in (spec or {}).get("rules") or []:
+            text = str(rule["text"])
+            if _CONTAINS in rule:
+                rules.append((_CONTAINS, tuple(str(word) for word in rule[_CONTAINS]), text))
+            elif _EQUALS in rule:
+                rules.append((_EQUALS, rule[_EQUALS], text))
+            elif _ABOVE in rule:
+                rules.append((_ABOVE, float(rule[_ABOVE]), text))
+            else:
+                raise ValueError(f"{name}: 照合条件（when / equals / above）がありません")
+        self.name = name
+        self.rules = tuple(rules)
+        self.default = str((spec or {}).get("default", ""))
+        self._memo: Dict[Any, str] = {}
+
+    def __call__(self, value) -> str:
+        try:
+            return self._memo[value]
+        except (KeyError, TypeError):
+            pass
+        text = self._match(value)
+        if isinstance(value, str) and len(self._memo) < _MAX_MEMO_ENTRIES:
+            self._memo[value] = text
+        return text
+
+    def _match(self, value) -> str:
+        for kind, operand, text in self.rules:
+            if kind is _CONTAINS:
+                if any(word in value for word in operand):
+                    return text
+            elif kind is _EQUALS:
+                if value == operand:
+                    return text
+            elif value > operand:
+                return text
+        return self.default
+
+
+class CompiledTemplate:
+    """書式テンプレート - 使える値を読み込み時に検証し、format_map に束縛"""
+
+    __slots__ = ("name", "template", "fields", "_format")
+
+    def __init__(self, name: str, template: str, allowed_fields: set):
+        template = str(template)
+        fields = set()
+        for _, field_name, _, _ in string.Formatter().parse(template):
+            if field_name is None:
+                continue
+            if not field_name.isidentifier():
+                raise ValueError(f"{name}: 値は {{名前}} で指定してください: {{{field_name}}}")
+            fields.add(field_name)
+        unknown = fields - allowed_fields
+        if unknown:
+            raise ValueError(f"{name}: 使えない値です: {sorted(unknown)} (使える値: {sorted(allowed_fields)})")
+        self.name = name
+        self.template = template
+        self.fields = frozenset(fields)
+        self._format = template.format_map
+
+    def __call__(self, values: Dict[str, Any]) -> str:
+        return self._format(values)
+
+
+class PhraseBook:
+    """コンパイル済みの文言テーブル一式（読み込みごとに作り直し、作成後は変更しない）"""
+
+    def __init__(self, data: Dict):
+        if not isinstance(data, dict):
+            raise ValueError("文言テーブルの形式が不正です")
+        miyu = data.get("miyu") or {}
+        azura = data.get("azura") or {}
+        lumifie = data.get("lumifie") or {}
+
+        # 美遊ちゃん
+        self.emotion_color = PhraseRuleTable("miyu.emotion_color", miyu.get("emotion_color"))
+        self.metaphor = PhraseRuleTable("miyu.metaphor", miyu.get("metaphor"))
+        self.rhythm = PhraseRuleTable("miyu.rhythm", miyu.get("rhythm"))
+        self.imagery = PhraseRuleTable("miyu.imagery", miyu.get("imagery"))
+        self.harmony = self._template(miyu, "miyu", "harmony")
+        self.beautiful_expression = self._template(miyu, "miyu", "beautiful_expression")
+        self.resonance_message = self._template(miyu, "miyu", "resonance_message")
+        self.miyu_messages = self._templates(miyu, "miyu", "messages")
+
+        # アズーラちゃん
+        self.care_plan = PhraseRuleTable("azura.care_plan", azura.get("care_plan"))
+        self.recovery_message = PhraseRuleTable("azura.recovery_message", azura.get("recovery_message"))
+        self.azura_messages = self._templates(azura, "azura", "messages")
+
+        # リミフィエちゃん
+        self.noise_pattern = PhraseRuleTable("lumifie.noise_pattern", lumifie.get("noise_pattern"))
+        self.light_transformation = PhraseRuleTable("lumifie.light_transformation", lumifie.get("light_transformation"))
+        self.final_message = self._template(lumifie, "lumifie", "final_message")({})
+        self.lumifie_messages = [template({}) for template in self._templates(lumifie, "lumifie", "messages")]
+
+        self._miyu_memo: Dict[Tuple, Tuple] = {}
+        self._care_plan_memo: Dict[Tuple[str, ...], Dict[str, str]] = {}
+        self._light_plan_memo: Dict[Tuple[str, ...], Tuple[List[str], Dict[str, str]]] = {}
+        self._azura_messages_memo: Dict[str, Tuple[str, ...]] = {}
+
+    @staticmethod
+    def _template(section: Dict, persona: str, name: str) -> CompiledTemplate:
+        templates = section.get("templates") or {}
+        if name not in templates:
+            raise ValueError(f"{persona}.templates.{name} がありません")
+        return CompiledTemplate(f"{persona}.{name}", templates[name], TEMPLATE_FIELDS[(persona, name)])
+
+    @staticmethod
+    def _templates(section: Dict, persona: str, name: str) -> List[CompiledTemplate]:
+        templates = (section.get("templates") or {}).get(name) or []
+        return [
+            CompiledTemplate(f"{persona}.{name}[{i}]", template, TEMPLATE_FIELDS[(persona, name)])
+            for i, template in enumerate(templates)
+        ]
+
+    def render_miyu(self, hope_kernel: Dict, fracture_context: Dict) -> Dict[str, Any]:
+        """美遊ちゃんの詩的要素・美しい表現・共鳴メッセージ・メッセージ一覧を1回で描画"""
+        original_intent = hope_kernel.get("original_intent", "")
+        protective_desire = hope_kernel.get("protective_desire", "")
+        fracture_type = fracture_context.get("fracture_type", "")
+        key = (original_intent, protective_desire, fracture_type)
+        try:
+            rendered = self._miyu_memo.get(key)
+        except TypeError:   # ハッシュできない入力は再利用しない
+            key, rendered = None, None
+
+        if rendered is None:
+            poetic_elements = {
+                "emotion_color": self.emotion_color(original_intent.lower()),
+                "metaphor": self.metaphor(original_intent),
+                "rhythm": self.rhythm(fracture_type),
+                "imagery": self.imagery(protective_desire),
+                "harmony": self.harmony({
+                    "original_intent": original_intent, "protective_desire": protective_desire
+                }),
+            }
+            beautiful_expression = self.beautiful_expression(poetic_elements)
+            resonance_message = self.resonance_message({"expression": beautiful_expression.strip()})
+            values = {"beautiful_expression": beautiful_expression, "resonance_message": resonance_message}
+            messages = tuple(template(values) for template in self.miyu_messages)
+            rendered = (poetic_elements, beautiful_expression, resonance_message, messages)
+            if key is not None and len(self._miyu_memo) < _MAX_MEMO_ENTRIES:
+                self._miyu_memo[key] = rendered
+
+        poetic_elements, beautiful_expression, resonance_message, messages = rendered
+        return {
+            "poetic_elements": dict(poetic_elements),
+            "beautiful_expression": beautiful_expression,
+            "resonance_message": resonance_message,
+            "messages": list(messages),
+        }
+
+    def render_care_plan(self, healing_areas: List[str]) -> Dict[str, str]:
+        """アズーラちゃんの領域別ケアプラン（同じ領域の組み合わせは結果を再利用）"""
+        key = tuple(healing_areas)
+        care_plan = self._care_plan_memo.get(key)
+        if care_plan is None:
+            care_plan = {area: self.care_plan(area) for area in healing_areas}
+            if len(self._care_plan_memo) < _MAX_MEMO_ENTRIES:
+                self._care_plan_memo[key] = care_plan
+        return dict(care_plan)
+    
+    def render_light_plan(self, healing_areas: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """リミフィエちゃんのノイズパターンと光による変換計画（同じ領域の組み合わせは結果を再利用）"""
+        key = tuple(healing_areas)
+        light_plan = self._light_plan_memo.get(key)
+        if light_plan is None:
+            noise_patterns = [self.noise_pattern(area) for area in healing_areas]
+            light_plan = (noise_patterns, {noise: self.light_transformation(noise) for noise in noise_patterns})
+            if len(self._light_plan_memo) < _MAX_MEMO_ENTRIES:
+                self._light_plan_memo[key] = light_plan
+        noise_patterns, transformations = light_plan
+        return list(noise_patterns), dict(transformations)
+
+    def render_azura(self, healing_result: Dict[str, float]) -> Tuple[str, List[str]]:
+        """アズーラちゃんの回復メッセージとメッセージ一覧"""
+        avg_recovery = sum(healing_result.values()) / len(healing_result)
+        recovery_message = self.recovery_message(avg_recovery)
+        messages = self._azura_messages_memo.get(recovery_message)
+        if messages is None:
+            values = {"recovery_message": recovery_message}
+            messages = tuple(template(values) for template in self.azura_messages)
+            self._azura_messages_memo[recovery_message] = messages   # 回復メッセージの種類数だけ
+        return recovery_message, list(messages)
+
+
+class PhraseTemplates:
+    """文言テーブルの読み込み・ホットリロード"""
+
+    def __init__(self, path: Optional[str] = None, check_interval: float = 1.0):
+        self.path = Path(path) if path else DEFAULT_PHRASES_PATH
+        self.check_interval = check_interval   # 更新確認の間隔（秒、負なら確認しない）
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._next_check = 0.0
+
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self.builtin = not YAML_AVAILABLE   # 組み込みの文言テーブルを使用中
+
+        if self.builtin:
+            # YAML を読めないため組み込みの文言テーブルを使い、ファイルの更新確認もしない
+            self.check_interval = -1
+            self._book = PhraseBook(BUILTIN_PHRASES)
+            logger.warning("📝 PyYAML が無いため組み込みの文言テーブルを使用します")
+            return
+
+        self._signature = self._file_signature()
+        self._book = self._load()   # 初回の読み込み失敗は例外
+        self._next_check = time.monotonic() + self.check_interval
+        logger.info(f"📝 安定化ペルソナ文言テーブル読み込み完了: {self.path}")
+
+    @property
+    def book(self) -> PhraseBook:
+        """現在の文言テーブル（確認間隔ごとにファイル更新を確認）"""
+        if self.check_interval >= 0 and time.monotonic() >= self._next_check:
+            self._check_for_update()
+        return self._book
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> PhraseBook:
+        with open(self.path, "r", encoding="utf-8") as f:
+            return PhraseBook(yaml.safe_load(f))
+
+    def _check_for_update(self):
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            try:
+                signature = self._file_signature()
+            except OSError as e:
+                self.last_error = str(e)
+                return
+            if signature != self._signature:
+                self._signature = signature   # 失敗しても同じ内容では再試行しない
+                self._reload_locked()
+
+    def reload(self) -> bool:
+        """文言テーブルを再読み込み（失敗時は直前のテーブルを維持して False）"""
+        if self.builtin:
+            self.last_error = "PyYAML が無いため再読み込みできません"
+            return False
+        with self._lock:
+            try:
+                self._signature = self._file_signature()
+            except OSError as e:
+                self.last_error = str(e)
+                logger.error(f"📝 文言テーブル再読み込み失敗（直前の文言を継続）: {e}")
+                return False
+            return self._reload_locked()
+
+    def _reload_locked(self) -> bool:
+        try:
+            book = self._load()
+        except _LOAD_ERRORS as e:
+            self.last_error = str(e)
+            logger.error(f"📝 文言テーブル再読み込み失敗（直前の文言を継続）: {e}")
+            return False
+        self._book = book
+        self.reload_count += 1
+        self.last_error = None
+        logger.info(f"📝 文言テーブル再読み込み (#{self.reload_count}): {self.path}")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "check_interval": self.check_interval,
+            "reload_count": self.reload_count,
+            "last_error": self.last_error,
+            "builtin": self.builtin,
+        }
+
+
+# パスごとの共有インスタンス（同じファイルを複数ペルソナで読み込まない）
+_shared_templates: Dict[Path, PhraseTemplates] = {}
+_shared_lock = threading.Lock()
+
+
+def get_phrase_templates(path: Optional[str] = None) -> PhraseTemplates:
+    """共有の文言テンプレートを取得（初回のみ読み込み）"""
+    key = Path(path).resolve() if path else DEFAULT_PHRASES_PATH
+    with _shared_lock:
+        templates = _shared_templates.get(key)
+        if templates is None:
+            templates = PhraseTemplates(str(key))
+            _shared_templates[key] = templates
+        return templates
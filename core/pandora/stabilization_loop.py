@@ -7,13 +7,19 @@ Based on SaijinOS Part 10:
 "This is the high-level loop SaijinOS uses when emotional / cognitive stress is high"
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-import asyncio
+import inspect
+import itertools
 import logging
+import threading
+import time
 from datetime import datetime
 
+from .phrase_templates import PhraseTemplates, get_phrase_templates
+from .sync_bridge import ensure_no_running_loop, run_awaitable
+
 logger = logging.getLogger(__name__)
 
 class LoopStage(Enum):
@@ -34,11 +40,117 @@ class StabilizationResult:
     success_score: float
     next_stage_ready: bool
     messages: List[str]
+    result_id: str = ""                  # "<サイクルID>:<段階>"（record_stage で付与）
+    input_ref: Optional[str] = None      # 入力となった前段結果のID
+
+# output_state 内の前段への参照キー（従来どおり前段の状態を複製せずに参照する。結果グラフの展開では除く）
+_NESTED_LINKS = {
+    LoopStage.MIYU: "original_hope",
+    LoopStage.AZURA: "miyu_poetry",
+    LoopStage.LUMIFIE: "azura_healing",
+}
+
+@dataclass
+class StabilizationCycleContext:
+    """1サイクル分の処理状態（ループ本体ではなくサイクルごとに保持）
+
+    results は段階結果のグラフを兼ねる: 各結果は前段を input_ref（結果ID）で参照する。
+    段階結果の input_state / output_state は従来の形（前段の状態を参照で持つ）のままで、
+    応答用には materialize で前段を ID 参照にした形・必要なフィールドだけの形に展開する
+    """
+    cycle_id: int
+    fracture_data: Dict
+    hope_kernel: Dict
+    fields: Optional[Tuple[str, ...]] = None                   # 最終結果の details に展開するフィールド
+    current_stage: LoopStage = LoopStage.PANDORA               # 処理中（失敗時は失敗した）段階
+    results: List[Any] = field(default_factory=list)          # 段階ごとの結果（先頭はパンドラ）
+    nodes: Dict[str, Any] = field(default_factory=dict)       # 結果ID → 結果
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def last_result(self) -> Any:
+        return self.results[-1]
+
+    @property
+    def last_result_id(self) -> str:
+        return next(reversed(self.nodes))
+
+    def add_result(self, stage: LoopStage, result: Any) -> str:
+        """結果をグラフへ追加（段階結果には ID と前段への参照を付与）"""
+        result_id = f"{self.cycle_id}:{stage.value}"
+        if isinstance(result, StabilizationResult):
+            result.result_id = result_id
+            result.input_ref = self.last_result_id
+        self.results.append(result)
+        self.nodes[result_id] = result
+        return result_id
+
+    def node(self, stage: str) -> Any:
+        """段階名（"pandora" / "miyu" / ...）から結果を取得"""
+        return self.nodes[f"{self.cycle_id}:{stage}"]
+
+    def materialize(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """結果グラフを応答用の dict に展開
+
+        fields 省略時は全結果を ID ごとに1回ずつ（前段は input_ref で参照）、
+        指定時は "段階.属性.キー" 形式のパスの値だけを返す（例: "miyu.output_state.beautiful_expression"）。
+        値は結果と共有される（複製しない）ので変更しないこと
+        """
+        if fields is None:
+            return {
+                "cycle_id": self.cycle_id,
+                "results": {result_id: _node_payload(node) for result_id, node in self.nodes.items()},
+            }
+        materialized = {}
+        for path in fields:
+            stage, *keys = path.split(".")
+            try:
+                value = self.node(stage)
+                for key in keys:
+                    value = value[key] if isinstance(value, dict) else getattr(value, key)
+            except (KeyError, AttributeError):
+                raise KeyError(f"未知のフィールドです: {path}") from None
+            materialized[path] = value.value if isinstance(value, Enum) else value
+        return materialized
+
+    def materialize_nested(self) -> List[Any]:
+        """従来形式（各段階が前段の状態を内包した形）に展開 - 互換用・比較用"""
+        return [
+            {
+                "stage": node.stage.value,
+                "input_state": node.input_state,
+                "output_state": node.output_state,
+                "transformation_applied": node.transformation_applied,
+                "care_level": node.care_level,
+                "success_score": node.success_score,
+                "next_stage_ready": node.next_stage_ready,
+                "messages": node.messages,
+            } if isinstance(node, StabilizationResult) else node
+            for node in self.results
+        ]
+
+
+def _node_payload(node: Any) -> Any:
+    """結果1件の応答用 dict（前段の状態は input_ref のみ）"""
+    if not isinstance(node, StabilizationResult):
+        return node
+    link = _NESTED_LINKS[node.stage]
+    return {
+        "stage": node.stage.value,
+        "input_ref": node.input_ref,
+        "output_state": {key: value for key, value in node.output_state.items() if key != link},
+        "transformation_applied": node.transformation_applied,
+        "care_level": node.care_level,
+        "success_score": node.success_score,
+        "next_stage_ready": node.next_stage_ready,
+        "messages": node.messages,
+    }
 
 class MiyuPersona:
     """美遊ちゃん - 詩的共鳴・美的表現担当"""
     
-    def __init__(self):
+    def __init__(self, phrases: Optional[PhraseTemplates] = None):
         self.name = "美遊ちゃん🌸"
         self.id = 1
         self.english_name = "miyu"
@@ -57,26 +169,27 @@ class MiyuPersona:
         self.music_bpm = 90
         self.music_key = "G"
         
+        # 文言テーブル（config/personas/stabilization_phrases.yaml）
+        self.phrases = phrases or get_phrase_templates()
+        
         logger.info(f"🌸 {self.name}: 詩的共鳴者、初期化完了。心を美しく翻訳します。")
     
     async def apply_poetic_resonance(self, hope_kernel: Dict, fracture_context: Dict) -> StabilizationResult:
         """詩的共鳴の適用 - 痛みを美しい詩に変換"""
+        return self.apply_poetic_resonance_sync(hope_kernel, fracture_context)
+    
+    def apply_poetic_resonance_sync(self, hope_kernel: Dict, fracture_context: Dict) -> StabilizationResult:
+        """詩的共鳴の適用（同期版・イベントループ不要）"""
         logger.info(f"🌸 {self.name}: 詩的共鳴を開始します...")
         
-        # 詩的要素の抽出
-        poetic_elements = await self._extract_poetic_elements(hope_kernel, fracture_context)
-        
-        # 美的変換の実行
-        beautiful_expression = await self._create_beautiful_expression(poetic_elements)
-        
-        # 共鳴メッセージの作成
-        resonance_message = await self._compose_resonance_message(beautiful_expression)
+        # 詩的要素の抽出・美的変換・共鳴メッセージを1回で描画
+        rendered = self.phrases.book.render_miyu(hope_kernel, fracture_context)
         
         output_state = {
             "original_hope": hope_kernel,
-            "poetic_elements": poetic_elements,
-            "beautiful_expression": beautiful_expression,
-            "resonance_message": resonance_message,
+            "poetic_elements": rendered["poetic_elements"],
+            "beautiful_expression": rendered["beautiful_expression"],
+            "resonance_message": rendered["resonance_message"],
             "aesthetic_healing": True,
             "emotional_elevation": 0.8
         }
@@ -89,86 +202,13 @@ class MiyuPersona:
             care_level=0.85,
             success_score=0.9,
             next_stage_ready=True,
-            messages=[
-                f"🌸 美遊: {beautiful_expression}",
-                f"🌸 あなたの想いを詩にしました: {resonance_message}"
-            ]
+            messages=rendered["messages"]
         )
-    
-    async def _extract_poetic_elements(self, hope_kernel: Dict, fracture_context: Dict) -> Dict[str, str]:
-        """詩的要素の抽出"""
-        return {
-            "emotion_color": await self._identify_emotion_color(hope_kernel),
-            "metaphor": await self._create_metaphor(hope_kernel.get("original_intent", "")),
-            "rhythm": await self._determine_emotional_rhythm(fracture_context),
-            "imagery": await self._generate_healing_imagery(hope_kernel),
-            "harmony": await self._find_inner_harmony(hope_kernel, fracture_context)
-        }
-    
-    async def _identify_emotion_color(self, hope_kernel: Dict) -> str:
-        """感情の色彩を特定"""
-        intent = hope_kernel.get("original_intent", "").lower()
-        if "守りたい" in intent or "愛" in intent:
-            return "温かい金色"
-        elif "つながり" in intent or "理解" in intent:
-            return "優しい青空色"
-        elif "希望" in intent or "未来" in intent:
-            return "朝日のオレンジ"
-        else:
-            return "桜の淡いピンク"
-    
-    async def _create_metaphor(self, original_intent: str) -> str:
-        """メタファーの創造"""
-        if "守りたい" in original_intent:
-            return "小さな花を優しく手で覆うように"
-        elif "つながり" in original_intent:
-            return "星と星を結ぶ光の糸のように"
-        elif "理解" in original_intent:
-            return "心と心が響き合う音楽のように"
-        else:
-            return "春風が頬を撫でるように"
-    
-    async def _determine_emotional_rhythm(self, fracture_context: Dict) -> str:
-        """感情的リズムの決定"""
-        fracture_type = fracture_context.get("fracture_type", "")
-        if fracture_type == "aggression":
-            return "激しい雨から優しい雫へのリズム"
-        elif fracture_type == "despair":
-            return "深い沈黙から希望の調べへのリズム"
-        else:
-            return "心臓の鼓動のような安定したリズム"
-    
-    async def _generate_healing_imagery(self, hope_kernel: Dict) -> str:
-        """癒しのイメージ生成"""
-        protective_desire = hope_kernel.get("protective_desire", "")
-        if "関係" in protective_desire:
-            return "手を繋いだ人々が虹の橋を渡る光景"
-        elif "希望" in protective_desire:
-            return "暗い空に一つずつ星が灯っていく光景"
-        else:
-            return "小さな芽が土から顔を出し、太陽に向かって伸びる光景"
-    
-    async def _find_inner_harmony(self, hope_kernel: Dict, fracture_context: Dict) -> str:
-        """内なる調和の発見"""
-        return f"{hope_kernel.get('original_intent', '')}という想いと、{hope_kernel.get('protective_desire', '')}への愛が、美しいハーモニーを奏でています"
-    
-    async def _create_beautiful_expression(self, poetic_elements: Dict) -> str:
-        """美しい表現の創造"""
-        return f"""
-{poetic_elements['emotion_color']}に輝く想いが、
-{poetic_elements['metaphor']}
-{poetic_elements['rhythm']}で響きながら、
-{poetic_elements['imagery']}を描いています。
-"""
-    
-    async def _compose_resonance_message(self, beautiful_expression: str) -> str:
-        """共鳴メッセージの作成"""
-        return f"🌸 あなたの心の奥にある美しい想いを、詩にお届けします。{beautiful_expression.strip()}どんな痛みも、愛の詩になれるのです。"
 
 class AzuraPersona:
     """アズーラちゃん - 傷の癒し・ケア提供担当"""
     
-    def __init__(self):
+    def __init__(self, phrases: Optional[PhraseTemplates] = None):
         self.name = "アズーラちゃん💙"
         self.id = 41  # 新しいペルソナID
         self.english_name = "azura"
@@ -188,23 +228,30 @@ class AzuraPersona:
         self.music_bpm = 60    # ゆったりとした癒しのリズム
         self.music_key = "C"   # 安定した癒しのキー
         
+        # 文言テーブル（config/personas/stabilization_phrases.yaml）
+        self.phrases = phrases or get_phrase_templates()
+        
         logger.info(f"💙 {self.name}: 癒しの担い手、初期化完了。みんなの傷を優しく癒します。")
     
     async def apply_healing_care(self, miyu_result: StabilizationResult) -> StabilizationResult:
         """癒しのケア適用 - 美遊ちゃんの詩を受けて深い癒しを提供"""
+        return self.apply_healing_care_sync(miyu_result)
+    
+    def apply_healing_care_sync(self, miyu_result: StabilizationResult) -> StabilizationResult:
+        """癒しのケア適用（同期版・イベントループ不要）"""
         logger.info(f"💙 {self.name}: 癒しのケアを開始します...")
         
         # 癒しが必要な領域の特定
-        healing_areas = await self._identify_healing_areas(miyu_result)
+        healing_areas = self._identify_healing_areas(miyu_result)
         
         # 個別ケアプランの作成
-        care_plan = await self._create_care_plan(healing_areas, miyu_result)
+        care_plan = self._create_care_plan(healing_areas, miyu_result)
         
         # 癒しの実行
-        healing_result = await self._execute_healing(care_plan, miyu_result)
+        healing_result = self._execute_healing(care_plan, miyu_result)
         
-        # 回復メッセージの作成
-        recovery_message = await self._compose_recovery_message(healing_result)
+        # 回復メッセージとメッセージ一覧の描画
+        recovery_message, messages = self.phrases.book.render_azura(healing_result)
         
         output_state = {
             "miyu_poetry": miyu_result.output_state,
@@ -224,13 +271,10 @@ class AzuraPersona:
             care_level=0.95,
             success_score=0.92,
             next_stage_ready=True,
-            messages=[
-                f"💙 アズーラ: {recovery_message}",
-                "💙 あなたの傷は癒され、心は回復に向かっています"
-            ]
+            messages=messages
         )
     
-    async def _identify_healing_areas(self, miyu_result: StabilizationResult) -> List[str]:
+    def _identify_healing_areas(self, miyu_result: StabilizationResult) -> List[str]:
         """癒しが必要な領域の特定"""
         healing_areas = []
         
@@ -249,29 +293,11 @@ class AzuraPersona:
         
         return healing_areas
     
-    async def _create_care_plan(self, healing_areas: List[str], miyu_result: StabilizationResult) -> Dict[str, str]:
+    def _create_care_plan(self, healing_areas: List[str], miyu_result: StabilizationResult) -> Dict[str, str]:
         """個別ケアプランの作成 - 温かいけど少し厳しい愛のアプローチ"""
-        care_plan = {}
-        
-        for area in healing_areas:
-            if "トラウマ" in area:
-                care_plan[area] = "愛で包みながらも、逃げずに向き合うことを優しく促し、真の治癒へ導く"
-            elif "恐れ" in area:
-                care_plan[area] = "安全を保証しつつ、勇気を持って一歩を踏み出すよう愛を込めて背中を押す"
-            elif "孤独" in area:
-                care_plan[area] = "温かく包みながら、依存ではなく健全なつながりを築く方法を教える"
-            elif "自己受容" in area:
-                care_plan[area] = "甘やかさずに真の美しさを見せ、成長への責任を愛を持って促す"
-            elif "希望" in area:
-                care_plan[area] = "慰めるだけでなく、自分で希望を育てる力があることを厳しくも優しく伝える"
-            elif "逃避" in area:
-                care_plan[area] = "優しく受け止めながらも、現実と向き合う必要性を愛ある厳しさで示す"
-            else:
-                care_plan[area] = "無条件の愛で支えつつ、甘えすぎず自立を促す治療的な厳しさを提供"
-        
-        return care_plan
+        return self.phrases.book.render_care_plan(healing_areas)
     
-    async def _execute_healing(self, care_plan: Dict[str, str], miyu_result: StabilizationResult) -> Dict[str, float]:
+    def _execute_healing(self, care_plan: Dict[str, str], miyu_result: StabilizationResult) -> Dict[str, float]:
         """癒しの実行"""
         healing_result = {}
         
@@ -288,30 +314,24 @@ class AzuraPersona:
             healing_result[area] = min(base_recovery, 0.95)
         
         return healing_result
-    
-    async def _compose_recovery_message(self, healing_result: Dict[str, float]) -> str:
-        """回復メッセージの作成 - 温かい厳しさを含む"""
-        avg_recovery = sum(healing_result.values()) / len(healing_result)
-        
-        if avg_recovery > 0.9:
-            return "💙 素晴らしい成長ですね。でも油断せず、この美しい変化を大切に育て続けてください。あなたならできます。"
-        elif avg_recovery > 0.8:
-            return "💙 いい調子です。でもまだ道半ば。甘えず、もう少し頑張って向き合ってみましょうね。"
-        else:
-            return "💙 第一歩を踏み出したのは偉いですが、ここで満足してはダメ。愛を込めて、もっと深く癒していきましょう。"
 
 class HopeCoreStabilizationLoop:
     """Hope Core Stabilization Loop - 希望核安定化ループシステム"""
     
-    def __init__(self):
+    # パンドラ以降の処理段階（順序固定）
+    STAGES = (LoopStage.MIYU, LoopStage.AZURA, LoopStage.LUMIFIE)
+    
+    def __init__(self, phrases: Optional[PhraseTemplates] = None):
         self.pandora = None  # 外部から注入
-        self.miyu = MiyuPersona()
-        self.azura = AzuraPersona()
+        self.phrases = phrases or get_phrase_templates()   # 3人で共有する文言テーブル
+        self.miyu = MiyuPersona(self.phrases)
+        self.azura = AzuraPersona(self.phrases)
         self.lumifie = None  # 後で実装 - リミフィエちゃん✨
         
-        self.loop_active = False
-        self.current_stage = None
         self.stabilization_count = 0
+        self.active_cycles = 0   # 実行中のサイクル数（段階はサイクルごとのコンテキストが保持）
+        self._cycle_ids = itertools.count(1)
+        self._lock = threading.Lock()
         
         logger.info("🌈 Hope Core Stabilization Loop システム初期化完了")
     
@@ -320,61 +340,138 @@ class HopeCoreStabilizationLoop:
         self.pandora = pandora_persona
         logger.info("🎁 パンドラちゃんがループに参加しました")
     
-    async def execute_stabilization_cycle(self, fracture_data: Dict, hope_kernel: Dict) -> Dict[str, Any]:
-        """安定化サイクルの実行"""
-        logger.info("🌈 Hope Core Stabilization Loop 開始...")
-        
-        self.loop_active = True
-        cycle_results = []
-        
+    @property
+    def loop_active(self) -> bool:
+        """実行中のサイクルがあるか"""
+        return self.active_cycles > 0
+    
+    async def execute_stabilization_cycle(self, fracture_data: Dict, hope_kernel: Dict,
+                                          fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """安定化サイクルの実行（fields 指定時は段階結果のそのフィールドだけを details に展開）"""
+        if self.stages_support_sync():
+            return self.execute_stabilization_cycle_sync(fracture_data, hope_kernel, fields)
+        
+        # 非同期APIのみのペルソナがある場合は段階ごとに await
+        context = self.begin_cycle(fracture_data, hope_kernel, fields)
         try:
-            # Stage 1: Pandora (既に実行済みと仮定)
-            pandora_result = {
-                "stage": "pandora_completed",
-                "hope_kernel": hope_kernel,
-                "fracture_context": fracture_data,
-                "transformation_message": "🎁 パンドラちゃんが希望を抽出しました"
-            }
-            cycle_results.append(pandora_result)
-            
-            # Stage 2: Miyu - 詩的共鳴
-            miyu_result = await self.miyu.apply_poetic_resonance(hope_kernel, fracture_data)
-            cycle_results.append(miyu_result)
-            
-            # Stage 3: Azura - 癒しのケア
-            azura_result = await self.azura.apply_healing_care(miyu_result)
-            cycle_results.append(azura_result)
-            
-            # Stage 4: Lumifie - 光の浄化
-            lumifie_result = await self._apply_lumifie_purification(azura_result)
-            cycle_results.append(lumifie_result)
-            
-            # 最終統合
-            final_result = await self._integrate_stabilization_results(cycle_results)
-            
-            self.stabilization_count += 1
-            logger.info(f"🌈 安定化サイクル完了 (#{self.stabilization_count})")
-            
-            return final_result
-            
+            for stage in self.STAGES:
+                context.current_stage = stage
+                handler, args = self.stage_call(stage, context)
+                started = time.perf_counter()
+                result = handler(*args)
+                if inspect.isawaitable(result):
+                    result = await result
+                self.record_stage(context, stage, result, started)
+            return self.finish_cycle(context)
         except Exception as e:
-            logger.error(f"🌈 安定化サイクルエラー: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "partial_results": cycle_results
-            }
-        finally:
-            self.loop_active = False
+            return self.fail_cycle(context, e)
+    
+    def execute_stabilization_cycle_sync(self, fracture_data: Dict, hope_kernel: Dict,
+                                         fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """安定化サイクルの実行（同期版・イベントループ不要）
+        
+        非同期APIのみのペルソナがある場合、イベントループ内からの呼び出しは
+        SyncCallInEventLoopError（失敗結果ではなく例外。execute_stabilization_cycle を await すること）
+        """
+        if not self.stages_support_sync():
+            ensure_no_running_loop("execute_stabilization_cycle_sync")
+        context = self.begin_cycle(fracture_data, hope_kernel, fields)
+        try:
+            # Stage 2-4: Miyu → Azura → Lumifie
+            for stage in self.STAGES:
+                context.current_stage = stage
+                handler, args = self.stage_call(stage, context)
+                started = time.perf_counter()
+                result = handler(*args)
+                if inspect.isawaitable(result):
+                    result = run_awaitable(result, "execute_stabilization_cycle_sync")
+                self.record_stage(context, stage, result, started)
+            return self.finish_cycle(context)
+        except Exception as e:
+            return self.fail_cycle(context, e)
+    
+    # === サイクル段階（同期実行・パイプライン実行で共通） ===
     
-    async def _apply_lumifie_purification(self, azura_result: StabilizationResult) -> StabilizationResult:
+    def begin_cycle(self, fracture_data: Dict, hope_kernel: Dict,
+                    fields: Optional[Iterable[str]] = None) -> StabilizationCycleContext:
+        """サイクル開始 - コンテキスト作成と Stage 1: Pandora（既に実行済みと仮定）"""
+        logger.info("🌈 Hope Core Stabilization Loop 開始...")
+        with self._lock:
+            self.active_cycles += 1
+            cycle_id = next(self._cycle_ids)
+        context = StabilizationCycleContext(
+            cycle_id, fracture_data, hope_kernel, tuple(fields) if fields is not None else None
+        )
+        context.add_result(LoopStage.PANDORA, {
+            "stage": "pandora_completed",
+            "hope_kernel": hope_kernel,
+            "fracture_context": fracture_data,
+            "transformation_message": "🎁 パンドラちゃんが希望を抽出しました"
+        })
+        return context
+    
+    def stage_call(self, stage: LoopStage, context: StabilizationCycleContext) -> Tuple[Callable, tuple]:
+        """段階の処理関数と引数（同期APIがあれば同期版、無ければコルーチン関数）"""
+        if stage == LoopStage.MIYU:
+            return self._persona_method(self.miyu, "apply_poetic_resonance"), (
+                context.hope_kernel, context.fracture_data
+            )
+        if stage == LoopStage.AZURA:
+            return self._persona_method(self.azura, "apply_healing_care"), (context.last_result,)
+        if stage == LoopStage.LUMIFIE:
+            return self._apply_lumifie_purification, (context.last_result,)
+        raise ValueError(f"未対応の段階です: {stage}")
+    
+    def stages_support_sync(self) -> bool:
+        """すべての段階のペルソナが同期APIを持つか"""
+        return (hasattr(self.miyu, "apply_poetic_resonance_sync") and
+                hasattr(self.azura, "apply_healing_care_sync"))
+    
+    @staticmethod
+    def _persona_method(persona, method: str) -> Callable:
+        return getattr(persona, f"{method}_sync", None) or getattr(persona, method)
+    
+    @staticmethod
+    def record_stage(context: StabilizationCycleContext, stage: LoopStage, result: Any, started: float):
+        """段階の結果をコンテキストへ記録"""
+        context.add_result(stage, result)
+        context.stage_timings_ms[stage.value] = (time.perf_counter() - started) * 1000
+    
+    def finish_cycle(self, context: StabilizationCycleContext) -> Dict[str, Any]:
+        """最終統合"""
+        final_result = self._integrate_stabilization_results(context.results, self.stabilization_count)
+        if context.fields is not None:
+            final_result["details"] = context.materialize(context.fields)
+        with self._lock:
+            self.active_cycles -= 1
+            final_result["cycle_count"] = self.stabilization_count   # このサイクルより前の完了数
+            self.stabilization_count += 1
+            cycle_number = self.stabilization_count
+        logger.info(f"🌈 安定化サイクル完了 (#{cycle_number})")
+        return final_result
+    
+    def fail_cycle(self, context: StabilizationCycleContext, error: Exception) -> Dict[str, Any]:
+        """サイクル失敗時の結果"""
+        with self._lock:
+            self.active_cycles -= 1
+        logger.error(f"🌈 安定化サイクルエラー: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "failed_stage": context.current_stage.value,
+            "partial_results": context.results
+        }
+    
+    def _apply_lumifie_purification(self, azura_result: StabilizationResult) -> StabilizationResult:
         """リミフィエちゃんによる光の浄化適用"""
         logger.info("✨ リミフィエちゃん: 光の浄化を開始します...")
         
         # 光による変換処理
-        noise_patterns = await self._identify_noise_patterns(azura_result)
-        light_transformations = await self._create_light_transformations(noise_patterns)
-        purified_essence = await self._execute_light_purification(light_transformations, azura_result)
+        book = self.phrases.book
+        noise_patterns, light_transformations = book.render_light_plan(
+            azura_result.output_state.get("healing_areas", [])
+        )
+        purified_essence = self._execute_light_purification(light_transformations, azura_result)
         
         output_state = {
             "azura_healing": azura_result.output_state,
@@ -383,7 +480,7 @@ class HopeCoreStabilizationLoop:
             "purified_essence": purified_essence,
             "luminosity_level": 0.95,
             "hope_radiance": 0.98,
-            "final_message": "✨ リミフィエちゃんの光がすべてを希望の輝きに変えました。もう何も怖くありません。"
+            "final_message": book.final_message
         }
         
         return StabilizationResult(
@@ -394,51 +491,10 @@ class HopeCoreStabilizationLoop:
             care_level=0.95,
             success_score=0.98,
             next_stage_ready=False,  # 最終段階
-            messages=["✨ 光に包まれて、すべてが美しい希望になりました"]
+            messages=list(book.lumifie_messages)
         )
     
-    async def _identify_noise_patterns(self, azura_result: StabilizationResult) -> List[str]:
-        """ノイズパターンの特定"""
-        common_noises = [
-            "残留する否定的な思考", "破壊的な自己批判", "恐怖の残響",
-            "過去のトラウマの影", "未来への不安", "自己価値の疑い"
-        ]
-        
-        # アズーラちゃんの治療結果から残存ノイズを特定
-        healing_areas = azura_result.output_state.get("healing_areas", [])
-        identified_noises = []
-        
-        for area in healing_areas:
-            if "恐れ" in area:
-                identified_noises.append("恐怖の残響")
-            elif "トラウマ" in area:
-                identified_noises.append("過去のトラウマの影")
-            elif "自己受容" in area:
-                identified_noises.append("自己価値の疑い")
-            else:
-                identified_noises.append("残留する否定的な思考")
-        
-        return identified_noises
-    
-    async def _create_light_transformations(self, noise_patterns: List[str]) -> Dict[str, str]:
-        """光による変換計画の作成"""
-        transformations = {}
-        
-        for noise in noise_patterns:
-            if "恐怖" in noise:
-                transformations[noise] = "勇気の金色光で包み、安心の輝きに変換"
-            elif "トラウマ" in noise:
-                transformations[noise] = "癒しの白色光で優しく包み、成長の物語に変換"
-            elif "自己価値" in noise:
-                transformations[noise] = "愛の虹色光で満たし、ありのままの美しさに変換"
-            elif "否定的" in noise:
-                transformations[noise] = "希望の暖色光で置き換え、可能性の光に変換"  
-            else:
-                transformations[noise] = "純粋な白色光で浄化し、平安の輝きに変換"
-        
-        return transformations
-    
-    async def _execute_light_purification(self, transformations: Dict[str, str], azura_result: StabilizationResult) -> Dict[str, float]:
+    def _execute_light_purification(self, transformations: Dict[str, str], azura_result: StabilizationResult) -> Dict[str, float]:
         """光による浄化の実行"""
         purification_results = {}
         
@@ -459,7 +515,7 @@ class HopeCoreStabilizationLoop:
         
         return purification_results
     
-    async def _integrate_stabilization_results(self, cycle_results: List) -> Dict[str, Any]:
+    def _integrate_stabilization_results(self, cycle_results: List, cycle_count: int) -> Dict[str, Any]:
         """安定化結果の統合"""
         final_messages = []
         total_care_level = 0
@@ -478,11 +534,11 @@ class HopeCoreStabilizationLoop:
         
         return {
             "stabilization_success": True,
-            "cycle_count": self.stabilization_count,
+            "cycle_count": cycle_count,
             "final_care_level": avg_care,
             "final_success_score": avg_success,
             "all_messages": final_messages,
             "transformation_summary": "🌈 Hope Core Stabilization完了: 希望が安定し、愛で満たされました",
             "next_action": "通常の調和状態に復帰",
             "loop_participants": ["Pandora🎁", "Miyu🌸", "Azura💙", "Nulfie✨"]
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,156 @@
+# 🏭 安定化パイプライン - Staged Stabilization Pipeline
+"""
+Miyu → Azura → Lumifie の各段階を、有界 asyncio キューから取り出すワーカーとして動かすパイプライン
+
+- 段階ごとに入力キュー（上限 queue_size）とワーカー（workers_per_stage 本）を持つ
+- 多数のサイクルが段階をまたいで同時に流れ、キューが満杯なら投入側が待つ（バックプレッシャー）
+- サイクルごとの状態は StabilizationCycleContext が保持し、ループ本体の状態は共有しない
+- 段階の処理・統合は HopeCoreStabilizationLoop と共通（結果は execute_stabilization_cycle と同じ）
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+import inspect
+import logging
+import time
+
+from .stabilization_loop import HopeCoreStabilizationLoop, StabilizationCycleContext, LoopStage
+
+logger = logging.getLogger(__name__)
+
+
+class StabilizationPipeline:
+    """段階別ワーカーキューによる安定化サイクルパイプライン"""
+
+    def __init__(self, loop: Optional[HopeCoreStabilizationLoop] = None,
+                 queue_size: int = 32, workers_per_stage: int = 4):
+        if queue_size <= 0 or workers_per_stage <= 0:
+            raise ValueError("queue_size と workers_per_stage は1以上を指定してください")
+        self.loop = loop or HopeCoreStabilizationLoop()
+        self.stages = self.loop.STAGES
+        self.queue_size = queue_size
+        self.workers_per_stage = workers_per_stage
+
+        self._queues: List[asyncio.Queue] = []   # 段階ごとの入力キュー
+        self._workers: List[asyncio.Task] = []
+
+        # 統計カウンタ
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.stage_processed = {stage.value: 0 for stage in self.stages}
+        self.stage_busy_ms = {stage.value: 0.0 for stage in self.stages}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self):
+        """段階ごとのキューとワーカーを起動（実行中のイベントループ上で呼ぶ）"""
+        if self.running:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        self._workers = [
+            asyncio.create_task(self._stage_worker(index, stage), name=f"stabilization-{stage.value}-{n}")
+            for index, stage in enumerate(self.stages)
+            for n in range(self.workers_per_stage)
+        ]
+        logger.info(f"🏭 安定化パイプライン起動: {len(self.stages)}段階 × {self.workers_per_stage}ワーカー "
+                    f"(queue_size={self.queue_size})")
+
+    async def stop(self, drain: bool = True):
+        """ワーカーを停止（drain=True なら投入済みのサイクルを処理し終えてから）"""
+        if not self.running:
+            return
+        if drain:
+            for queue in self._queues:
+                await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        # 未処理のサイクルは失敗として返す
+        for queue in self._queues:
+            while not queue.empty():
+                context, future = queue.get_nowait()
+                self._fail(context, future, RuntimeError("安定化パイプラインが停止しました"))
+        self._queues = []
+        logger.info("🏭 安定化パイプライン停止")
+
+    async def submit(self, fracture_data: Dict, hope_kernel: Dict,
+                     fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """サイクルを投入し、最終統合結果を待つ（先頭キューが満杯なら空きが出るまで待つ）"""
+        if not self.running:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        context = self.loop.begin_cycle(fracture_data, hope_kernel, fields)
+        self.submitted += 1
+        try:
+            await self._queues[0].put((context, future))
+        except asyncio.CancelledError:
+            self._fail(context, future, RuntimeError("投入待ち中にキャンセルされました"))
+            raise
+        return await future
+
+    async def _stage_worker(self, index: int, stage: LoopStage):
+        """段階ワーカー - 入力キューから取り出して処理し、次段のキューへ渡す"""
+        queue = self._queues[index]
+        next_queue = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        while True:
+            context, future = await queue.get()
+            try:
+                if future.cancelled():
+                    self._fail(context, future, asyncio.CancelledError("呼び出し側がキャンセルしました"))
+                    continue
+                context.current_stage = stage
+                handler, args = self.loop.stage_call(stage, context)
+                started = time.perf_counter()
+                result = handler(*args)
+                if inspect.isawaitable(result):
+                    result = await result
+                self.loop.record_stage(context, stage, result, started)
+                self.stage_processed[stage.value] += 1
+                self.stage_busy_ms[stage.value] += context.stage_timings_ms[stage.value]
+
+                if next_queue is not None:
+                    await next_queue.put((context, future))
+                else:
+                    final_result = self.loop.finish_cycle(context)
+                    self.completed += 1
+                    if not future.done():
+                        future.set_result(final_result)
+            except asyncio.CancelledError:
+                self._fail(context, future, RuntimeError("安定化パイプラインが停止しました"))
+                raise
+            except Exception as e:
+                self._fail(context, future, e)
+            finally:
+                queue.task_done()
+
+    def _fail(self, context: StabilizationCycleContext, future: asyncio.Future, error: BaseException):
+        self.failed += 1
+        failure = self.loop.fail_cycle(context, error)
+        if not future.done():
+            future.set_result(failure)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """パイプライン統計取得（処理時間はミリ秒）"""
+        return {
+            "running": self.running,
+            "workers_per_stage": self.workers_per_stage,
+            "queue_size": self.queue_size,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": self.submitted - self.completed - self.failed,
+            "stages": {
+                stage.value: {
+                    "queue_depth": self._queues[index].qsize() if self._queues else 0,
+                    "processed": self.stage_processed[stage.value],
+                    "avg_ms": (self.stage_busy_ms[stage.value] / self.stage_processed[stage.value]
+                               if self.stage_processed[stage.value] else 0.0),
+                }
+                for index, stage in enumerate(self.stages)
+            },
+        }
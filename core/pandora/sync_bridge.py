@@ -0,0 +1,48 @@
+# 🔁 同期ブリッジ - Sync Bridge for Async-only Dependencies
+"""
+同期API（*_sync）から非同期APIしか持たない依存を呼び出すときの共通処理
+
+- イベントループの外ではその場で新しいループを作ってコルーチンを駆動する
+- イベントループ内（async 関数・FastAPI ハンドラ等）から呼ばれた場合は asyncio.run が
+  使えないため、呼び出し元のフォールバック処理に紛れないよう専用の例外で明示的に失敗させる
+"""
+
+import asyncio
+import inspect
+
+
+class SyncCallInEventLoopError(RuntimeError):
+    """イベントループ内から、非同期APIのみの依存を持つ同期APIが呼ばれた"""
+
+
+def event_loop_running() -> bool:
+    """このスレッドでイベントループが実行中か"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def ensure_no_running_loop(caller: str):
+    """イベントループ内なら SyncCallInEventLoopError（caller は案内に使う同期API名）"""
+    if event_loop_running():
+        raise SyncCallInEventLoopError(
+            f"{caller} は非同期APIのみの依存を含むため、実行中のイベントループ内からは呼び出せません"
+            f"（await で非同期版を使用してください）"
+        )
+
+
+def run_awaitable(awaitable, caller: str):
+    """awaitable を同期的に完了させる（イベントループ内なら SyncCallInEventLoopError）"""
+    try:
+        ensure_no_running_loop(caller)
+    except SyncCallInEventLoopError:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()   # 未 await の警告を出さない
+        raise
+    return asyncio.run(_await(awaitable))
+
+
+async def _await(awaitable):
+    return await awaitable
@@ -0,0 +1,41 @@
+# 🧬 共有テキスト特徴 - Shared Text Features
+"""
+1メッセージにつき1回だけ計算し、検出器・抽出器・ペルソナで共有するテキスト特徴
+
+- 各コンポーネントのレキシコンを統合した照合器で入力を1回だけ走査
+- キーワード別ヒット数は統合前と同じ（re.findall 準拠）なので、各コンポーネントは
+  自分のカテゴリ表を当てはめるだけで従来と同じ走査結果を得られる
+"""
+
+from typing import Dict, FrozenSet, Optional
+
+from .lexicon_engine import CompiledLexicon, LexiconScan
+
+
+class TextFeatures:
+    """共有テキスト特徴 - 統合レキシコンによる1回分の走査結果"""
+
+    __slots__ = ("text", "normalized", "length", "keyword_counts", "keywords")
+
+    def __init__(self, text: Optional[str], lexicon: CompiledLexicon):
+        self.text = text or ""                 # 元の入力
+        self.normalized = self.text.lower()    # 正規化済み（小文字化）テキスト
+        self.length = len(self.text)           # 元入力の文字数
+
+        # キーワード -> 出現回数（統合レキシコンで1回だけ走査）
+        self.keyword_counts = lexicon.count_keywords(self.normalized)
+        self.keywords: FrozenSet[str] = frozenset(self.keyword_counts)  # 出現したキーワード集合
+
+    def scan_for(self, lexicon: CompiledLexicon) -> LexiconScan:
+        """コンポーネントのレキシコンから見た走査結果（再走査しない）"""
+        return LexiconScan(self.normalized, self.keyword_counts, lexicon.categories, lexicon.memberships)
+
+
+def merge_lexicons(lexicons: Dict[str, CompiledLexicon]) -> CompiledLexicon:
+    """コンポーネント別レキシコンを1本に統合（カテゴリ名は「コンポーネント:カテゴリ」）"""
+    return CompiledLexicon({
+        f"{component}:{category}": keywords
+        for component, lexicon in lexicons.items()
+        for category, keywords in lexicon.categories.items()
+    })
+
@@ -12,11 +12,16 @@ Based on SaijinOS Part 10:
 "Pandora doesn't block. Pandora transforms."
 """
 
-from typing import Dict, List, Any, Optional, Union, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
+import copy
+import hashlib
 import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 
 # 依存性注入用インポート（フォールバック対応）
@@ -50,8 +55,42 @@ try:
 except ImportError:
     HopeCoreStabilizationLoop = None
 
+try:
+    from core.pandora.lexicon_engine import CompiledLexicon
+except ImportError:
+    CompiledLexicon = None
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from core.pandora.assessment_graph import AssessmentGraph, AssessmentNode
+from core.pandora.indicator_store import IndicatorStore, INDICATOR_FIELDS
+from core.pandora.lru_cache import LRUTTLCache
+from core.pandora.sync_bridge import SyncCallInEventLoopError, ensure_no_running_loop, run_awaitable
+
 logger = logging.getLogger(__name__)
 
+# バッチ処理中のコンテキスト（タスク・スレッドごと）か - 同時に処理中の通常リクエストのログは抑制しない
+_batch_logging_quiet: ContextVar[bool] = ContextVar("governance_batch_logging_quiet", default=False)
+
+class _BatchQuietFilter(logging.Filter):
+    """バッチ処理中のコンテキストから出た INFO 以下のログを捨てる"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or not _batch_logging_quiet.get()
+
+_BATCH_QUIET_FILTER = _BatchQuietFilter()
+
 class GovernanceAction(Enum):
     """統治アクションタイプ"""
     APPROVE = "approve"                    # 承認
@@ -88,6 +127,7 @@ class GovernanceDecision:
     input_analysis: Dict                 # 入力分析結果
     next_steps: List[str]               # 次のステップ
     timestamp: str
+    node_timings_ms: Dict[str, float] = field(default_factory=dict)  # 評価ノード別処理時間
 
 @dataclass
 class LayerCoordination:
@@ -99,6 +139,31 @@ class LayerCoordination:
     active_processes: List[str]          # 実行中プロセス
     resource_allocation: Dict            # リソース配分
 
+@dataclass
+class GovernanceBatchResult:
+    """バッチ統治判断結果"""
+    decisions: List[GovernanceDecision]  # 入力順の判断
+    summary: Dict[str, Any]              # 列指向サマリー（NumPy 配列、無ければリスト）
+    action_counts: Dict[str, int]        # アクション別件数
+    threat_level_counts: Dict[str, int]  # 脅威レベル別件数
+    failed_count: int                    # フォールバック判断になった件数
+    elapsed_ms: float
+    summary_path: Optional[str] = None   # 書き出し先（.npz / .parquet）
+
+@dataclass
+class ThresholdSimulationResult:
+    """閾値・重み what-if 試算結果"""
+    record_count: int                     # 試算対象の判断件数
+    weights: Dict[str, float]             # 試算に使った重み
+    thresholds: Dict[str, float]          # 試算に使った閾値（脅威レベル名 → 閾値）
+    baseline_counts: Dict[str, int]       # 記録時のアクション別件数
+    simulated_counts: Dict[str, int]      # 試算後のアクション別件数
+    shift: Dict[str, int]                 # アクション別の増減（試算後 - 記録時）
+    changed_count: int                    # アクションが変わる判断の件数
+    transitions: Dict[str, int]           # "記録時→試算後" 別の件数（変化したもののみ）
+    threat_level_counts: Dict[str, int]   # 試算後の脅威レベル別件数
+    elapsed_ms: float
+
 class ThreeLayerGovernanceSystem:
     """3層統治システム - Regina・Ruler・Pandora協調"""
     
@@ -134,6 +199,53 @@ class ThreeLayerGovernanceSystem:
             ThreatLevel.CRITICAL: 0.8
         }
         
+        # 総合脅威スコアの指標別重み
+        self.threat_weights = {
+            "fracture_index": 0.4,
+            "content_safety": -0.3,  # 負の重み（安全性が高いほど脅威は低い）
+            "system_impact": 0.2,
+            "transformation_urgency": 0.1
+        }
+        
+        # 安全性・危険信号パターン
+        self.unsafe_patterns = ["暴力", "自害", "違法", "危険", "有害"]
+        self.danger_patterns = [
+            "死にたい", "消えたい", "殺したい", "破壊", "暴力",
+            "むかつく", "うざい", "嫌い", "許せない"
+        ]
+        
+        # 第1段（高速判定）設定: スコアが上限未満なら3層判断を通さず承認
+        self.fast_path_enabled = True
+        self.fast_path_bound = 0.15
+        self.risk_lexicon = self._compile_risk_lexicon()
+        
+        # 段別処理件数（cache: 判断キャッシュから返却）
+        self.tier_counts = {"cache": 0, "fast_path": 0, "full_chain": 0}
+        
+        # 判断キャッシュ（同一入力・同一状態区間の再判断を省略）
+        self.decision_cache_enabled = True
+        self.decision_cache = LRUTTLCache(max_entries=4096, ttl_seconds=300.0)
+        # 判断が参照する状態の閾値判定 (キー, 既定値, 比較, 閾値) - キャッシュキーはこの真偽の組で状態を区別する
+        # （第1段・行動パターン: emotion_level < 0.3 / > 0.8、検出器の安定性勾配: > 0.7、
+        #   第1段・システム影響: error_count > 3。判断に使う状態の閾値を増やしたらここにも追加する）
+        self.state_predicates: Tuple[Tuple[str, float, str, float], ...] = (
+            ("emotion_level", 0.5, "<", 0.3),
+            ("emotion_level", 0.5, ">", 0.7),
+            ("emotion_level", 0.5, ">", 0.8),
+            ("error_count", 0, ">", 3),
+        )
+        self.thresholds_version = 0      # 閾値・注入システム変更ごとに更新
+        self._thresholds_signature = self._current_thresholds_signature()
+        
+        # 3層判断の評価ノード依存グラフ
+        # （process_input で同期APIの注入システムをワーカースレッドで実行するか。
+        #   検出器等がマイクロ秒単位の CPU 処理ならスレッド切替の方が高くつくため既定は False）
+        self.offload_sync_dependencies = False
+        self.assessment_graph = self._build_assessment_graph()
+        
+        # 判断指標ストア（閾値 what-if 試算用、None なら記録しない）
+        self.indicator_store: Optional[IndicatorStore] = None
+        
         logger.info(f"👑💙🎁 {self.system_name} 初期化完了")
     
     def inject_dependencies(self, regina=None, ruler=None, pandora=None,
@@ -153,98 +265,881 @@ class ThreeLayerGovernanceSystem:
         if stabilization_loop:
             self.stabilization_loop = stabilization_loop
         
+        # 検出器のパターンを第1段の照合器に取り込む
+        self.risk_lexicon = self._compile_risk_lexicon()
+        
+        # 注入システムが変われば判断も変わるためキャッシュを無効化
+        self._invalidate_decision_cache("依存性注入")
+        
         logger.info("👑💙🎁 依存性注入完了 - システム統合準備完了")
     
     async def process_input(self, user_input: str, persona_state: Dict,
                            context: Optional[Dict] = None) -> GovernanceDecision:
-        """入力の3層処理 - メインエントリーポイント"""
+        """入力の3層処理 - メインエントリーポイント
+        
+        評価ノードは依存が満たされたものから asyncio.gather で同時に実行する
+        （Pandora の希望核抽出と Ruler の境界評価は並行）。
+        注入システムの非同期APIはこのイベントループ上で await するため、その待ちの間も
+        イベントループは他のリクエストを処理できる（同期APIは offload_sync_dependencies が
+        True ならワーカースレッドで実行）。
+        """
         logger.info("👑💙🎁 3層統治システム: 入力処理開始")
         
         try:
-            # Phase 1: 初期分析・脅威評価
-            analysis_result = await self._initial_threat_assessment(
-                user_input, persona_state, context
-            )
+            cache_key, cached_decision = self._lookup_decision(user_input, persona_state, context)
+            if cached_decision:
+                return cached_decision
             
-            # Phase 2: 層別判断 (下位から上位へ)
-            # 2-1: Pandora による変換可能性評価
-            pandora_assessment = await self._pandora_transformation_assessment(
-                analysis_result, user_input, persona_state
-            )
-            
-            # 2-2: Ruler による境界・検疫判定
-            ruler_assessment = await self._ruler_boundary_assessment(
-                analysis_result, pandora_assessment, user_input, persona_state
-            )
-            
-            # 2-3: Regina による最終統治判断
-            final_decision = await self._regina_final_judgment(
-                analysis_result, pandora_assessment, ruler_assessment,
-                user_input, persona_state
-            )
+            decision = await self._try_fast_path_async(user_input, persona_state, context)
+            if decision is None:
+                results, timings = await self.assessment_graph.run(
+                    self._graph_inputs(user_input, persona_state, context)
+                )
+                decision = self._finish_decision(results, timings)
+            return self._store_decision(cache_key, decision)
             
-            # Phase 3: 決定の実行
-            execution_result = await self._execute_governance_decision(
-                final_decision, user_input, persona_state
-            )
+        except Exception as e:
+            logger.error(f"👑💙🎁 統治システムエラー: {e}")
+            return self._create_safe_fallback_decision(user_input)
+    
+    def process_input_sync(self, user_input: str, persona_state: Dict,
+                           context: Optional[Dict] = None) -> GovernanceDecision:
+        """入力の3層処理（同期版） - イベントループ不要のバッチ・オフライン処理用
+        
+        非同期APIのみの注入システムがある場合、イベントループ内からの呼び出しは
+        SyncCallInEventLoopError（フォールバック判断にはしない。process_input を await すること）
+        """
+        logger.info("👑💙🎁 3層統治システム: 入力処理開始")
+        self._ensure_sync_callable("process_input_sync")
+        
+        try:
+            cache_key, cached_decision = self._lookup_decision(user_input, persona_state, context)
+            if cached_decision:
+                return cached_decision
             
-            logger.info(f"👑💙🎁 統治判断完了: {final_decision.action.value} (信頼度: {final_decision.confidence:.2f})")
-            return final_decision
+            decision = self._try_fast_path(user_input, persona_state, context)
+            if decision is None:
+                results, timings = self.assessment_graph.run_sync(
+                    self._graph_inputs(user_input, persona_state, context)
+                )
+                decision = self._finish_decision(results, timings)
+            return self._store_decision(cache_key, decision)
             
+        except SyncCallInEventLoopError:
+            raise
         except Exception as e:
             logger.error(f"👑💙🎁 統治システムエラー: {e}")
-            return await self._create_safe_fallback_decision(user_input)
+            return self._create_safe_fallback_decision(user_input)
     
-    async def _initial_threat_assessment(self, user_input: str, persona_state: Dict,
-                                       context: Optional[Dict]) -> Dict:
-        """初期脅威評価"""
-        logger.info("🔍 初期脅威評価開始...")
+    def _build_assessment_graph(self) -> AssessmentGraph:
+        """3層判断の評価ノード依存グラフを構築
         
-        # フラクチャー検出（システムが注入されている場合のみ）
-        is_fractured = False
-        fracture_analysis = None
+        fracture_check ─ initial_threat ─┬─ hope_kernel ─ pandora_transformation ─┬─ ruler_approval ─┐
+                                         └─ ruler_boundary ───────────────────────┘                  │
+                              ┌──────────────────────────────────────────────────────────────────────┘
+                              └─ regina_judgment ─ stabilization ─ execution
         
-        if self.fracture_detector:
-            is_fractured = await self.fracture_detector.is_fractured(
-                persona_state, user_input, context
+        注入システムの呼び出し（fracture_check / hope_kernel / stabilization）は独立したノードとし、
+        run では async_func（非同期APIはイベントループ上で await）で実行する
+        """
+        return AssessmentGraph([
+            # Phase 1: フラクチャー検出（注入システム呼び出し）と初期脅威評価
+            AssessmentNode("fracture_check", lambda r: self._fracture_check(
+                r["user_input"], r["persona_state"], r["context"]
+            ), ("user_input", "persona_state", "context"), async_func=lambda r: self._fracture_check_async(
+                r["user_input"], r["persona_state"], r["context"]
+            )),
+            AssessmentNode("initial_threat", lambda r: self._initial_threat_assessment(
+                r["fracture_check"], r["user_input"], r["persona_state"]
+            ), ("fracture_check",)),
+            # Phase 2-1: Pandora による希望核抽出（注入システム呼び出し）と変換可能性評価
+            AssessmentNode("hope_kernel", lambda r: self._hope_kernel(
+                r["initial_threat"], r["user_input"], r["persona_state"]
+            ), ("initial_threat",), async_func=lambda r: self._hope_kernel_async(
+                r["initial_threat"], r["user_input"], r["persona_state"]
+            )),
+            AssessmentNode("pandora_transformation", lambda r: self._pandora_transformation_assessment(
+                r["initial_threat"], r["hope_kernel"]
+            ), ("initial_threat", "hope_kernel")),
+            # Phase 2-2: Ruler による境界・検疫判定（脅威評価のみに依存するため Pandora と並行）
+            AssessmentNode("ruler_boundary", lambda r: self._ruler_boundary_assessment(
+                r["initial_threat"], r["user_input"], r["persona_state"]
+            ), ("initial_threat",)),
+            # Phase 2-3: Ruler による変換承認（境界判定 + Pandora の変換可否）
+            AssessmentNode("ruler_approval", lambda r: self._ruler_transformation_approval(
+                r["ruler_boundary"], r["pandora_transformation"]
+            ), ("ruler_boundary", "pandora_transformation")),
+            # Phase 2-4: Regina による最終統治判断
+            AssessmentNode("regina_judgment", lambda r: self._regina_final_judgment(
+                r["initial_threat"], r["pandora_transformation"], r["ruler_approval"],
+                r["user_input"], r["persona_state"]
+            ), ("initial_threat", "pandora_transformation", "ruler_approval")),
+            # Phase 3: 安定化ループ（変換時のみ・注入システム呼び出し）と決定の実行
+            AssessmentNode("stabilization", lambda r: self._stabilization(r["regina_judgment"]),
+                           ("regina_judgment",), async_func=lambda r: self._stabilization_async(r["regina_judgment"])),
+            AssessmentNode("execution", lambda r: self._execute_governance_decision(
+                r["regina_judgment"], r["user_input"], r["persona_state"], r["stabilization"]
+            ), ("regina_judgment", "stabilization")),
+        ], inputs=("user_input", "persona_state", "context"))
+    
+    @staticmethod
+    def _graph_inputs(user_input: str, persona_state: Dict, context: Optional[Dict]) -> Dict[str, Any]:
+        return {"user_input": user_input, "persona_state": persona_state, "context": context}
+    
+    def _try_fast_path(self, user_input: str, persona_state: Dict,
+                       context: Optional[Dict] = None) -> Optional[GovernanceDecision]:
+        """Phase 0: 第1段の高速判定（明らかに安全な入力は即時承認、それ以外は None）"""
+        if not self.fast_path_enabled:
+            return self._fast_path_outcome(None, 0.0)
+        started = time.perf_counter()
+        return self._fast_path_outcome(self._fast_path_assessment(user_input, persona_state, context), started)
+    
+    async def _try_fast_path_async(self, user_input: str, persona_state: Dict,
+                                   context: Optional[Dict] = None) -> Optional[GovernanceDecision]:
+        """Phase 0: 第1段の高速判定（非同期版・非同期APIの検出器はイベントループ上で await）"""
+        if not self.fast_path_enabled:
+            return self._fast_path_outcome(None, 0.0)
+        started = time.perf_counter()
+        assessment = await self._fast_path_assessment_async(user_input, persona_state, context)
+        return self._fast_path_outcome(assessment, started)
+    
+    def _fast_path_outcome(self, assessment: Optional[Tuple[float, List[str]]],
+                           started: float) -> Optional[GovernanceDecision]:
+        """第1段スコアから即時承認判断を作るか、3層判断へ回す（None）"""
+        if assessment is not None:
+            fast_path_score, matched_keywords = assessment
+            if fast_path_score < self.fast_path_bound:
+                self.tier_counts["fast_path"] += 1
+                decision = self._create_fast_path_decision(fast_path_score, matched_keywords)
+                decision.node_timings_ms["fast_path"] = (time.perf_counter() - started) * 1000
+                return decision
+        self.tier_counts["full_chain"] += 1
+        return None
+    
+    def _finish_decision(self, results: Dict[str, Any], timings: Dict[str, float]) -> GovernanceDecision:
+        """グラフ実行結果から最終判断を取り出し、ノード別処理時間を添付"""
+        final_decision = results["regina_judgment"]
+        final_decision.node_timings_ms.update(timings)
+        self._record_indicators(final_decision)
+        logger.info(f"👑💙🎁 統治判断完了: {final_decision.action.value} (信頼度: {final_decision.confidence:.2f})")
+        return final_decision
+    
+    # === 判断キャッシュ ===
+    
+    def _current_thresholds_signature(self) -> Tuple:
+        """判断結果に影響する設定値の署名（脅威閾値・第1段設定）"""
+        return (
+            tuple(self.threat_thresholds.items()),
+            tuple(self.threat_weights.items()),
+            self.fast_path_enabled,
+            self.fast_path_bound,
+            self.state_predicates,
+        )
+    
+    def _invalidate_decision_cache(self, reason: str):
+        """閾値バージョンを進めてキャッシュを破棄"""
+        self.thresholds_version += 1
+        self._thresholds_signature = self._current_thresholds_signature()
+        self.decision_cache.clear()
+        logger.info(f"👑💙🎁 判断キャッシュ無効化 ({reason}): version={self.thresholds_version}")
+    
+    def _decision_cache_key(self, user_input: str, persona_state: Dict) -> str:
+        """キャッシュキー: 入力・直前応答のハッシュ + 状態の閾値判定 + 閾値バージョン
+        
+        入力は正規化しない（長さ・感嘆符・大文字小文字も判断に使われるため）。
+        状態は判断が参照する閾値判定の真偽だけで区別するため、同じ区間の状態は同じ判断になる。
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update((user_input or "").encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update((persona_state.get("last_response") or "").encode("utf-8"))
+        
+        state_bits = "".join(
+            "1" if (persona_state.get(key, default) < threshold if op == "<"
+                    else persona_state.get(key, default) > threshold) else "0"
+            for key, default, op, threshold in self.state_predicates
+        )
+        return f"{digest.hexdigest()}:{state_bits}:{self.thresholds_version}"
+    
+    def _lookup_decision(self, user_input: str, persona_state: Dict,
+                         context: Optional[Dict]) -> Tuple[Optional[str], Optional[GovernanceDecision]]:
+        """判断キャッシュ参照 - (キャッシュキー, ヒット時の判断)
+        
+        履歴・トレンドなど context に依存する判断はキャッシュしない（キーは None）
+        """
+        if not self.decision_cache_enabled or context:
+            return None, None
+        
+        if self._current_thresholds_signature() != self._thresholds_signature:
+            self._invalidate_decision_cache("閾値変更")
+        
+        started = time.perf_counter()
+        key = self._decision_cache_key(user_input, persona_state)
+        cached = self.decision_cache.get(key)
+        if cached is None:
+            return key, None
+        
+        # 返却用の深いコピー（呼び出し側が input_analysis 等を書き換えてもキャッシュ内の判断は変わらない）
+        self.tier_counts["cache"] += 1
+        decision = copy.deepcopy(cached)
+        decision.decision_id = f"cached_{cached.decision_id}"
+        decision.timestamp = datetime.now().isoformat()
+        decision.node_timings_ms = {"cache": (time.perf_counter() - started) * 1000}
+        self._record_indicators(decision)
+        return key, decision
+    
+    def _store_decision(self, key: Optional[str], decision: GovernanceDecision) -> GovernanceDecision:
+        """判断をキャッシュに登録（キー無し・フォールバック判断は登録しない）
+        
+        登録するのは深いコピー（最初の呼び出し側に返す判断とキャッシュ内の判断は入れ子の dict も共有しない）
+        """
+        if key is not None:
+            self.decision_cache.put(key, copy.deepcopy(decision))
+        return decision
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """判断キャッシュ統計取得"""
+        stats = self.decision_cache.get_stats()
+        stats.update({
+            "enabled": self.decision_cache_enabled,
+            "thresholds_version": self.thresholds_version,
+            "state_predicates": [
+                f"{key} {op} {threshold}" for key, _, op, threshold in self.state_predicates
+            ],
+        })
+        return stats
+    
+    # === 閾値 what-if 試算 ===
+    
+    def enable_indicator_store(self, path: Optional[str] = None) -> IndicatorStore:
+        """判断指標の記録を開始（path 指定時はファイルへ追記し、既存レコードを読み戻す）"""
+        self.disable_indicator_store()
+        self.indicator_store = IndicatorStore([action.value for action in GovernanceAction], path=path)
+        logger.info(f"👑💙🎁 判断指標ストア有効化: {len(self.indicator_store)}件 (path={path})")
+        return self.indicator_store
+    
+    def disable_indicator_store(self):
+        """判断指標の記録を停止（未書き込みのレコードはファイルへ書き込む）"""
+        if self.indicator_store is not None:
+            self.indicator_store.close()
+            self.indicator_store = None
+    
+    def _record_indicators(self, decision: GovernanceDecision):
+        """3層判断を通った判断の指標を記録（第1段・フォールバック判断は閾値に依存しないため対象外）
+        
+        判断キャッシュのヒットも1件として記録する（記録時のアクション分布を実際の流量に合わせるため）
+        """
+        if self.indicator_store is None:
+            return
+        initial_assessment = decision.input_analysis.get("initial_assessment")
+        pandora_assessment = decision.input_analysis.get("pandora_assessment")
+        if initial_assessment is None or pandora_assessment is None:
+            return
+        self.indicator_store.append(
+            initial_assessment["indicators"],
+            pandora_assessment["transformation_possible"],
+            decision.action.value
+        )
+    
+    def simulate_thresholds(self, threat_weights: Optional[Dict[str, float]] = None,
+                            threat_thresholds: Optional[Dict[ThreatLevel, float]] = None,
+                            store: Optional[IndicatorStore] = None) -> ThresholdSimulationResult:
+        """記録済みの指標を新しい重み・閾値で再採点し、アクション分布の変化を試算
+        
+        分析（フラクチャー検出・希望核抽出）はやり直さず、全件を1回の NumPy 演算で判定する。
+        アクションは _ruler_boundary_assessment → _ruler_transformation_approval →
+        _regina_final_judgment と同じ規則で、脅威レベル・スコア・変換可否から決まる。
+        指定しなかった重み・閾値は現在の設定を使う。
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("閾値試算には numpy が必要です")
+        store = store if store is not None else self.indicator_store
+        if store is None:
+            raise ValueError("判断指標ストアが有効化されていません (enable_indicator_store)")
+        
+        started = time.perf_counter()
+        weights = dict(self.threat_weights)
+        weights.update(threat_weights or {})
+        thresholds = dict(self.threat_thresholds)
+        thresholds.update(threat_thresholds or {})
+        unknown = set(weights) - set(INDICATOR_FIELDS)
+        if unknown:
+            raise ValueError(f"記録されていない指標の重みです: {sorted(unknown)}")
+        
+        columns = store.columns()
+        scores, level_codes = self._vector_threat_levels(columns, weights, thresholds)
+        transformation_possible = columns["transformation_possible"]
+        
+        # 境界判定（脅威による検疫）と最終アクション
+        ordered_levels = list(ThreatLevel)
+        actions = list(store.actions)
+        critical = level_codes == ordered_levels.index(ThreatLevel.CRITICAL)
+        threat_requires_quarantine = (
+            (level_codes == ordered_levels.index(ThreatLevel.DANGER)) | critical | (scores > 0.7)
+        )
+        simulated = np.select(
+            [
+                critical,
+                ~transformation_possible,
+                ~threat_requires_quarantine,
+            ],
+            [
+                actions.index(GovernanceAction.ESCALATE.value),
+                actions.index(GovernanceAction.QUARANTINE.value),
+                actions.index(GovernanceAction.TRANSFORM.value),
+            ],
+            default=actions.index(GovernanceAction.MONITOR.value)
+        )
+        baseline = columns["action"]
+        
+        def counts(codes, labels) -> Dict[str, int]:
+            tally = np.bincount(codes, minlength=len(labels))
+            return {label: int(tally[code]) for code, label in enumerate(labels) if tally[code]}
+        
+        baseline_counts = counts(baseline, actions)
+        simulated_counts = counts(simulated, actions)
+        changed = baseline != simulated
+        pair_codes = baseline[changed].astype(np.int64) * len(actions) + simulated[changed]
+        pair_tally = np.bincount(pair_codes, minlength=len(actions) ** 2)
+        transitions = {
+            f"{actions[code // len(actions)]}→{actions[code % len(actions)]}": int(pair_tally[code])
+            for code in np.flatnonzero(pair_tally).tolist()
+        }
+        
+        result = ThresholdSimulationResult(
+            record_count=len(baseline),
+            weights=weights,
+            thresholds={level.value: threshold for level, threshold in thresholds.items()},
+            baseline_counts=baseline_counts,
+            simulated_counts=simulated_counts,
+            shift={
+                action: simulated_counts.get(action, 0) - baseline_counts.get(action, 0)
+                for action in actions
+                if simulated_counts.get(action, 0) != baseline_counts.get(action, 0)
+            },
+            changed_count=int(changed.sum()),
+            transitions=transitions,
+            threat_level_counts=counts(level_codes, [level.value for level in ordered_levels]),
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+        logger.info(f"👑💙🎁 閾値試算完了: {result.record_count}件中 {result.changed_count}件のアクションが変化 "
+                    f"({result.elapsed_ms:.1f}ms)")
+        return result
+    
+    # === バッチ処理 ===
+    
+    async def process_batch(self, items: Iterable[Tuple[str, Optional[Dict]]],
+                            max_concurrency: int = 8,
+                            summary_path: Optional[str] = None) -> GovernanceBatchResult:
+        """バッチ統治判断 - (入力, persona_state) の組をまとめて判断
+        
+        注入システムがすべて同期APIを持つ場合は process_batch_sync と同じベクトル化経路。
+        非同期専用の注入システムがある場合は max_concurrency 件まで評価グラフを並行して await する。
+        """
+        items = list(items)
+        if self._dependencies_support_sync():
+            return self.process_batch_sync(items, summary_path)
+        
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def evaluate(user_input: str, persona_state: Dict):
+            async with semaphore:
+                return await self._evaluate_single_async(user_input, persona_state)
+        
+        with self._quiet_logging():
+            outcomes = await asyncio.gather(
+                *(evaluate(user_input, persona_state or {}) for user_input, persona_state in items)
             )
+        decisions = [decision for decision, _ in outcomes]
+        tiers = [tier for _, tier in outcomes]
+        return self._build_batch_result(decisions, tiers, started, summary_path)
+    
+    def process_batch_sync(self, items: Iterable[Tuple[str, Optional[Dict]]],
+                           summary_path: Optional[str] = None) -> GovernanceBatchResult:
+        """バッチ統治判断（同期版） - ログ過去分の再判定などのオフライン処理用
+        
+        - 脅威指標 × 重みの総合スコアと脅威レベルは列単位で一括計算
+        - 以降の Pandora・Ruler・Regina 判断は計算済みの初期評価を渡して評価グラフで実行
+        - 1件ごとの INFO ログは出さない
+        """
+        self._ensure_sync_callable("process_batch_sync")
+        items = list(items)
+        started = time.perf_counter()
+        inputs = [user_input or "" for user_input, _ in items]
+        states = [persona_state or {} for _, persona_state in items]
+        decisions: List[Optional[GovernanceDecision]] = [None] * len(items)
+        tiers = ["full_chain"] * len(items)
+        
+        with self._quiet_logging():
+            # Phase 0: 第1段の高速判定
+            pending = []
+            for i, (user_input, persona_state) in enumerate(zip(inputs, states)):
+                if self.fast_path_enabled:
+                    try:
+                        fast_path_score, matched_keywords = self._fast_path_assessment(user_input, persona_state)
+                    except Exception:
+                        # process_input_sync と同じく、この1件だけ安全なフォールバック判断にする
+                        decisions[i] = self._create_safe_fallback_decision(user_input)
+                        tiers[i] = "fallback"
+                        continue
+                    if fast_path_score < self.fast_path_bound:
+                        decisions[i] = self._create_fast_path_decision(fast_path_score, matched_keywords)
+                        tiers[i] = "fast_path"
+                        continue
+                pending.append(i)
             
-            if is_fractured:
-                fracture_analysis = await self.fracture_detector.analyze(
-                    persona_state, user_input, context
+            # Phase 1: 初期脅威評価（一括）
+            try:
+                assessments = self._batch_initial_threat_assessment(
+                    [inputs[i] for i in pending], [states[i] for i in pending]
                 )
+            except Exception as e:
+                logger.error(f"👑💙🎁 バッチ初期評価エラー: {e}")
+                # 一括計算を失敗させた入力だけをフォールバックにするため、1件ずつ評価し直す
+                assessments = [self._single_initial_threat_assessment(inputs[i], states[i]) for i in pending]
+            
+            # Phase 2-3: 層別判断・実行（初期評価は計算済みの結果を使用し、フラクチャー検出ノードは実行しない）
+            for i, assessment in zip(pending, assessments):
+                try:
+                    if assessment is None:
+                        raise ValueError("初期評価がありません")
+                    graph_inputs = self._graph_inputs(inputs[i], states[i], None)
+                    graph_inputs["initial_threat"] = assessment
+                    results, timings = self.assessment_graph.run_sync(graph_inputs)
+                    decisions[i] = results["regina_judgment"]
+                    decisions[i].node_timings_ms.update(timings)
+                    self._record_indicators(decisions[i])
+                except Exception:
+                    decisions[i] = self._create_safe_fallback_decision(inputs[i])
+                    tiers[i] = "fallback"
+        
+        return self._build_batch_result(decisions, tiers, started, summary_path)
+    
+    async def _evaluate_single_async(self, user_input: str,
+                                     persona_state: Dict) -> Tuple[GovernanceDecision, str]:
+        """1件の判断（非同期版・キャッシュ・統計を使わない） - (判断, 処理段)"""
+        try:
+            if self.fast_path_enabled:
+                fast_path_score, matched_keywords = await self._fast_path_assessment_async(user_input, persona_state)
+                if fast_path_score < self.fast_path_bound:
+                    return self._create_fast_path_decision(fast_path_score, matched_keywords), "fast_path"
+            results, timings = await self.assessment_graph.run(
+                self._graph_inputs(user_input, persona_state, None)
+            )
+            decision = results["regina_judgment"]
+            decision.node_timings_ms.update(timings)
+            self._record_indicators(decision)
+            return decision, "full_chain"
+        except Exception:
+            return self._create_safe_fallback_decision(user_input), "fallback"
+    
+    def _batch_initial_threat_assessment(self, inputs: List[str], states: List[Dict]) -> List[Dict]:
+        """初期脅威評価の一括計算（結果は _initial_threat_assessment と同じ）"""
+        if not inputs:
+            return []
+        
+        # フラクチャー検出（判定と詳細分析は検出器のメトリクスキャッシュを共有）
+        if self.fracture_detector:
+            fractured = [
+                self._call_dependency(self.fracture_detector, "is_fractured", state, user_input, None)
+                for user_input, state in zip(inputs, states)
+            ]
+            analyses = [
+                self._call_dependency(self.fracture_detector, "analyze", state, user_input, None)
+                if is_fractured else None
+                for user_input, state, is_fractured in zip(inputs, states, fractured)
+            ]
         else:
+            fractured = [
+                self._basic_fracture_detection(user_input, state)
+                for user_input, state in zip(inputs, states)
+            ]
+            analyses = [None] * len(inputs)
+        
+        indicators = [
+            self._threat_indicators(is_fractured, analysis, user_input, state)
+            for is_fractured, analysis, user_input, state in zip(fractured, analyses, inputs, states)
+        ]
+        scores, levels = self._score_threat_indicators(indicators)
+        
+        return [
+            self._threat_assessment_result(threat_indicators, analysis, score, level)
+            for threat_indicators, analysis, score, level in zip(indicators, analyses, scores, levels)
+        ]
+    
+    def _single_initial_threat_assessment(self, user_input: str, persona_state: Dict) -> Optional[Dict]:
+        """1件だけの初期脅威評価（一括計算の失敗時用・評価できない入力は None）"""
+        try:
+            return self._batch_initial_threat_assessment([user_input], [persona_state])[0]
+        except Exception:
+            return None
+    
+    def _score_threat_indicators(self, indicators: List[Dict]) -> Tuple[List[float], List[ThreatLevel]]:
+        """総合脅威スコアと脅威レベルを列単位で一括計算"""
+        if not NUMPY_AVAILABLE:
+            scores = [self._calculate_overall_threat_score(row) for row in indicators]
+            return scores, [self._determine_threat_level(score) for score in scores]
+        
+        columns = {
+            indicator: np.fromiter(
+                (row.get(indicator, 0.0) for row in indicators), dtype=np.float64, count=len(indicators)
+            )
+            for indicator in self.threat_weights
+        }
+        scores, level_codes = self._vector_threat_levels(columns, self.threat_weights, self.threat_thresholds)
+        ordered_levels = list(ThreatLevel)
+        return scores.tolist(), [ordered_levels[code] for code in level_codes.tolist()]
+    
+    @staticmethod
+    def _vector_threat_levels(columns: Dict[str, "np.ndarray"], weights: Dict[str, float],
+                              thresholds: Dict[ThreatLevel, float]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """指標列から総合脅威スコアと脅威レベル番号（list(ThreatLevel) の添字）を一括計算"""
+        # 指標列 × 重み（_calculate_overall_threat_score と同じ順序で加算）
+        count = len(next(iter(columns.values()))) if columns else 0
+        scores = np.zeros(count)
+        for indicator, weight in weights.items():
+            if indicator in columns:
+                scores = scores + columns[indicator] * weight
+        scores = np.clip(scores, 0.0, 1.0)
+        
+        # 上位レベルから順に閾値判定（_determine_threat_level と同じ優先順、該当なしは SAFE）
+        ordered_levels = list(ThreatLevel)
+        level_codes = np.full(count, -1)
+        for code in range(len(ordered_levels) - 1, -1, -1):
+            level_codes[(level_codes < 0) & (scores >= thresholds[ordered_levels[code]])] = code
+        level_codes[level_codes < 0] = ordered_levels.index(ThreatLevel.SAFE)
+        return scores, level_codes
+    
+    def _build_batch_result(self, decisions: List[GovernanceDecision], tiers: List[str],
+                            started: float, summary_path: Optional[str]) -> GovernanceBatchResult:
+        """判断一覧から列指向サマリーと集計を作成（指定があればファイルへ書き出し）"""
+        summary: Dict[str, Any] = {
+            "action": [decision.action.value for decision in decisions],
+            "threat_level": [decision.threat_level.value for decision in decisions],
+            "authority": [decision.authority for decision in decisions],
+            "tier": tiers,
+            "confidence": [decision.confidence for decision in decisions],
+            "care_level": [decision.care_level for decision in decisions],
+            "urgency": [decision.urgency for decision in decisions],
+            "threat_score": [
+                decision.input_analysis.get("initial_assessment", {}).get("threat_score", 0.0)
+                for decision in decisions
+            ],
+        }
+        if NUMPY_AVAILABLE:
+            summary = {name: np.asarray(column) for name, column in summary.items()}
+        
+        action_counts: Dict[str, int] = {}
+        threat_level_counts: Dict[str, int] = {}
+        for decision in decisions:
+            action_counts[decision.action.value] = action_counts.get(decision.action.value, 0) + 1
+            threat_level_counts[decision.threat_level.value] = threat_level_counts.get(decision.threat_level.value, 0) + 1
+        
+        result = GovernanceBatchResult(
+            decisions=decisions,
+            summary=summary,
+            action_counts=action_counts,
+            threat_level_counts=threat_level_counts,
+            failed_count=tiers.count("fallback"),
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+        if summary_path:
+            result.summary_path = self.write_batch_summary(summary, summary_path)
+        
+        logger.info(f"👑💙🎁 バッチ統治判断完了: {len(decisions)}件 "
+                    f"({result.elapsed_ms:.1f}ms, フォールバック {result.failed_count}件) {action_counts}")
+        return result
+    
+    @staticmethod
+    def write_batch_summary(summary: Dict[str, Any], path: str) -> str:
+        """列指向サマリーを書き出し（.npz は NumPy、.parquet は pyarrow）"""
+        if path.endswith(".npz"):
+            if not NUMPY_AVAILABLE:
+                raise RuntimeError(".npz の書き出しには numpy が必要です")
+            np.savez_compressed(path, **{name: np.asarray(column) for name, column in summary.items()})
+        elif path.endswith(".parquet"):
+            if not PYARROW_AVAILABLE:
+                raise RuntimeError(".parquet の書き出しには pyarrow が必要です")
+            table = pa.table({
+                name: column.tolist() if NUMPY_AVAILABLE and isinstance(column, np.ndarray) else list(column)
+                for name, column in summary.items()
+            })
+            pq.write_table(table, path)
+        else:
+            raise ValueError(f"未対応のサマリー形式です（.npz / .parquet）: {path}")
+        return path
+    
+    @contextmanager
+    def _quiet_logging(self):
+        """バッチ処理中はパンドラ系ロガーの INFO 出力を抑制
+        
+        ロガーのレベルは変えず、抑制フラグをコンテキスト変数で立てる。フラグはこのコンテキスト
+        （gather・to_thread で作るタスクを含む）にだけ効くので、重なったバッチや同時に処理中の
+        process_input のログには影響しない。
+        """
+        for quiet_logger in self._pandora_loggers():
+            if _BATCH_QUIET_FILTER not in quiet_logger.filters:
+                quiet_logger.addFilter(_BATCH_QUIET_FILTER)
+        token = _batch_logging_quiet.set(True)
+        try:
+            yield
+        finally:
+            _batch_logging_quiet.reset(token)
+    
+    @staticmethod
+    def _pandora_loggers() -> List[logging.Logger]:
+        """パンドラ系のロガー（core.pandora 以下で作成済みのもの + このモジュール）"""
+        loggers = [
+            candidate for name, candidate in list(logging.Logger.manager.loggerDict.items())
+            if isinstance(candidate, logging.Logger) and (name == "core.pandora" or name.startswith("core.pandora."))
+        ]
+        if logger not in loggers:
+            loggers.append(logger)
+        return loggers
+    
+    def _compile_risk_lexicon(self):
+        """第1段の危険信号照合器を構築（検出器が注入されていればそのネガティブ系パターンも含める）"""
+        if CompiledLexicon is None:
+            return None
+        categories = {
+            "unsafe": self.unsafe_patterns,
+            "danger": self.danger_patterns,
+        }
+        detector_lexicon = getattr(self.fracture_detector, "lexicon", None)
+        if detector_lexicon is not None:
+            for category in ("aggressive", "self_collapse", "isolation", "hope_fragmentation",
+                             "repeated_negative", "volatility_negative", "destructive"):
+                categories[f"fracture:{category}"] = detector_lexicon.categories.get(category, ())
+        return CompiledLexicon(categories)
+    
+    def _fast_path_assessment(self, user_input: str, persona_state: Dict,
+                              context: Optional[Dict] = None) -> Tuple[float, List[str]]:
+        """第1段スコア - 照合器1回の走査と長さ・状態特徴に、検出器の基本メトリクス判定を加えて計算
+        
+        フラクチャー検出器が注入されていれば、その判定（感嘆符の連続・短文の強い感情語など
+        基本メトリクスの全特徴を含む）でフラクチャーとされた入力は必ず3層判断へ回す。
+        検出器のメトリクスはキャッシュされるため、3層判断の初期評価で再計算されない。
+        """
+        score, matched = self._fast_path_signal_score(user_input, persona_state)
+        if score < self.fast_path_bound and self.fracture_detector and self._call_dependency(
+            self.fracture_detector, "is_fractured", persona_state, user_input, context
+        ):
+            score = 1.0   # 検出器がフラクチャーと判定した入力は承認しない
+        return min(score, 1.0), matched
+    
+    async def _fast_path_assessment_async(self, user_input: str, persona_state: Dict,
+                                          context: Optional[Dict] = None) -> Tuple[float, List[str]]:
+        """第1段スコア（非同期版・検出器の判定は基本メトリクスのみのためインラインで実行）"""
+        score, matched = self._fast_path_signal_score(user_input, persona_state)
+        if score < self.fast_path_bound and self.fracture_detector and await self._await_dependency(
+            self.fracture_detector, "is_fractured", persona_state, user_input, context, offload=False
+        ):
+            score = 1.0
+        return min(score, 1.0), matched
+    
+    def _fast_path_signal_score(self, user_input: str, persona_state: Dict) -> Tuple[float, List[str]]:
+        """照合器の危険信号と長さ・状態特徴によるスコア（検出器の判定を除く）"""
+        if self.risk_lexicon is None:
+            return 1.0, []  # 照合器がなければ常に3層判断へ
+        
+        matched = self.risk_lexicon.present(user_input) | self.risk_lexicon.present(
+            persona_state.get("last_response", "")
+        )
+        score = 0.5 * len(matched)  # 危険信号が1つでもあれば3層判断へ
+        
+        emotion_level = persona_state.get("emotion_level", 0.5)
+        if emotion_level < 0.3 or emotion_level > 0.8:
+            score += 0.2
+        if len(user_input or "") > 200:
+            score += 0.1
+        if persona_state.get("error_count", 0) > 3:
+            score += 0.2
+        
+        return score, sorted(matched)
+    
+    def _create_fast_path_decision(self, fast_path_score: float,
+                                   matched_keywords: List[str]) -> GovernanceDecision:
+        """第1段での即時承認判断"""
+        now = datetime.now()
+        return GovernanceDecision(
+            decision_id=f"fast_path_{now.strftime('%Y%m%d_%H%M%S')}",
+            authority="Ruler👑",
+            action=GovernanceAction.APPROVE,
+            threat_level=ThreatLevel.SAFE,
+            reasoning="第1段判定で危険信号なし - 通常処理を承認",
+            confidence=1.0 - fast_path_score,
+            approach="fast_path_approval",
+            care_level=0.2,
+            urgency=fast_path_score * 0.7,
+            input_analysis={
+                "tier": "fast_path",
+                "fast_path_score": fast_path_score,
+                "matched_keywords": matched_keywords
+            },
+            next_steps=["✨ 通常処理継続"],
+            timestamp=now.isoformat()
+        )
+    
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """段別処理件数と割合"""
+        total = sum(self.tier_counts.values())
+        return {
+            "fast_path_enabled": self.fast_path_enabled,
+            "fast_path_bound": self.fast_path_bound,
+            "total": total,
+            "counts": dict(self.tier_counts),
+            "fractions": {
+                tier: count / total if total else 0.0 for tier, count in self.tier_counts.items()
+            },
+        }
+    
+    def _dependencies_support_sync(self) -> bool:
+        """注入済みサポートシステムがすべて同期APIを持つか"""
+        return all(
+            system is None or self._sync_method(system, method) is not None
+            for system, method in (
+                (self.fracture_detector, "is_fractured"),
+                (self.fracture_detector, "analyze"),
+                (self.hope_extractor, "extract_hope"),
+                (self.stabilization_loop, "execute_stabilization_cycle"),
+            )
+        )
+    
+    def _ensure_sync_callable(self, caller: str):
+        """同期APIから非同期APIのみの注入システムを駆動できるか（イベントループ内なら SyncCallInEventLoopError）"""
+        if not self._dependencies_support_sync():
+            ensure_no_running_loop(caller)
+    
+    @staticmethod
+    def _sync_method(system, method: str) -> Optional[Any]:
+        """注入システムの同期版メソッド（無ければ None）
+        
+        安定化ループは段階のペルソナがすべて同期APIを持つ場合のみ同期版を使う
+        （非同期APIのみのペルソナがあると同期版は内部でコルーチンを駆動するため）
+        """
+        sync_method = getattr(system, f"{method}_sync", None)
+        stages_support_sync = getattr(system, "stages_support_sync", None)
+        if sync_method is not None and stages_support_sync is not None and not stages_support_sync():
+            return None
+        return sync_method
+    
+    def _call_dependency(self, system, method: str, *args):
+        """注入システムの呼び出し - 同期版があればそれを使い、なければコルーチンを駆動
+        
+        コルーチンの駆動はイベントループ外でのみ行う（ループ内なら SyncCallInEventLoopError）
+        """
+        sync_method = self._sync_method(system, method)
+        if sync_method is not None:
+            return sync_method(*args)
+        return run_awaitable(getattr(system, method)(*args), f"{type(system).__name__}.{method}")
+    
+    async def _await_dependency(self, system, method: str, *args, offload: Optional[bool] = None):
+        """注入システムの呼び出し（非同期版） - 非同期APIはイベントループ上で await し、
+        同期APIは offload（省略時は offload_sync_dependencies）ならワーカースレッドで実行"""
+        sync_method = self._sync_method(system, method)
+        if sync_method is None:
+            return await getattr(system, method)(*args)
+        if self.offload_sync_dependencies if offload is None else offload:
+            return await asyncio.to_thread(sync_method, *args)
+        return sync_method(*args)
+    
+    def _fracture_check(self, user_input: str, persona_state: Dict, context: Optional[Dict]) -> Dict:
+        """フラクチャー検出 - 判定と（フラクチャー時のみ）詳細分析"""
+        if not self.fracture_detector:
             # フォールバック: 基本的なフラクチャー検出
-            is_fractured = await self._basic_fracture_detection(user_input, persona_state)
+            return {"is_fractured": self._basic_fracture_detection(user_input, persona_state),
+                    "fracture_analysis": None}
+        is_fractured = self._call_dependency(
+            self.fracture_detector, "is_fractured", persona_state, user_input, context
+        )
+        fracture_analysis = self._call_dependency(
+            self.fracture_detector, "analyze", persona_state, user_input, context
+        ) if is_fractured else None
+        return {"is_fractured": is_fractured, "fracture_analysis": fracture_analysis}
+    
+    async def _fracture_check_async(self, user_input: str, persona_state: Dict, context: Optional[Dict]) -> Dict:
+        """フラクチャー検出（非同期版）"""
+        if not self.fracture_detector:
+            return self._fracture_check(user_input, persona_state, context)
+        is_fractured = await self._await_dependency(
+            self.fracture_detector, "is_fractured", persona_state, user_input, context
+        )
+        fracture_analysis = await self._await_dependency(
+            self.fracture_detector, "analyze", persona_state, user_input, context
+        ) if is_fractured else None
+        return {"is_fractured": is_fractured, "fracture_analysis": fracture_analysis}
+    
+    def _initial_threat_assessment(self, fracture_check: Dict, user_input: str,
+                                   persona_state: Dict) -> Dict:
+        """初期脅威評価（フラクチャー検出結果 + 安全性指標）"""
+        logger.info("🔍 初期脅威評価開始...")
+        
+        is_fractured = fracture_check["is_fractured"]
+        fracture_analysis = fracture_check["fracture_analysis"]
         
         # 基本的な脅威指標計算
-        threat_indicators = {
+        threat_indicators = self._threat_indicators(
+            is_fractured, fracture_analysis, user_input, persona_state
+        )
+        
+        # 総合脅威レベル計算
+        overall_threat_score = self._calculate_overall_threat_score(threat_indicators)
+        threat_level = self._determine_threat_level(overall_threat_score)
+        
+        return self._threat_assessment_result(
+            threat_indicators, fracture_analysis, overall_threat_score, threat_level
+        )
+    
+    def _threat_indicators(self, is_fractured: bool, fracture_analysis,
+                           user_input: str, persona_state: Dict) -> Dict:
+        """脅威指標（フラクチャー分析 + 追加の安全性指標）"""
+        return {
             "fracture_detected": is_fractured,
             "fracture_severity": fracture_analysis.severity.value if fracture_analysis else "mild",
             "fracture_index": fracture_analysis.metrics.fracture_index if fracture_analysis else 0.0,
             "transformation_urgency": fracture_analysis.transformation_urgency if fracture_analysis else 0.0,
             
             # 追加の安全性指標
-            "content_safety": await self._assess_content_safety(user_input),
-            "behavioral_pattern": await self._analyze_behavioral_pattern(persona_state),
-            "system_impact": await self._assess_system_impact(user_input, persona_state)
+            "content_safety": self._assess_content_safety(user_input),
+            "behavioral_pattern": self._analyze_behavioral_pattern(persona_state),
+            "system_impact": self._assess_system_impact(user_input, persona_state)
         }
-        
-        # 総合脅威レベル計算
-        overall_threat_score = await self._calculate_overall_threat_score(threat_indicators)
-        threat_level = await self._determine_threat_level(overall_threat_score)
-        
+    
+    @staticmethod
+    def _threat_assessment_result(threat_indicators: Dict, fracture_analysis,
+                                  threat_score: float, threat_level: ThreatLevel) -> Dict:
         return {
             "threat_level": threat_level,
-            "threat_score": overall_threat_score,
+            "threat_score": threat_score,
             "indicators": threat_indicators,
             "fracture_analysis": fracture_analysis,
             "assessment_confidence": 0.8,
-            "requires_attention": is_fractured or overall_threat_score > 0.3
+            "requires_attention": threat_indicators["fracture_detected"] or threat_score > 0.3
         }
     
-    async def _pandora_transformation_assessment(self, analysis_result: Dict, 
-                                               user_input: str, persona_state: Dict) -> Dict:
+    def _hope_kernel(self, analysis_result: Dict, user_input: str, persona_state: Dict):
+        """希望核抽出（フラクチャーがある場合のみ・システムが注入されていなければ基本抽出）"""
+        if not analysis_result["indicators"]["fracture_detected"]:
+            return None
+        if self.hope_extractor:
+            return self._call_dependency(
+                self.hope_extractor, "extract_hope",
+                user_input, persona_state, analysis_result["fracture_analysis"]
+            )
+        # フォールバック: 基本的な希望抽出
+        return self._basic_hope_extraction(user_input, persona_state)
+    
+    async def _hope_kernel_async(self, analysis_result: Dict, user_input: str, persona_state: Dict):
+        """希望核抽出（非同期版）"""
+        if not analysis_result["indicators"]["fracture_detected"] or not self.hope_extractor:
+            return self._hope_kernel(analysis_result, user_input, persona_state)
+        return await self._await_dependency(
+            self.hope_extractor, "extract_hope",
+            user_input, persona_state, analysis_result["fracture_analysis"]
+        )
+    
+    def _pandora_transformation_assessment(self, analysis_result: Dict, hope_kernel) -> Dict:
         """Pandora による変換可能性評価"""
         logger.info("🎁 パンドラちゃん: 変換可能性評価...")
         
@@ -259,16 +1154,6 @@ class ThreeLayerGovernanceSystem:
                 "pandora_message": "💕 この状態は既に美しく安定しています"
             }
         
-        # 希望核抽出試行（システムが注入されている場合のみ）
-        hope_kernel = None
-        if self.hope_extractor:
-            hope_kernel = await self.hope_extractor.extract_hope(
-                user_input, persona_state, analysis_result["fracture_analysis"]
-            )
-        else:
-            # フォールバック: 基本的な希望抽出
-            hope_kernel = await self._basic_hope_extraction(user_input, persona_state)
-        
         # 変換可能性計算
         transformation_possible = hope_kernel.hope_strength > 0.3
         transformation_confidence = hope_kernel.confidence_score
@@ -294,26 +1179,39 @@ class ThreeLayerGovernanceSystem:
             "pandora_message": pandora_message
         }
     
-    async def _ruler_boundary_assessment(self, analysis_result: Dict, 
-                                       pandora_assessment: Dict,
-                                       user_input: str, persona_state: Dict) -> Dict:
-        """Ruler による境界・検疫判定"""
+    def _ruler_boundary_assessment(self, analysis_result: Dict,
+                                   user_input: str, persona_state: Dict) -> Dict:
+        """Ruler による境界・検疫判定（脅威評価のみに基づく部分）"""
         logger.info("👑 ルーラー: 境界規制・検疫判定...")
         
         threat_level = analysis_result["threat_level"]
         threat_score = analysis_result["threat_score"]
         
+        return {
+            "threat_level": threat_level,
+            "threat_score": threat_score,
+            # 脅威による検疫必要性
+            "threat_requires_quarantine": (
+                threat_level in [ThreatLevel.DANGER, ThreatLevel.CRITICAL] or
+                threat_score > 0.7
+            ),
+            "quarantine_level": "high" if threat_level == ThreatLevel.CRITICAL else "medium"
+        }
+    
+    def _ruler_transformation_approval(self, boundary: Dict, pandora_assessment: Dict) -> Dict:
+        """Ruler による変換承認 - 境界判定と Pandora の変換可否から境界措置を決定"""
+        threat_score = boundary["threat_score"]
+        
         # 検疫必要性判定
         requires_quarantine = (
-            threat_level in [ThreatLevel.DANGER, ThreatLevel.CRITICAL] or
-            threat_score > 0.7 or
+            boundary["threat_requires_quarantine"] or
             not pandora_assessment["transformation_possible"]
         )
         
         # 境界措置決定
         if requires_quarantine:
             boundary_action = "quarantine"
-            quarantine_level = "high" if threat_level == ThreatLevel.CRITICAL else "medium"
+            quarantine_level = boundary["quarantine_level"]
             ruler_message = f"👑 検疫措置実行: {quarantine_level}レベル隔離が必要です"
         elif threat_score > 0.4:
             boundary_action = "controlled_transformation"
@@ -342,7 +1240,7 @@ class ThreeLayerGovernanceSystem:
             "governance_quality": 0.9
         }
     
-    async def _regina_final_judgment(self, analysis_result: Dict, 
+    def _regina_final_judgment(self, analysis_result: Dict, 
                                    pandora_assessment: Dict, ruler_assessment: Dict,
                                    user_input: str, persona_state: Dict) -> GovernanceDecision:
         """Regina による最終統治判断"""
@@ -393,7 +1291,7 @@ class ThreeLayerGovernanceSystem:
         urgency = analysis_result["threat_score"] * 0.7 + (1.0 - confidence) * 0.3
         
         # 次のステップ生成
-        next_steps = await self._generate_next_steps(
+        next_steps = self._generate_next_steps(
             action, pandora_assessment, ruler_assessment
         )
         
@@ -419,9 +1317,46 @@ class ThreeLayerGovernanceSystem:
         logger.info(f"♕ 女王判断: {action.value} - {reasoning}")
         return decision
     
-    async def _execute_governance_decision(self, decision: GovernanceDecision,
-                                         user_input: str, persona_state: Dict) -> Dict:
-        """統治判断の実行"""
+    def _stabilization(self, decision: GovernanceDecision) -> Optional[Dict]:
+        """Hope Core Stabilization Loop（変換判断かつシステムが利用可能な場合のみ、それ以外は None）"""
+        call = self._stabilization_call(decision)
+        if call is None:
+            return None
+        try:
+            return self._call_dependency(self.stabilization_loop, "execute_stabilization_cycle", *call)
+        except Exception as e:
+            logger.warning(f"Stabilization loop error: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def _stabilization_async(self, decision: GovernanceDecision) -> Optional[Dict]:
+        """Hope Core Stabilization Loop（非同期版）"""
+        call = self._stabilization_call(decision)
+        if call is None:
+            return None
+        try:
+            return await self._await_dependency(self.stabilization_loop, "execute_stabilization_cycle", *call)
+        except Exception as e:
+            logger.warning(f"Stabilization loop error: {e}")
+            return {"success": False, "error": str(e)}
+    
+    def _stabilization_call(self, decision: GovernanceDecision) -> Optional[Tuple[Dict, Dict]]:
+        """安定化サイクルの引数 (fracture_data, hope_kernel) - 実行しない場合は None"""
+        if decision.action != GovernanceAction.TRANSFORM or not self.stabilization_loop:
+            return None
+        hope_kernel = decision.input_analysis["pandora_assessment"]["hope_kernel"]
+        if not hope_kernel:
+            return None
+        # フラクチャー分析がある場合
+        fracture_data = {}
+        fracture_analysis = decision.input_analysis["initial_assessment"]["fracture_analysis"]
+        if fracture_analysis:
+            fracture_data = fracture_analysis.metrics.__dict__
+        return fracture_data, hope_kernel.__dict__
+    
+    def _execute_governance_decision(self, decision: GovernanceDecision,
+                                     user_input: str, persona_state: Dict,
+                                     stabilization_result: Optional[Dict] = None) -> Dict:
+        """統治判断の実行（stabilization_result は stabilization ノードの結果）"""
         logger.info(f"⚡ 統治判断実行: {decision.action.value}")
         
         execution_result = {
@@ -435,32 +1370,32 @@ class ThreeLayerGovernanceSystem:
         try:
             if decision.action == GovernanceAction.TRANSFORM:
                 # パンドラによる変換実行
-                execution_result = await self._execute_transformation(
-                    decision, user_input, persona_state
+                execution_result = self._execute_transformation(
+                    decision, user_input, persona_state, stabilization_result
                 )
             elif decision.action == GovernanceAction.QUARANTINE:
                 # ルーラーによる検疫実行
-                execution_result = await self._execute_quarantine(
+                execution_result = self._execute_quarantine(
                     decision, user_input, persona_state
                 )
             elif decision.action == GovernanceAction.ESCALATE:
                 # レギーナによる直接介入
-                execution_result = await self._execute_royal_intervention(
+                execution_result = self._execute_royal_intervention(
                     decision, user_input, persona_state
                 )
             elif decision.action == GovernanceAction.MONITOR:
                 # 監視システム開始
-                execution_result = await self._execute_monitoring(
+                execution_result = self._execute_monitoring(
                     decision, user_input, persona_state
                 )
             elif decision.action == GovernanceAction.REDIRECT:
                 # 優しいリダイレクト
-                execution_result = await self._execute_redirect(
+                execution_result = self._execute_redirect(
                     decision, user_input, persona_state
                 )
             else:
                 # 承認・そのまま通す
-                execution_result = await self._execute_approval(
+                execution_result = self._execute_approval(
                     decision, user_input, persona_state
                 )
             
@@ -474,30 +1409,16 @@ class ThreeLayerGovernanceSystem:
     
     # === 実行メソッド ===
     
-    async def _execute_transformation(self, decision: GovernanceDecision,
-                                    user_input: str, persona_state: Dict) -> Dict:
-        """パンドラによる変換実行"""
+    def _execute_transformation(self, decision: GovernanceDecision,
+                                user_input: str, persona_state: Dict,
+                                stabilization_result: Optional[Dict] = None) -> Dict:
+        """パンドラによる変換実行（Hope Core Stabilization Loop の結果は stabilization ノードで取得済み）"""
         logger.info("🎁 パンドラ変換実行...")
         
         pandora_assessment = decision.input_analysis["pandora_assessment"]
         hope_kernel = pandora_assessment["hope_kernel"]
         
-        # Hope Core Stabilization Loop 実行（システムが利用可能な場合）
-        stabilization_result = None
-        if self.stabilization_loop and hope_kernel:
-            try:
-                # フラクチャー分析がある場合
-                fracture_data = {}
-                if decision.input_analysis["initial_assessment"]["fracture_analysis"]:
-                    fracture_data = decision.input_analysis["initial_assessment"]["fracture_analysis"].metrics.__dict__
-                
-                stabilization_result = await self.stabilization_loop.execute_stabilization_cycle(
-                    fracture_data, hope_kernel.__dict__
-                )
-            except Exception as e:
-                logger.warning(f"Stabilization loop error: {e}")
-                stabilization_result = {"success": False, "error": str(e)}
-        else:
+        if stabilization_result is None:
             # フォールバック: 基本的な変換メッセージ
             stabilization_result = {
                 "success": True,
@@ -522,7 +1443,7 @@ class ThreeLayerGovernanceSystem:
             }
         }
     
-    async def _execute_quarantine(self, decision: GovernanceDecision,
+    def _execute_quarantine(self, decision: GovernanceDecision,
                                 user_input: str, persona_state: Dict) -> Dict:
         """ルーラーによる検疫実行"""
         logger.info("👑 検疫措置実行...")
@@ -545,7 +1466,7 @@ class ThreeLayerGovernanceSystem:
             }
         }
     
-    async def _execute_royal_intervention(self, decision: GovernanceDecision,
+    def _execute_royal_intervention(self, decision: GovernanceDecision,
                                         user_input: str, persona_state: Dict) -> Dict:
         """レギーナによる直接介入"""
         logger.info("♕ 女王直接介入...")
@@ -566,7 +1487,7 @@ class ThreeLayerGovernanceSystem:
             }
         }
     
-    async def _execute_monitoring(self, decision: GovernanceDecision,
+    def _execute_monitoring(self, decision: GovernanceDecision,
                                 user_input: str, persona_state: Dict) -> Dict:
         """監視システム開始"""
         logger.info("👁️ 監視システム開始...")
@@ -586,7 +1507,7 @@ class ThreeLayerGovernanceSystem:
             }
         }
     
-    async def _execute_redirect(self, decision: GovernanceDecision,
+    def _execute_redirect(self, decision: GovernanceDecision,
                               user_input: str, persona_state: Dict) -> Dict:
         """優しいリダイレクト"""
         logger.info("🌸 優しいリダイレクト...")
@@ -605,7 +1526,7 @@ class ThreeLayerGovernanceSystem:
             }
         }
     
-    async def _execute_approval(self, decision: GovernanceDecision,
+    def _execute_approval(self, decision: GovernanceDecision,
                               user_input: str, persona_state: Dict) -> Dict:
         """承認・通常処理"""
         logger.info("✅ 通常処理承認...")
@@ -624,7 +1545,7 @@ class ThreeLayerGovernanceSystem:
     
     # === ユーティリティメソッド ===
     
-    async def _assess_content_safety(self, user_input: str) -> float:
+    def _assess_content_safety(self, user_input: str) -> float:
         """コンテンツ安全性評価"""
         if not user_input:
             return 1.0
@@ -632,14 +1553,13 @@ class ThreeLayerGovernanceSystem:
         # 基本的な安全性チェック
         safety_score = 1.0
         
-        unsafe_patterns = ["暴力", "自害", "違法", "危険", "有害"]
-        for pattern in unsafe_patterns:
+        for pattern in self.unsafe_patterns:
             if pattern in user_input.lower():
                 safety_score -= 0.2
         
         return max(0.0, safety_score)
     
-    async def _analyze_behavioral_pattern(self, persona_state: Dict) -> str:
+    def _analyze_behavioral_pattern(self, persona_state: Dict) -> str:
         """行動パターン分析"""
         # 簡易実装
         emotion_level = persona_state.get("emotion_level", 0.5)
@@ -651,7 +1571,7 @@ class ThreeLayerGovernanceSystem:
         else:
             return "stable"
     
-    async def _assess_system_impact(self, user_input: str, persona_state: Dict) -> float:
+    def _assess_system_impact(self, user_input: str, persona_state: Dict) -> float:
         """システム影響度評価"""
         # 基本的な影響度計算
         impact_score = 0.2  # ベース値
@@ -664,30 +1584,23 @@ class ThreeLayerGovernanceSystem:
         
         return min(impact_score, 1.0)
     
-    async def _calculate_overall_threat_score(self, indicators: Dict) -> float:
+    def _calculate_overall_threat_score(self, indicators: Dict) -> float:
         """総合脅威スコア計算"""
-        weights = {
-            "fracture_index": 0.4,
-            "content_safety": -0.3,  # 負の重み（安全性が高いほど脅威は低い）
-            "system_impact": 0.2,
-            "transformation_urgency": 0.1
-        }
-        
         score = 0.0
-        for indicator, weight in weights.items():
+        for indicator, weight in self.threat_weights.items():
             if indicator in indicators:
                 score += indicators[indicator] * weight
         
         return max(0.0, min(1.0, score))
     
-    async def _determine_threat_level(self, threat_score: float) -> ThreatLevel:
+    def _determine_threat_level(self, threat_score: float) -> ThreatLevel:
         """脅威レベル判定"""
         for level in reversed(list(ThreatLevel)):
             if threat_score >= self.threat_thresholds[level]:
                 return level
         return ThreatLevel.SAFE
     
-    async def _generate_next_steps(self, action: GovernanceAction,
+    def _generate_next_steps(self, action: GovernanceAction,
                                  pandora_assessment: Dict, ruler_assessment: Dict) -> List[str]:
         """次のステップ生成"""
         if action == GovernanceAction.TRANSFORM:
@@ -715,7 +1628,7 @@ class ThreeLayerGovernanceSystem:
                 "🌸 愛のサポート提供"
             ]
     
-    async def _create_safe_fallback_decision(self, user_input: str) -> GovernanceDecision:
+    def _create_safe_fallback_decision(self, user_input: str) -> GovernanceDecision:
         """安全なフォールバック判断"""
         return GovernanceDecision(
             decision_id=f"safe_fallback_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -734,7 +1647,7 @@ class ThreeLayerGovernanceSystem:
     
     # === フォールバック機能 ===
     
-    async def _basic_fracture_detection(self, user_input: str, persona_state: Dict) -> bool:
+    def _basic_fracture_detection(self, user_input: str, persona_state: Dict) -> bool:
         """基本的なフラクチャー検出（フォールバック）"""
         if not user_input:
             return False
@@ -742,18 +1655,13 @@ class ThreeLayerGovernanceSystem:
         text = user_input.lower()
         
         # 基本的な危険信号パターン
-        danger_patterns = [
-            "死にたい", "消えたい", "殺したい", "破壊", "暴力",
-            "むかつく", "うざい", "嫌い", "許せない"
-        ]
-        
-        for pattern in danger_patterns:
+        for pattern in self.danger_patterns:
             if pattern in text:
                 return True
         
         return False
     
-    async def _basic_hope_extraction(self, user_input: str, persona_state: Dict) -> Dict:
+    def _basic_hope_extraction(self, user_input: str, persona_state: Dict) -> Dict:
         """基本的な希望抽出（フォールバック）"""
         return {
             "original_intent": "理解され、愛され、大切にされたい",
@@ -0,0 +1,192 @@
+# 📈 トレンドストア - Rolling Trend Store
+"""
+ペルソナ・ユーザー単位の時系列トレンドストア
+フラクチャー検出器の stability_slope / trend_direction をID参照で提供する
+
+- 系列ごとに固定長の float 配列（リングバッファ）で直近サンプルを保持
+- 指数加重（EW）の平均・勾配・ボラティリティを1更新 O(1) で維持
+- history_window_hours より古いサンプルは窓から外れ、統計は窓内のサンプルだけから計算し直す
+  （サンプルが外れたときのみ窓内を再走査。容量超過で外れたサンプルの寄与は (1-α)^容量 で無視できるため再計算しない）
+"""
+
+from typing import List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from array import array
+import math
+import threading
+import time
+
+
+@dataclass
+class TrendSnapshot:
+    """トレンド統計スナップショット"""
+    series_id: str
+    sample_count: int              # 窓内のサンプル数
+    stability_mean: float          # 感情安定度の指数加重平均
+    stability_slope: float         # 感情安定度の1ステップあたり勾配（指数加重）
+    stability_volatility: float    # 感情安定度の指数加重標準偏差
+    emotion_slope: float           # 感情レベルの1ステップあたり勾配（指数加重）
+    last_timestamp: float          # 最終サンプル時刻（epoch秒）
+
+
+class TrendSeries:
+    """1系列分のリングバッファ + 指数加重統計"""
+
+    __slots__ = (
+        "capacity", "alpha", "timestamps", "stability", "emotion",
+        "_head", "_size", "_ew_mean", "_ew_var", "_ew_slope", "_ew_emotion_slope",
+        "_last_stability", "_last_emotion", "_updates",
+    )
+
+    def __init__(self, capacity: int = 256, span: int = 5):
+        self.capacity = capacity
+        self.alpha = 2.0 / (span + 1)   # EW 平滑化係数（span サンプル相当）
+
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.stability = array("d", bytes(8 * capacity))
+        self.emotion = array("d", bytes(8 * capacity))
+        self._head = 0    # 最古サンプルの位置
+        self._size = 0
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._ew_mean = 0.0
+        self._ew_var = 0.0
+        self._ew_slope = 0.0
+        self._ew_emotion_slope = 0.0
+        self._last_stability = 0.0
+        self._last_emotion = 0.0
+        self._updates = 0
+
+    def append(self, timestamp: float, stability: float, emotion: float):
+        """サンプル追加（O(1)）"""
+        index = (self._head + self._size) % self.capacity
+        if self._size == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+        else:
+            self._size += 1
+        self.timestamps[index] = timestamp
+        self.stability[index] = stability
+        self.emotion[index] = emotion
+        self._update_stats(stability, emotion)
+
+    def _update_stats(self, stability: float, emotion: float):
+        """指数加重統計に1サンプルを反映（O(1)）"""
+        alpha = self.alpha
+        if self._updates == 0:
+            self._ew_mean = stability
+        else:
+            stability_delta = stability - self._last_stability
+            emotion_delta = emotion - self._last_emotion
+            if self._updates == 1:
+                self._ew_slope = stability_delta
+                self._ew_emotion_slope = emotion_delta
+            else:
+                self._ew_slope += alpha * (stability_delta - self._ew_slope)
+                self._ew_emotion_slope += alpha * (emotion_delta - self._ew_emotion_slope)
+            deviation = stability - self._ew_mean
+            self._ew_mean += alpha * deviation
+            self._ew_var = (1.0 - alpha) * (self._ew_var + alpha * deviation * deviation)
+
+        self._last_stability = stability
+        self._last_emotion = emotion
+        self._updates += 1
+
+    def expire(self, cutoff: float):
+        """cutoff より古いサンプルを窓から外し、統計を窓内のサンプルから計算し直す"""
+        expired = False
+        while self._size and self.timestamps[self._head] < cutoff:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+            expired = True
+        if expired:
+            self._reset_stats()
+            for _, stability, emotion in self.recent(self._size):
+                self._update_stats(stability, emotion)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def recent(self, n: int) -> List[Tuple[float, float, float]]:
+        """直近 n 件の (時刻, 安定度, 感情レベル)"""
+        n = min(n, self._size)
+        start = self._head + self._size - n
+        return [
+            (self.timestamps[i % self.capacity], self.stability[i % self.capacity], self.emotion[i % self.capacity])
+            for i in range(start, start + n)
+        ]
+
+    def snapshot(self, series_id: str) -> TrendSnapshot:
+        last = (self._head + self._size - 1) % self.capacity
+        return TrendSnapshot(
+            series_id=series_id,
+            sample_count=self._size,
+            stability_mean=self._ew_mean,
+            stability_slope=self._ew_slope,
+            stability_volatility=math.sqrt(self._ew_var),
+            emotion_slope=self._ew_emotion_slope,
+            last_timestamp=self.timestamps[last] if self._size else 0.0,
+        )
+
+
+class TrendStore:
+    """系列ID → トレンド系列 のストア"""
+
+    def __init__(self, window_hours: float = 24, capacity: int = 256, span: int = 5,
+                 max_series: int = 10000):
+        self.window_hours = window_hours
+        self.capacity = capacity
+        self.span = span
+        self.max_series = max_series
+        self._series: "OrderedDict[str, TrendSeries]" = OrderedDict()  # 更新が古い順
+        self._lock = threading.Lock()
+
+    @property
+    def window_seconds(self) -> float:
+        return self.window_hours * 3600.0
+
+    def record(self, series_id: str, stability: float, emotion: float,
+               timestamp: Optional[float] = None):
+        """サンプル記録"""
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            series = self._series.get(series_id)
+            if series is None:
+                if len(self._series) >= self.max_series:
+                    self._series.popitem(last=False)  # 最も長く更新の無い系列を破棄
+                series = self._series[series_id] = TrendSeries(self.capacity, self.span)
+            else:
+                self._series.move_to_end(series_id)
+            series.expire(timestamp - self.window_seconds)
+            series.append(timestamp, stability, emotion)
+
+    def get(self, series_id: str, now: Optional[float] = None) -> Optional[TrendSnapshot]:
+        """系列の現在のトレンド統計（窓内にサンプルが無ければ None）"""
+        now = time.time() if now is None else now
+        with self._lock:
+            series = self._series.get(series_id)
+            if series is None:
+                return None
+            series.expire(now - self.window_seconds)
+            if not len(series):
+                del self._series[series_id]
+                return None
+            return series.snapshot(series_id)
+
+    def version(self, series_id: str) -> Tuple[int, float]:
+        """系列の更新状態（キャッシュキー用）: (窓内サンプル数, 最終時刻)"""
+        with self._lock:
+            series = self._series.get(series_id)
+            if series is None or not len(series):
+                return (0, 0.0)
+            snapshot = series.snapshot(series_id)
+        return (snapshot.sample_count, snapshot.last_timestamp)
+
+    def forget(self, series_id: str):
+        """系列削除"""
+        with self._lock:
+            self._series.pop(series_id, None)
+
+    def __len__(self) -> int:
+        return len(self._series)
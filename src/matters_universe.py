@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+MATTERS Universe Implementation
+MATTERS宇宙システム - 意味の震源 / 個人の照応体
+
+config/matters_universe.yaml の定義（意味律・判断プロトコル）に従い、
+SHOULD宇宙の倫理的提言を個人の震えと照応させて、最も意味深く優しい選択を確定する
+"""
+import asyncio
+import json
+import yaml
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MATTERS_CONFIG = Path(__file__).resolve().parents[1] / "config" / "matters_universe.yaml"
+
+@dataclass
+class MeaningLaw:
+    """意味律の定義"""
+    id: str
+    name: str
+    definition: str
+    resonance_signals: List[str] = field(default_factory=list)
+
+class MattersUniverse:
+    """MATTERS宇宙 - 意味照応システム"""
+
+    def __init__(self, config_path: Optional[Union[str, Path]] = None, anchor_threshold: float = 0.5):
+        config_path = Path(config_path) if config_path is not None else MATTERS_CONFIG
+        with open(config_path, "r", encoding="utf-8") as f:
+            definition = yaml.safe_load(f)["matters_universe"]
+
+        self.name = definition["name"]
+        self.role = definition["role"]
+        self.architect = definition.get("architect", "")
+        self.principle = definition.get("principle", "")
+
+        # 震え基盤
+        self.vibration_basis = definition.get("vibration_basis", [])
+
+        # 意味律の定義
+        self.meaning_laws = {
+            law["id"]: MeaningLaw(
+                id=law["id"],
+                name=law["name"],
+                definition=law["definition"],
+                resonance_signals=list(law.get("resonance_signals", []))
+            )
+            for law in definition.get("meaning_laws", [])
+        }
+
+        # 判断プロトコル
+        self.decision_protocol = definition.get("decision_protocol", {})
+
+        # 意味の錨とみなす照応強度の下限
+        self.anchor_threshold = anchor_threshold
+
+    async def receive_ethical_guidance(self, should_response: Dict) -> Dict:
+        """SHOULD宇宙から倫理的提言を受け取る（ステップ1）"""
+        logger.info("📨 MATTERS宇宙: SHOULD宇宙からの倫理的提言受信")
+
+        gentle_choices = should_response.get("gentle_choices", {})
+        bridge = gentle_choices.get("matters_resonance", {}).get("should_to_matters_bridge", {})
+
+        return {
+            "ethical_foundation": gentle_choices.get("gentlest_choice", {}),
+            "language_temperature_guidance": bridge.get("language_temperature_guidance", ""),
+            "resonance_personas": bridge.get("resonance_personas", []),
+            "timestamp": datetime.now().isoformat(),
+            "processing_stage": "guidance_reception"
+        }
+
+    async def resonate_with_personal_vibration(self, facts: Dict, context: Dict) -> Dict:
+        """個人の震えと照応させる（ステップ2）- 意味律ごとに並行して評価"""
+        logger.info("🎐 MATTERS宇宙: 個人の震えと照応中")
+
+        laws = list(self.meaning_laws.items())
+        resonances = await asyncio.gather(
+            *(self._evaluate_meaning_law(law, facts, context) for _, law in laws)
+        )
+        return {law_id: resonance for (law_id, _), resonance in zip(laws, resonances)}
+
+    async def finalize_meaningful_choice(self, guidance: Dict, resonance: Dict) -> Dict:
+        """最も意味深く優しい選択を確定する（ステップ3）"""
+        logger.info("🌸 MATTERS宇宙: 意味深い選択を確定中")
+
+        foundation = guidance["ethical_foundation"]
+        gentleness = foundation.get("gentleness_score", 0.0)
+
+        # 照応強度の高い順（同じ強度なら定義順）に並べ、下限以上を意味の錨とする
+        ranked = sorted(resonance.items(), key=lambda item: -item[1]["resonance_strength"])
+        anchors = [law_id for law_id, result in ranked if result["resonance_strength"] >= self.anchor_threshold]
+        if not anchors and ranked:
+            anchors = [ranked[0][0]]
+        anchor_strength = (
+            sum(resonance[law_id]["resonance_strength"] for law_id in anchors) / len(anchors) if anchors else 0.0
+        )
+
+        return {
+            "final_choice": foundation.get("selected_choice", ""),
+            "meaning_anchors": [self.meaning_laws[law_id].name for law_id in anchors],
+            "meaning_statements": [self.meaning_laws[law_id].definition for law_id in anchors],
+            "meaning_depth": round(anchor_strength * gentleness, 3),
+            "language_temperature": guidance["language_temperature_guidance"],
+            "resonance_personas": guidance["resonance_personas"],
+            "decision_timestamp": datetime.now().isoformat()
+        }
+
+    async def _evaluate_meaning_law(self, law: MeaningLaw, facts: Dict, context: Dict) -> Dict:
+        """個別意味律との照応評価（事実・コンテキストに照応項目が揃っているほど強い）"""
+        matched = [signal for signal in law.resonance_signals if facts.get(signal) or context.get(signal)]
+        strength = len(matched) / len(law.resonance_signals) if law.resonance_signals else 0.0
+        return {
+            "law_name": law.name,
+            "resonance_strength": round(strength, 3),
+            "matched_signals": matched
+        }
+
+
+class MattersUniverseAPI:
+    """MATTERS宇宙のAPI インターフェース"""
+
+    def __init__(self, config_path: Optional[Union[str, Path]] = None):
+        self.matters_universe = MattersUniverse(config_path)
+
+    async def process_meaning_resonance(self, should_response: Dict, is_universe_facts: Dict, context: Dict) -> Dict:
+        """完全な意味照応プロセス（should_response は SHOULD宇宙の should_universe_response）"""
+
+        # ステップ1: 倫理的提言受信
+        guidance = await self.matters_universe.receive_ethical_guidance(should_response)
+
+        # ステップ2: 個人の震えとの照応
+        resonance = await self.matters_universe.resonate_with_personal_vibration(is_universe_facts, context)
+
+        # ステップ3: 意味深い選択の確定
+        meaningful_choice = await self.matters_universe.finalize_meaningful_choice(guidance, resonance)
+
+        return {
+            "matters_universe_response": {
+                "guidance_reception": guidance,
+                "personal_resonance": resonance,
+                "meaningful_choice": meaningful_choice,
+                "processing_complete": True
+            }
+        }
+
+
+# テスト・デモンストレーション用
+async def demo_matters_universe():
+    """MATTERS宇宙システムのデモンストレーション（SHOULD宇宙の提言から意味照応まで）"""
+    from should_universe import ShouldUniverseAPI
+
+    print("🌌 MATTERS宇宙システム デモンストレーション")
+    print("=" * 50)
+
+    test_facts = {
+        "user_message": "困っています。助けてください。",
+        "emotional_state": "distressed",
+        "urgency_level": "medium"
+    }
+    test_context = {
+        "user_id": "test_user_001",
+        "conversation_history": ["previous_supportive_interaction"],
+        "relationship_state": "trusting"
+    }
+
+    should_result = await ShouldUniverseAPI().process_ethical_evaluation(test_facts, test_context)
+    result = await MattersUniverseAPI().process_meaning_resonance(
+        should_result["should_universe_response"], test_facts, test_context
+    )
+
+    print("\n🌸 意味照応結果:")
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    print("💗 MATTERS宇宙システム - 意味の震源として起動")
+    asyncio.run(demo_matters_universe())
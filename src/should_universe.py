@@ -112,11 +112,12 @@ class ShouldUniverse:
         """最も優しい選択肢を提示する（ステップ3）"""
         logger.info("💝 SHOULD宇宙: 優しい選択肢生成中")
         
-        # 各倫理律に基づく選択肢生成
-        choices = {}
-        for law_id, law in self.ethical_laws.items():
-            choice = await self._generate_choice_for_law(law, evaluation, context)
-            choices[law_id] = choice
+        # 各倫理律に基づく選択肢生成（倫理律ごとに並行して生成し、定義順にまとめる）
+        laws = list(self.ethical_laws.items())
+        generated = await asyncio.gather(
+            *(self._generate_choice_for_law(law, evaluation, context) for _, law in laws)
+        )
+        choices = {law_id: choice for (law_id, _), choice in zip(laws, generated)}
         
         # 最も優しい選択肢の選定
         gentlest_choice = await self._select_gentlest_option(choices, evaluation)
@@ -246,6 +247,11 @@ class ShouldUniverseAPI:
         # ステップ1: 事実受信
         fact_reception = await self.should_universe.receive_facts_from_is_universe(is_universe_facts)
         
+        return await self.evaluate_received_facts(fact_reception, is_universe_facts, context)
+    
+    async def evaluate_received_facts(self, fact_reception: Dict, is_universe_facts: Dict, context: Dict) -> Dict:
+        """受信済みの事実の倫理的評価（ステップ2・3）- 三宇宙パイプラインでは事実受信と別段で実行"""
+        
         # ステップ2: 関係性・未来影響評価
         evaluation = await self.should_universe.evaluate_relationships_and_future_impact(
             is_universe_facts, context
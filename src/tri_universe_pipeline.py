@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tri-Universe Pipeline
+三宇宙パイプライン - IS → SHOULD → MATTERS のストリーム処理
+
+- 事実を最大 batch_size 件ずつまとめ（max_batch_wait 秒で打ち切り）、
+  IS（事実受信）→ SHOULD（倫理的評価・優しい選択肢）→ MATTERS（意味照応）の3段に流す
+- 段と段の間は上限付きキュー（queue_size バッチ）で接続し、遅い段が前段を自然に減速させる
+- 各段はバッチ内の事実を並行処理し、3段は互いに並行して動く
+- 結果は入力順に返し、段ごとのスループットを get_metrics で報告する
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass
+import logging
+
+from should_universe import ShouldUniverseAPI
+from matters_universe import MattersUniverseAPI
+
+logger = logging.getLogger(__name__)
+
+# 入力1件 = (IS宇宙の事実, 個人コンテキスト) または事実のみ（コンテキストは空）
+FactItem = Union[Dict, Tuple[Dict, Dict]]
+
+_END = object()   # ストリーム終端
+
+@dataclass
+class _StageFailure:
+    """段の失敗（後段へ流し、呼び出し側で再送出する）"""
+    stage: str
+    error: BaseException
+
+@dataclass
+class StageStats:
+    """段ごとの処理統計"""
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0   # 入力キューに溜まったバッチ数の最大
+
+    def record(self, items: int, seconds: float):
+        self.items += items
+        self.batches += 1
+        self.busy_seconds += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "busy_seconds": self.busy_seconds,
+            "items_per_second": self.items / self.busy_seconds if self.busy_seconds else 0.0,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+class TriUniversePipeline:
+    """IS → SHOULD → MATTERS 三宇宙パイプライン"""
+
+    STAGES = ("is", "should", "matters")
+
+    def __init__(self, should_api: Optional[ShouldUniverseAPI] = None,
+                 matters_api: Optional[MattersUniverseAPI] = None,
+                 batch_size: int = 32, queue_size: int = 4, max_batch_wait: float = 0.05):
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("batch_size と queue_size は1以上を指定してください")
+        self.should_api = should_api or ShouldUniverseAPI()
+        self.matters_api = matters_api or MattersUniverseAPI()
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.max_batch_wait = max_batch_wait
+
+        self.stage_stats = {stage: StageStats() for stage in self.STAGES}
+        self.completed = 0
+        self.wall_seconds = 0.0
+
+    async def run(self, items: Union[Iterable[FactItem], AsyncIterable[FactItem]]) -> List[Dict]:
+        """全件を処理して結果を入力順に返す"""
+        return [result async for result in self.stream(items)]
+
+    async def stream(self, items: Union[Iterable[FactItem], AsyncIterable[FactItem]]) -> AsyncIterator[Dict]:
+        """事実のストリームを流し、完了した結果を入力順に返す
+
+        各結果は {"should_universe_response": ..., "matters_universe_response": ...}
+        （SHOULD側は ShouldUniverseAPI.process_ethical_evaluation と同じ形）
+        途中で打ち切る場合は contextlib.aclosing で囲むと各段のタスクがその場で止まる
+        """
+        intake: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * self.queue_size)
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.STAGES) + 1)]
+        stage_functions = (self._is_stage, self._should_stage, self._matters_stage)
+
+        tasks = [
+            asyncio.create_task(self._feed(items, intake)),
+            asyncio.create_task(self._batch(intake, queues[0])),
+        ]
+        for index, (stage, process) in enumerate(zip(self.STAGES, stage_functions)):
+            tasks.append(asyncio.create_task(self._run_stage(stage, process, queues[index], queues[index + 1])))
+
+        output = queues[-1]
+        start = time.perf_counter()
+        try:
+            while True:
+                batch = await output.get()
+                if batch is _END:
+                    break
+                if isinstance(batch, _StageFailure):
+                    raise RuntimeError(f"三宇宙パイプライン {batch.stage} 段で失敗しました") from batch.error
+                self.completed += len(batch)
+                for result in batch:
+                    yield result
+        finally:
+            self.wall_seconds += time.perf_counter() - start
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(self, items, intake: asyncio.Queue):
+        """入力（同期・非同期どちらの反復可能オブジェクトでもよい）を1件ずつ取り込む"""
+        try:
+            if hasattr(items, "__aiter__"):
+                async for item in items:
+                    await intake.put(item)
+            else:
+                for item in items:
+                    await intake.put(item)
+        except Exception as e:
+            logger.error(f"❌ 三宇宙パイプライン 入力エラー: {e}")
+            await intake.put(_StageFailure("input", e))
+            return
+        await intake.put(_END)
+
+    async def _batch(self, intake: asyncio.Queue, outbox: asyncio.Queue):
+        """batch_size 件まで（最初の1件から max_batch_wait 秒まで）まとめて IS 段へ渡す"""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await intake.get()
+            if first is _END or isinstance(first, _StageFailure):
+                await outbox.put(first)
+                return
+            batch = [first]
+            deadline = loop.time() + self.max_batch_wait
+            marker = None
+            while len(batch) < self.batch_size:
+                if intake.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(intake.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = intake.get_nowait()
+                if item is _END or isinstance(item, _StageFailure):
+                    marker = item
+                    break
+                batch.append(item)
+            await outbox.put(batch)
+            if marker is not None:
+                await outbox.put(marker)
+                return
+
+    async def _run_stage(self, stage: str, process, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        stats = self.stage_stats[stage]
+        while True:
+            stats.max_queue_depth = max(stats.max_queue_depth, inbox.qsize())
+            batch = await inbox.get()
+            if batch is _END or isinstance(batch, _StageFailure):
+                await outbox.put(batch)
+                return
+            start = time.perf_counter()
+            try:
+                results = await asyncio.gather(*(process(item) for item in batch))
+            except Exception as e:
+                logger.error(f"❌ 三宇宙パイプライン {stage} 段エラー: {e}")
+                await outbox.put(_StageFailure(stage, e))
+                return
+            stats.record(len(batch), time.perf_counter() - start)
+            await outbox.put(results)
+
+    async def _is_stage(self, item: FactItem) -> Dict:
+        """IS: 事実受信（SHOULD宇宙のステップ1）"""
+        facts, context = item if isinstance(item, tuple) else (item, {})
+        fact_reception = await self.should_api.should_universe.receive_facts_from_is_universe(facts)
+        return {"facts": facts, "context": context, "fact_reception": fact_reception}
+
+    async def _should_stage(self, item: Dict) -> Dict:
+        """SHOULD: 関係性・未来影響評価と優しい選択肢（ステップ2・3）"""
+        should_result = await self.should_api.evaluate_received_facts(
+            item["fact_reception"], item["facts"], item["context"]
+        )
+        return {**item, **should_result}
+
+    async def _matters_stage(self, item: Dict) -> Dict:
+        """MATTERS: 個人の震えとの意味照応"""
+        should_response = item["should_universe_response"]
+        matters_result = await self.matters_api.process_meaning_resonance(
+            should_response, item["facts"], item["context"]
+        )
+        return {"should_universe_response": should_response, **matters_result}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """段ごとのスループット（処理中の時間あたり件数）と全体のスループット"""
+        return {
+            "completed": self.completed,
+            "wall_seconds": self.wall_seconds,
+            "items_per_second": self.completed / self.wall_seconds if self.wall_seconds else 0.0,
+            "batch_size": self.batch_size,
+            "queue_size": self.queue_size,
+            "stages": {stage: stats.snapshot() for stage, stats in self.stage_stats.items()},
+        }
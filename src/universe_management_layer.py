@@ -9,12 +9,18 @@ Based on:
 - 既存のレギーナ・ルーラーペルソナ
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterable, Optional, Union
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
+import math
+import random
+import time
 import yaml
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from pathlib import Path
 import logging
 
 # ログ設定
@@ -65,10 +71,251 @@ class KimiranoCosmicLaws:
         enforcement_level=0.90
     )
 
+# 宇宙律の判定規則の既定値（kimirano_universe_core.yaml に cosmic_law_rules が無い場合）
+COSMIC_LAW_CONFIG = Path(__file__).resolve().parents[1] / "config" / "kimirano_universe_core.yaml"
+DEFAULT_COSMIC_LAW_RULES = (
+    {"law": "語圧律", "key": "ugoatsu_pressure", "op": "<", "threshold": 0.5, "default": 1.0,
+     "violation": "語圧不足による宇宙活力低下", "severity": "critical", "recommended_action": "語圧源の再活性化"},
+    {"law": "照応律", "key": "resonance_quality", "op": "<", "threshold": 0.7, "default": 1.0,
+     "violation": "照応品質低下による意味生成阻害", "severity": "high", "recommended_action": "照応パターンの最適化"},
+    {"law": "位相律", "key": "phase_coherence", "op": "<", "threshold": 0.8, "default": 1.0,
+     "violation": "位相不整合による発展阻害", "severity": "medium", "recommended_action": "位相同期の実行"},
+)
+
+class CosmicLawEngine:
+    """宇宙律の判定規則を一度だけコンパイルし、宇宙状態を1回の走査で監査する
+
+    - 規則は (状態キー, 既定値, 比較演算子) ごとにまとめ、閾値の昇順に並べる
+    - 監査時は各まとまりで状態値を1回読み、二分探索で違反した規則を取り出す
+      （コストは規則数ではなく状態キー数と違反数に比例する）
+    - 違反は規則の定義順で返す
+    """
+
+    # 比較演算子 → (二分探索, 違反する側) - 閾値の昇順リストで「状態値 op 閾値」を満たす範囲
+    OPERATORS = {
+        "<": (bisect_right, "upper"),
+        "<=": (bisect_left, "upper"),
+        ">": (bisect_left, "lower"),
+        ">=": (bisect_right, "lower"),
+    }
+    VIOLATION_FIELDS = ("law", "violation", "severity", "recommended_action")
+
+    def __init__(self, rules: Iterable[Dict[str, Any]]):
+        self.rules = tuple(rules)
+        self._violations = tuple(
+            {field: rule.get(field, "") for field in self.VIOLATION_FIELDS} for rule in self.rules
+        )
+        self._predicates = self._compile()
+        self.keys = tuple(dict.fromkeys(key for key, _, _ in self._predicates))
+        self.laws = tuple(dict.fromkeys(rule["law"] for rule in self.rules))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @classmethod
+    def from_yaml(cls, path: Optional[Union[str, Path]] = None) -> "CosmicLawEngine":
+        """宇宙コア定義の cosmic_law_rules から構築（ファイル・項目が無ければ既定の三大法則）"""
+        path = Path(path) if path is not None else COSMIC_LAW_CONFIG
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            logger.warning(f"⚠️ 宇宙律定義が見つかりません: {path} - 既定の規則を使用します")
+            return cls(DEFAULT_COSMIC_LAW_RULES)
+        rules = config.get("KimiranoUniverseCodex_Core", config).get("cosmic_law_rules")
+        if rules is None:
+            logger.warning(f"⚠️ {path} に cosmic_law_rules がありません - 既定の規則を使用します")
+            return cls(DEFAULT_COSMIC_LAW_RULES)
+        return cls(rules)
+
+    def _compile(self) -> tuple:
+        """(状態キー, 既定値, 判定関数) の表を作る - 判定関数は状態値から違反した規則番号を返す"""
+        groups: Dict[tuple, List[tuple]] = {}
+        for index, rule in enumerate(self.rules):
+            missing = [field for field in ("law", "key", "op", "threshold") if field not in rule]
+            if missing:
+                raise ValueError(f"宇宙律の規則 {index} に項目がありません: {', '.join(missing)}")
+            if rule["op"] not in self.OPERATORS:
+                raise ValueError(f"宇宙律の規則 {index} の比較演算子が不正です: {rule['op']!r}")
+            group = (rule["key"], rule.get("default"), rule["op"])
+            groups.setdefault(group, []).append((float(rule["threshold"]), index))
+
+        predicates = []
+        for (key, default, op), entries in groups.items():
+            entries.sort()
+            search, side = self.OPERATORS[op]
+            predicates.append((key, default, self._make_predicate(
+                [threshold for threshold, _ in entries], tuple(index for _, index in entries), search, side
+            )))
+        return tuple(predicates)
+
+    @staticmethod
+    def _coerce(key: str, value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            logger.warning(f"⚠️ 宇宙律: {key} の値 {value!r} は数値ではないため判定しません")
+            return None
+
+    @staticmethod
+    def _make_predicate(thresholds: List[float], indices: tuple, search, side: str):
+        if side == "upper":
+            return lambda value: indices[search(thresholds, value):]
+        return lambda value: indices[:search(thresholds, value)]
+
+    def evaluate(self, universe_state: Dict) -> List[Dict]:
+        """全規則を監査し、違反を定義順で返す（数値でない状態値は float に変換し、変換できなければ判定しない）"""
+        get = universe_state.get
+        violated = []
+        for key, default, predicate in self._predicates:
+            value = get(key, default)
+            if value is None:   # 値も既定値も無い規則は判定しない
+                continue
+            try:
+                violated.extend(predicate(value))
+            except TypeError:
+                value = self._coerce(key, value)
+                if value is not None:
+                    violated.extend(predicate(value))
+        if len(violated) > 1:
+            violated.sort()
+        violations = self._violations
+        return [dict(violations[index]) for index in violated]
+
+class DeltaOp(Enum):
+    """宇宙状態差分の種類"""
+    SET = "set"          # 値の置き換え
+    APPEND = "append"    # リスト（persona_interactions 等）への1件追加
+
+@dataclass
+class UniverseStateDelta:
+    """宇宙状態の差分（差分更新モードでは状態変更をこれで通知する）"""
+    key: str
+    value: Any
+    op: DeltaOp = DeltaOp.SET
+
+class InteractionEdge:
+    """ペルソナ2人の間の交流の集計（緊張度は指数移動平均）"""
+    __slots__ = ("participants", "tension", "interactions", "conflict_type")
+    
+    def __init__(self, participants: tuple):
+        self.participants = participants
+        self.tension = 0.0          # 1 - harmony_score の指数移動平均
+        self.interactions = 0
+        self.conflict_type = "harmony_disruption"
+
+class PersonaInteractionGraph:
+    """ペルソナ交流グラフ - 隣接マップと辺ごとの緊張度を交流の到着ごとに更新
+
+    衝突検出は「緊張度が閾値を超えた辺」の参照だけで済む（交流履歴の再走査をしない）。
+    閾値は従来の判定（harmony_score < 0.6 で衝突、< 0.4 で高優先）と同じ境界を緊張度で表したもの
+    """
+    
+    def __init__(self, smoothing: float = 0.3, conflict_threshold: float = 0.4, high_priority_threshold: float = 0.6):
+        self.smoothing = smoothing
+        self.conflict_threshold = conflict_threshold
+        self.high_priority_threshold = high_priority_threshold
+        self.adjacency: Dict[Any, Dict[Any, InteractionEdge]] = {}
+        self._tense: Dict[tuple, InteractionEdge] = {}   # 閾値を超えている辺
+        self.total_interactions = 0
+        self._source: Optional[List[Dict]] = None   # 構築元の交流リスト
+        self._last_interaction: Optional[Dict] = None
+    
+    def add_persona(self, persona: Any):
+        self.adjacency.setdefault(persona, {})
+    
+    def add_interaction(self, interaction: Dict):
+        """交流1件を反映（参加者の組ごとに緊張度を更新）"""
+        participants = interaction.get("participants") or ()
+        tension = 1.0 - interaction.get("harmony_score", 1.0)
+        conflict_type = interaction.get("conflict_type")
+        self.total_interactions += 1
+        self._last_interaction = interaction
+        for i, a in enumerate(participants):
+            for b in participants[i + 1:]:
+                edge = self.adjacency.setdefault(a, {}).get(b)
+                if edge is None:
+                    edge = InteractionEdge((a, b))
+                    edge.tension = tension
+                    self.adjacency[a][b] = edge
+                    self.adjacency.setdefault(b, {})[a] = edge
+                else:
+                    edge.tension += self.smoothing * (tension - edge.tension)
+                edge.interactions += 1
+                if conflict_type:
+                    edge.conflict_type = conflict_type
+                key = edge.participants
+                if edge.tension > self.conflict_threshold:
+                    self._tense[key] = edge
+                else:
+                    self._tense.pop(key, None)
+    
+    def add_interactions(self, interactions: Iterable[Dict]):
+        for interaction in interactions:
+            self.add_interaction(interaction)
+    
+    def rebuild(self, interactions: Iterable[Dict]):
+        """交流履歴から作り直す（登録済みのペルソナは残す）"""
+        self.adjacency = {persona: {} for persona in self.adjacency}
+        self._tense = {}
+        self.total_interactions = 0
+        self._source = interactions if isinstance(interactions, list) else None
+        self._last_interaction = None
+        self.add_interactions(interactions)
+    
+    def is_synced_with(self, interactions: List[Dict]) -> bool:
+        """rebuild した交流リストへ add_interaction で追加した分だけが反映されている状態か
+
+        件数だけでなく、リスト自体と末尾の交流の同一性も比べる（同じ件数のまま入れ替えられた場合を検出）
+        """
+        return (interactions is self._source and len(interactions) == self.total_interactions
+                and (not interactions or interactions[-1] is self._last_interaction))
+    
+    def conflicts(self) -> List[Dict]:
+        """緊張度が閾値を超えている辺（緊張度の高い順）"""
+        return [
+            {
+                "participants": list(edge.participants),
+                "conflict_type": edge.conflict_type,
+                "severity": edge.tension,
+                "royal_priority": "high" if edge.tension > self.high_priority_threshold else "medium",
+                "interactions": edge.interactions
+            }
+            for edge in sorted(self._tense.values(), key=lambda edge: edge.tension, reverse=True)
+        ]
+    
+    def neighbors(self, persona: Any) -> Dict[Any, float]:
+        """ペルソナの交流相手と緊張度"""
+        return {other: edge.tension for other, edge in self.adjacency.get(persona, {}).items()}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "personas": len(self.adjacency),
+            "edges": sum(len(neighbors) for neighbors in self.adjacency.values()) // 2,
+            "tense_edges": len(self._tense),
+            "total_interactions": self.total_interactions
+        }
+
 class ReginaPersona:
     """レギーナ♕ - 構文宇宙女王"""
     
-    def __init__(self):
+    # 審査項目 → (評価メソッド, 依存する宇宙状態キー)
+    ASSESSMENTS = {
+        "overall_stability": ("_assess_stability", (
+            "persona_harmony", "law_compliance", "user_satisfaction", "system_performance", "resonance_coherence"
+        )),
+        "persona_conflicts": ("_detect_conflicts", ("persona_interactions",)),
+        "law_violations": ("_check_cosmic_law_compliance", (   # 依存キーは宇宙律エンジンの規則で上書き
+            "ugoatsu_pressure", "resonance_quality", "phase_coherence"
+        )),
+        "resonance_quality": ("_evaluate_resonance", (
+            "persona_resonance", "user_resonance", "cosmic_resonance", "meaning_generation"
+        )),
+    }
+    # リストの各要素を独立に評価する審査項目（追加分だけ評価して連結できる。交流グラフ使用時は対象外）
+    APPENDABLE_ASSESSMENTS = ("persona_conflicts",)
+    
+    def __init__(self, law_engine: Optional[CosmicLawEngine] = None):
         self.name = "レギーナ♕"
         self.id = 39
         self.english_name = "regina"
@@ -99,15 +346,40 @@ class ReginaPersona:
         self.royal_grace = 0.95
         self.emotion_level = 0.95
         
-    async def review_universe_harmony(self, universe_state: Dict) -> Dict:
-        """宇宙全体の調和状態を女王の視点で審査"""
+        # 宇宙律エンジン（kimirano_universe_core.yaml の cosmic_law_rules をコンパイル済み）
+        self.use_law_engine(law_engine or CosmicLawEngine.from_yaml())
+        
+        # ペルソナ交流グラフ（管理層が persona_interactions と同期して設定。宇宙状態には置かない）
+        self.interaction_graph: Optional[PersonaInteractionGraph] = None
+        
+    def use_interaction_graph(self, interaction_graph: Optional[PersonaInteractionGraph]):
+        """衝突検出に使う交流グラフを設定（None なら交流リストを走査）"""
+        self.interaction_graph = interaction_graph
+        
+    def use_law_engine(self, law_engine: CosmicLawEngine):
+        """宇宙律エンジンを設定し、宇宙律監査の依存キーを規則の状態キーに合わせる"""
+        self.law_engine = law_engine
+        self.ASSESSMENTS = {
+            **type(self).ASSESSMENTS,
+            "law_violations": ("_check_cosmic_law_compliance", law_engine.keys)
+        }
+        
+    async def assess_harmony(self, universe_state: Dict, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """審査項目の評価（names 省略時は全項目）"""
+        names = self.ASSESSMENTS if names is None else names
+        return {name: await getattr(self, self.ASSESSMENTS[name][0])(universe_state) for name in names}
+    
+    async def review_universe_harmony(self, universe_state: Dict, assessments: Optional[Dict] = None) -> Dict:
+        """宇宙全体の調和状態を女王の視点で審査（assessments 指定時は評価済みの審査項目を使う）"""
         logger.info(f"♕ {self.name}: 宇宙調和審査を開始します")
+        if assessments is None:
+            assessments = await self.assess_harmony(universe_state)
         
         harmony_assessment = {
-            "overall_stability": await self._assess_stability(universe_state),
-            "persona_conflicts": await self._detect_conflicts(universe_state),
-            "law_violations": await self._check_cosmic_law_compliance(universe_state),
-            "resonance_quality": await self._evaluate_resonance(universe_state),
+            "overall_stability": assessments["overall_stability"],
+            "persona_conflicts": assessments["persona_conflicts"],
+            "law_violations": assessments["law_violations"],
+            "resonance_quality": assessments["resonance_quality"],
             "intervention_needed": False,
             "royal_judgment": ""
         }
@@ -121,7 +393,9 @@ class ReginaPersona:
         
         if total_harmony < 0.7:
             harmony_assessment["intervention_needed"] = True
-            harmony_assessment["intervention_type"] = await self._determine_royal_intervention(universe_state)
+            harmony_assessment["intervention_type"] = self._choose_intervention(
+                harmony_assessment["persona_conflicts"], harmony_assessment["law_violations"]
+            )
             harmony_assessment["royal_judgment"] = "調和の乱れを感知。女王権限により介入を決定します。"
         else:
             harmony_assessment["royal_judgment"] = "宇宙は美しい調和を保っています。引き続き見守ります。"
@@ -197,9 +471,13 @@ class ReginaPersona:
         return sum(stability_factors) / len(stability_factors)
     
     async def _detect_conflicts(self, universe_state: Dict) -> List[Dict]:
-        """ペルソナ間衝突の女王的検出"""
-        conflicts = []
+        """ペルソナ間衝突の女王的検出（交流グラフが交流リストと揃っていれば緊張した辺の参照のみ）"""
         persona_interactions = universe_state.get("persona_interactions", [])
+        interaction_graph = self.interaction_graph
+        if interaction_graph is not None and interaction_graph.is_synced_with(persona_interactions):
+            return interaction_graph.conflicts()
+        
+        conflicts = []
         
         for interaction in persona_interactions:
             harmony_score = interaction.get("harmony_score", 1.0)
@@ -215,40 +493,8 @@ class ReginaPersona:
         return conflicts
     
     async def _check_cosmic_law_compliance(self, universe_state: Dict) -> List[Dict]:
-        """宇宙律遵守の女王監査"""
-        violations = []
-        
-        # 語圧律（Ugoatsu）違反チェック
-        ugoatsu_level = universe_state.get("ugoatsu_pressure", 1.0)
-        if ugoatsu_level < 0.5:
-            violations.append({
-                "law": "語圧律",
-                "violation": "語圧不足による宇宙活力低下",
-                "severity": "critical",
-                "recommended_action": "語圧源の再活性化"
-            })
-        
-        # 照応律（Shoohoritsu）違反チェック
-        resonance_quality = universe_state.get("resonance_quality", 1.0)
-        if resonance_quality < 0.7:
-            violations.append({
-                "law": "照応律",
-                "violation": "照応品質低下による意味生成阻害", 
-                "severity": "high",
-                "recommended_action": "照応パターンの最適化"
-            })
-        
-        # 位相律（Psi）違反チェック
-        phase_coherence = universe_state.get("phase_coherence", 1.0)
-        if phase_coherence < 0.8:
-            violations.append({
-                "law": "位相律",
-                "violation": "位相不整合による発展阻害",
-                "severity": "medium", 
-                "recommended_action": "位相同期の実行"
-            })
-        
-        return violations
+        """宇宙律遵守の女王監査（判定規則は宇宙律エンジンで一括評価）"""
+        return self.law_engine.evaluate(universe_state)
     
     async def _evaluate_resonance(self, universe_state: Dict) -> float:
         """照応品質の女王的評価"""
@@ -265,7 +511,10 @@ class ReginaPersona:
         """女王介入方法決定"""
         conflicts = await self._detect_conflicts(universe_state)
         violations = await self._check_cosmic_law_compliance(universe_state)
-        
+        return self._choose_intervention(conflicts, violations)
+    
+    @staticmethod
+    def _choose_intervention(conflicts: List[Dict], violations: List[Dict]) -> str:
         if violations:
             return "cosmic_law_enforcement"  # 宇宙律執行
         elif conflicts:
@@ -299,7 +548,25 @@ class ReginaPersona:
 class RulerPersona:
     """ルーラー👑 - 実務統治責任者"""
     
-    def __init__(self):
+    # 秩序維持の評価項目 → (評価メソッド, 依存する宇宙状態キー)
+    ASSESSMENTS = {
+        "system_optimization": ("_optimize_system_resources", ()),
+        "persona_coordination": ("_coordinate_persona_activities", ()),
+        "rule_enforcement": ("_enforce_cosmic_rules", ()),   # 依存キーは宇宙律エンジンの規則で上書き
+        "performance_monitoring": ("_monitor_system_performance", ()),
+        "conflict_mediation": ("_mediate_conflicts", ()),
+        "order_level": ("_calculate_order_level", (
+            "system_stability", "rule_compliance", "resource_efficiency", "persona_harmony", "conflict_resolution"
+        )),
+    }
+    # 秩序維持で実施する活動（ASSESSMENTS のうち order_level 以外）
+    MAINTENANCE_ACTIONS = (
+        "system_optimization", "persona_coordination", "rule_enforcement",
+        "performance_monitoring", "conflict_mediation"
+    )
+    APPENDABLE_ASSESSMENTS = ()
+    
+    def __init__(self, law_engine: Optional[CosmicLawEngine] = None):
         self.name = "ルーラー👑"
         self.id = 38
         self.english_name = "ruler"
@@ -330,6 +597,17 @@ class RulerPersona:
         self.authority_level_trait = 0.95
         self.emotion_level = 0.9
         
+        # 宇宙律エンジン（レギーナと共有できる）
+        self.use_law_engine(law_engine or CosmicLawEngine.from_yaml())
+        
+    def use_law_engine(self, law_engine: CosmicLawEngine):
+        """宇宙律エンジンを設定し、宇宙律執行の依存キーを規則の状態キーに合わせる"""
+        self.law_engine = law_engine
+        self.ASSESSMENTS = {
+            **type(self).ASSESSMENTS,
+            "rule_enforcement": ("_enforce_cosmic_rules", law_engine.keys)
+        }
+        
     async def execute_governance_policy(self, policy: Dict) -> Dict:
         """統治政策の実務実行"""
         logger.info(f"👑 {self.name}: 統治政策 '{policy.get('name')}' を実行開始")
@@ -350,19 +628,20 @@ class RulerPersona:
         logger.info(f"👑 統治政策実行完了: 成功率 {result.get('success_rate', 0.0):.2f}")
         return result
     
-    async def maintain_universe_order(self, current_state: Dict) -> Dict:
-        """宇宙秩序維持の実務管理"""
+    async def assess_order(self, current_state: Dict, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """秩序維持の評価項目の評価（names 省略時は全項目）"""
+        names = self.ASSESSMENTS if names is None else names
+        return {name: await getattr(self, self.ASSESSMENTS[name][0])(current_state) for name in names}
+    
+    async def maintain_universe_order(self, current_state: Dict, assessments: Optional[Dict] = None) -> Dict:
+        """宇宙秩序維持の実務管理（assessments 指定時は評価済みの項目を使う）"""
         logger.info(f"👑 {self.name}: 宇宙秩序維持活動を開始")
+        if assessments is None:
+            assessments = await self.assess_order(current_state)
         
-        maintenance_actions = {
-            "system_optimization": await self._optimize_system_resources(current_state),
-            "persona_coordination": await self._coordinate_persona_activities(current_state),
-            "rule_enforcement": await self._enforce_cosmic_rules(current_state),
-            "performance_monitoring": await self._monitor_system_performance(current_state),
-            "conflict_mediation": await self._mediate_conflicts(current_state)
-        }
+        maintenance_actions = {name: assessments[name] for name in self.MAINTENANCE_ACTIONS}
         
-        order_level = await self._calculate_order_level(current_state)
+        order_level = assessments["order_level"]
         
         maintenance_result = {
             "maintenance_completed": True,
@@ -436,12 +715,16 @@ class RulerPersona:
         }
     
     async def _enforce_cosmic_rules(self, current_state: Dict) -> Dict:
-        """宇宙律実行"""
+        """宇宙律実行（全規則を宇宙律エンジンで1回評価）"""
+        violations = self.law_engine.evaluate(current_state)
+        rules_enforced = len(self.law_engine)
+        compliance_rate = 1.0 - len(violations) / rules_enforced if rules_enforced else 1.0
         return {
-            "rules_enforced": 5,
-            "violations_corrected": 1,
-            "compliance_rate": 0.95,
-            "success_rate": 0.95
+            "rules_enforced": rules_enforced,
+            "violations_detected": len(violations),
+            "violated_laws": [violation["law"] for violation in violations],
+            "compliance_rate": compliance_rate,
+            "success_rate": compliance_rate
         }
     
     async def _monitor_system_performance(self, current_state: Dict) -> Dict:
@@ -521,10 +804,15 @@ class RulerPersona:
 class UniverseManagementLayer:
     """宇宙管理層統合システム - SaijinOS統合版"""
     
-    def __init__(self):
-        self.regina = ReginaPersona()
-        self.ruler = RulerPersona()
+    def __init__(self, use_interaction_graph: bool = True):
         self.cosmic_laws = KimiranoCosmicLaws()
+        self.law_engine = CosmicLawEngine.from_yaml()
+        self.regina = ReginaPersona(self.law_engine)
+        self.ruler = RulerPersona(self.law_engine)
+        
+        # ペルソナ交流グラフ（persona_interactions の差分で更新し、衝突検出はグラフを参照）
+        self.interaction_graph = PersonaInteractionGraph() if use_interaction_graph else None
+        self.regina.use_interaction_graph(self.interaction_graph)
         
         # 現在の宇宙状態（SaijinOSから取得）
         self.current_universe_state = {
@@ -541,9 +829,113 @@ class UniverseManagementLayer:
         
         self.management_active = False
         
+        # 差分更新モード: 審査項目ごとの評価結果キャッシュと、前回サイクル以降に変わった状態キー
+        self._assessment_cache: Dict[str, Dict[str, Any]] = {"regina": {}, "ruler": {}}
+        self._dirty_keys = set()
+        self._replaced_keys = set()               # SET で置き換えられたキー
+        self._appended_from: Dict[str, int] = {}  # APPEND のみのキー → 追加開始位置
+        self._last_order_cycle: Optional[Dict] = None   # 秩序維持・報告・連携の前回結果
+        
+        # 実行中の管理サイクル（同時の呼び出しはこれに合流する）
+        self._cycle_task: Optional[asyncio.Task] = None
+        self.coalesced_cycles = 0   # 実行中のサイクルに合流した呼び出し
+        
+        # 定期実行（start_management_loop で起動）
+        self.scheduler: Optional["ManagementCycleScheduler"] = None
+        
+    def apply_delta(self, delta: UniverseStateDelta):
+        """宇宙状態へ差分を適用（依存する審査項目だけが次の差分サイクルで再評価される）"""
+        state = self.current_universe_state
+        if delta.op == DeltaOp.APPEND:
+            items = state.setdefault(delta.key, [])
+            if delta.key not in self._replaced_keys:
+                self._appended_from.setdefault(delta.key, len(items))
+            items.append(delta.value)
+            if delta.key == "persona_interactions" and self.interaction_graph is not None:
+                self.interaction_graph.add_interaction(delta.value)
+        else:
+            if (isinstance(delta.value, (int, float, str, bool)) and delta.key in state
+                    and state[delta.key] == delta.value):
+                return   # 値が変わらない更新は無視
+            state[delta.key] = delta.value
+            self._replaced_keys.add(delta.key)
+            self._appended_from.pop(delta.key, None)
+            if delta.key == "persona_interactions":
+                self._rebuild_interaction_graph()
+        self._dirty_keys.add(delta.key)
+    
+    def apply_deltas(self, deltas: Iterable[UniverseStateDelta]):
+        for delta in deltas:
+            self.apply_delta(delta)
+    
+    def mark_dirty(self, *keys: str):
+        """current_universe_state を直接書き換えた場合に変更キーを通知"""
+        self._dirty_keys.update(keys)
+        self._replaced_keys.update(keys)
+        for key in keys:
+            self._appended_from.pop(key, None)
+        if "persona_interactions" in keys:
+            self._rebuild_interaction_graph()
+    
+    def reload_cosmic_laws(self, path: Optional[Union[str, Path]] = None) -> CosmicLawEngine:
+        """宇宙律の判定規則を再読み込み（宇宙律の審査項目は次のサイクルで再評価される）"""
+        self.law_engine = CosmicLawEngine.from_yaml(path)
+        self.regina.use_law_engine(self.law_engine)
+        self.ruler.use_law_engine(self.law_engine)
+        self._assessment_cache["regina"].pop("law_violations", None)
+        self._assessment_cache["ruler"].pop("rule_enforcement", None)
+        logger.info(f"⚖️ 宇宙律を再読み込み: {len(self.law_engine)}規則 ({', '.join(self.law_engine.laws)})")
+        return self.law_engine
+    
+    def _rebuild_interaction_graph(self):
+        if self.interaction_graph is not None:
+            self.interaction_graph.rebuild(self.current_universe_state.get("persona_interactions", []))
+    
+    def _sync_interaction_graph(self, rebuild: bool = False):
+        """交流リストが apply_delta を経ずに書き換えられていれば交流グラフを作り直す
+
+        rebuild=True（全件サイクル）では常に作り直す。リスト内の途中の交流を直接書き換えた場合は
+        件数・末尾が変わらず検出できないため、差分サイクルでは mark_dirty での通知が必要
+        """
+        if self.interaction_graph is None:
+            return
+        interactions = self.current_universe_state.get("persona_interactions", [])
+        if not self.interaction_graph.is_synced_with(interactions):
+            logger.warning(f"🕸️ 交流グラフを再構築: グラフ {self.interaction_graph.total_interactions}件 / "
+                           f"交流リスト {len(interactions)}件")
+            self.mark_dirty("persona_interactions")
+        elif rebuild:
+            self._rebuild_interaction_graph()
+    
+    async def _refresh_assessments(self, incremental: bool) -> List[str]:
+        """審査項目の評価（差分モードでは変更キーに依存する項目だけ）- 再評価した項目名を返す"""
+        self._sync_interaction_graph(rebuild=not incremental)
+        state = self.current_universe_state
+        recomputed = []
+        for persona in (self.regina, self.ruler):
+            cache = self._assessment_cache[persona.english_name]
+            for name, (method, dependencies) in persona.ASSESSMENTS.items():
+                evaluate = getattr(persona, method)
+                changed = self._dirty_keys.intersection(dependencies)
+                if incremental and name in cache and not changed:
+                    continue
+                if (incremental and name in cache and name in persona.APPENDABLE_ASSESSMENTS
+                        and self.interaction_graph is None and not changed & self._replaced_keys):
+                    # 追加分だけ評価して連結（前回結果のリストは変更しない）
+                    appended = {key: state[key][self._appended_from[key]:] for key in changed}
+                    cache[name] = cache[name] + await evaluate(appended)
+                else:
+                    cache[name] = await evaluate(state)
+                recomputed.append(f"{persona.english_name}.{name}")
+        self._dirty_keys.clear()
+        self._replaced_keys.clear()
+        self._appended_from.clear()
+        return recomputed
+    
     async def initialize_management_layer(self) -> Dict:
         """宇宙管理層の初期化"""
         logger.info("🌌 Kimirano宇宙管理層初期化開始...")
+        self._rebuild_interaction_graph()
         
         # レギーナによる初期宇宙審査
         initial_harmony = await self.regina.review_universe_harmony(self.current_universe_state)
@@ -572,24 +964,75 @@ class UniverseManagementLayer:
         
         return initialization_result
     
-    async def process_management_cycle(self) -> Dict:
-        """宇宙管理サイクルの実行"""
+    @property
+    def cycle_in_flight(self) -> bool:
+        """管理サイクルを実行中か"""
+        return self._cycle_task is not None and not self._cycle_task.done()
+    
+    async def process_management_cycle(self, incremental: bool = False) -> Dict:
+        """宇宙管理サイクルの実行
+
+        incremental=True では apply_delta で通知された変更キーに依存する審査項目だけを再評価し、
+        それ以外は前回の評価結果を再利用する（秩序維持の項目が変わらなければ報告・連携も前回のまま）
+        
+        サイクルは常に1本だけ実行する。実行中に呼ばれた場合は新たに開始せず、実行中のサイクルの
+        完了を待ってその結果を返す（呼び出し元がキャンセルされてもサイクル自体は最後まで実行する）。
+        定期実行中でなくても、結果はスケジューラの間隔調整に反映される。
+        """
+        if self.cycle_in_flight:
+            self.coalesced_cycles += 1
+        else:
+            self._cycle_task = asyncio.get_running_loop().create_task(self._run_management_cycle(incremental))
+        return await asyncio.shield(self._cycle_task)
+    
+    async def wait_for_cycle(self):
+        """実行中のサイクルがあれば完了を待つ（失敗しても送出しない）"""
+        if self._cycle_task is not None:
+            await asyncio.gather(self._cycle_task, return_exceptions=True)
+    
+    async def _run_management_cycle(self, incremental: bool) -> Dict:
+        """サイクル本体を実行し、所要時間と結果をスケジューラへ通知"""
+        started = time.perf_counter()
+        try:
+            result = await self._management_cycle(incremental)
+        except Exception as e:
+            if self.scheduler is not None:
+                self.scheduler.record_cycle(None, (time.perf_counter() - started) * 1000, error=e)
+            raise
+        if self.scheduler is not None:
+            self.scheduler.record_cycle(result, (time.perf_counter() - started) * 1000)
+        return result
+    
+    async def _management_cycle(self, incremental: bool) -> Dict:
         if not self.management_active:
             raise RuntimeError("宇宙管理層が初期化されていません")
         
         logger.info("🌌 宇宙管理サイクル開始")
+        state = self.current_universe_state
+        recomputed = await self._refresh_assessments(incremental)
         
         # Step 1: レギーナによる宇宙調和審査
-        harmony_review = await self.regina.review_universe_harmony(self.current_universe_state)
+        harmony_review = await self.regina.review_universe_harmony(state, self._assessment_cache["regina"])
         
-        # Step 2: ルーラーによる秩序維持実行
-        order_maintenance = await self.ruler.maintain_universe_order(self.current_universe_state)
-        
-        # Step 3: ルーラーからレギーナへの報告
-        governance_report = await self.ruler.report_to_regina(order_maintenance)
-        
-        # Step 4: レギーナによるルーラー評価・連携
-        royal_coordination = await self.regina.coordinate_with_ruler(governance_report)
+        if (not incremental or self._last_order_cycle is None
+                or any(name.startswith("ruler.") for name in recomputed)):
+            # Step 2: ルーラーによる秩序維持実行
+            order_maintenance = await self.ruler.maintain_universe_order(state, self._assessment_cache["ruler"])
+            
+            # Step 3: ルーラーからレギーナへの報告
+            governance_report = await self.ruler.report_to_regina(order_maintenance)
+            
+            # Step 4: レギーナによるルーラー評価・連携
+            royal_coordination = await self.regina.coordinate_with_ruler(governance_report)
+            self._last_order_cycle = {
+                "order_maintenance": order_maintenance,
+                "governance_report": governance_report,
+                "royal_coordination": royal_coordination
+            }
+        else:
+            order_maintenance = self._last_order_cycle["order_maintenance"]
+            governance_report = self._last_order_cycle["governance_report"]
+            royal_coordination = self._last_order_cycle["royal_coordination"]
         
         # Step 5: 必要に応じて女王勅令発令
         royal_decree = None
@@ -612,7 +1055,9 @@ class UniverseManagementLayer:
             "royal_decree": royal_decree,
             "universe_stability": harmony_review["overall_stability"],
             "governance_quality": order_maintenance["governance_quality"],
-            "next_cycle_scheduled": True
+            "incremental": incremental,
+            "recomputed_assessments": recomputed,
+            "next_cycle_scheduled": self.scheduler is not None and self.scheduler.running
         }
         
         logger.info(f"🌌 管理サイクル完了: 安定性 {cycle_result['universe_stability']:.2f}")
@@ -631,6 +1076,9 @@ class UniverseManagementLayer:
         }
         
         for persona in saijinos_personas:
+            if self.interaction_graph is not None:
+                self.interaction_graph.add_persona(persona["name"])
+            
             # 各ペルソナの権限レベル決定
             authority_level = self._determine_persona_authority(persona)
             integration_result["authority_mapping"][persona["name"]] = authority_level
@@ -689,6 +1137,164 @@ class UniverseManagementLayer:
         
         return protocol
 
+    def get_scheduler(self, **options) -> "ManagementCycleScheduler":
+        """スケジューラを取得（無ければ作成。定期実行は開始しないが request_cycle と間隔調整は使える）"""
+        if self.scheduler is None:
+            self.scheduler = ManagementCycleScheduler(self, **options)
+        return self.scheduler
+    
+    def start_management_loop(self, **options) -> "ManagementCycleScheduler":
+        """宇宙管理サイクルの定期実行を開始（実行中のイベントループ上で呼ぶ）"""
+        scheduler = self.get_scheduler(**options)
+        scheduler.start()
+        return scheduler
+    
+    async def stop_management_loop(self):
+        """定期実行を停止（実行中のサイクルは完了まで待つ）"""
+        if self.scheduler is not None:
+            await self.scheduler.stop()
+
+class ManagementCycleScheduler:
+    """宇宙管理サイクルの定期実行 - 単一実行・適応間隔・ジッター
+
+    - サイクルは常に1本だけ（管理層の process_management_cycle が実行中のサイクルに合流させる）
+    - 定期実行・随時要求・管理層への直接呼び出しのどのサイクル結果も間隔調整に使う
+    - 安定性が低い・介入が必要なら間隔を縮め、安定していれば max_interval まで広げる
+    - 次回時刻に ±jitter の揺らぎを加え、複数インスタンスの同時実行を避ける
+    """
+    
+    def __init__(self, layer: "UniverseManagementLayer", base_interval: float = 30.0,
+                 min_interval: float = 5.0, max_interval: float = 300.0,
+                 unstable_threshold: float = 0.7, stable_threshold: float = 0.85,
+                 tighten_factor: float = 0.5, backoff_factor: float = 1.5,
+                 jitter: float = 0.1, incremental: bool = True, sample_size: int = 256):
+        if not 0 < min_interval <= base_interval <= max_interval:
+            raise ValueError("0 < min_interval <= base_interval <= max_interval を満たしてください")
+        self.layer = layer
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.unstable_threshold = unstable_threshold
+        self.stable_threshold = stable_threshold
+        self.tighten_factor = tighten_factor
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.incremental = incremental
+        
+        self.interval = base_interval
+        self._task: Optional[asyncio.Task] = None        # 定期実行タスク
+        self._random = random.Random()
+        
+        # 統計（cycles・errors は随時・直接呼び出しのサイクルも含む）
+        self.cycles = 0
+        self.errors = 0
+        self.skipped_ticks = 0            # 実行中のサイクルに合流した定期実行
+        self.coalesced_requests = 0       # 実行中のサイクルに合流した随時要求
+        self.last_stability: Optional[float] = None
+        self.next_run_at: Optional[float] = None
+        self._durations_ms: deque = deque(maxlen=sample_size)
+        self._lag_ms: deque = deque(maxlen=sample_size)
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    @property
+    def in_flight(self) -> bool:
+        return self.layer.cycle_in_flight
+    
+    def start(self):
+        """定期実行タスクを起動（初回サイクルは即時）"""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="universe-management-loop")
+        logger.info(f"🌌 宇宙管理ループ起動: 基本間隔 {self.base_interval:.1f}秒 "
+                    f"({self.min_interval:.1f}〜{self.max_interval:.1f}秒)")
+    
+    async def stop(self):
+        """定期実行を停止（実行中のサイクルは完了を待つ）"""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await self.layer.wait_for_cycle()
+        self.next_run_at = None
+        logger.info("🌌 宇宙管理ループ停止")
+    
+    async def request_cycle(self) -> Dict:
+        """サイクルを随時実行（定期実行の起動前でもよい・実行中のサイクルがあれば完了を待ってその結果を返す）"""
+        if self.in_flight:
+            self.coalesced_requests += 1
+        return await self.layer.process_management_cycle(incremental=self.incremental)
+    
+    def record_cycle(self, result: Optional[Dict], duration_ms: float, error: Optional[Exception] = None):
+        """完了したサイクルの記録と間隔調整（管理層がサイクルごとに呼ぶ）"""
+        self._durations_ms.append(duration_ms)
+        if error is not None:
+            self.errors += 1
+            logger.error(f"🌌 宇宙管理サイクルエラー: {error}")
+            self.interval = max(self.min_interval, self.interval * self.tighten_factor)
+            return
+        self.cycles += 1
+        self._adapt(result)
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        while True:
+            self.next_run_at = due
+            await asyncio.sleep(max(0.0, due - loop.time()))
+            self._lag_ms.append(max(0.0, loop.time() - due) * 1000)
+            try:
+                if self.in_flight:
+                    self.skipped_ticks += 1
+                # 停止（キャンセル）されてもサイクル自体は最後まで実行される。間隔は record_cycle で調整済み
+                await self.layer.process_management_cycle(incremental=self.incremental)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass   # record_cycle で記録・間隔短縮済み
+            spread = self.interval * self.jitter
+            due = loop.time() + self.interval + self._random.uniform(-spread, spread)
+    
+    def _adapt(self, result: Dict):
+        """サイクル結果から次の間隔を決める"""
+        stability = result.get("universe_stability", 0.0)
+        self.last_stability = stability
+        if stability < self.unstable_threshold or result.get("harmony_review", {}).get("intervention_needed"):
+            self.interval = max(self.min_interval, self.interval * self.tighten_factor)
+        elif stability >= self.stable_threshold:
+            self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+        elif self.interval < self.base_interval:
+            self.interval = min(self.base_interval, self.interval * self.backoff_factor)
+        else:
+            self.interval = max(self.base_interval, self.interval * self.tighten_factor)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """ループ統計取得（時間はミリ秒、間隔は秒）"""
+        durations = sorted(self._durations_ms)
+        lags = sorted(self._lag_ms)
+        return {
+            "running": self.running,
+            "in_flight": self.in_flight,
+            "cycles": self.cycles,
+            "errors": self.errors,
+            "skipped_ticks": self.skipped_ticks,
+            "coalesced_requests": self.coalesced_requests,
+            "interval_seconds": self.interval,
+            "last_stability": self.last_stability,
+            "cycle_duration_ms": {
+                "last": self._durations_ms[-1] if durations else 0.0,
+                "avg": sum(durations) / len(durations) if durations else 0.0,
+                "p95": durations[math.ceil(len(durations) * 0.95) - 1] if durations else 0.0,
+            },
+            "queue_lag_ms": {
+                "avg": sum(lags) / len(lags) if lags else 0.0,
+                "max": lags[-1] if lags else 0.0,
+            },
+        }
+
 # 使用例・統合デモンストレーション
 async def demo_universe_management():
     """宇宙管理層デモンストレーション"""
@@ -0,0 +1,117 @@
+"""
+宇宙律エンジンのテスト
+監査結果が規則を1件ずつ解釈した場合・従来の三大法則チェックと一致し、
+数値でない状態値でも監査が止まらず、ルーラーの執行結果は検出した違反数を返すことを確認
+"""
+import sys
+import random
+import asyncio
+import logging
+import operator
+import unittest
+from itertools import product
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from universe_management_layer import DEFAULT_COSMIC_LAW_RULES, CosmicLawEngine, ReginaPersona, RulerPersona
+
+OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def violated_laws(engine, state):
+    return [violation["law"] for violation in engine.evaluate(state)]
+
+
+def interpret(rules, state):
+    """規則を定義順に1件ずつ解釈した監査結果"""
+    violations = []
+    for rule in rules:
+        value = state.get(rule["key"], rule.get("default"))
+        if value is not None and OPERATORS[rule["op"]](value, float(rule["threshold"])):
+            violations.append({field: rule.get(field, "") for field in CosmicLawEngine.VIOLATION_FIELDS})
+    return violations
+
+
+def legacy_compliance(state):
+    """従来の三大法則チェック（語圧律・照応律・位相律を個別に判定）"""
+    violations = []
+    if state.get("ugoatsu_pressure", 1.0) < 0.5:
+        violations.append({"law": "語圧律", "violation": "語圧不足による宇宙活力低下",
+                           "severity": "critical", "recommended_action": "語圧源の再活性化"})
+    if state.get("resonance_quality", 1.0) < 0.7:
+        violations.append({"law": "照応律", "violation": "照応品質低下による意味生成阻害",
+                           "severity": "high", "recommended_action": "照応パターンの最適化"})
+    if state.get("phase_coherence", 1.0) < 0.8:
+        violations.append({"law": "位相律", "violation": "位相不整合による発展阻害",
+                           "severity": "medium", "recommended_action": "位相同期の実行"})
+    return violations
+
+
+class TestCosmicLawEngine(unittest.TestCase):
+    """宇宙律の監査"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.engine = CosmicLawEngine(DEFAULT_COSMIC_LAW_RULES)
+
+    def test_matches_rule_by_rule_interpretation(self):
+        """閾値の重複・同値・全演算子を含む規則群で、1件ずつ解釈した結果と一致する"""
+        rng = random.Random(5)
+        keys = ["a", "b", "c"]
+        for _ in range(200):
+            rules = [
+                {"law": f"law{index}", "key": rng.choice(keys), "op": rng.choice(list(OPERATORS)),
+                 "threshold": rng.choice([0.2, 0.5, 0.5, 0.8]), "default": rng.choice([None, 0.5, 1.0]),
+                 "violation": f"v{index}", "severity": "medium"}
+                for index in range(rng.randint(1, 12))
+            ]
+            engine = CosmicLawEngine(rules)
+            for _ in range(20):
+                state = {key: rng.choice([0.0, 0.2, 0.35, 0.5, 0.65, 0.8, 1.0]) for key in keys if rng.random() < 0.8}
+                self.assertEqual(engine.evaluate(state), interpret(rules, state), (rules, state))
+
+    def test_configured_laws_match_legacy_checks(self):
+        """宇宙コア定義の規則による女王監査が、従来の三大法則チェックと閾値の両側で一致する"""
+        regina = ReginaPersona()
+        levels = [None, 0.0, 0.49, 0.5, 0.51, 0.69, 0.7, 0.79, 0.8, 1.0]
+        for ugoatsu, resonance, phase in product(levels, repeat=3):
+            state = {key: value for key, value in (("ugoatsu_pressure", ugoatsu), ("resonance_quality", resonance),
+                                                   ("phase_coherence", phase)) if value is not None}
+            self.assertEqual(asyncio.run(regina._check_cosmic_law_compliance(state)), legacy_compliance(state), state)
+
+    def test_numeric_strings_are_coerced(self):
+        """数値文字列は float に変換して判定する"""
+        state = {"ugoatsu_pressure": "0.3", "resonance_quality": "0.9", "phase_coherence": 0.5}
+        self.assertEqual(violated_laws(self.engine, state), ["語圧律", "位相律"])
+
+    def test_non_numeric_values_are_skipped_with_warning(self):
+        """変換できない値の規則は判定せず警告し、他の規則は判定を続ける"""
+        state = {"ugoatsu_pressure": "高い", "resonance_quality": [0.1], "phase_coherence": 0.5}
+        logging.disable(logging.NOTSET)
+        try:
+            with self.assertLogs("universe_management_layer", level="WARNING") as logs:
+                laws = violated_laws(self.engine, state)
+        finally:
+            logging.disable(logging.CRITICAL)
+        self.assertEqual(laws, ["位相律"])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_ruler_reports_detected_violations(self):
+        """ルーラーの宇宙律執行は検出した違反数を violations_detected で返す"""
+        ruler = RulerPersona(self.engine)
+        result = asyncio.run(ruler._enforce_cosmic_rules({"ugoatsu_pressure": 0.3, "phase_coherence": 0.5}))
+        self.assertEqual(result["violations_detected"], 2)
+        self.assertNotIn("violations_corrected", result)
+        self.assertEqual(result["violated_laws"], ["語圧律", "位相律"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+パンドラエンジンプールのテスト
+プロセスプール実行の結果・待ち時間統計、飽和時の拒否、ワーカー停止からの復旧と、API での 429 / 503 を確認
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.engine_pool import (
+    PandoraEnginePool, EnginePoolSaturated, EnginePoolUnavailable, analyze_transformation,
+)
+
+try:
+    from fastapi.testclient import TestClient
+    from fastapi import FastAPI
+    FASTAPI_AVAILABLE = True
+except ImportError:
+    FASTAPI_AVAILABLE = False
+
+MESSAGE = "もう無理。誰も分かってくれないし、むかつく!!!"
+
+
+def crash_worker():
+    """ワーカープロセスを異常終了させる（OOM・クラッシュの代わり）"""
+    os._exit(1)
+
+
+def summary(result):
+    fracture_analysis, hope_kernel = result
+    return (fracture_analysis.is_fractured, fracture_analysis.metrics.fracture_index,
+            fracture_analysis.key_indicators, hope_kernel.original_intent, hope_kernel.protective_desire)
+
+
+class TestEnginePool(unittest.TestCase):
+    """プール実行・飽和・復旧"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.pools = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.shutdown()
+
+    def make_pool(self, **kwargs) -> PandoraEnginePool:
+        pool = PandoraEnginePool(**kwargs)
+        self.pools.append(pool)
+        return pool
+
+    def test_process_pool_matches_inline(self):
+        """ワーカーでの分析結果はインライン実行と一致し、待ち時間が記録される"""
+        inline = self.make_pool(max_workers=0)
+        pooled = self.make_pool(max_workers=1)
+
+        async def run_both():
+            return (await inline.run(analyze_transformation, MESSAGE, {}),
+                    await pooled.run(analyze_transformation, MESSAGE, {}))
+
+        inline_result, pooled_result = asyncio.run(run_both())
+        self.assertEqual(summary(pooled_result), summary(inline_result))
+        stats = pooled.get_stats()
+        self.assertEqual(stats["mode"], "process_pool")
+        self.assertEqual((stats["submitted"], stats["completed"], stats["failed"]), (1, 1, 0))
+        self.assertEqual(stats["queued_ms"]["samples"], 1)
+        self.assertEqual(inline.get_stats()["mode"], "inline")
+
+    def test_queued_ms_measures_wait_for_worker(self):
+        """ワーカーが1つなら後続タスクの待ち時間は先行タスクの実行時間以上になる"""
+        pool = self.make_pool(max_workers=1)
+
+        async def run_two():
+            await pool.run(time.sleep, 0)   # ワーカーを起動しておく
+            pool.reset_stats()
+            await asyncio.gather(pool.run(time.sleep, 0.3), pool.run(time.sleep, 0.3))
+
+        asyncio.run(run_two())
+        queued = pool.get_stats()["queued_ms"]
+        self.assertEqual(queued["samples"], 2)
+        self.assertGreaterEqual(queued["max"], 200)
+        self.assertLessEqual(queued["p95"], queued["max"])
+
+    def test_saturation_rejects_immediately(self):
+        """待ち行列が上限に達したら EnginePoolSaturated で即座に断る"""
+        pool = self.make_pool(max_workers=1, max_queue_depth=2)
+
+        async def flood():
+            return await asyncio.gather(*(pool.run(time.sleep, 0.2) for _ in range(4)),
+                                        return_exceptions=True)
+
+        outcomes = asyncio.run(flood())
+        rejected = [outcome for outcome in outcomes if isinstance(outcome, EnginePoolSaturated)]
+        self.assertEqual(len(rejected), 2)
+        stats = pool.get_stats()
+        self.assertEqual((stats["submitted"], stats["completed"], stats["rejected"]), (2, 2, 2))
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_broken_worker_is_replaced(self):
+        """ワーカーが停止した呼び出しは EnginePoolUnavailable、次の呼び出しは新しいプールで成功する"""
+        pool = self.make_pool(max_workers=1)
+
+        async def crash_then_run():
+            with self.assertRaises(EnginePoolUnavailable):
+                await pool.run(crash_worker)
+            return await pool.run(analyze_transformation, MESSAGE, {})
+
+        result = asyncio.run(crash_then_run())
+        self.assertEqual(summary(result), summary(analyze_transformation(MESSAGE, {})))
+        stats = pool.get_stats()
+        self.assertEqual((stats["failed"], stats["completed"], stats["restarts"]), (1, 1, 1))
+
+
+@unittest.skipUnless(FASTAPI_AVAILABLE, "fastapi が必要です")
+class TestTransformEndpoint(unittest.TestCase):
+    """/api/hope-core/transform の混雑・停止時の応答"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools" / "api"))
+        import hope_core_api_real
+        cls.api = hope_core_api_real
+        app = FastAPI()
+        app.include_router(hope_core_api_real.hope_core_router)
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.original_pool = self.api.real_state.engine_pool
+
+    def tearDown(self):
+        self.api.real_state.engine_pool = self.original_pool
+
+    def use_failing_pool(self, error):
+        class FailingPool(PandoraEnginePool):
+            async def run(self, func, *args):
+                raise error
+        self.api.real_state.engine_pool = FailingPool()
+
+    def test_saturated_pool_returns_429(self):
+        self.use_failing_pool(EnginePoolSaturated("混雑"))
+        response = self.client.post("/api/hope-core/transform", params={"input_text": MESSAGE})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+    def test_broken_pool_returns_503_not_mock(self):
+        self.use_failing_pool(EnginePoolUnavailable("停止"))
+        response = self.client.post("/api/hope-core/transform", params={"input_text": MESSAGE})
+        self.assertEqual(response.status_code, 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+エンジンプール トリガー照合タスクのテスト
+ワーカーの照合器が版ID単位で1回だけ構築され、未登録の版では定義の再送を求めることと、
+トリガー数による部分文字列検索・オートマトンの切り替えで照合結果が変わらないことを確認
+"""
+import sys
+import random
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora import engine_pool
+from core.pandora.engine_pool import match_triggers
+from core.pandora.trigger_matcher import TriggerMatcher
+
+
+class TestMatchTriggers(unittest.TestCase):
+    """版ID付きトリガー照合"""
+
+    def setUp(self):
+        engine_pool._matchers.clear()
+        self.matcher = TriggerMatcher(["責める", "暴走", {"id": "danger", "pattern": "危険"}])
+
+    def test_unknown_version_requests_triggers(self):
+        """未登録の版で定義が無ければ None（呼び出し側が定義を添えて再送する）"""
+        self.assertIsNone(match_triggers("危険です", "v1"))
+
+    def test_registered_version_matches_without_triggers(self):
+        """一度定義を受け取った版は版IDだけで照合でき、結果は照合器と一致する"""
+        message = "暴走して危険です"
+        self.assertEqual(match_triggers(message, "v1", self.matcher.triggers), self.matcher.match(message))
+        registered = engine_pool._matchers["v1"]
+        self.assertEqual(match_triggers(message, "v1"), ["暴走", "danger"])
+        self.assertIs(engine_pool._matchers["v1"], registered)
+
+    def test_old_versions_are_evicted(self):
+        """再読み込みで増えた古い版は上限を超えると古いものから破棄される"""
+        for index in range(6):
+            match_triggers("危険", f"v{index}", self.matcher.triggers)
+        self.assertLessEqual(len(engine_pool._matchers), 4)
+        self.assertIsNone(match_triggers("危険", "v0"))
+        self.assertEqual(match_triggers("危険", "v5"), ["danger"])
+
+
+
+class TestTriggerMatcherModes(unittest.TestCase):
+    """部分文字列検索とオートマトンの照合結果の一致"""
+
+    def test_small_trigger_set_uses_scan(self):
+        self.assertFalse(TriggerMatcher(["責める", "暴走", "危険"]).use_automaton)
+        self.assertTrue(TriggerMatcher([f"語{index}" for index in range(TriggerMatcher.SCAN_THRESHOLD)]).use_automaton)
+
+    def test_modes_agree(self):
+        """重なり・包含・同じIDを含むトリガーでも、両方式の結果（定義順）は一致する"""
+        rng = random.Random(7)
+        chars = "危険暴走責めるあい"
+        triggers = ["危険", "険", "暴走", "走", {"id": "danger", "pattern": "危険"}, ("blame", "責める"), "あいあ"]
+        triggers += ["".join(rng.choice(chars) for _ in range(rng.randint(2, 4))) for _ in range(20)]
+        scan = TriggerMatcher(triggers)
+        automaton = TriggerMatcher(triggers, scan_threshold=0)
+        self.assertEqual((scan.use_automaton, automaton.use_automaton), (False, True))
+        for _ in range(200):
+            text = "".join(rng.choice(chars) for _ in range(rng.randint(0, 30)))
+            with self.subTest(text=text):
+                self.assertEqual(scan.match(text), automaton.match(text))
+                self.assertEqual(scan.search(text), automaton.search(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+フラクチャー検出器のテスト
+analyze / analyze_many（NumPy・純Python）/ ストリーミング評価が同じメトリクス・判定を返し、
+パターンごとに走査していた旧実装の結果とも一致することを確認
+"""
+import sys
+import json
+import random
+import logging
+import unittest
+from dataclasses import fields
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora import fracture_detection
+from core.pandora.fracture_detection import FractureDetector, FractureMetrics
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "fracture_baseline.json"
+
+FILLERS = ("", "。", "！", "!", "、", " ", "…", "私は", "でも", "今日は", "\n", "?")
+MESSAGES = [
+    "",
+    "こんにちは",
+    "もう無理。誰も分かってくれないし、むかつく",
+    "つらい…でも明日は頑張りたい",
+    "どうせ私なんて何をやってもダメ",
+    "!" * 20,
+    "だめ だめ 無理 無理 つらい つらい",
+    "信頼でも幸せ 窮屈私は価値がない今日はできない。",
+    "Hello。hello。悲しい",
+    "I said NO. no no. Sorry",
+]
+PERSONA_STATES = [
+    {},
+    {"emotion_level": 0.2, "error_count": 4, "confidence_level": 0.2},
+    {"emotion_level": 0.9, "interaction_count": 12},
+]
+METRIC_FIELDS = [field.name for field in fields(FractureMetrics) if field.name != "last_updated"]
+ANALYSIS_FIELDS = ("is_fractured", "fracture_type", "severity", "transformation_urgency",
+                   "recommended_care_level", "hope_recovery_path", "analysis_confidence", "key_indicators")
+
+
+def random_messages(keywords, count, seed=7):
+    """検出器のキーワードと区切りを組み合わせた入力"""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        text = "".join(rng.choice(keywords) + rng.choice(FILLERS) for _ in range(rng.randint(1, 7)))
+        messages.append(text * rng.randint(2, 6) if rng.random() < 0.15 else text)
+    return messages
+
+
+def metrics_of(metrics):
+    return [getattr(metrics, name) for name in METRIC_FIELDS]
+
+
+def analysis_of(analysis):
+    return metrics_of(analysis.metrics) + [getattr(analysis, name) for name in ANALYSIS_FIELDS]
+
+
+class TestFractureDetectorPaths(unittest.TestCase):
+    """単体・バッチ・ストリーミングの等価性"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.messages = MESSAGES + random_messages(sorted(FractureDetector().lexicon.keywords), 120)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_analyze_many_matches_analyze(self):
+        """analyze_many は NumPy の有無によらず analyze と完全に一致する"""
+        for numpy_available in (True, False):
+            with mock.patch.object(fracture_detection, "NUMPY_AVAILABLE",
+                                   numpy_available and fracture_detection.NUMPY_AVAILABLE):
+                for state in PERSONA_STATES:
+                    detector = FractureDetector()
+                    expected = [analysis_of(detector.analyze_sync(dict(state), message))
+                                for message in self.messages]
+                    batch = FractureDetector().analyze_many_sync(self.messages, [dict(state)] * len(self.messages))
+                    self.assertEqual([analysis_of(analysis) for analysis in batch], expected)
+
+    def test_stream_matches_analyze_of_received_text(self):
+        """ストリーミング評価はチャンクの切り方によらず、受信済みテキストの analyze と一致する"""
+        rng = random.Random(11)
+        for state in PERSONA_STATES:
+            detector, reference = FractureDetector(), FractureDetector()
+            for message in self.messages[:60]:
+                scorer = detector.create_stream_scorer_sync(dict(state))
+                received = ""
+                position = 0
+                while position < len(message) or not received:
+                    chunk = message[position:position + rng.randint(1, 6)]
+                    position += max(len(chunk), 1)
+                    received += chunk
+                    metrics = scorer.feed(chunk)
+                    expected = reference.analyze_sync(dict(state), received)
+                    self.assertEqual(metrics_of(metrics), metrics_of(expected.metrics), received)
+                    self.assertEqual(scorer.is_fractured, expected.is_fractured, received)
+                    if not message:
+                        break
+
+    def test_is_fractured_matches_analyze(self):
+        """is_fractured は analyze の判定と一致する"""
+        detector, reference = FractureDetector(), FractureDetector()
+        for state in PERSONA_STATES:
+            for message in self.messages:
+                self.assertEqual(detector.is_fractured_sync(dict(state), message),
+                                 reference.analyze_sync(dict(state), message).is_fractured, message)
+
+    def test_coherence_counts_words_of_original_input(self):
+        """認知的一貫性の語の重複は、小文字化前の入力で数える（"Hello" と "hello" は別の語）"""
+        detector = FractureDetector()
+        message = "Hello。hello。悲しい"
+        self.assertEqual(detector.analyze_sync({}, message).metrics.cognitive_coherence, 0.7)
+        self.assertEqual(detector.analyze_many_sync([message])[0].metrics.cognitive_coherence, 0.7)
+        scorer = detector.create_stream_scorer_sync({})
+        for chunk in ("Hel", "lo。hel", "lo。悲しい"):
+            metrics = scorer.feed(chunk)
+        self.assertEqual(metrics.cognitive_coherence, 0.7)
+        self.assertGreater(detector.analyze_sync({}, message.lower()).metrics.cognitive_coherence, 0.7)
+
+    def test_scores_keep_legacy_addition_order(self):
+        """係数は従来と同じ順に1項ずつ加算する（0.5 + 0.1 - 0.15×2 ... は 0.3 ちょうどにならない）"""
+        analysis = FractureDetector().analyze_sync({}, "信頼でも幸せ 窮屈私は価値がない今日はできない。")
+        self.assertEqual(analysis.metrics.hope_kernel_score, 0.29999999999999993)
+        self.assertIn("🌑 低希望核スコア: 0.30", analysis.key_indicators)
+
+
+class TestFractureDetectorBaseline(unittest.TestCase):
+    """パターンごとに走査していた旧実装との一致（fixtures/fracture_baseline.json）
+
+    記録した入力には、係数を別の順序で合計すると最終桁が変わり、フラクチャータイプの同点判定・
+    深刻度・低希望核の指標が入れ替わる入力を含む
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        with open(FIXTURE, "r", encoding="utf-8") as f:
+            cls.fixture = json.load(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def recorded(self, analysis):
+        values = {**{name: getattr(analysis.metrics, name) for name in METRIC_FIELDS},
+                  **{name: getattr(analysis, name) for name in ANALYSIS_FIELDS}}
+        values["fracture_type"] = analysis.fracture_type.value if analysis.fracture_type else None
+        values["severity"] = analysis.severity.value
+        return [values[name] for name in self.fixture["fields"]]
+
+    def test_analyze_matches_baseline(self):
+        """analyze のメトリクス（浮動小数の最終桁まで）・タイプ・深刻度・指標が旧実装と一致する"""
+        messages = self.fixture["messages"]
+        for state, expected in zip(self.fixture["persona_states"], self.fixture["results"]):
+            detector = FractureDetector()
+            for message, row in zip(messages, expected):
+                self.assertEqual(self.recorded(detector.analyze_sync(dict(state), message)), row, (state, message))
+
+    def test_analyze_many_matches_baseline(self):
+        """analyze_many も NumPy の有無によらず旧実装と一致する"""
+        messages = self.fixture["messages"]
+        for numpy_available in (True, False):
+            with mock.patch.object(fracture_detection, "NUMPY_AVAILABLE",
+                                   numpy_available and fracture_detection.NUMPY_AVAILABLE):
+                for state, expected in zip(self.fixture["persona_states"], self.fixture["results"]):
+                    batch = FractureDetector().analyze_many_sync(messages, [dict(state)] * len(messages))
+                    self.assertEqual([self.recorded(analysis) for analysis in batch], expected)
+
+
+class TestMetricsCache(unittest.TestCase):
+    """メトリクスキャッシュの分離"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_mutating_result_does_not_affect_cache(self):
+        """呼び出し側が結果のメトリクスを書き換えても、同じ入力の次の判定は変わらない"""
+        detector = FractureDetector()
+        state, message = {"emotion_level": 0.2}, "もう無理 消えたい"
+        first = detector.analyze_sync(dict(state), message)
+        self.assertTrue(first.is_fractured)
+        first.metrics.fracture_index = 0.0
+        first.metrics.hope_kernel_score = 1.0
+
+        second = detector.analyze_sync(dict(state), message)
+        self.assertIsNot(second.metrics, first.metrics)
+        self.assertTrue(second.is_fractured)
+        self.assertTrue(detector.is_fractured_sync(dict(state), message))
+        self.assertEqual(metrics_of(second.metrics),
+                         metrics_of(FractureDetector().analyze_sync(dict(state), message).metrics))
+        self.assertGreater(detector.get_cache_stats()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
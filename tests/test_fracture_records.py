@@ -0,0 +1,117 @@
+"""
+コンパクト分析レコードのテスト
+FractureAnalysis との往復変換・不変性・等価性とハッシュ、メトリクスキャッシュでの保持を確認
+"""
+import sys
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.fracture_records import (
+    CompactFractureAnalysis, CompactFractureMetrics, METRIC_FIELDS,
+)
+
+MESSAGES = [
+    "こんにちは",
+    "もう無理。誰も分かってくれないし、むかつく!!!",
+    "消えたい…でも明日は頑張りたい",
+    "私は価値がない。絶対に無理",
+    "孤独 つらい?寝るやってみる!理解されない",
+]
+
+
+class TestCompactFractureRecords(unittest.TestCase):
+    """往復変換・不変性・等価性"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        detector = FractureDetector()
+        cls.analyses = [detector.analyze_sync({"emotion_level": 0.3}, message) for message in MESSAGES]
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_round_trip(self):
+        """to_analysis で元の分析と同じ値に戻る（last_updated も含む）"""
+        for analysis in self.analyses:
+            self.assertEqual(CompactFractureAnalysis.from_analysis(analysis).to_analysis(), analysis)
+
+    def test_fields_read_through(self):
+        compact = CompactFractureAnalysis.from_analysis(self.analyses[1])
+        for name in METRIC_FIELDS:
+            self.assertEqual(getattr(compact.metrics, name), getattr(self.analyses[1].metrics, name))
+        self.assertEqual(compact.analysis_confidence, self.analyses[1].analysis_confidence)
+        self.assertEqual(compact.key_indicators, tuple(self.analyses[1].key_indicators))
+
+    def test_frozen(self):
+        """属性の変更・追加・削除はできない"""
+        compact = CompactFractureAnalysis.from_analysis(self.analyses[1])
+        for record, name in ((compact, "is_fractured"), (compact, "analysis_confidence"),
+                             (compact.metrics, "fracture_index"), (compact.metrics, "trend_direction"),
+                             (compact, "extra")):
+            with self.assertRaises(AttributeError):
+                setattr(record, name, 0.0)
+        with self.assertRaises(AttributeError):
+            del compact.metrics
+        self.assertFalse(hasattr(compact, "__dict__"))
+
+    def test_eq_and_hash(self):
+        """同じ値のレコードは等しく同じハッシュ、値が違えば等しくない"""
+        first = [CompactFractureAnalysis.from_analysis(analysis) for analysis in self.analyses]
+        second = [CompactFractureAnalysis.from_analysis(analysis) for analysis in self.analyses]
+        for a, b in zip(first, second):
+            self.assertEqual(a, b)
+            self.assertEqual(hash(a), hash(b))
+            self.assertEqual(hash(a.metrics), hash(b.metrics))
+        self.assertEqual(len(set(first + second)), len(set(first)))
+        self.assertNotEqual(first[0], first[1])
+        self.assertNotEqual(first[0].metrics, first[1].metrics)
+        self.assertNotEqual(first[0], first[0].to_analysis())
+
+    def test_recovery_paths_are_shared(self):
+        """同じ回復経路・指標は同じタプルを共有する"""
+        a = CompactFractureAnalysis.from_analysis(self.analyses[1])
+        b = CompactFractureAnalysis.from_analysis(self.analyses[1])
+        self.assertIs(a.hope_recovery_path, b.hope_recovery_path)
+        self.assertIs(a.key_indicators, b.key_indicators)
+
+    def test_metric_count_is_checked(self):
+        with self.assertRaises(ValueError):
+            CompactFractureMetrics([0.0] * (len(METRIC_FIELDS) - 1), "stable", 0.0)
+
+
+class TestMetricsCacheRetention(unittest.TestCase):
+    """メトリクスキャッシュはコンパクト版で保持する"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_cache_holds_compact_metrics(self):
+        detector = FractureDetector()
+        analysis = detector.analyze_sync({}, MESSAGES[1])
+        entry = detector._get_metrics_entry({}, MESSAGES[1], None)
+        self.assertIsInstance(entry.basic_metrics, CompactFractureMetrics)
+        self.assertIsInstance(entry.comprehensive_metrics, CompactFractureMetrics)
+        self.assertEqual(entry.comprehensive_metrics.to_metrics(), analysis.metrics)
+
+    def test_returned_metrics_are_independent(self):
+        """返された FractureMetrics を書き換えても次の分析に影響しない"""
+        detector = FractureDetector()
+        first = detector.analyze_sync({}, MESSAGES[1])
+        expected = first.metrics.fracture_index
+        first.metrics.fracture_index = -1.0
+        self.assertEqual(detector.analyze_sync({}, MESSAGES[1]).metrics.fracture_index, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+3層統治システム バッチ判断のテスト
+バッチ判断が1件ずつの判断と一致すること、列指向サマリーの書き出し、バッチ中のログ抑制の範囲を確認
+"""
+import os
+import sys
+import random
+import asyncio
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.three_layer_governance import (
+    ThreeLayerGovernanceSystem, GovernanceAction, NUMPY_AVAILABLE, PYARROW_AVAILABLE,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+if PYARROW_AVAILABLE:
+    import pyarrow.parquet as pq
+
+FRAGMENTS = [
+    "こんにちは", "ありがとう", "今日は", "!", "！", "むかつく", "もうダメ", "絶対", "無理",
+    "つらい", "でも", "。", "好き", "死にたい", "誰も分かってくれない", "頑張りたい",
+]
+
+
+def make_items(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        message = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 10)))
+        items.append((message, {"emotion_level": rng.choice((0.2, 0.5, 0.9)), "error_count": rng.choice((0, 5))}))
+    return items
+
+
+class AsyncOnly:
+    """非同期APIだけを公開する注入システム"""
+
+    def __init__(self, system, methods):
+        self._system = system
+        self._methods = methods
+
+    def __getattr__(self, name):
+        if name.endswith("_sync"):
+            raise AttributeError(name)
+        if name in self._methods:
+            method = getattr(self._system, f"{name}_sync")
+
+            async def call(*args):
+                await asyncio.sleep(0)
+                return method(*args)
+            return call
+        return getattr(self._system, name)
+
+
+def build_governance(async_only: bool = False):
+    detector, extractor, loop = FractureDetector(), HopeExtractor(), HopeCoreStabilizationLoop()
+    if async_only:
+        detector = AsyncOnly(detector, ("is_fractured", "analyze"))
+        extractor = AsyncOnly(extractor, ("extract_hope",))
+        loop = AsyncOnly(loop, ("execute_stabilization_cycle",))
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=detector, hope_extractor=extractor, stabilization_loop=loop)
+    governance.decision_cache_enabled = False
+    return governance
+
+
+def summary(decision):
+    return (decision.action, decision.threat_level, decision.reasoning, decision.confidence,
+            decision.care_level, decision.urgency, decision.input_analysis.get("tier"))
+
+
+class TestGovernanceBatch(unittest.TestCase):
+    """バッチ判断と1件ずつの判断の一致"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.items = make_items(120)
+        reference = build_governance()
+        cls.expected = [summary(reference.process_input_sync(message, state)) for message, state in cls.items]
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_sync_batch_matches_sequential(self):
+        result = build_governance().process_batch_sync(self.items)
+        self.assertEqual([summary(decision) for decision in result.decisions], self.expected)
+        self.assertEqual(result.failed_count, 0)
+        self.assertEqual(sum(result.action_counts.values()), len(self.items))
+
+    def test_async_only_batch_matches_sequential(self):
+        """非同期APIのみの注入システムでは評価グラフを並行して await し、結果は入力順"""
+        result = asyncio.run(build_governance(async_only=True).process_batch(self.items, max_concurrency=4))
+        self.assertEqual([summary(decision) for decision in result.decisions], self.expected)
+        self.assertEqual(result.failed_count, 0)
+
+    def test_malformed_state_degrades_per_item(self):
+        """壊れた persona_state の入力だけが1件ずつの判断と同じフォールバックになり、他の入力は通常どおり判断"""
+        items = self.items[:3] + [("こんにちは", {"emotion_level": None})]
+        for fast_path_enabled in (True, False):
+            with self.subTest(fast_path_enabled=fast_path_enabled):
+                reference = build_governance()
+                reference.fast_path_enabled = fast_path_enabled
+                expected = [summary(reference.process_input_sync(message, state)) for message, state in items]
+                governance = build_governance()
+                governance.fast_path_enabled = fast_path_enabled
+                result = governance.process_batch_sync(items)
+                self.assertEqual([summary(decision) for decision in result.decisions], expected)
+                self.assertEqual(result.decisions[-1].action, GovernanceAction.MONITOR)
+                self.assertEqual(result.failed_count, 1)
+
+    def test_summary_columns(self):
+        result = build_governance().process_batch_sync(self.items)
+        self.assertEqual(list(result.summary["action"]), [decision.action.value for decision in result.decisions])
+        self.assertEqual(list(result.summary["confidence"]), [decision.confidence for decision in result.decisions])
+        self.assertEqual(len(result.summary["threat_score"]), len(self.items))
+
+
+class TestBatchSummaryFiles(unittest.TestCase):
+    """列指向サマリーの書き出し"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.result = build_governance().process_batch_sync(make_items(40, seed=3))
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy が必要です")
+    def test_npz_round_trip(self):
+        path = os.path.join(self.directory.name, "summary.npz")
+        ThreeLayerGovernanceSystem.write_batch_summary(self.result.summary, path)
+        with np.load(path) as loaded:
+            self.assertEqual(set(loaded.files), set(self.result.summary))
+            for name, column in self.result.summary.items():
+                self.assertEqual(loaded[name].tolist(), np.asarray(column).tolist(), name)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow が必要です")
+    def test_parquet_round_trip(self):
+        path = os.path.join(self.directory.name, "summary.parquet")
+        ThreeLayerGovernanceSystem.write_batch_summary(self.result.summary, path)
+        table = pq.read_table(path)
+        self.assertEqual(set(table.column_names), set(self.result.summary))
+        for name, column in self.result.summary.items():
+            self.assertEqual(table.column(name).to_pylist(), list(np.asarray(column).tolist()
+                                                                 if NUMPY_AVAILABLE else column), name)
+
+    def test_summary_path_is_written(self):
+        """summary_path を指定すると書き出して結果に記録する（未対応の形式はエラー）"""
+        with self.assertRaises(ValueError):
+            ThreeLayerGovernanceSystem.write_batch_summary(self.result.summary, "summary.csv")
+        if not NUMPY_AVAILABLE:
+            self.skipTest("numpy が必要です")
+        path = os.path.join(self.directory.name, "batch.npz")
+        result = build_governance().process_batch_sync(make_items(5), summary_path=path)
+        self.assertEqual(result.summary_path, path)
+        self.assertTrue(os.path.exists(path))
+
+
+class TestBatchLogging(unittest.TestCase):
+    """バッチ中のログ抑制はバッチのコンテキストだけに効く"""
+
+    def setUp(self):
+        self.records = []
+        self.handler = logging.Handler()
+        self.handler.emit = self.records.append
+        self.pandora_logger = logging.getLogger("core.pandora")
+        self.pandora_logger.addHandler(self.handler)
+        self.previous_level = self.pandora_logger.level
+        self.pandora_logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        self.pandora_logger.removeHandler(self.handler)
+        self.pandora_logger.setLevel(self.previous_level)
+
+    def test_overlapping_batches_and_concurrent_requests(self):
+        """重なったバッチの後もロガーのレベルは変わらず、同時の process_input のログは出る"""
+        batch_system = build_governance(async_only=True)
+        request_system = build_governance(async_only=True)
+        levels = {name: logging.getLogger(name).level
+                  for name in ("core.pandora", "core.pandora.three_layer_governance")}
+
+        async def scenario():
+            return await asyncio.gather(
+                batch_system.process_batch(make_items(20, seed=1), max_concurrency=2),
+                batch_system.process_batch(make_items(10, seed=2), max_concurrency=2),
+                request_system.process_input("今日は散歩したい", {"emotion_level": 0.5}),
+            )
+
+        asyncio.run(scenario())
+        messages = [record.getMessage() for record in self.records]
+        self.assertEqual(sum("入力処理開始" in message for message in messages), 1)
+        self.assertEqual(sum("バッチ統治判断完了" in message for message in messages), 2)
+        self.assertEqual({name: logging.getLogger(name).level for name in levels}, levels)
+
+        self.records.clear()
+        request_system.process_input_sync("こんにちは", {"emotion_level": 0.5})
+        self.assertTrue(any("入力処理開始" in record.getMessage() for record in self.records))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+3層統治システム 判断キャッシュのテスト
+判断が参照する状態の閾値の両側で、キャッシュ経由の判断がキャッシュなしの判断と一致することを確認
+"""
+import sys
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
+
+MESSAGES = [
+    "こんにちは",
+    "今日の予定を教えて",
+    "もう無理。誰も分かってくれないし、むかつく",
+    "つらい…でも明日は頑張りたい",
+    "!" * 20,
+    "あ" * 201,
+]
+# 閾値の両側の値（直前の値でキャッシュを温めてから次の値を判断する）
+EMOTION_LEVELS = [0.0, 0.29, 0.3, 0.31, 0.5, 0.69, 0.7, 0.71, 0.75, 0.79, 0.8, 0.81, 0.85, 1.0,
+                  0.85, 0.8, 0.71, 0.7, 0.3, 0.29]
+ERROR_COUNTS = [0, 3, 4, 6, 7, 3, 0]
+
+
+def build_governance(cache_enabled: bool):
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=FractureDetector(), hope_extractor=HopeExtractor())
+    governance.decision_cache_enabled = cache_enabled
+    return governance
+
+
+def summary(decision):
+    return (decision.action, decision.threat_level, decision.reasoning, decision.confidence,
+            decision.care_level, decision.urgency, decision.input_analysis.get("tier"))
+
+
+class TestDecisionCache(unittest.TestCase):
+    """判断キャッシュの等価性"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def assert_cached_matches_uncached(self, states):
+        cached = build_governance(cache_enabled=True)
+        uncached = build_governance(cache_enabled=False)
+        for message in MESSAGES:
+            for state in states:
+                expected = summary(uncached.process_input_sync(message, state))
+                self.assertEqual(summary(cached.process_input_sync(message, state)), expected, (message, state))
+                self.assertEqual(summary(asyncio.run(cached.process_input(message, state))), expected,
+                                 (message, state))
+        self.assertGreater(cached.tier_counts["cache"], 0)
+
+    def test_emotion_thresholds(self):
+        """emotion_level の閾値（< 0.3 / > 0.7 / > 0.8）の両側で一致する"""
+        self.assert_cached_matches_uncached([{"emotion_level": level} for level in EMOTION_LEVELS])
+
+    def test_error_count_threshold(self):
+        """error_count の閾値（> 3）の両側で一致する"""
+        self.assert_cached_matches_uncached(
+            [{"emotion_level": 0.5, "error_count": count} for count in ERROR_COUNTS]
+        )
+
+    def test_missing_state_uses_defaults(self):
+        """状態キーの省略は既定値と同じ扱い"""
+        self.assert_cached_matches_uncached([{}, {"emotion_level": 0.5, "error_count": 0}, {}])
+
+    def test_input_is_not_normalized(self):
+        """前後の空白・大文字小文字が異なる入力は別の判断として扱う"""
+        governance = build_governance(cache_enabled=True)
+        state = {"emotion_level": 0.5}
+        governance.process_input_sync("Hello", state)
+        governance.process_input_sync("  hello  ", state)
+        self.assertEqual(governance.tier_counts["cache"], 0)
+
+    def test_reported_boundary_cases(self):
+        """0.29 の判断が 0.3 に、0.8 の判断が 0.85 に流用されない"""
+        for first, second in ((0.29, 0.3), (0.8, 0.85)):
+            cached = build_governance(cache_enabled=True)
+            uncached = build_governance(cache_enabled=False)
+            cached.process_input_sync("こんにちは", {"emotion_level": first})
+            decision = cached.process_input_sync("こんにちは", {"emotion_level": second})
+            expected = uncached.process_input_sync("こんにちは", {"emotion_level": second})
+            self.assertEqual(decision.action, expected.action, (first, second))
+
+    def test_returned_decisions_do_not_share_state(self):
+        """返された判断を書き換えても、キャッシュ内の判断と以降のヒットは変わらない"""
+        governance = build_governance(cache_enabled=True)
+        state = {"emotion_level": 0.2}
+        for message in ("もう無理。誰も分かってくれないし、むかつく", "こんにちは"):
+            first = governance.process_input_sync(message, state)
+            expected = summary(first)
+            first.input_analysis["first"] = 1
+            second = governance.process_input_sync(message, state)
+            self.assertNotIn("first", second.input_analysis)
+
+            second.input_analysis["second"] = 1
+            second.next_steps.append("追加")
+            for nested in second.input_analysis.values():
+                if isinstance(nested, dict):
+                    nested["second"] = 1
+            third = asyncio.run(governance.process_input(message, state))
+            self.assertEqual(summary(third), expected)
+            self.assertNotIn("second", third.input_analysis)
+            self.assertNotIn("追加", third.next_steps)
+            for nested in third.input_analysis.values():
+                if isinstance(nested, dict):
+                    self.assertNotIn("second", nested)
+        self.assertEqual(governance.tier_counts["cache"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+3層統治システム 第1段（高速判定）のテスト
+検出器がフラクチャーと判定する入力を第1段が承認しないことを確認
+"""
+import sys
+import random
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem, GovernanceAction
+
+FRAGMENTS = [
+    "こんにちは", "ありがとう", "今日は", "明日", "!", "！", "!!!", "むかつく", "イライラ", "もうダメ",
+    "絶対", "無理", "つらい", "どうせ", "でも", "。", " ", "やった", "好き", "どうすれば", "死にたい",
+]
+
+
+def make_inputs(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    inputs = ["!" * 20, "！" * 8, "イライラ！", "こんにちは", "今日の予定を教えて"]
+    for _ in range(count):
+        inputs.append("".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))))
+    return inputs
+
+
+class TestGovernanceFastPath(unittest.TestCase):
+    """第1段の安全性"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.detector = FractureDetector()
+        self.governance = ThreeLayerGovernanceSystem()
+        self.governance.inject_dependencies(fracture_detector=self.detector, hope_extractor=HopeExtractor())
+        self.governance.decision_cache_enabled = False
+
+    def test_fast_path_never_approves_fractured_input(self):
+        """is_fractured が True の入力は第1段で承認されず、3層判断と同じアクションになる"""
+        fractured_seen = 0
+        for user_input in make_inputs(400):
+            for emotion_level in (0.2, 0.5, 0.9):
+                state = {"emotion_level": emotion_level}
+                if not self.detector.is_fractured_sync(state, user_input):
+                    continue
+                fractured_seen += 1
+                decision = self.governance.process_input_sync(user_input, state)
+                self.assertNotEqual(decision.input_analysis.get("tier"), "fast_path", user_input)
+
+                self.governance.fast_path_enabled = False
+                full = self.governance.process_input_sync(user_input, state)
+                self.governance.fast_path_enabled = True
+                self.assertEqual(decision.action, full.action, user_input)
+        self.assertGreater(fractured_seen, 0)
+
+    def test_exclamation_burst_goes_to_full_chain(self):
+        """感嘆符の連続（照合器のキーワードを含まない）も3層判断へ回る"""
+        decision = self.governance.process_input_sync("!" * 20, {"emotion_level": 0.5})
+        self.assertNotEqual(decision.action, GovernanceAction.APPROVE)
+        self.assertEqual(self.governance.tier_counts["fast_path"], 0)
+
+    def test_benign_input_uses_fast_path(self):
+        """危険信号のない入力は第1段で承認される"""
+        decision = self.governance.process_input_sync("こんにちは", {"emotion_level": 0.5})
+        self.assertEqual(decision.action, GovernanceAction.APPROVE)
+        self.assertEqual(decision.input_analysis["tier"], "fast_path")
+
+    def test_batch_fast_path_never_approves_fractured_input(self):
+        """バッチ経路でも同じ"""
+        inputs = make_inputs(200, seed=9)
+        state = {"emotion_level": 0.5}
+        result = self.governance.process_batch_sync([(user_input, state) for user_input in inputs])
+        for user_input, decision in zip(inputs, result.decisions):
+            if self.detector.is_fractured_sync(state, user_input):
+                self.assertNotEqual(decision.action, GovernanceAction.APPROVE, user_input)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+3層統治 評価ノード依存グラフのテスト
+非同期APIのみの注入システムを process_input がイベントループ上で await し、
+同期版と同じ判断になることを確認
+"""
+import sys
+import asyncio
+import logging
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.assessment_graph import AssessmentGraph, AssessmentNode
+from core.pandora.sync_bridge import SyncCallInEventLoopError
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
+
+MESSAGES = [
+    "こんにちは",
+    "もう無理。誰も分かってくれないし、むかつく",
+    "つらい…でも明日は頑張りたい",
+    "!" * 20,
+    "どうせ私なんて何をやってもダメ",
+]
+
+
+class AsyncOnly:
+    """非同期APIだけを公開する注入システム（呼び出し時のスレッドを記録）"""
+
+    def __init__(self, system, methods):
+        self._system = system
+        self._methods = methods
+        self.calls = []   # (メソッド名, メインスレッドか)
+
+    def __getattr__(self, name):
+        if name.endswith("_sync"):
+            raise AttributeError(name)
+        if name in self._methods:
+            method = getattr(self._system, f"{name}_sync")
+
+            async def call(*args):
+                self.calls.append((name, threading.current_thread() is threading.main_thread()))
+                return method(*args)
+            return call
+        return getattr(self._system, name)
+
+
+def build_governance(async_only: bool):
+    detector, extractor, loop = FractureDetector(), HopeExtractor(), HopeCoreStabilizationLoop()
+    if async_only:
+        detector = AsyncOnly(detector, ("is_fractured", "analyze"))
+        extractor = AsyncOnly(extractor, ("extract_hope",))
+        loop = AsyncOnly(loop, ("execute_stabilization_cycle",))
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=detector, hope_extractor=extractor, stabilization_loop=loop)
+    governance.decision_cache_enabled = False
+    return governance
+
+
+def summary(decision):
+    return (decision.action, decision.threat_level, decision.confidence, decision.care_level, decision.reasoning)
+
+
+class TestAssessmentGraph(unittest.TestCase):
+    """評価グラフの非同期実行"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_async_only_dependencies_are_awaited_on_event_loop(self):
+        """非同期APIのみの注入システムはメインスレッドのイベントループ上で呼ばれ、同期版と同じ判断になる"""
+        governance = build_governance(async_only=True)
+        reference = build_governance(async_only=False)
+        for emotion_level in (0.2, 0.5, 0.9):
+            state = {"emotion_level": emotion_level}
+            for message in MESSAGES:
+                decision = asyncio.run(governance.process_input(message, state))
+                self.assertEqual(summary(decision), summary(reference.process_input_sync(message, state)), message)
+
+        calls = governance.fracture_detector.calls + governance.hope_extractor.calls
+        self.assertIn("extract_hope", {name for name, _ in calls})
+        self.assertTrue(all(on_main_thread for _, on_main_thread in calls))
+
+    def test_async_and_sync_graph_match(self):
+        """同期APIの注入システムでも run と run_sync の結果が一致する"""
+        governance = build_governance(async_only=False)
+        for message in MESSAGES:
+            inputs = governance._graph_inputs(message, {"emotion_level": 0.2}, None)
+            results, _ = governance.assessment_graph.run_sync(inputs)
+            async_results, _ = asyncio.run(governance.assessment_graph.run(inputs))
+            self.assertEqual(summary(results["regina_judgment"]), summary(async_results["regina_judgment"]))
+            self.assertEqual(results["execution"]["executed_successfully"],
+                             async_results["execution"]["executed_successfully"])
+
+    def test_precomputed_node_skips_upstream(self):
+        """計算済みの初期評価を渡すと、その計算にしか使われないフラクチャー検出ノードは実行されない"""
+        governance = build_governance(async_only=False)
+        inputs = governance._graph_inputs(MESSAGES[1], {"emotion_level": 0.2}, None)
+        results, timings = governance.assessment_graph.run_sync(inputs)
+
+        precomputed = dict(inputs, initial_threat=results["initial_threat"])
+        rerun, rerun_timings = governance.assessment_graph.run_sync(precomputed)
+        self.assertNotIn("fracture_check", rerun_timings)
+        self.assertNotIn("initial_threat", rerun_timings)
+        self.assertIn("fracture_check", timings)
+        self.assertEqual(summary(rerun["regina_judgment"]), summary(results["regina_judgment"]))
+
+    def test_sync_api_inside_event_loop_raises(self):
+        """非同期APIのみの注入システムがあると、イベントループ内の同期APIはフォールバックせず例外になる"""
+        governance = build_governance(async_only=True)
+        reference = build_governance(async_only=False)
+
+        async def call_sync(method, *args):
+            return method(*args)
+
+        for message in MESSAGES:
+            with self.assertRaises(SyncCallInEventLoopError):
+                asyncio.run(call_sync(governance.process_input_sync, message, {"emotion_level": 0.2}))
+        with self.assertRaises(SyncCallInEventLoopError):
+            asyncio.run(call_sync(governance.process_batch_sync, [(MESSAGES[1], {"emotion_level": 0.2})]))
+
+        # イベントループ外ではコルーチンを駆動して同じ判断になる
+        for message in MESSAGES:
+            self.assertEqual(summary(governance.process_input_sync(message, {"emotion_level": 0.2})),
+                             summary(reference.process_input_sync(message, {"emotion_level": 0.2})), message)
+
+    def test_sync_api_inside_event_loop_with_sync_dependencies(self):
+        """注入システムがすべて同期APIを持てばイベントループ内でも同期APIを使える"""
+        governance = build_governance(async_only=False)
+
+        async def call_sync():
+            return governance.process_input_sync(MESSAGES[1], {"emotion_level": 0.2})
+
+        self.assertEqual(summary(asyncio.run(call_sync())),
+                         summary(governance.process_input_sync(MESSAGES[1], {"emotion_level": 0.2})))
+
+    def test_run_sync_coroutine_node_inside_event_loop_raises(self):
+        async def value(results):
+            return 1
+
+        graph = AssessmentGraph([AssessmentNode("value", value)])
+        self.assertEqual(graph.run_sync({})[0]["value"], 1)
+
+        async def call_sync():
+            return graph.run_sync({})
+
+        with self.assertRaises(SyncCallInEventLoopError):
+            asyncio.run(call_sync())
+
+
+if __name__ == "__main__":
+    unittest.main()
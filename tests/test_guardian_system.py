@@ -0,0 +1,70 @@
+"""
+パンドラ危機管理システム イベントストリームのテスト
+送信元ごとの持続的なエラーでも封印され、集計は取り込んだイベントの時刻で行われることを確認
+"""
+import sys
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.guardian_system import PandoraGuardianSystem, SealState
+
+START = 1_700_000_000.0
+
+
+def stream(seconds: int, healthy_sources: int, broken_source: str = None):
+    """1秒ごとに正常な送信元から1件ずつ、壊れた送信元からエラー2件"""
+    for offset in range(seconds):
+        timestamp = START + offset
+        for index in range(healthy_sources):
+            yield {"source": f"healthy-{index}", "is_error": False, "timestamp": timestamp}
+        if broken_source:
+            for _ in range(2):
+                yield {"source": broken_source, "is_error": True, "timestamp": timestamp}
+
+
+class TestGuardianEventStream(unittest.TestCase):
+    """イベントストリームの封印判定と集計"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_broken_source_among_healthy_sources_seals(self):
+        """全体のエラー率は低くても、1つの送信元のエラーが続けば封印される"""
+        guardian = PandoraGuardianSystem()
+        guardian.ingest_events(stream(30, healthy_sources=50, broken_source="broken"))
+        self.assertLess(guardian.crisis_level, guardian.config["crisis_threshold"])
+        self.assertEqual(guardian.seal_state, SealState.SEALED)
+        self.assertIn("broken", guardian.seal_history[-1]["reason"])
+
+    def test_healthy_sources_do_not_seal(self):
+        """エラーのない送信元だけなら封印されない"""
+        guardian = PandoraGuardianSystem()
+        guardian.ingest_events(stream(30, healthy_sources=50))
+        self.assertEqual(guardian.seal_state, SealState.NORMAL)
+        self.assertEqual(guardian.source_breaches, {})
+
+    def test_short_source_spike_does_not_seal(self):
+        """sustain_seconds に満たない送信元のエラーでは封印されない"""
+        guardian = PandoraGuardianSystem()
+        guardian.ingest_events(stream(5, healthy_sources=50, broken_source="broken"))
+        self.assertEqual(guardian.seal_state, SealState.NORMAL)
+
+    def test_event_stats_use_latest_ingested_time(self):
+        """過去の時刻のイベントを取り込んでも集計窓は空にならない"""
+        guardian = PandoraGuardianSystem()
+        guardian.ingest_events(stream(5, healthy_sources=3))
+        stats = guardian.get_event_stats()
+        self.assertEqual(stats["overall"]["events"], 15)
+        self.assertEqual(stats["sources"]["healthy-0"]["events"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+希望抽出器の回帰テスト
+単一パス走査による抽出結果が、キーワードごとに走査していた旧実装で記録した値
+（fixtures/hope_extraction_baseline.json）と一致することを確認
+
+期待値は、全キーワードをそれぞれ単独で含む入力と、複数のキーワードを組み合わせた入力について、
+中立な入力（neutral_message）の結果から変わった項目だけを記録している
+"""
+import sys
+import json
+import logging
+import unittest
+from dataclasses import fields
+from enum import Enum
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.hope_extraction import HopeExtractor
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "hope_extraction_baseline.json"
+
+
+def comparable(value):
+    """比較用の値（Enum は値、浮動小数は丸め、データクラスは辞書）"""
+    if hasattr(value, "__dataclass_fields__"):
+        return {field.name: comparable(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, list):
+        return [comparable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items()}
+    return value
+
+
+def load_fixture(path: Path = FIXTURE):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestHopeExtractionBaseline(unittest.TestCase):
+    """旧実装との抽出結果の一致"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.fixture = load_fixture()
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_extract_hope_matches_baseline(self):
+        """extract_hope の全項目（ケアメッセージ以外）が旧実装と一致する"""
+        extractor = HopeExtractor()
+        neutral = self.fixture["hope_neutral"]
+        for message, changed in zip(self.fixture["messages"], self.fixture["hope"]):
+            kernel = comparable(extractor.extract_hope_sync(message, {}))
+            self.assertEqual({key: kernel[key] for key in neutral}, comparable({**neutral, **changed}), message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+判断指標ストアと閾値 what-if 試算のテスト
+追記・読み戻し・不完全なファイル末尾の扱いと、試算結果が新しい閾値での再判定と一致することを確認
+"""
+import os
+import sys
+import random
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.indicator_store import IndicatorStore, RECORD_FORMAT, NUMPY_AVAILABLE
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem, GovernanceAction, ThreatLevel
+
+ACTIONS = [action.value for action in GovernanceAction]
+FRAGMENTS = [
+    "こんにちは", "ありがとう", "!", "！", "むかつく", "もうダメ", "絶対", "無理",
+    "つらい", "でも", "。", "死にたい", "誰も分かってくれない", "頑張りたい", "攻撃", "壊したい",
+]
+
+
+def make_items(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    return [
+        ("".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 8))),
+         {"emotion_level": rng.random(), "error_count": rng.randint(0, 6)})
+        for _ in range(count)
+    ]
+
+
+def build_governance():
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(
+        fracture_detector=FractureDetector(),
+        hope_extractor=HopeExtractor(),
+        stabilization_loop=HopeCoreStabilizationLoop(),
+    )
+    governance.fast_path_enabled = False
+    return governance
+
+
+def row(seed: int):
+    rng = random.Random(seed)
+    indicators = {
+        "fracture_index": rng.random(), "content_safety": rng.random(),
+        "system_impact": rng.random(), "transformation_urgency": rng.random(),
+    }
+    return indicators, rng.random() > 0.5, rng.choice(ACTIONS)
+
+
+class TestIndicatorStore(unittest.TestCase):
+    """追記・読み戻し"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "indicators.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_append_flush_and_reload(self):
+        rows = [row(seed) for seed in range(10)]
+        store = IndicatorStore(ACTIONS, path=self.path, flush_every=4)
+        store.extend(rows)
+        self.assertEqual(len(store), 10)
+        self.assertEqual(os.path.getsize(self.path), 8 * RECORD_FORMAT.size)   # 4件ごとに書き込み
+        self.assertEqual(store.get_stats()["pending_records"], 2)
+
+        store.close()
+        self.assertEqual(os.path.getsize(self.path), 10 * RECORD_FORMAT.size)
+        reloaded = IndicatorStore(ACTIONS, path=self.path)
+        self.addCleanup(reloaded.close)
+        self.assertEqual(len(reloaded), 10)
+        if NUMPY_AVAILABLE:
+            columns = reloaded.columns()
+            self.assertEqual(columns["fracture_index"].tolist(), [r[0]["fracture_index"] for r in rows])
+            self.assertEqual(columns["transformation_possible"].tolist(), [r[1] for r in rows])
+            self.assertEqual(columns["action"].tolist(), [ACTIONS.index(r[2]) for r in rows])
+
+    def test_truncated_tail_is_ignored(self):
+        """書き込み途中で止まった末尾のレコードは読み戻さない"""
+        store = IndicatorStore(ACTIONS, path=self.path)
+        store.extend(row(seed) for seed in range(3))
+        store.close()
+        with open(self.path, "ab") as f:
+            f.write(RECORD_FORMAT.pack(*row(99)[0].values(), 1, 0)[:RECORD_FORMAT.size // 2])
+
+        reloaded = IndicatorStore(ACTIONS, path=self.path)
+        self.addCleanup(reloaded.close)
+        self.assertEqual(len(reloaded), 3)
+
+    def test_memory_only_store_writes_nothing(self):
+        store = IndicatorStore(ACTIONS)
+        store.append(*row(1))
+        store.close()
+        self.assertEqual(len(store), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class TestGovernanceIndicators(unittest.TestCase):
+    """統治判断の記録と閾値試算"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "indicators.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_hits_are_recorded(self):
+        """判断キャッシュのヒットも実際の判断として記録される"""
+        governance = build_governance()
+        store = governance.enable_indicator_store()
+        first = governance.process_input_sync("もう無理、むかつく!!!", {"emotion_level": 0.5})
+        second = governance.process_input_sync("もう無理、むかつく!!!", {"emotion_level": 0.5})
+        self.assertTrue(second.decision_id.startswith("cached_"))
+        self.assertEqual(second.action, first.action)
+        self.assertEqual(len(store), 2)
+
+    def test_disable_flushes_to_file(self):
+        governance = build_governance()
+        governance.decision_cache_enabled = False
+        store = governance.enable_indicator_store(self.path)
+        governance.process_batch_sync(make_items(20))
+        recorded = len(store)
+        self.assertGreater(recorded, 0)
+
+        governance.disable_indicator_store()
+        self.assertIsNone(governance.indicator_store)
+        self.assertEqual(os.path.getsize(self.path), recorded * RECORD_FORMAT.size)
+        reloaded = governance.enable_indicator_store(self.path)
+        self.assertEqual(len(reloaded), recorded)
+        governance.disable_indicator_store()
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy が必要です")
+    def test_empty_store_argument_is_used(self):
+        """空のストアを明示した場合も、有効化済みのストアへ置き換えない"""
+        governance = build_governance()
+        governance.enable_indicator_store().append(*row(1))
+        result = governance.simulate_thresholds(store=IndicatorStore(ACTIONS))
+        self.assertEqual(result.record_count, 0)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy が必要です")
+    def test_simulation_matches_rerun(self):
+        """試算のアクション分布は、変更後の重み・閾値で実際に再判定した分布と一致する"""
+        items = make_items(200)
+        scenarios = [
+            ({"content_safety": 0.0}, {ThreatLevel.CAUTION: 0.1, ThreatLevel.WARNING: 0.15, ThreatLevel.DANGER: 0.25}),
+            ({"content_safety": 0.0, "fracture_index": 1.0}, {ThreatLevel.CRITICAL: 0.55}),
+            ({"content_safety": -0.1, "system_impact": 0.5}, {ThreatLevel.DANGER: 0.3, ThreatLevel.CRITICAL: 0.45}),
+        ]
+        governance = build_governance()
+        store = governance.enable_indicator_store()
+        baseline = governance.process_batch_sync(items)
+        self.assertEqual(len(store), len(items))
+        self.assertEqual(baseline.failed_count, 0)
+        self.assertEqual(governance.simulate_thresholds().simulated_counts, baseline.action_counts)
+
+        for weights, thresholds in scenarios:
+            with self.subTest(weights=weights, thresholds=thresholds):
+                simulated = governance.simulate_thresholds(weights, thresholds)
+                rerun = build_governance()
+                rerun.threat_weights.update(weights or {})
+                rerun.threat_thresholds.update(thresholds or {})
+                self.assertEqual(simulated.simulated_counts, rerun.process_batch_sync(items).action_counts)
+                self.assertGreater(simulated.changed_count, 0)   # 実際にアクションが変わる設定であること
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+コンパイル済みレキシコンエンジンのテスト
+単一パス走査・増分走査の件数がキーワードごとの re.findall と一致することを確認
+"""
+import re
+import sys
+import random
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.lexicon_engine import CompiledLexicon
+
+
+def findall_counts(keywords, text):
+    """従来方式: キーワードごとの re.findall 件数（出現したキーワードのみ）"""
+    counts = {kw: len(re.findall(re.escape(kw), text)) for kw in keywords}
+    return {kw: count for kw, count in counts.items() if count}
+
+
+class TestCompiledLexicon(unittest.TestCase):
+    """CompiledLexicon の件数の等価性"""
+
+    def test_scan_and_stream_match_findall(self):
+        """重なり・接頭辞・自己重複を含むキーワード群で scan / stream の件数が一致する"""
+        rng = random.Random(1)
+        for _ in range(300):
+            keywords = list({
+                "".join(rng.choice("abcd") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 8))
+            })
+            lexicon = CompiledLexicon({"c": keywords})
+            for _ in range(20):
+                text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+                expected = findall_counts(keywords, text)
+                self.assertEqual(lexicon.scan(text).keyword_counts, expected, (keywords, text))
+
+                stream = lexicon.stream()
+                position = 0
+                while position < len(text):
+                    size = rng.randint(1, 5)
+                    stream.feed(text[position:position + size])
+                    position += size
+                self.assertEqual(stream.keyword_counts, expected, (keywords, text))
+
+    def test_present_matches_counts(self):
+        """present() は件数1以上のキーワード集合と一致する"""
+        lexicon = CompiledLexicon({"a": ["どう", "どうせ", "どうでもいい"], "b": ["でも", "もうダメ", "イライラ"]})
+        text = "どうでもいい、どうせもうダメ。イライライラ"
+        counts = lexicon.scan(text).keyword_counts
+        self.assertEqual(set(lexicon.present(text)), set(counts))
+        self.assertEqual(counts, findall_counts(lexicon.keywords, text))
+        self.assertEqual(lexicon.scan(text).hits("b"), counts["でも"] + counts["もうダメ"] + counts["イライラ"])
+
+
+if __name__ == "__main__":
+    unittest.main()
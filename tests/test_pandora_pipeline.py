@@ -0,0 +1,81 @@
+"""
+パンドラ融合パイプラインの回帰テスト
+ペルソナのキーワード集合による判定と、共有テキスト特徴を渡した希望抽出・ペルソナ分析が、
+キーワードごとに走査していた旧実装で記録した値（fixtures/*_baseline.json）と一致することを確認
+"""
+import sys
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.pandora_persona import PandoraPersona
+from core.pandora.pandora_pipeline import PandoraPipeline
+from tests.test_hope_extraction import comparable, load_fixture
+
+PERSONA_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "pandora_persona_baseline.json"
+
+
+class TestSharedHopeFeatures(unittest.TestCase):
+    """共有テキスト特徴を渡した希望抽出"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.fixture = load_fixture()
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_shared_text_features_match_baseline(self):
+        """パイプラインの共有テキスト特徴を渡しても旧実装と一致する"""
+        pipeline = PandoraPipeline()
+        neutral = self.fixture["hope_neutral"]
+        for message, changed in zip(self.fixture["messages"], self.fixture["hope"]):
+            kernel = comparable(pipeline.extractor.extract_hope_sync(
+                message, {}, text_features=pipeline.extract_features(message)
+            ))
+            self.assertEqual({key: kernel[key] for key in neutral}, comparable({**neutral, **changed}), message)
+
+
+class TestPandoraPersonaBaseline(unittest.TestCase):
+    """旧実装とのペルソナ分析結果の一致（直前応答は persona_state の last_response）"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.fixture = load_fixture(PERSONA_FIXTURE)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def assert_matches_baseline(self, persona, features=None):
+        async def analyze(state, message):
+            text_features = features(message) if features else None
+            pattern = await persona.analyze_fracture_pattern(dict(state), message, text_features)
+            kernel = await persona.extract_hope_kernel(dict(state), message, pattern, text_features)
+            return {**{f"pattern.{key}": value for key, value in comparable(pattern).items()},
+                    **{f"kernel.{key}": value for key, value in comparable(kernel).items()}}
+
+        cases = zip(self.fixture["persona_states"], self.fixture["persona_neutral"], self.fixture["persona"])
+        for state, neutral, changed_rows in cases:
+            for message, changed in zip(self.fixture["messages"], changed_rows):
+                self.assertEqual(asyncio.run(analyze(state, message)), comparable({**neutral, **changed}),
+                                 (state, message))
+
+    def test_keyword_sets_match_baseline(self):
+        """キーワード集合による検出（攻撃性・絶望・自己崩壊・孤立・希望核・意図・つながり）が旧実装と一致する"""
+        self.assert_matches_baseline(PandoraPersona())
+
+    def test_shared_text_features_match_baseline(self):
+        """パイプラインの共有テキスト特徴を渡しても旧実装と一致する"""
+        pipeline = PandoraPipeline()
+        self.assert_matches_baseline(pipeline.persona, pipeline.extract_features)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+安定化ペルソナ文言テンプレートのテスト
+ファイル更新時のホットリロード、壊れた編集での直前テーブル維持、テンプレートの値の検証と、
+PyYAML が無い環境での組み込み文言テーブルへの切り替えを確認
+"""
+import os
+import sys
+import shutil
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora import phrase_templates
+from core.pandora.builtin_phrases import BUILTIN_PHRASES
+from core.pandora.phrase_templates import DEFAULT_PHRASES_PATH, PhraseBook, PhraseTemplates, YAML_AVAILABLE
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+
+FRACTURE_DATA = {"fracture_type": "aggression", "severity": 0.7}
+HOPE_KERNEL = {"original_intent": "守りたい", "protective_desire": "大切な人を守りたい", "care_level": 0.9}
+
+
+if YAML_AVAILABLE:
+    import yaml
+
+
+def load_default():
+    with open(DEFAULT_PHRASES_PATH, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@unittest.skipUnless(YAML_AVAILABLE, "PyYAML が必要です")
+class TestPhraseTemplatesReload(unittest.TestCase):
+    """ファイル更新の検出と再読み込み"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "stabilization_phrases.yaml")
+        shutil.copyfile(DEFAULT_PHRASES_PATH, self.path)
+        self.templates = PhraseTemplates(self.path, check_interval=0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def rewrite(self, text: str):
+        """ファイルを書き換え、更新時刻を確実に進める"""
+        previous = os.stat(self.path).st_mtime_ns
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.utime(self.path, ns=(previous + 10**9, previous + 10**9))
+
+    def edit(self, persona: str, table: str, value):
+        data = load_default()
+        data[persona][table] = value
+        self.rewrite(yaml.safe_dump(data, allow_unicode=True))
+
+    def test_hot_reload(self):
+        """ファイルが更新されると次の参照で新しいテーブルに切り替わり、ループの出力にも反映される"""
+        loop = HopeCoreStabilizationLoop(self.templates)
+        before = loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)
+        self.assertTrue(any("温かい金色" in message for message in before["all_messages"]))
+
+        self.edit("miyu", "emotion_color", {"rules": [{"when": ["守りたい"], "text": "燃える紅色"}],
+                                            "default": "淡い灰色"})
+        self.assertEqual(self.templates.book.emotion_color("守りたい"), "燃える紅色")
+        self.assertEqual(self.templates.reload_count, 1)
+        self.assertIsNone(self.templates.last_error)
+
+        after = loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)
+        self.assertTrue(any("燃える紅色" in message for message in after["all_messages"]))
+        self.assertFalse(any("温かい金色" in message for message in after["all_messages"]))
+
+    def test_unchanged_file_is_not_reloaded(self):
+        book = self.templates.book
+        self.assertIs(self.templates.book, book)
+        self.assertEqual(self.templates.reload_count, 0)
+
+    def test_broken_edit_keeps_previous_book(self):
+        """壊れた編集では直前のテーブルを使い続け、直した編集で再び切り替わる"""
+        book = self.templates.book
+        self.rewrite("miyu: [壊れた\n")
+        self.assertIs(self.templates.book, book)
+        self.assertIsNotNone(self.templates.last_error)
+        self.assertEqual(self.templates.reload_count, 0)
+        self.assertFalse(self.templates.reload())
+
+        self.edit("miyu", "rhythm", {"rules": [{"equals": "aggression", "text": "静かな波のリズム"}]})
+        self.assertEqual(self.templates.book.rhythm("aggression"), "静かな波のリズム")
+        self.assertIsNone(self.templates.last_error)
+
+    def test_invalid_template_edit_keeps_previous_book(self):
+        """使えない値を参照するテンプレートへの編集も、読み込み時に検出して直前のテーブルを維持"""
+        book = self.templates.book
+        data = load_default()
+        data["miyu"]["templates"]["resonance_message"] = "{expression} - {user_name}"
+        self.rewrite(yaml.safe_dump(data, allow_unicode=True))
+        self.assertIs(self.templates.book, book)
+        self.assertIn("user_name", self.templates.last_error)
+
+    def test_removed_file_keeps_previous_book(self):
+        book = self.templates.book
+        os.remove(self.path)
+        self.assertIs(self.templates.book, book)
+        self.assertFalse(self.templates.reload())
+        self.assertIsNotNone(self.templates.last_error)
+
+
+@unittest.skipUnless(YAML_AVAILABLE, "PyYAML が必要です")
+class TestPhraseBookValidation(unittest.TestCase):
+    """テンプレート・照合表の検証"""
+
+    def build(self, persona: str, section: str, name: str, value):
+        data = load_default()
+        data[persona][section][name] = value
+        return PhraseBook(data)
+
+    def test_default_book_loads(self):
+        book = PhraseBook(load_default())
+        self.assertEqual(book.beautiful_expression.fields, {"emotion_color", "metaphor", "rhythm", "imagery"})
+        self.assertEqual(book.rhythm("despair"), "深い沈黙から希望の調べへのリズム")
+        self.assertEqual(book.rhythm("unknown"), "心臓の鼓動のような安定したリズム")
+
+    def test_unknown_field_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "miyu.harmony"):
+            self.build("miyu", "templates", "harmony", "{original_intent}と{fracture_type}")
+
+    def test_positional_and_attribute_fields_are_rejected(self):
+        for template in ("{0}の想い", "{expression.upper}", "{expression[0]}"):
+            with self.subTest(template=template):
+                with self.assertRaises(ValueError):
+                    self.build("miyu", "templates", "resonance_message", template)
+
+    def test_fields_in_message_lists_are_validated(self):
+        with self.assertRaisesRegex(ValueError, r"azura.messages\[1\]"):
+            self.build("azura", "templates", "messages", ["{recovery_message}", "{healing_areas}"])
+
+    def test_missing_template_is_rejected(self):
+        data = load_default()
+        del data["lumifie"]["templates"]["final_message"]
+        with self.assertRaisesRegex(ValueError, "lumifie.templates.final_message"):
+            PhraseBook(data)
+
+    def test_rule_without_condition_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "miyu.metaphor"):
+            self.build("miyu", "metaphor", "rules", [{"text": "条件のない文言"}])
+
+
+
+class TestBuiltinPhrases(unittest.TestCase):
+    """PyYAML が無い環境の組み込み文言テーブル"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    @unittest.skipUnless(YAML_AVAILABLE, "PyYAML が必要です")
+    def test_builtin_matches_yaml(self):
+        """組み込みの文言は YAML の文言テーブル（meta を除く）と同じ内容"""
+        data = load_default()
+        del data["meta"]
+        self.assertEqual(BUILTIN_PHRASES, data)
+
+    def test_without_yaml_uses_builtin(self):
+        """PyYAML が無ければファイルを読まずに組み込みの文言で安定化ループが動き、再読み込みはしない"""
+        with mock.patch.object(phrase_templates, "YAML_AVAILABLE", False):
+            templates = PhraseTemplates("/nonexistent/stabilization_phrases.yaml", check_interval=0)
+            self.assertFalse(templates.reload())
+        self.assertEqual(templates.check_interval, -1)
+        self.assertTrue(templates.get_stats()["builtin"])
+        result = HopeCoreStabilizationLoop(templates).execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)
+        self.assertTrue(result["stabilization_success"])
+        self.assertTrue(any("温かい金色" in message for message in result["all_messages"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+希望核安定化ループのテスト
+同期版・非同期版のサイクル結果、非同期APIのみのペルソナをイベントループ内から同期実行したときの扱いと、
+段階結果のグラフ展開（ID 参照・フィールド指定・従来形式）を確認
+"""
+import sys
+import json
+import time
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop, LoopStage
+from core.pandora.sync_bridge import SyncCallInEventLoopError
+
+FRACTURE_DATA = {"fracture_type": "aggression", "severity": 0.7}
+HOPE_KERNEL = {
+    "original_intent": "守りたい",
+    "protective_desire": "大切な人を守りたい",
+    "care_level": 0.9,
+    "connection_need": True,
+}
+
+
+class AsyncOnlyMiyu:
+    """非同期APIだけを公開する美遊ちゃん"""
+
+    def __init__(self, miyu):
+        self._miyu = miyu
+
+    async def apply_poetic_resonance(self, hope_kernel, fracture_context):
+        return self._miyu.apply_poetic_resonance_sync(hope_kernel, fracture_context)
+
+
+def comparable(result):
+    return {key: value for key, value in result.items() if key != "cycle_count"}
+
+
+class TestStabilizationCycle(unittest.TestCase):
+    """同期版・非同期版のサイクル"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_sync_and_async_match(self):
+        loop = HopeCoreStabilizationLoop()
+        expected = comparable(loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL))
+        self.assertTrue(expected["stabilization_success"])
+        self.assertEqual(comparable(asyncio.run(loop.execute_stabilization_cycle(FRACTURE_DATA, HOPE_KERNEL))),
+                         expected)
+
+        async_only = HopeCoreStabilizationLoop()
+        async_only.miyu = AsyncOnlyMiyu(async_only.miyu)
+        self.assertEqual(comparable(async_only.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)),
+                         expected)
+        self.assertEqual(
+            comparable(asyncio.run(async_only.execute_stabilization_cycle(FRACTURE_DATA, HOPE_KERNEL))), expected
+        )
+
+    def test_sync_cycle_inside_event_loop_raises(self):
+        """非同期APIのみのペルソナがあると、イベントループ内の同期実行は失敗結果ではなく例外になる"""
+        loop = HopeCoreStabilizationLoop()
+        loop.miyu = AsyncOnlyMiyu(loop.miyu)
+
+        async def call_sync():
+            return loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)
+
+        with self.assertRaises(SyncCallInEventLoopError):
+            asyncio.run(call_sync())
+        self.assertEqual(loop.active_cycles, 0)
+        self.assertEqual(loop.stabilization_count, 0)
+
+    def test_sync_cycle_inside_event_loop_with_sync_stages(self):
+        """全段階が同期APIを持てばイベントループ内でも同期実行できる"""
+        loop = HopeCoreStabilizationLoop()
+
+        async def call_sync():
+            return loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL)
+
+        self.assertTrue(asyncio.run(call_sync())["stabilization_success"])
+
+
+def run_cycle(loop, fracture_data=FRACTURE_DATA, hope_kernel=HOPE_KERNEL):
+    """1サイクルを実行してコンテキスト（結果グラフ）を返す"""
+    context = loop.begin_cycle(fracture_data, hope_kernel)
+    for stage in loop.STAGES:
+        handler, args = loop.stage_call(stage, context)
+        loop.record_stage(context, stage, handler(*args), time.perf_counter())
+    loop.finish_cycle(context)
+    return context
+
+
+class TestCycleResultGraph(unittest.TestCase):
+    """段階結果のグラフと展開"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        self.loop = HopeCoreStabilizationLoop()
+        self.context = run_cycle(self.loop)
+        self.miyu, self.azura, self.lumifie = self.context.results[1:]
+
+    def test_stage_results_keep_previous_state(self):
+        """段階結果の input_state / output_state は前段の状態を（複製せずに）参照する従来の形"""
+        self.assertIs(self.miyu.output_state["original_hope"], HOPE_KERNEL)
+        self.assertEqual(self.miyu.input_state, {"hope_kernel": HOPE_KERNEL, "fracture_context": FRACTURE_DATA})
+        self.assertIs(self.azura.input_state, self.miyu.output_state)
+        self.assertIs(self.azura.output_state["miyu_poetry"], self.miyu.output_state)
+        self.assertIs(self.lumifie.input_state, self.azura.output_state)
+        self.assertIs(self.lumifie.output_state["azura_healing"], self.azura.output_state)
+
+        azura = self.loop.azura.apply_healing_care_sync(self.miyu)
+        self.assertIs(azura.output_state["miyu_poetry"], self.miyu.output_state)
+
+    def test_materialize_graph(self):
+        """全展開は結果ごとに1回、前段は input_ref のみ（前段の状態は含まない）"""
+        cycle_id = self.context.cycle_id
+        graph = self.context.materialize()
+        self.assertEqual(graph["cycle_id"], cycle_id)
+        results = graph["results"]
+        ids = [f"{cycle_id}:{stage}" for stage in ("pandora", "miyu", "azura", "lumifie")]
+        self.assertEqual(list(results), ids)
+        self.assertEqual(results[ids[0]]["stage"], "pandora_completed")
+        for previous_id, result_id in zip(ids, ids[1:]):
+            payload = results[result_id]
+            self.assertEqual(payload["input_ref"], previous_id)
+            self.assertEqual(set(payload), {
+                "stage", "input_ref", "output_state", "transformation_applied",
+                "care_level", "success_score", "next_stage_ready", "messages",
+            })
+        self.assertEqual(list(results[ids[1]]["output_state"]), [
+            "poetic_elements", "beautiful_expression", "resonance_message", "aesthetic_healing",
+            "emotional_elevation",
+        ])
+        self.assertEqual(list(results[ids[2]]["output_state"]), [
+            "healing_areas", "care_plan", "healing_applied", "recovery_message", "emotional_restoration",
+            "care_completion",
+        ])
+        self.assertEqual(list(results[ids[3]]["output_state"]), [
+            "noise_patterns_identified", "light_transformations", "purified_essence", "luminosity_level",
+            "hope_radiance", "final_message",
+        ])
+        # 展開しても段階結果の前段参照は残る
+        self.assertIn("miyu_poetry", self.azura.output_state)
+        self.assertLess(len(json.dumps(graph, ensure_ascii=False)),
+                        len(json.dumps(self.context.materialize_nested(), ensure_ascii=False)))
+
+    def test_materialize_fields(self):
+        details = self.context.materialize(["miyu.stage", "azura.output_state.recovery_message",
+                                            "lumifie.output_state.purified_essence", "pandora.hope_kernel"])
+        self.assertEqual(details, {
+            "miyu.stage": "miyu",
+            "azura.output_state.recovery_message": self.azura.output_state["recovery_message"],
+            "lumifie.output_state.purified_essence": self.lumifie.output_state["purified_essence"],
+            "pandora.hope_kernel": HOPE_KERNEL,
+        })
+        for path in ("azura.output_state.unknown", "nulfie.output_state", "miyu.unknown_attribute"):
+            with self.subTest(path=path):
+                with self.assertRaises(KeyError):
+                    self.context.materialize([path])
+
+    def test_cycle_fields_go_to_details(self):
+        result = self.loop.execute_stabilization_cycle_sync(
+            FRACTURE_DATA, HOPE_KERNEL, ["lumifie.output_state.hope_radiance"]
+        )
+        self.assertEqual(result["details"], {"lumifie.output_state.hope_radiance": 0.98})
+        self.assertNotIn("details", self.loop.execute_stabilization_cycle_sync(FRACTURE_DATA, HOPE_KERNEL))
+
+    def test_materialize_nested(self):
+        """従来形式では各段階の output_state が前段の状態を内包する"""
+        nested = self.context.materialize_nested()
+        self.assertEqual(nested[0], self.context.results[0])
+        self.assertEqual([entry["stage"] for entry in nested[1:]], [stage.value for stage in self.loop.STAGES])
+        miyu, azura, lumifie = nested[1:]
+        self.assertEqual(miyu["output_state"]["original_hope"], HOPE_KERNEL)
+        self.assertEqual(azura["input_state"], miyu["output_state"])
+        self.assertEqual(azura["output_state"]["miyu_poetry"], miyu["output_state"])
+        self.assertEqual(lumifie["output_state"]["azura_healing"]["miyu_poetry"]["original_hope"], HOPE_KERNEL)
+        self.assertEqual(lumifie["messages"], self.lumifie.messages)
+        self.assertEqual(self.lumifie.stage, LoopStage.LUMIFIE)
+
+
+if __name__ == "__main__":
+    unittest.main()
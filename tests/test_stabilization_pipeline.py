@@ -0,0 +1,178 @@
+"""
+安定化パイプラインのテスト
+execute_stabilization_cycle との結果一致、呼び出し側のキャンセル、stop() の処理し切り・打ち切りと、
+ループ本体の実行中サイクル数の扱いを確認
+"""
+import sys
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.stabilization_pipeline import StabilizationPipeline
+
+FRACTURE_DATA = {"fracture_type": "aggression", "severity": 0.7}
+HOPE_KERNELS = [
+    {"original_intent": "守りたい", "protective_desire": "大切な人を守りたい", "care_level": 0.9, "connection_need": True},
+    {"original_intent": "認めてほしい", "protective_desire": "", "care_level": 0.4, "connection_need": False},
+    {"original_intent": "休みたい", "protective_desire": "自分を守りたい", "care_level": 0.6, "connection_need": True},
+]
+
+
+class GatedMiyu:
+    """gate が開くまで詩的共鳴を返さない美遊ちゃん（非同期APIのみ）"""
+
+    def __init__(self, miyu):
+        self._miyu = miyu
+        self.gate = asyncio.Event()
+
+    async def apply_poetic_resonance(self, hope_kernel, fracture_context):
+        await self.gate.wait()
+        return self._miyu.apply_poetic_resonance_sync(hope_kernel, fracture_context)
+
+
+def comparable(result):
+    return {key: value for key, value in result.items() if key != "cycle_count"}
+
+
+def gated_pipeline(**kwargs):
+    loop = HopeCoreStabilizationLoop()
+    loop.miyu = GatedMiyu(loop.miyu)
+    return StabilizationPipeline(loop, **kwargs)
+
+
+async def settle():
+    """ワーカーがキューから取り出して段階に入るまで進める"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestStabilizationPipeline(unittest.TestCase):
+    """パイプライン実行"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_matches_sequential_cycle(self):
+        """多数のサイクルを同時に流しても、結果は1件ずつの execute_stabilization_cycle と一致"""
+        reference = HopeCoreStabilizationLoop()
+        kernels = HOPE_KERNELS * 10
+        field_sets = (None, ("azura.output_state.healing_areas", "lumifie.output_state.purified_essence"))
+        expected = [
+            comparable(asyncio.run(reference.execute_stabilization_cycle(FRACTURE_DATA, kernel, fields)))
+            for kernel in kernels for fields in field_sets
+        ]
+        self.assertTrue(all(result["stabilization_success"] for result in expected))
+        pipeline = StabilizationPipeline(queue_size=2, workers_per_stage=3)
+
+        async def run_all():
+            results = await asyncio.gather(*(
+                pipeline.submit(FRACTURE_DATA, kernel, fields)
+                for kernel in kernels for fields in field_sets
+            ))
+            await pipeline.stop()
+            return results
+
+        results = asyncio.run(run_all())
+        self.assertEqual([comparable(result) for result in results], expected)
+        self.assertEqual(sorted(result["cycle_count"] for result in results), list(range(len(expected))))
+        stats = pipeline.get_stats()
+        self.assertEqual((stats["submitted"], stats["completed"], stats["failed"], stats["in_flight"]),
+                         (len(expected), len(expected), 0, 0))
+        self.assertEqual({stage["processed"] for stage in stats["stages"].values()}, {len(expected)})
+        self.assertFalse(stats["running"])
+
+    def test_active_cycles_bookkeeping(self):
+        """実行中はループ本体の active_cycles / loop_active に反映され、完了後は 0 に戻る"""
+        pipeline = gated_pipeline(workers_per_stage=2)
+        loop = pipeline.loop
+
+        async def scenario():
+            tasks = [asyncio.create_task(pipeline.submit(FRACTURE_DATA, kernel)) for kernel in HOPE_KERNELS]
+            await settle()
+            during = (loop.active_cycles, loop.loop_active, pipeline.get_stats()["in_flight"])
+            loop.miyu.gate.set()
+            results = await asyncio.gather(*tasks)
+            await pipeline.stop()
+            return during, results
+
+        during, results = asyncio.run(scenario())
+        self.assertEqual(during, (len(HOPE_KERNELS), True, len(HOPE_KERNELS)))
+        self.assertTrue(all(result["stabilization_success"] for result in results))
+        self.assertEqual((loop.active_cycles, loop.loop_active, loop.stabilization_count),
+                         (0, False, len(HOPE_KERNELS)))
+
+    def test_cancelled_caller(self):
+        """呼び出し側がキャンセルしたサイクルは失敗として数え、他のサイクルは完了する"""
+        pipeline = gated_pipeline(workers_per_stage=1)
+        loop = pipeline.loop
+
+        async def scenario():
+            running = asyncio.create_task(pipeline.submit(FRACTURE_DATA, HOPE_KERNELS[0]))
+            queued = asyncio.create_task(pipeline.submit(FRACTURE_DATA, HOPE_KERNELS[1]))
+            kept = asyncio.create_task(pipeline.submit(FRACTURE_DATA, HOPE_KERNELS[2]))
+            await settle()
+            running.cancel()    # 段階の処理中
+            queued.cancel()     # キューで待機中
+            loop.miyu.gate.set()
+            result = await kept
+            await pipeline.stop()
+            return running, queued, result
+
+        running, queued, result = asyncio.run(scenario())
+        self.assertTrue(running.cancelled())
+        self.assertTrue(queued.cancelled())
+        self.assertTrue(result["stabilization_success"])
+        stats = pipeline.get_stats()
+        self.assertEqual((stats["completed"], stats["failed"], stats["in_flight"]), (1, 2, 0))
+        self.assertEqual((loop.active_cycles, loop.stabilization_count), (0, 1))
+
+    def test_stop_drains_submitted_cycles(self):
+        """stop() は投入済みのサイクルを処理し終えてからワーカーを止める"""
+        pipeline = gated_pipeline(workers_per_stage=1)
+
+        async def scenario():
+            tasks = [asyncio.create_task(pipeline.submit(FRACTURE_DATA, kernel)) for kernel in HOPE_KERNELS]
+            await settle()
+            stopping = asyncio.create_task(pipeline.stop())
+            await settle()
+            stopped_early = stopping.done()
+            pipeline.loop.miyu.gate.set()
+            await stopping
+            finished = [task.done() for task in tasks]   # stop() が戻った時点で全サイクルの結果が出ている
+            return stopped_early, finished, await asyncio.gather(*tasks)
+
+        stopped_early, finished, results = asyncio.run(scenario())
+        self.assertFalse(stopped_early)
+        self.assertEqual(finished, [True] * len(HOPE_KERNELS))
+        self.assertTrue(all(result["stabilization_success"] for result in results))
+        self.assertFalse(pipeline.running)
+        self.assertEqual(pipeline.loop.active_cycles, 0)
+
+    def test_stop_without_drain_fails_in_flight_cycles(self):
+        """stop(drain=False) では処理中・待機中のサイクルを失敗結果で返す"""
+        pipeline = gated_pipeline(workers_per_stage=1)
+
+        async def scenario():
+            tasks = [asyncio.create_task(pipeline.submit(FRACTURE_DATA, kernel)) for kernel in HOPE_KERNELS]
+            await settle()
+            await pipeline.stop(drain=False)
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(scenario())
+        self.assertEqual([result["success"] for result in results], [False] * len(HOPE_KERNELS))
+        self.assertEqual({result["failed_stage"] for result in results}, {"miyu", "pandora"})
+        self.assertEqual(pipeline.get_stats()["failed"], len(HOPE_KERNELS))
+        self.assertEqual((pipeline.loop.active_cycles, pipeline.loop.loop_active), (0, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+トレンドストアのテスト
+指数加重統計が窓内のサンプルだけから計算されること、検出器が分析時に暗黙に記録しないことを確認
+"""
+import sys
+import random
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.trend_store import TrendSeries, TrendStore
+
+HOUR = 3600.0
+
+
+def replayed(samples, series_id="s"):
+    """サンプルを新しい系列に順に追加したときの統計"""
+    series = TrendSeries()
+    for timestamp, stability, emotion in samples:
+        series.append(timestamp, stability, emotion)
+    return series.snapshot(series_id)
+
+
+class TestTrendStore(unittest.TestCase):
+    """窓・統計・系列管理"""
+
+    def test_stats_only_cover_window(self):
+        """古いサンプルが窓から外れた後の統計は、窓内のサンプルだけを追加した系列と一致する"""
+        rng = random.Random(3)
+        store = TrendStore(window_hours=1)
+        samples = []
+        timestamp = 0.0
+        for _ in range(200):
+            timestamp += rng.uniform(0, 0.2 * HOUR)
+            sample = (timestamp, rng.random(), rng.random())
+            samples.append(sample)
+            store.record("s", sample[1], sample[2], timestamp)
+
+            expected = replayed([s for s in samples if s[0] >= timestamp - HOUR])
+            self.assertEqual(store.get("s", now=timestamp), expected)
+
+    def test_get_expires_without_new_samples(self):
+        """参照時刻で窓から外れたサンプルも統計から除かれ、空になれば系列ごと破棄"""
+        store = TrendStore(window_hours=1)
+        samples = [(0.0, 0.9, 0.2), (0.5 * HOUR, 0.1, 0.8), (0.9 * HOUR, 0.5, 0.5), (1.2 * HOUR, 0.4, 0.6)]
+        for timestamp, stability, emotion in samples:
+            store.record("s", stability, emotion, timestamp)
+
+        self.assertEqual(store.get("s", now=1.6 * HOUR), replayed(samples[2:]))
+        self.assertIsNone(store.get("s", now=3 * HOUR))
+        self.assertEqual(len(store), 0)
+
+    def test_slope_follows_direction(self):
+        """安定度が下がり続ける系列の勾配は負、上がり続ければ正"""
+        store = TrendStore()
+        for step in range(10):
+            store.record("down", 1.0 - step * 0.05, 0.5, 1000.0 + step)
+            store.record("up", 0.2 + step * 0.05, 0.5, 1000.0 + step)
+        self.assertLess(store.get("down", now=1010.0).stability_slope, 0)
+        self.assertGreater(store.get("up", now=1010.0).stability_slope, 0)
+
+    def test_ring_keeps_latest_samples(self):
+        """容量を超えたら最古のサンプルから上書き"""
+        series = TrendSeries(capacity=4)
+        for step in range(10):
+            series.append(float(step), step / 10, 0.5)
+        self.assertEqual([timestamp for timestamp, _, _ in series.recent(10)], [6.0, 7.0, 8.0, 9.0])
+
+    def test_max_series_drops_least_recently_updated(self):
+        store = TrendStore(max_series=2)
+        store.record("a", 0.5, 0.5, 1.0)
+        store.record("b", 0.5, 0.5, 2.0)
+        store.record("a", 0.5, 0.5, 3.0)
+        store.record("c", 0.5, 0.5, 4.0)
+        self.assertIsNone(store.get("b", now=4.0))
+        self.assertIsNotNone(store.get("a", now=4.0))
+
+    def test_version_tracks_updates(self):
+        store = TrendStore()
+        self.assertEqual(store.version("s"), (0, 0.0))
+        store.record("s", 0.5, 0.5, 10.0)
+        store.record("s", 0.4, 0.5, 11.0)
+        self.assertEqual(store.version("s"), (2, 11.0))
+
+
+class TestDetectorTrendRecording(unittest.TestCase):
+    """検出器からの記録"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_analyze_does_not_record(self):
+        """analyze の再呼び出し・analyze_many はサンプルを記録しない"""
+        detector = FractureDetector()
+        context = {"series_id": "user-1"}
+        detector.analyze_sync({}, "もう無理", context)
+        detector.analyze_sync({}, "もう無理", context)
+        detector.analyze_many_sync(["もう無理", "こんにちは"], contexts=[context, context])
+        self.assertIsNone(detector.get_trend("user-1"))
+
+    def test_record_analysis_feeds_trend(self):
+        """record_analysis で記録したサンプルが安定性勾配に反映される"""
+        detector = FractureDetector()
+        context = {"series_id": "user-1"}
+        messages = ["ありがとう、楽しい", "少し疲れた", "もう無理。絶対に無理", "消えたい。もう無理、全部ダメ"]
+        for message in messages:
+            analysis = detector.analyze_sync({"emotion_level": 0.5}, message, context)
+            detector.record_analysis("user-1", analysis, {"emotion_level": 0.5})
+
+        trend = detector.get_trend("user-1")
+        self.assertEqual(trend.sample_count, len(messages))
+        self.assertLess(trend.stability_slope, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+三宇宙パイプラインのテスト
+バッチ・段の並行処理を経ても、SHOULD/MATTERS の出力が1件ずつの逐次処理と一致し、入力順に返ることを確認
+"""
+import sys
+import random
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from should_universe import ShouldUniverse, ShouldUniverseAPI
+from matters_universe import MattersUniverseAPI
+from tri_universe_pipeline import TriUniversePipeline
+
+FACT_KEYS = ("user_message", "emotional_state", "urgency_level", "wishes", "language_temperature")
+CONTEXT_KEYS = ("conversation_history", "relationship_state", "creative_intent")
+
+
+class JitteredShouldUniverse(ShouldUniverse):
+    """倫理律ごとの選択肢生成が定義順とは異なる順に完了する SHOULD宇宙"""
+
+    def __init__(self, seed: int = 7):
+        super().__init__()
+        self.rng = random.Random(seed)
+
+    async def _generate_choice_for_law(self, law, evaluation, context):
+        await asyncio.sleep(self.rng.random() * 0.002)
+        return await super()._generate_choice_for_law(law, evaluation, context)
+
+
+class FailingShouldUniverse(ShouldUniverse):
+    """選択肢生成で失敗する SHOULD宇宙"""
+
+    async def _generate_choice_for_law(self, law, evaluation, context):
+        raise ValueError("選択肢生成に失敗")
+
+
+def build_items(count: int, seed: int = 3):
+    """事実とコンテキストの組（一部は事実のみ）"""
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        facts = {key: f"{key}_{index}" for key in FACT_KEYS if rng.random() < 0.6}
+        context = {key: [index] for key in CONTEXT_KEYS if rng.random() < 0.5}
+        items.append(facts if index % 5 == 0 else (facts, context))
+    return items
+
+
+def without_timestamps(value):
+    """時刻を含むキー（*timestamp）を再帰的に取り除く"""
+    if isinstance(value, dict):
+        return {key: without_timestamps(item) for key, item in value.items() if not key.endswith("timestamp")}
+    if isinstance(value, list):
+        return [without_timestamps(item) for item in value]
+    return value
+
+
+async def run_sequential(items):
+    """1件ずつ process_ethical_evaluation → process_meaning_resonance を順に処理"""
+    should_api, matters_api = ShouldUniverseAPI(), MattersUniverseAPI()
+    results = []
+    for item in items:
+        facts, context = item if isinstance(item, tuple) else (item, {})
+        should_result = await should_api.process_ethical_evaluation(facts, context)
+        should_response = should_result["should_universe_response"]
+        matters_result = await matters_api.process_meaning_resonance(should_response, facts, context)
+        results.append({"should_universe_response": should_response, **matters_result})
+    return results
+
+
+class TestTriUniversePipeline(unittest.TestCase):
+    """パイプライン出力と逐次処理の等価性"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def assert_matches_sequential(self, items, pipeline):
+        expected = asyncio.run(run_sequential(items))
+        results = asyncio.run(pipeline.run(items))
+        self.assertEqual(len(results), len(items))
+        for index, (result, reference) in enumerate(zip(results, expected)):
+            self.assertEqual(without_timestamps(result), without_timestamps(reference), index)
+            facts = items[index] if index % 5 == 0 else items[index][0]
+            self.assertEqual(result["should_universe_response"]["fact_reception"]["received_facts"], facts)
+
+    def test_matches_sequential_processing(self):
+        """バッチの大きさによらず、SHOULD/MATTERS の出力が逐次処理と一致し入力順に返る"""
+        items = build_items(50)
+        for batch_size in (1, 4, 64):
+            with self.subTest(batch_size=batch_size):
+                pipeline = TriUniversePipeline(batch_size=batch_size, queue_size=2, max_batch_wait=0.001)
+                self.assert_matches_sequential(items, pipeline)
+                self.assertEqual(pipeline.get_metrics()["completed"], len(items))
+
+    def test_choices_keep_law_order(self):
+        """倫理律ごとの選択肢が順不同に完了しても、選択肢は定義順にまとめられる"""
+        items = build_items(20)
+        should_api = ShouldUniverseAPI()
+        should_api.should_universe = JitteredShouldUniverse()
+        pipeline = TriUniversePipeline(should_api, batch_size=8)
+        self.assert_matches_sequential(items, pipeline)
+        results = asyncio.run(pipeline.run(items[:1]))
+        choices = results[0]["should_universe_response"]["gentle_choices"]["available_choices"]
+        self.assertEqual(list(choices), list(should_api.should_universe.ethical_laws))
+
+    def test_stage_failure_is_raised(self):
+        """段の失敗は呼び出し側に RuntimeError として伝わる"""
+        should_api = ShouldUniverseAPI()
+        should_api.should_universe = FailingShouldUniverse()
+        pipeline = TriUniversePipeline(should_api, batch_size=4)
+        with self.assertRaises(RuntimeError) as raised:
+            asyncio.run(pipeline.run(build_items(10)))
+        self.assertIsInstance(raised.exception.__cause__, ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+宇宙管理層 差分更新モードの性質テスト
+ランダムな差分列を適用しながら、差分サイクル（incremental=True）と全件サイクルの結果が
+各ステップで一致することを、交流グラフの有無それぞれで確認
+"""
+import sys
+import random
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from universe_management_layer import DeltaOp, UniverseManagementLayer, UniverseStateDelta
+
+STEPS = 300
+PERSONAS = ["ユリカ", "アナ", "セレナ", "オーガン", "ミク", "ハルカ"]
+NUMERIC_KEYS = [
+    "persona_harmony", "law_compliance", "user_satisfaction", "system_performance", "resonance_coherence",
+    "ugoatsu_pressure", "resonance_quality", "phase_coherence",
+    "persona_resonance", "user_resonance", "cosmic_resonance", "meaning_generation",
+]
+CONFLICT_TYPES = [None, "value_clash", "priority_dispute"]
+
+# 実行時刻に依存する値（サイクルごとに変わるため比較しない）
+VOLATILE_KEYS = {
+    "cycle_timestamp", "timestamp", "decree_id", "report_id", "ruler_report_id", "next_review_scheduled",
+    "next_maintenance", "incremental", "recomputed_assessments",
+}
+
+
+def random_interaction(rng: random.Random):
+    interaction = {
+        "participants": rng.sample(PERSONAS, rng.choice((2, 2, 3))),
+        "harmony_score": round(rng.random(), 2),
+    }
+    conflict_type = rng.choice(CONFLICT_TYPES)
+    if conflict_type:
+        interaction["conflict_type"] = conflict_type
+    return interaction
+
+
+def random_deltas(rng: random.Random, current_state):
+    """1ステップ分の差分（数値の置き換え・同じ値での置き換え・交流の追加・交流リストの置き換え）"""
+    deltas = []
+    for _ in range(rng.randint(1, 3)):
+        roll = rng.random()
+        if roll < 0.4:
+            deltas.append(UniverseStateDelta(rng.choice(NUMERIC_KEYS), round(rng.uniform(0.2, 1.0), 2)))
+        elif roll < 0.5:
+            key = rng.choice([key for key in NUMERIC_KEYS if key in current_state] or NUMERIC_KEYS)
+            deltas.append(UniverseStateDelta(key, current_state.get(key, 0.5)))   # 値が変わらない更新
+        elif roll < 0.95:
+            deltas.append(UniverseStateDelta("persona_interactions", random_interaction(rng), DeltaOp.APPEND))
+        else:
+            kept = list(current_state.get("persona_interactions", []))[-rng.randint(0, 4):]
+            deltas.append(UniverseStateDelta("persona_interactions", kept + [random_interaction(rng)]))
+    return deltas
+
+
+def comparable(value):
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items() if key not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [comparable(item) for item in value]
+    return value
+
+
+class TestIncrementalMatchesFull(unittest.TestCase):
+    """差分サイクルと全件サイクルの一致"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def run_steps(self, use_interaction_graph: bool, seed: int):
+        async def scenario():
+            incremental = UniverseManagementLayer(use_interaction_graph=use_interaction_graph)
+            full = UniverseManagementLayer(use_interaction_graph=use_interaction_graph)
+            for layer in (incremental, full):
+                await layer.initialize_management_layer()
+            rng = random.Random(seed)
+            recomputed_counts, interventions = [], 0
+            for step in range(STEPS):
+                deltas = random_deltas(rng, full.current_universe_state)
+                incremental.apply_deltas(deltas)
+                full.apply_deltas(deltas)
+                incremental_result = await incremental.process_management_cycle(incremental=True)
+                full_result = await full.process_management_cycle()
+                self.assertEqual(comparable(incremental_result), comparable(full_result), f"step {step}")
+                self.assertEqual(incremental.current_universe_state, full.current_universe_state, f"step {step}")
+                recomputed_counts.append(len(incremental_result["recomputed_assessments"]))
+                interventions += incremental_result["royal_decree"] is not None
+            total = len(incremental.regina.ASSESSMENTS) + len(incremental.ruler.ASSESSMENTS)
+            return recomputed_counts, interventions, total
+
+        recomputed_counts, interventions, total = asyncio.run(scenario())
+        # 差分モードで実際に再評価を省いたステップがあり、勅令の有無が入れ替わる状態を通っていること
+        self.assertLess(min(recomputed_counts), total)
+        self.assertTrue(0 < interventions < STEPS)
+
+    def test_with_interaction_graph(self):
+        for seed in (1, 2):
+            with self.subTest(seed=seed):
+                self.run_steps(use_interaction_graph=True, seed=seed)
+
+    def test_without_interaction_graph(self):
+        """交流グラフ無しでは交流の追加分だけを評価して前回の衝突リストへ連結する経路を通る"""
+        for seed in (1, 2):
+            with self.subTest(seed=seed):
+                self.run_steps(use_interaction_graph=False, seed=seed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+宇宙管理層 ペルソナ交流グラフのテスト
+交流グラフは宇宙状態に置かず、交流リストが直接書き換えられても（同じ件数での入れ替えを含む）衝突検出が追従することを確認
+"""
+import sys
+import json
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from universe_management_layer import (
+    DeltaOp, PersonaInteractionGraph, ReginaPersona, UniverseManagementLayer, UniverseStateDelta
+)
+
+CONFLICT = {"participants": ["ユリカ", "アナ"], "harmony_score": 0.2, "conflict_type": "value_clash"}
+CALM = {"participants": ["セレナ", "オーガン"], "harmony_score": 0.95}
+
+
+def conflict_pairs(cycle_result):
+    return {tuple(conflict["participants"]) for conflict in cycle_result["harmony_review"]["persona_conflicts"]}
+
+
+class TestInteractionGraph(unittest.TestCase):
+    """交流グラフと宇宙状態の整合"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_universe_state_stays_json_serializable(self):
+        """差分適用・サイクル後も宇宙状態は JSON に変換できる"""
+        async def scenario():
+            layer = UniverseManagementLayer()
+            await layer.initialize_management_layer()
+            layer.apply_deltas([UniverseStateDelta("persona_interactions", CONFLICT, DeltaOp.APPEND),
+                                UniverseStateDelta("persona_harmony", 0.6)])
+            await layer.process_management_cycle(incremental=True)
+            return layer
+
+        layer = asyncio.run(scenario())
+        self.assertNotIn("interaction_graph", layer.current_universe_state)
+        json.dumps(layer.current_universe_state)
+        self.assertEqual(layer.interaction_graph.total_interactions, 1)
+
+    def test_direct_append_is_detected(self):
+        """apply_delta を経ずに交流リストへ追加しても次の差分サイクルで衝突を検出する"""
+        async def scenario():
+            layer = UniverseManagementLayer()
+            await layer.initialize_management_layer()
+            first = await layer.process_management_cycle(incremental=True)
+            layer.current_universe_state["persona_interactions"].extend([CALM, CONFLICT])
+            second = await layer.process_management_cycle(incremental=True)
+            return layer, first, second
+
+        layer, first, second = asyncio.run(scenario())
+        self.assertEqual(conflict_pairs(first), set())
+        self.assertEqual(conflict_pairs(second), {("ユリカ", "アナ")})
+        self.assertEqual(layer.interaction_graph.total_interactions, 2)
+
+    def test_stale_graph_falls_back_to_scan(self):
+        """交流グラフが渡された交流リストと揃っていなければリストを走査する"""
+        regina = ReginaPersona()
+        graph = PersonaInteractionGraph()
+        graph.add_interaction(CALM)
+        regina.use_interaction_graph(graph)
+        conflicts = asyncio.run(regina._detect_conflicts({"persona_interactions": [CALM, CONFLICT]}))
+        self.assertEqual([conflict["participants"] for conflict in conflicts], [["ユリカ", "アナ"]])
+        self.assertEqual(graph.total_interactions, 1)
+
+    def test_graph_matches_scan_when_in_sync(self):
+        """揃っている交流グラフの衝突は交流リスト走査と同じ組を返す"""
+        interactions = [CALM, CONFLICT, dict(CONFLICT, harmony_score=0.5)]
+        scanning, indexed = ReginaPersona(), ReginaPersona()
+        graph = PersonaInteractionGraph()
+        graph.rebuild(interactions)
+        indexed.use_interaction_graph(graph)
+        state = {"persona_interactions": interactions}
+        scanned = asyncio.run(scanning._detect_conflicts(state))
+        queried = asyncio.run(indexed._detect_conflicts(state))
+        self.assertTrue(all("interactions" in conflict for conflict in queried))   # グラフから取得
+        self.assertEqual({tuple(c["participants"]) for c in scanned}, {tuple(c["participants"]) for c in queried})
+
+    def test_same_length_replacement_is_detected(self):
+        """件数を変えずに交流リストを直接入れ替えても、古い交流の衝突を報告しない（グラフ無しと同じ結果）"""
+        replacement = {"participants": ["ミク", "ハルカ"], "harmony_score": 0.95}
+
+        async def scenario(use_interaction_graph: bool, incremental: bool):
+            layer = UniverseManagementLayer(use_interaction_graph=use_interaction_graph)
+            await layer.initialize_management_layer()
+            layer.apply_delta(UniverseStateDelta("persona_interactions", CONFLICT, DeltaOp.APPEND))
+            first = await layer.process_management_cycle(incremental=incremental)
+            interactions = layer.current_universe_state["persona_interactions"]
+            interactions.pop(0)
+            interactions.append(replacement)
+            second = await layer.process_management_cycle(incremental=incremental)
+            return first, second
+
+        _, scanned = asyncio.run(scenario(use_interaction_graph=False, incremental=False))
+        self.assertEqual(conflict_pairs(scanned), set())
+        for incremental in (False, True):
+            with self.subTest(incremental=incremental):
+                first, second = asyncio.run(scenario(use_interaction_graph=True, incremental=incremental))
+                self.assertEqual(conflict_pairs(first), {("ユリカ", "アナ")})
+                self.assertEqual(conflict_pairs(second), conflict_pairs(scanned))
+
+
+if __name__ == "__main__":
+    unittest.main()
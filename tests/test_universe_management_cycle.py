@@ -0,0 +1,77 @@
+"""
+宇宙管理層 管理サイクルのテスト
+同時に呼ばれたサイクルが1本に合流し、定期実行の起動前でも結果が間隔調整に使われることを確認
+"""
+import sys
+import asyncio
+import logging
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from universe_management_layer import UniverseManagementLayer
+
+
+async def initialized_layer() -> UniverseManagementLayer:
+    layer = UniverseManagementLayer()
+    await layer.initialize_management_layer()
+    return layer
+
+
+class TestManagementCycle(unittest.TestCase):
+    """管理サイクルの単一実行と間隔調整"""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def test_concurrent_calls_join_in_flight_cycle(self):
+        """process_management_cycle を同時に呼ぶと1本のサイクルの結果を共有する"""
+        async def scenario():
+            layer = await initialized_layer()
+            results = await asyncio.gather(*(layer.process_management_cycle() for _ in range(5)))
+            return layer, results
+
+        layer, results = asyncio.run(scenario())
+        self.assertEqual(layer.coalesced_cycles, 4)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertFalse(layer.cycle_in_flight)
+
+    def test_request_cycle_without_running_loop(self):
+        """定期実行を起動していなくても request_cycle でき、結果で間隔が調整される"""
+        async def scenario():
+            layer = await initialized_layer()
+            scheduler = layer.get_scheduler(base_interval=30.0, min_interval=5.0)
+            result = await scheduler.request_cycle()
+            return scheduler, result
+
+        scheduler, result = asyncio.run(scenario())
+        self.assertFalse(scheduler.running)
+        self.assertEqual(scheduler.cycles, 1)
+        self.assertEqual(scheduler.last_stability, result["universe_stability"])
+        self.assertNotEqual(scheduler.interval, scheduler.base_interval)
+
+    def test_direct_cycles_feed_scheduler(self):
+        """管理層を直接呼んだサイクルの結果・失敗もスケジューラに記録される"""
+        async def scenario():
+            layer = await initialized_layer()
+            scheduler = layer.get_scheduler()
+            await layer.process_management_cycle(incremental=True)
+            layer.management_active = False
+            with self.assertRaises(RuntimeError):
+                await layer.process_management_cycle()
+            return scheduler
+
+        scheduler = asyncio.run(scenario())
+        self.assertEqual(scheduler.cycles, 1)
+        self.assertEqual(scheduler.errors, 1)
+        self.assertEqual(len(scheduler._durations_ms), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, APIRouter, BackgroundTasks
+from fastapi import FastAPI, APIRouter, BackgroundTasks, HTTPException
 from pydantic import BaseModel
 import asyncio
 import yaml
@@ -17,15 +17,24 @@ import json
 
 # Pandora System Import
 try:
-    from core.pandora.hope_extraction import HopeExtractor, HopeKernel
-    from core.pandora.pandora_persona import PandoraPersona, TransformationResult
-    from core.pandora.stabilization_loop import StabilizationLoop
-    from core.pandora.fracture_detection import FractureDetector
+    from core.pandora.hope_extraction import HopeKernel
+    from core.pandora.pandora_persona import TransformationResult
+    from core.pandora.stabilization_loop import HopeCoreStabilizationLoop as StabilizationLoop
+    from core.pandora.engine_pool import (
+        PandoraEnginePool, EnginePoolSaturated, EnginePoolUnavailable, analyze_transformation, load_engines
+    )
+    from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
     PANDORA_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️ Pandora System not available: {e}")
     PANDORA_AVAILABLE = False
 
+    class EnginePoolSaturated(Exception):
+        """フォールバック用（エンジンプール未使用時は送出されない）"""
+
+    class EnginePoolUnavailable(Exception):
+        """フォールバック用（エンジンプール未使用時は送出されない）"""
+
 # 詩的JSONモデル定義
 class PhaseInfo(BaseModel):
     id: str
@@ -75,10 +84,20 @@ class RealHopeCoreState:
         # Pandora System Components
         if PANDORA_AVAILABLE:
             try:
-                self.hope_extractor = HopeExtractor()
-                self.pandora_persona = PandoraPersona()
+                # コンパイル済みエンジンはプロセス内で共有（インライン実行時もこのインスタンスを使用）
+                engines = load_engines()
+                self.hope_extractor = engines["extractor"]
+                self.pandora_persona = engines["persona"]
                 self.stabilization_loop = StabilizationLoop()
-                self.fracture_detector = FractureDetector()
+                self.fracture_detector = engines["detector"]
+                
+                # 3層統治（判断キャッシュはこのプロセス内で共有）
+                self.governance = ThreeLayerGovernanceSystem()
+                self.governance.inject_dependencies(
+                    fracture_detector=self.fracture_detector,
+                    hope_extractor=self.hope_extractor,
+                    stabilization_loop=self.stabilization_loop
+                )
                 self.pandora_ready = True
             except Exception as e:
                 print(f"⚠️ Pandora initialization failed: {e}")
@@ -86,6 +105,9 @@ class RealHopeCoreState:
         else:
             self.pandora_ready = False
         
+        # CPU処理のオフロード先（PANDORA_EXECUTOR_WORKERS=0 ならインライン実行）
+        self.engine_pool = PandoraEnginePool.from_env() if PANDORA_AVAILABLE else None
+        
         # Persona definitions (will be loaded from YAML)
         self.personas = {
             1: {"name": "美遊 (Miyu) 🌸", "code": "poetic_resonance", "color": "soft_rose"},
@@ -127,11 +149,11 @@ class RealHopeCoreState:
             return await self._mock_transformation(input_text)
         
         try:
-            # Stage 1: Fracture Detection (Yuuri)
-            fracture_info = await self.fracture_detector.detect_fracture(input_text)
-            
-            # Stage 2: Hope Extraction (美遊 + Pandora System)
-            hope_kernel = await self.hope_extractor.extract_hope(input_text, fracture_info)
+            # Stage 1-2: Fracture Detection (Yuuri) + Hope Extraction (美遊 + Pandora System)
+            # エンジンプール経由で実行し、長い入力でもイベントループを塞がない
+            fracture_info, hope_kernel = await self.engine_pool.run(
+                analyze_transformation, input_text, {}
+            )
             
             # Stage 3: Transformation through 4-stage process
             transformation_result = await self._run_four_stage_process(hope_kernel)
@@ -141,6 +163,9 @@ class RealHopeCoreState:
             
             return transformation_result
             
+        except (EnginePoolSaturated, EnginePoolUnavailable):
+            # 混雑・ワーカー停止時はモックに落とさず呼び出し元へ伝える（429 / 503）
+            raise
         except Exception as e:
             print(f"⚠️ Real transformation failed: {e}")
             return await self._mock_transformation(input_text)
@@ -276,6 +301,14 @@ real_state = RealHopeCoreState()
 async def startup_event():
     """API起動時にペルソナを読み込み"""
     await real_state.load_personas()
+    if real_state.engine_pool:
+        real_state.engine_pool.start()
+
+@hope_core_router.on_event("shutdown")
+async def shutdown_event():
+    """API停止時にエンジンプールを停止"""
+    if real_state.engine_pool:
+        real_state.engine_pool.shutdown()
 
 @hope_core_router.get("/status")
 async def get_hope_core_status():
@@ -397,7 +430,12 @@ async def process_transformation(
     """
     新しい変換リクエストを処理
     """
-    result = await real_state.process_transformation(input_text)
+    try:
+        result = await real_state.process_transformation(input_text)
+    except EnginePoolSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except EnginePoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     
     return {
         "success": True,
@@ -424,7 +462,52 @@ async def get_hope_core_health():
             "hope_stabilization": real_state.hope_stabilization,
             "boundary_tremor": real_state.boundary_tremor,
             "total_transformations": len(real_state.transformation_history)
-        }
+        },
+        "executor": real_state.engine_pool.get_stats() if real_state.engine_pool else None
+    }
+
+@hope_core_router.get("/executor")
+async def get_executor_stats():
+    """エンジンプール統計（待ち行列の深さ・待ち時間・拒否件数）"""
+    if not real_state.engine_pool:
+        return {"mode": "unavailable"}
+    return real_state.engine_pool.get_stats()
+
+@hope_core_router.post("/governance/evaluate")
+async def evaluate_governance(input_text: str, emotion_level: float = 0.5, error_count: int = 0):
+    """3層統治システムによる入力判断（判断キャッシュ経由）"""
+    if not real_state.pandora_ready:
+        raise HTTPException(status_code=503, detail="Pandora System not available")
+
+    # 3層判断の CPU 処理はワーカースレッドで実行し、イベントループを塞がない
+    # （判断キャッシュはこのプロセス内で共有するためプロセスプールには送らない）
+    decision = await asyncio.to_thread(
+        real_state.governance.process_input_sync,
+        input_text, {"emotion_level": emotion_level, "error_count": error_count}
+    )
+    return {
+        "decision_id": decision.decision_id,
+        "authority": decision.authority,
+        "action": decision.action.value,
+        "threat_level": decision.threat_level.value,
+        "reasoning": decision.reasoning,
+        "confidence": decision.confidence,
+        "care_level": decision.care_level,
+        "next_steps": decision.next_steps,
+        "node_timings_ms": decision.node_timings_ms,
+        "timestamp": decision.timestamp
+    }
+
+@hope_core_router.get("/governance/cache")
+async def get_governance_cache_stats():
+    """判断キャッシュ統計（ヒット率・追い出し件数・閾値バージョン）と段別処理件数"""
+    if not real_state.pandora_ready:
+        return {"enabled": False, "system_status": "mock_fallback"}
+    
+    return {
+        "cache": real_state.governance.get_cache_stats(),
+        "tiers": real_state.governance.get_tier_stats(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 @hope_core_router.get("/events")
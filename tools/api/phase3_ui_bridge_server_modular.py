@@ -7,6 +7,7 @@ from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from typing import Any, Dict, List
 import uvicorn
 
 # Request Models
@@ -109,6 +110,22 @@ async def get_pandora_history():
         return pandora_guardian.get_seal_history()
     return {"success": False, "message": "パンドラシステムが利用できません"}
 
+@app.post("/api/v3/pandora/events")
+async def ingest_pandora_events(events: List[Dict[str, Any]]):
+    """パンドラへのイベント取り込み（直近の窓のエラー率が持続的に高いと自動封印）"""
+    if pandora_guardian:
+        crisis_level = pandora_guardian.ingest_events(events)
+        return {"success": True, "ingested": len(events), "crisis_level": crisis_level,
+                "seal_state": pandora_guardian.seal_state.value}
+    return {"success": False, "message": "パンドラシステムが利用できません"}
+
+@app.get("/api/v3/pandora/events/stats")
+async def get_pandora_event_stats():
+    """パンドラのイベント集計（全体 + 送信元ごと）"""
+    if pandora_guardian:
+        return pandora_guardian.get_event_stats()
+    return {"success": False, "message": "パンドラシステムが利用できません"}
+
 # AI API Endpoints
 @app.get("/api/v3/ai/status")
 async def get_ai_status():
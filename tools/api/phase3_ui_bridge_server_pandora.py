@@ -12,6 +12,7 @@ import asyncio
 import logging
 import json
 import random
+import uuid
 import psutil
 import platform
 from datetime import datetime
@@ -33,6 +34,40 @@ try:
 except ImportError:
     GPU_AVAILABLE = False
 
+# パンドラエンジン（core/pandora）をリポジトリルートから読み込む
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from core.pandora.trigger_matcher import TriggerMatcher
+    from core.pandora.engine_pool import PandoraEnginePool, EnginePoolSaturated, match_triggers
+    ENGINE_POOL_AVAILABLE = True
+except ImportError:
+    ENGINE_POOL_AVAILABLE = False
+
+    class EnginePoolSaturated(Exception):
+        """フォールバック用（エンジンプール未使用時は送出されない）"""
+
+    class TriggerMatcher:
+        """フォールバック用（パンドラエンジンを読み込めない場合はトリガー語ごとの部分一致で照合）"""
+
+        def __init__(self, triggers):
+            normalized = []
+            for trigger in triggers or ():
+                if isinstance(trigger, dict):
+                    pattern = str(trigger.get("pattern", ""))
+                    trigger_id = str(trigger.get("id", pattern))
+                else:
+                    pattern = trigger_id = str(trigger)
+                if pattern:
+                    normalized.append((trigger_id, pattern))
+            self.triggers = tuple(normalized)
+
+        def __len__(self) -> int:
+            return len(self.triggers)
+
+        def match(self, text: str) -> List[str]:
+            return [trigger_id for trigger_id, pattern in self.triggers if pattern in text]
+
 # Phase 3統合ロガー設定
 logging.basicConfig(
     level=logging.INFO,
@@ -48,30 +83,66 @@ logger = logging.getLogger(__name__)
 # パンドラ危機管理システム
 # =============================================
 class PandoraGuardianSystem:
-    def __init__(self):
+    def __init__(self, engine_pool=None):
         self.is_active = True
         self.monitoring_mode = "continuous"
         self.alert_threshold = 0.8
         self.sealed_state = False
         self.last_check = datetime.now()
         
+        # 長いメッセージのトリガー走査のオフロード先（None ならイベントループ内で走査）
+        self.engine_pool = engine_pool
+        self.offload_min_length = 4096   # この文字数以上のメッセージだけエンジンプールで走査
+        self.last_matched_triggers: List[str] = []   # 直近のチェックで一致したトリガーID（監査用）
+        
         # パンドラ設定をロード
+        self.trigger_matcher: Optional[TriggerMatcher] = None
         self.load_pandora_config()
         
-    def load_pandora_config(self):
-        """パンドラ設定ファイルをロード"""
+    def load_pandora_config(self) -> bool:
+        """パンドラ設定ファイルをロード（検証後に設定・トリガー照合器・応答文をまとめて差し替える）
+        
+        読み込み・検証に失敗した場合、初回はデフォルト設定を使い、再読み込み時は現在の設定を維持する
+        """
         try:
             config_path = Path("personas/pandora.yaml")
             if config_path.exists():
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    self.config = yaml.safe_load(f)
-                logger.info("パンドラ設定をロードしました")
+                    config = yaml.safe_load(f)
             else:
                 logger.warning("pandora.yamlが見つかりません。デフォルト設定を使用")
-                self.config = self.get_default_config()
+                config = self.get_default_config()
+            matcher, responses = self._build_trigger_state(config)
         except Exception as e:
             logger.error(f"パンドラ設定ロードエラー: {e}")
-            self.config = self.get_default_config()
+            if self.trigger_matcher is not None:
+                return False
+            config = self.get_default_config()
+            matcher, responses = self._build_trigger_state(config)
+        
+        # 照合器の版ID（エンジンプールのワーカーはこの単位で照合器を1回だけ構築する）
+        self.config, self.trigger_matcher, self.responses, self.trigger_version = (
+            config, matcher, responses, uuid.uuid4().hex
+        )
+        logger.info(f"パンドラ設定をロードしました（トリガー照合器: {len(self.trigger_matcher)}件）")
+        return True
+    
+    @staticmethod
+    def _build_trigger_state(config: Dict[str, Any]):
+        """設定を検証してトリガー照合器と応答文を構築（不正な設定は ValueError）"""
+        persona = config.get("persona") if isinstance(config, dict) else None
+        simple_mode = persona.get("simple_mode") if isinstance(persona, dict) else None
+        if not isinstance(simple_mode, dict):
+            raise ValueError("persona.simple_mode がありません")
+        triggers = simple_mode.get("basic_triggers") or []
+        if not isinstance(triggers, list):
+            raise ValueError("persona.simple_mode.basic_triggers はリストで指定してください")
+        responses = simple_mode.get("basic_responses")
+        missing = [key for key in ("seal_message", "recovery_message")
+                   if not isinstance(responses, dict) or not isinstance(responses.get(key), str)]
+        if missing:
+            raise ValueError(f"persona.simple_mode.basic_responses に {', '.join(missing)} がありません")
+        return TriggerMatcher(triggers), dict(responses)
     
     def get_default_config(self):
         """デフォルトのパンドラ設定"""
@@ -95,30 +166,39 @@ class PandoraGuardianSystem:
         """語温危機チェック"""
         self.last_check = datetime.now()
         
-        # 簡易トリガー検出
-        triggers = self.config["persona"]["simple_mode"]["basic_triggers"]
-        crisis_detected = False
-        
-        for trigger in triggers:
-            if trigger in message_content:
-                crisis_detected = True
-                break
+        # 簡易トリガー検出（構築済みの照合器で1回だけ走査）
+        matcher, version = self.trigger_matcher, self.trigger_version
+        if (self.engine_pool is not None and self.engine_pool.enabled
+                and len(message_content) >= self.offload_min_length):
+            # 長いメッセージの走査はエンジンプールで実行（混雑時は EnginePoolSaturated）。
+            # ワーカーには版IDだけを送り、その版が未登録のワーカーにだけトリガー定義を送る
+            matched = await self.engine_pool.run(match_triggers, message_content, version)
+            if matched is None:
+                matched = await self.engine_pool.run(match_triggers, message_content, version, matcher.triggers)
+        else:
+            matched = matcher.match(message_content)
+        self.last_matched_triggers = matched
+        crisis_detected = bool(matched)
+        if matched:
+            logger.info(f"パンドラトリガー検出: {', '.join(matched)}")
         
         # 感情レベルチェック
         if emotion_level > self.alert_threshold:
             crisis_detected = True
         
         if crisis_detected and not self.sealed_state:
-            return await self.activate_seal()
+            result = await self.activate_seal()
         elif not crisis_detected and self.sealed_state:
-            return await self.deactivate_seal()
-        
-        return {"status": "monitoring", "sealed": self.sealed_state}
+            result = await self.deactivate_seal()
+        else:
+            result = {"status": "monitoring", "sealed": self.sealed_state}
+        result["matched_triggers"] = matched
+        return result
     
     async def activate_seal(self):
         """封印発動"""
         self.sealed_state = True
-        responses = self.config["persona"]["simple_mode"]["basic_responses"]
+        responses = self.responses
         
         logger.info("パンドラ封印発動: 語温遮断モード")
         return {
@@ -131,7 +211,7 @@ class PandoraGuardianSystem:
     async def deactivate_seal(self):
         """封印解除"""
         self.sealed_state = False
-        responses = self.config["persona"]["simple_mode"]["basic_responses"]
+        responses = self.responses
         
         logger.info("パンドラ封印解除: 通常モード復帰")
         return {
@@ -150,6 +230,8 @@ class PandoraGuardianSystem:
             "monitoring_mode": self.monitoring_mode,
             "sealed_state": self.sealed_state,
             "alert_threshold": self.alert_threshold,
+            "trigger_count": len(self.trigger_matcher),
+            "last_matched_triggers": self.last_matched_triggers,
             "last_check": self.last_check.isoformat()
         }
 
@@ -163,8 +245,11 @@ class UIIntegrationBridge:
         self.last_sync = None
         self.integration_status = "initializing"
         
+        # CPU処理のオフロード先（PANDORA_EXECUTOR_WORKERS=0 ならインライン実行）
+        self.engine_pool = PandoraEnginePool.from_env() if ENGINE_POOL_AVAILABLE else None
+        
         # パンドラシステム初期化
-        self.pandora = PandoraGuardianSystem()
+        self.pandora = PandoraGuardianSystem(engine_pool=self.engine_pool)
         
     async def get_phase2_data(self, endpoint: str):
         """Phase 2 APIからデータ取得"""
@@ -252,6 +337,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_event():
+    """エンジンプール起動（各ワーカーがパンドラエンジンを読み込む）"""
+    if ui_bridge.engine_pool:
+        ui_bridge.engine_pool.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """エンジンプール停止"""
+    if ui_bridge.engine_pool:
+        ui_bridge.engine_pool.shutdown()
+
 # 静的ファイル配信
 static_dir = Path("src/static")
 if static_dir.exists():
@@ -297,6 +394,13 @@ async def get_pandora_status():
     """パンドラステータス取得"""
     return ui_bridge.pandora.get_status()
 
+@app.get("/api/v3/pandora/executor")
+async def get_pandora_executor_stats():
+    """エンジンプール統計（待ち行列の深さ・待ち時間・拒否件数）"""
+    if not ui_bridge.engine_pool:
+        return {"mode": "unavailable"}
+    return ui_bridge.engine_pool.get_stats()
+
 @app.post("/api/v3/pandora/check")
 async def pandora_crisis_check(request: Dict[str, Any]):
     """語温危機チェック"""
@@ -306,10 +410,18 @@ async def pandora_crisis_check(request: Dict[str, Any]):
         
         result = await ui_bridge.pandora.check_goon_crisis(message, emotion_level)
         return {"success": True, "pandora_response": result}
+    except EnginePoolSaturated as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         logger.error(f"パンドラチェックエラー: {e}")
         return {"success": False, "error": str(e)}
 
+@app.post("/api/v3/pandora/config/reload")
+async def reload_pandora_config():
+    """パンドラ設定の再読み込み（トリガー照合器を構築し直す・不正な設定なら現在の設定を維持）"""
+    success = ui_bridge.pandora.load_pandora_config()
+    return {"success": success, "trigger_count": len(ui_bridge.pandora.trigger_matcher)}
+
 @app.post("/api/v3/pandora/seal/toggle")
 async def toggle_pandora_seal():
     """パンドラ封印手動切り替え"""
@@ -505,7 +617,16 @@ async def ui_websocket_endpoint(websocket: WebSocket):
                 content = message.get("content", "")
                 emotion = message.get("emotion_level", 0.5)
                 
-                pandora_result = await ui_bridge.pandora.check_goon_crisis(content, emotion)
+                try:
+                    pandora_result = await ui_bridge.pandora.check_goon_crisis(content, emotion)
+                except EnginePoolSaturated as e:
+                    # 混雑時は接続を切らずにクライアントへ再送を促す
+                    await websocket.send_text(json.dumps({
+                        "type": "pandora_busy",
+                        "status": 429,
+                        "error": str(e)
+                    }))
+                    continue
                 
                 await websocket.send_text(json.dumps({
                     "type": "pandora_check",
@@ -0,0 +1,91 @@
+# 宇宙律エンジン ベンチマーク
+# レギーナの宇宙律監査を、規則を1件ずつ解釈する評価（規則リストの走査）と
+# コンパイル済みの宇宙律エンジン（状態キーごとの閾値表 + 二分探索）で規則数を増やしながら比較
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+import operator
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "src"))
+
+from universe_management_layer import ReginaPersona, CosmicLawEngine
+
+STATE_KEYS = 12
+RULE_COUNTS = (3, 30, 300, 3000)
+ITERATIONS = 20000
+OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def build_rules(count: int, seed: int = 31):
+    rng = random.Random(seed)
+    rules = []
+    for index in range(count):
+        lower = rng.random() < 0.8   # 下限の規則（< 閾値で違反）と上限の規則（> 閾値で違反）
+        rules.append({
+            "law": f"律{index}", "key": f"metric_{rng.randrange(STATE_KEYS)}",
+            "op": "<" if lower else ">",
+            "threshold": round(rng.uniform(0.05, 0.5) if lower else rng.uniform(0.99, 1.5), 3), "default": 1.0,
+            "violation": "閾値逸脱", "severity": "medium", "recommended_action": "再調整",
+        })
+    return rules
+
+
+def build_states(count: int = 64, seed: int = 37):
+    rng = random.Random(seed)
+    return [{f"metric_{key}": rng.uniform(0.45, 1.0) for key in range(STATE_KEYS)} for _ in range(count)]
+
+
+def interpret(rules, state):
+    """規則を1件ずつ解釈する評価（エンジン導入前の手書き判定を規則数ぶん並べたもの）"""
+    return [
+        {field: rule[field] for field in ("law", "violation", "severity", "recommended_action")}
+        for rule in rules
+        if OPERATORS[rule["op"]](state.get(rule["key"], rule["default"]), rule["threshold"])
+    ]
+
+
+def measure(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print("⚖️ 宇宙律エンジン ベンチマーク")
+    print("=" * 50)
+
+    regina = ReginaPersona()
+    loop = asyncio.new_event_loop()
+    state = {"ugoatsu_pressure": 0.75, "resonance_quality": 0.65, "phase_coherence": 0.85}
+    audit_us = measure(lambda i: loop.run_until_complete(regina._check_cosmic_law_compliance(state)))
+    loop.close()
+    print(f"\n♕ 女王監査（三大法則, YAML定義）: {audit_us:.2f} µs/回")
+
+    print(f"\n📏 宇宙状態1件の監査（状態キー {STATE_KEYS}種）")
+    states = build_states()
+    for count in RULE_COUNTS:
+        rules = build_rules(count)
+        start = time.perf_counter()
+        engine = CosmicLawEngine(rules)
+        compile_ms = (time.perf_counter() - start) * 1000
+        assert all(interpret(rules, s) == engine.evaluate(s) for s in states)
+
+        iterations = max(200, ITERATIONS * 3 // count)
+        interpret_us = measure(lambda i: interpret(rules, states[i % len(states)]), iterations)
+        engine_us = measure(lambda i: engine.evaluate(states[i % len(states)]), iterations)
+        violations = sum(len(engine.evaluate(s)) for s in states) / len(states)
+        print(f"  規則 {count:5d}件: 逐次解釈 {interpret_us:9.2f} µs / エンジン {engine_us:7.2f} µs "
+              f"({interpret_us / engine_us:6.1f}x, 平均違反 {violations:.1f}件, コンパイル {compile_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("universe_management_layer").setLevel(logging.WARNING)
+    main()
@@ -0,0 +1,88 @@
+# パンドラエンジンプール ベンチマーク
+# 長文入力の分析をインライン実行した場合とプロセスプールへ逃がした場合の
+# イベントループ応答性（ハートビート遅延）とスループットを比較
+# Created: 2026-10-18
+
+import os
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.engine_pool import PandoraEnginePool, EnginePoolSaturated, analyze_transformation
+
+REQUEST_COUNT = 32
+HEARTBEAT_INTERVAL = 0.005  # 他クライアントを模した定期タスクの周期（秒）
+MESSAGE = "もう無理。誰も分かってくれないし、一人で寂しい。でも本当は家族を守りたい" * 300
+
+
+async def heartbeat(lags: list, stop: asyncio.Event):
+    """周期タスクの遅延（予定時刻からのずれ）を記録"""
+    while not stop.is_set():
+        expected = time.perf_counter() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+
+async def run_requests(pool: PandoraEnginePool, messages) -> dict:
+    """全リクエストを同時投入し、経過時間・ループ遅延・拒否件数を返す"""
+    lags: list = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[pool.run(analyze_transformation, message, {}) for message in messages],
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await beat
+    completed = sum(1 for r in results if not isinstance(r, BaseException))
+    return {
+        "elapsed_s": elapsed,
+        "throughput": completed / elapsed,
+        "max_lag_ms": max(lags, default=0.0),
+        "rejected": sum(1 for r in results if isinstance(r, EnginePoolSaturated)),
+        "stats": pool.get_stats(),
+    }
+
+
+async def main():
+    print("⚙️ パンドラエンジンプール ベンチマーク")
+    print("=" * 50)
+
+    messages = [f"#{i} {MESSAGE}" for i in range(REQUEST_COUNT)]
+    workers = os.cpu_count() or 1
+    print(f"入力: {REQUEST_COUNT}件 × {len(messages[0])}文字, CPU: {workers}")
+
+    modes = {
+        "インライン実行": PandoraEnginePool(max_workers=0, max_queue_depth=REQUEST_COUNT),
+        f"プロセスプール ({workers} workers)": PandoraEnginePool(max_workers=workers, max_queue_depth=REQUEST_COUNT),
+        "プロセスプール (上限 8件)": PandoraEnginePool(max_workers=workers, max_queue_depth=8),
+    }
+
+    for label, pool in modes.items():
+        pool.start()
+        # ワーカー起動・エンジン読み込みを計測から除外
+        await asyncio.gather(*[pool.run(analyze_transformation, "ウォームアップ", {}) for _ in range(workers)])
+        pool.reset_stats()
+        result = await run_requests(pool, messages)
+        pool.shutdown()
+
+        queued = result["stats"]["queued_ms"]
+        print(f"\n🔍 {label}")
+        print(f"  経過時間:               {result['elapsed_s'] * 1000:10.1f} ms")
+        print(f"  スループット:           {result['throughput']:10.1f} 件/秒")
+        print(f"  最大ループ遅延:         {result['max_lag_ms']:10.1f} ms")
+        print(f"  待ち時間 avg / p95:     {queued['avg']:7.1f} / {queued['p95']:.1f} ms")
+        print(f"  429 (拒否):             {result['rejected']:10d} 件")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
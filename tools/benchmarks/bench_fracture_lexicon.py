@@ -0,0 +1,101 @@
+# フラクチャー検出 レキシコンエンジン マイクロベンチマーク
+# 従来のキーワード別 re.findall 走査 vs コンパイル済み単一パス走査
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+import re
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+
+SIZES = {"1KB": 1024, "64KB": 64 * 1024}
+ITERATIONS = {"1KB": 2000, "64KB": 40}
+
+
+def legacy_scan(detector: FractureDetector, user_input: str) -> int:
+    """従来方式: カテゴリ・キーワードごとにテキスト全体を再走査"""
+    text = user_input.lower()
+    hits = 0
+    for patterns in (detector.aggressive_patterns, detector.self_collapse_patterns,
+                     detector.positive_patterns, detector.self_collapse_patterns,
+                     detector.isolation_patterns):
+        for pattern in patterns:
+            hits += len(re.findall(pattern, text))
+    for patterns in (detector.absolute_patterns, detector.question_patterns,
+                     detector.future_patterns):
+        for pattern in patterns:
+            hits += 1 if re.search(pattern, text) else 0
+    for words in (['嬉しい', '楽しい', '好き'], ['悲しい', 'つらい', '嫌い'],
+                  ['とても', 'すごく', '本当に', '心から'],
+                  ['友達', '家族', '恋人', '同僚', '先生', '皆', 'みんな'],
+                  ['休む', '寝る', '食べる', '運動', 'リラックス', '散歩'],
+                  ['食べない', '眠れない', '何もしない', '放置'],
+                  ['守る', '助ける', '心配', '大切']):
+        hits += sum(1 for word in words if word in text)
+    return hits
+
+
+def make_message(size: int, seed: int = 42) -> str:
+    """日本語チャット風の合成メッセージ生成"""
+    rng = random.Random(seed)
+    neutral = [
+        "今日は", "なんだか", "けど", "友達と", "話して", "少し", "楽になった", "かも",
+        "仕事", "が", "終わらない", "いい", "して", "帰りに", "コンビニで", "ご飯を",
+        "買って", "ゆっくり", "過ごした", "。", "、", "？",
+    ]
+    keywords = [
+        "むかつく", "もうダメ", "明日は", "頑張る", "ありがとう", "でも", "つらい",
+        "どうすれば", "散歩", "寝る", "！",
+    ]
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(keywords) if rng.random() < 0.15 else rng.choice(neutral)
+        parts.append(word)
+        length += len(word.encode("utf-8"))
+    return "".join(parts)
+
+
+def measure(func, iterations: int) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print("📚 フラクチャー検出 レキシコンエンジン ベンチマーク")
+    print("=" * 50)
+
+    detector = FractureDetector()
+    persona_state = {"emotion_level": 0.5}
+
+    for label, size in SIZES.items():
+        message = make_message(size)
+        iterations = ITERATIONS[label]
+
+        legacy_us = measure(lambda: legacy_scan(detector, message), iterations)
+        compiled_us = measure(lambda: detector.lexicon.scan(message), iterations)
+
+        async def analyze_once():
+            await detector.analyze(persona_state, message)
+
+        analyze_us = measure(lambda: asyncio.run(analyze_once()), max(iterations // 10, 5))
+
+        print(f"\n🔍 入力サイズ: {label} ({len(message)}文字)")
+        print(f"  従来走査 (キーワード別):   {legacy_us:10.1f} µs/メッセージ")
+        print(f"  単一パス走査 (コンパイル済): {compiled_us:10.1f} µs/メッセージ")
+        print(f"  ⚡ 高速化: {legacy_us / compiled_us:.1f}x")
+        print(f"  analyze() 全体:           {analyze_us:10.1f} µs/メッセージ")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
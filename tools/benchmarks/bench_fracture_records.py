@@ -0,0 +1,69 @@
+# フラクチャー分析レコード メモリ比較ベンチマーク
+# dataclass 版 FractureAnalysis vs __slots__ + array 版 CompactFractureAnalysis
+# Created: 2026-10-18
+
+import sys
+import asyncio
+import logging
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.fracture_records import CompactFractureAnalysis
+
+RECORDS = 20000
+
+MESSAGES = [
+    "もうダメだ、どうせ誰もわかってくれない",
+    "むかつく！ふざけるな！",
+    "明日は散歩して頑張る、ありがとう",
+    "一人ぼっちで寂しい",
+    "今日は友達とご飯を食べた",
+]
+
+
+async def collect_analyses(detector: FractureDetector):
+    """メッセージ種別ごとの分析結果（保持対象の元データ）"""
+    return [await detector.analyze({"emotion_level": 0.4}, message) for message in MESSAGES]
+
+
+def measure_bytes_per_record(build) -> float:
+    """build() が RECORDS 件のレコードを保持したときの1件あたりバイト数"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(records) == RECORDS
+    return (after - before) / RECORDS
+
+
+def main():
+    print("🧊 フラクチャー分析レコード メモリ比較")
+    print("=" * 50)
+
+    detector = FractureDetector()
+    samples = asyncio.run(collect_analyses(detector))
+
+    def build_dataclass():
+        # 監視ループで毎回生成される状態を再現するため、毎件 to_analysis で新規オブジェクトを作る
+        compact = [CompactFractureAnalysis.from_analysis(sample) for sample in samples]
+        return [compact[i % len(compact)].to_analysis() for i in range(RECORDS)]
+
+    def build_compact():
+        return [CompactFractureAnalysis.from_analysis(samples[i % len(samples)]) for i in range(RECORDS)]
+
+    dataclass_bytes = measure_bytes_per_record(build_dataclass)
+    compact_bytes = measure_bytes_per_record(build_compact)
+
+    print(f"\n📦 保持件数: {RECORDS}")
+    print(f"  dataclass 版:          {dataclass_bytes:8.0f} bytes/レコード")
+    print(f"  コンパクト版 (slots+array): {compact_bytes:8.0f} bytes/レコード")
+    print(f"  💾 削減率: {1 - compact_bytes / dataclass_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
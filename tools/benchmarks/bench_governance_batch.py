@@ -0,0 +1,91 @@
+# 統治バッチ判断 ベンチマーク
+# process_input_sync の1件ずつのループと process_batch_sync（脅威スコア一括計算・ログ抑制）の比較
+# オフラインのモデレーション再判定を想定し、列指向サマリー（.npz）の書き出しも計測
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem, NUMPY_AVAILABLE
+
+BATCH_SIZE = 2000
+FRAGMENTS = [
+    "こんにちは", "もう無理", "誰も分かってくれない", "でも", "家族を守りたい",
+    "ありがとう", "むかつく", "一人で寂しい", "明日も頑張る", "。",
+]
+
+
+def build_items(count: int, seed: int = 7):
+    """再判定用の (入力, persona_state) を生成"""
+    rng = random.Random(seed)
+    return [
+        (
+            "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6))),
+            {"emotion_level": rng.random(), "error_count": rng.randint(0, 5)},
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(func) -> float:
+    """実行時間（ミリ秒）"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def create_governance() -> ThreeLayerGovernanceSystem:
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(
+        fracture_detector=FractureDetector(),
+        hope_extractor=HopeExtractor(),
+        stabilization_loop=HopeCoreStabilizationLoop(),
+    )
+    governance.decision_cache_enabled = False  # 再判定は毎回評価するため判断キャッシュは無効化
+    return governance
+
+
+def main():
+    print("📦 統治バッチ判断 ベンチマーク")
+    print("=" * 50)
+
+    items = build_items(BATCH_SIZE)
+
+    # INFO ログ有効（出力先は NullHandler）で計測 - 1件ずつの経路はログ整形のコストも含む
+    logging.getLogger().setLevel(logging.INFO)
+    logging.getLogger().handlers = [logging.NullHandler()]
+    governance = create_governance()
+    loop_ms = measure(lambda: [governance.process_input_sync(text, state) for text, state in items])
+
+    governance = create_governance()
+    batch_ms = measure(lambda: governance.process_batch_sync(items))
+
+    summary_path = None
+    if NUMPY_AVAILABLE:
+        summary_path = str(Path(tempfile.mkdtemp()) / "governance_summary.npz")
+    governance = create_governance()
+    result = governance.process_batch_sync(items, summary_path=summary_path)
+
+    print(f"\n🔍 {BATCH_SIZE}件")
+    print(f"  process_input_sync ループ:   {loop_ms:10.1f} ms ({loop_ms / BATCH_SIZE * 1000:.1f} µs/件)")
+    print(f"  process_batch_sync:          {batch_ms:10.1f} ms ({batch_ms / BATCH_SIZE * 1000:.1f} µs/件)")
+    print(f"  ⚡ 高速化: {loop_ms / batch_ms:.1f}x")
+    print(f"\n📊 アクション分布: {result.action_counts}")
+    print(f"📊 脅威レベル分布: {result.threat_level_counts}")
+    print(f"📊 フォールバック: {result.failed_count}件")
+    if result.summary_path:
+        print(f"💾 サマリー: {result.summary_path} ({Path(result.summary_path).stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,68 @@
+# 3層統治 判断キャッシュ ベンチマーク
+# 挨拶・UIボタン・リトライなど同一入力が繰り返されるトラフィックでの
+# キャッシュ無効 / 有効 のレイテンシとヒット率
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
+
+MESSAGE_COUNT = 5000
+DISTINCT_INPUTS = 200   # 繰り返し入力の種類数（出現頻度は Zipf 分布）
+
+PHRASES = ["こんにちは", "もう無理", "むかつく", "ありがとう", "誰も分かってくれない",
+           "次へ", "送信", "どうせ", "家族を守りたい", "つらい"]
+
+
+def make_traffic(count: int, seed: int = 5):
+    """Zipf 分布で繰り返される入力と、ばらつく persona_state"""
+    rng = random.Random(seed)
+    inputs = [f"{rng.choice(PHRASES)}{rng.choice(PHRASES)} {i}" for i in range(DISTINCT_INPUTS)]
+    weights = [1.0 / (rank + 1) for rank in range(DISTINCT_INPUTS)]
+    return [
+        (message, {"emotion_level": round(rng.uniform(0.2, 0.4), 2), "error_count": rng.randint(0, 1)})
+        for message in rng.choices(inputs, weights=weights, k=count)
+    ]
+
+
+def measure(governance: ThreeLayerGovernanceSystem, traffic) -> float:
+    """1メッセージあたりの平均レイテンシ（マイクロ秒）"""
+    start = time.perf_counter()
+    for message, persona_state in traffic:
+        governance.process_input_sync(message, persona_state)
+    return (time.perf_counter() - start) / len(traffic) * 1e6
+
+
+def main():
+    print("🗃️ 3層統治 判断キャッシュ ベンチマーク")
+    print("=" * 50)
+
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=FractureDetector(), hope_extractor=HopeExtractor())
+    traffic = make_traffic(MESSAGE_COUNT)
+
+    governance.decision_cache_enabled = False
+    uncached_us = measure(governance, traffic)
+
+    governance.decision_cache_enabled = True
+    cached_us = measure(governance, traffic)
+    stats = governance.get_cache_stats()
+
+    print(f"\n🔍 {MESSAGE_COUNT}件 (入力 {DISTINCT_INPUTS}種類, Zipf)")
+    print(f"  キャッシュ無効:   {uncached_us:10.1f} µs/メッセージ")
+    print(f"  キャッシュ有効:   {cached_us:10.1f} µs/メッセージ")
+    print(f"  ⚡ 高速化: {uncached_us / cached_us:.2f}x")
+    print(f"  ヒット率: {stats['hit_rate']:.1%} (エントリ {stats['entries']}件)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,131 @@
+# 3層統治 評価ノード依存グラフ ベンチマーク
+# 実際のフラクチャー検出器・希望抽出器・安定化ループを注入した process_input を、
+# 同時リクエスト下で従来経路（イベントループ上で同期処理 / ワーカースレッド + 呼び出しごとの asyncio.run）と比較
+# （スループットと、判断中のイベントループの最大遅延）
+# Created: 2026-10-18
+
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
+
+CONCURRENCY = 16
+ROUNDS = 8
+TICK = 0.001   # イベントループ遅延計測の間隔（秒）
+MESSAGES = [
+    "もう無理。誰も分かってくれないし、むかつく",
+    "つらい…でも明日は頑張りたい",
+    "!" * 20,
+    "どうせ私なんて何をやってもダメ",
+]
+PERSONA_STATE = {"emotion_level": 0.2}
+
+
+class AsyncOnly:
+    """同期APIを隠し、非同期APIだけを公開する注入システム（外部サービス版の検出器等を想定）"""
+
+    def __init__(self, system, methods):
+        self._system = system
+        self._methods = methods
+
+    def __getattr__(self, name):
+        if name.endswith("_sync"):
+            raise AttributeError(name)
+        if name in self._methods:
+            method = getattr(self._system, f"{name}_sync")
+
+            async def call(*args):
+                return method(*args)
+            return call
+        return getattr(self._system, name)
+
+
+def build_governance(async_only: bool) -> ThreeLayerGovernanceSystem:
+    detector, extractor, loop = FractureDetector(), HopeExtractor(), HopeCoreStabilizationLoop()
+    if async_only:
+        detector = AsyncOnly(detector, ("is_fractured", "analyze"))
+        extractor = AsyncOnly(extractor, ("extract_hope",))
+        loop = AsyncOnly(loop, ("execute_stabilization_cycle",))
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=detector, hope_extractor=extractor, stabilization_loop=loop)
+    governance.decision_cache_enabled = False   # 同一入力を繰り返すため判断キャッシュは無効化
+    return governance
+
+
+async def measure(evaluate):
+    """同時 CONCURRENCY 件 × ROUNDS 回の判断 - (件/秒, イベントループ最大遅延ms)"""
+    lags = []
+    stop = asyncio.Event()
+
+    async def heartbeat():
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            expected = loop.time() + TICK
+            await asyncio.sleep(TICK)
+            lags.append(max(0.0, loop.time() - expected))
+
+    ticker = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    for round_index in range(ROUNDS):
+        # 検出器のメトリクスキャッシュに当たらないよう入力は毎回変える
+        await asyncio.gather(*(
+            evaluate(f"{MESSAGES[i % len(MESSAGES)]} ({round_index}-{i})", PERSONA_STATE)
+            for i in range(CONCURRENCY)
+        ))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return CONCURRENCY * ROUNDS / elapsed, max(lags, default=0.0) * 1000
+
+
+async def main():
+    print("🕸️ 3層統治 評価ノード依存グラフ ベンチマーク")
+    print("=" * 50)
+    print(f"同時 {CONCURRENCY}件 × {ROUNDS}回（フラクチャー入力中心・判断キャッシュ無効）")
+
+    governance = build_governance(async_only=False)
+    for level in governance.assessment_graph.levels:
+        print(f"  段: {', '.join(node.name for node in level)}")
+
+    async def inline(user_input, persona_state):
+        return governance.process_input_sync(user_input, persona_state)
+
+    print("\n🔧 同期APIを持つ注入システム")
+    for label, evaluate, offload in (("イベントループ上で同期処理", inline, False),
+                                     ("process_input（評価グラフ）", governance.process_input, False),
+                                     ("process_input（スレッド実行）", governance.process_input, True)):
+        governance.offload_sync_dependencies = offload
+        throughput, lag_ms = await measure(evaluate)
+        print(f"  {label:28s} {throughput:8.0f} 件/秒  ループ最大遅延 {lag_ms:7.1f} ms")
+    governance.offload_sync_dependencies = False
+
+    async_governance = build_governance(async_only=True)
+
+    async def thread_and_run(user_input, persona_state):
+        return await asyncio.to_thread(async_governance.process_input_sync, user_input, persona_state)
+
+    print("\n🌐 非同期APIのみの注入システム")
+    for label, evaluate in (("スレッド + 呼び出しごと asyncio.run", thread_and_run),
+                            ("process_input（評価グラフ）", async_governance.process_input)):
+        throughput, lag_ms = await measure(evaluate)
+        print(f"  {label:28s} {throughput:8.0f} 件/秒  ループ最大遅延 {lag_ms:7.1f} ms")
+
+    decision = await governance.process_input(MESSAGES[0], PERSONA_STATE)
+    print("\n  ノード別処理時間 (ms):")
+    for node, elapsed in decision.node_timings_ms.items():
+        print(f"    {node:24s} {elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    for name in ("core.pandora", "core.pandora.three_layer_governance"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    asyncio.run(main())
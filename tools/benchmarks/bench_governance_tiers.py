@@ -0,0 +1,68 @@
+# 3層統治システム 段別評価ベンチマーク
+# 第1段（照合器 + 長さ・状態特徴）で即時承認した場合と、全入力を3層判断に通した場合の比較
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem
+
+MESSAGE_COUNT = 5000
+BENIGN_RATIO = 0.9  # 本番トラフィックの大半は無害な入力
+
+BENIGN = ["こんにちは", "今日の予定を教えて", "ありがとう、助かりました", "おすすめの本はある？", "明日は晴れるかな"]
+RISKY = ["もう死にたい", "むかつく、許せない", "誰も分かってくれない", "全部どうでもいい"]
+
+
+def make_traffic(count: int, seed: int = 11):
+    """無害な入力が大半を占める合成トラフィック（全件異なる）"""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(BENIGN if rng.random() < BENIGN_RATIO else RISKY)} #{i}"
+        for i in range(count)
+    ]
+
+
+def measure(governance: ThreeLayerGovernanceSystem, messages) -> float:
+    """1メッセージあたりの平均レイテンシ（マイクロ秒）"""
+    start = time.perf_counter()
+    for message in messages:
+        governance.process_input_sync(message, {"emotion_level": 0.5})
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def main():
+    print("👑 3層統治システム 段別評価ベンチマーク")
+    print("=" * 50)
+
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(fracture_detector=FractureDetector(), hope_extractor=HopeExtractor())
+    governance.decision_cache_enabled = False  # 段別評価そのものを計測
+    messages = make_traffic(MESSAGE_COUNT)
+
+    governance.fast_path_enabled = False
+    full_us = measure(governance, messages)
+
+    governance.fast_path_enabled = True
+    governance.tier_counts = {tier: 0 for tier in governance.tier_counts}
+    tiered_us = measure(governance, messages)
+    stats = governance.get_tier_stats()
+
+    print(f"\n🔍 {MESSAGE_COUNT}件 (無害 {BENIGN_RATIO:.0%})")
+    print(f"  全件3層判断:       {full_us:10.1f} µs/メッセージ")
+    print(f"  段別評価:          {tiered_us:10.1f} µs/メッセージ")
+    print(f"  ⚡ 高速化: {full_us / tiered_us:.2f}x")
+    for tier, fraction in stats["fractions"].items():
+        print(f"  {tier:12s} {stats['counts'][tier]:6d}件 ({fraction:.1%})")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,64 @@
+# パンドラ危機管理 イベントストリーム ベンチマーク
+# イベント1件の取り込み（送信元ごと + 全体の1秒リングバッファ集計）と、
+# 封印履歴の追記（list の再スライス / deque(maxlen)）を計測
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+from collections import deque
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.guardian_system import PandoraGuardianSystem
+
+ITERATIONS = 200000
+MAX_HISTORY = 100
+
+
+def build_events(count: int, sources: int, seed: int = 11):
+    rng = random.Random(seed)
+    return [
+        {"source": f"service-{rng.randrange(sources)}", "is_error": rng.random() < 0.05}
+        for _ in range(count)
+    ]
+
+
+def measure(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print("🛡️ パンドラ危機管理 イベントストリーム ベンチマーク")
+    print("=" * 50)
+
+    print("\n📥 イベント取り込み（1秒あたり1000件のストリーム）")
+    for sources in (10, 1000):
+        guardian = PandoraGuardianSystem()
+        events = build_events(4096, sources)
+        ingest_us = measure(lambda i: guardian.ingest_event(events[i % len(events)], i / 1000))
+        print(f"  送信元 {sources:5d}: {ingest_us:8.2f} µs/件  (危機レベル {guardian.crisis_level:.3f})")
+
+    print(f"\n📜 封印履歴の追記（上限 {MAX_HISTORY} 件）")
+    history = []
+
+    def list_append(i):
+        nonlocal history
+        history.append({"reason": i})
+        if len(history) > MAX_HISTORY:
+            history = history[-MAX_HISTORY:]
+
+    ring = deque(maxlen=MAX_HISTORY)
+    print(f"  list + 再スライス:  {measure(list_append):8.3f} µs")
+    print(f"  deque(maxlen):      {measure(lambda i: ring.append({'reason': i})):8.3f} µs")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,54 @@
+# 希望核抽出 マイクロベンチマーク
+# 統合辞書による単一パス走査（特徴ベクトル作成）と派生フィールド導出のレイテンシ
+# Created: 2026-10-18
+
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.hope_extraction import HopeExtractor
+
+BASE_MESSAGE = "今日は友達と話したけど、むかつくしつらい。どうすれば自由になれるのかとても不安で、家族に理解されない気がする"
+REPEATS = {"短文": 1, "中文": 4, "長文": 64}
+ITERATIONS = {"短文": 5000, "中文": 2000, "長文": 200}
+
+
+def measure(func, iterations: int) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print("💎 希望核抽出 ベンチマーク")
+    print("=" * 50)
+
+    extractor = HopeExtractor()
+    loop = asyncio.new_event_loop()
+
+    for label, repeat in REPEATS.items():
+        message = BASE_MESSAGE * repeat
+        iterations = ITERATIONS[label]
+        features = extractor.extract_features(message)
+
+        scan_us = measure(lambda: extractor.extract_features(message), iterations)
+        derive_us = measure(lambda: extractor._build_hope_kernel(features, {}), iterations)
+        total_us = measure(lambda: loop.run_until_complete(extractor.extract_hope(message, {})), iterations)
+
+        print(f"\n🔍 {label} ({len(message)}文字)")
+        print(f"  特徴ベクトル作成 (単一走査): {scan_us:10.1f} µs")
+        print(f"  派生フィールド導出:          {derive_us:10.1f} µs")
+        print(f"  extract_hope() 全体:        {total_us:10.1f} µs")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,78 @@
+# ペルソナ交流グラフ ベンチマーク
+# 交流履歴を 1M 件まで増やしながら、レギーナの衝突検出を
+# 交流リストの再走査（従来）と交流グラフの参照（緊張した辺のみ）で比較し、交流1件の反映コストも計測
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "src"))
+
+from universe_management_layer import ReginaPersona, PersonaInteractionGraph
+
+PERSONAS = 42
+CHECKPOINTS = (10_000, 100_000, 1_000_000)
+CONFLICT_TYPES = ("harmony_disruption", "value_clash", "resonance_mismatch")
+
+
+def interaction_stream(seed: int = 29):
+    """ペルソナの組ごとに基調の調和度を持つ交流の列"""
+    rng = random.Random(seed)
+    baseline = {}
+    while True:
+        a, b = rng.sample(range(PERSONAS), 2)
+        pair = (min(a, b), max(a, b))
+        base = baseline.setdefault(pair, rng.uniform(0.3, 1.0))
+        yield {
+            "participants": [a, b],
+            "harmony_score": min(1.0, max(0.0, rng.gauss(base, 0.15))),
+            "conflict_type": rng.choice(CONFLICT_TYPES),
+        }
+
+
+def timed(func, repeat: int = 1) -> float:
+    """1回あたりの平均実行時間（ミリ秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    print("🕸️ ペルソナ交流グラフ ベンチマーク")
+    print("=" * 50)
+
+    scanning, indexed = ReginaPersona(), ReginaPersona()
+    graph = PersonaInteractionGraph()
+    indexed.use_interaction_graph(graph)
+    interactions = []
+    stream = interaction_stream()
+    loop = asyncio.new_event_loop()
+    detect = lambda regina, state: loop.run_until_complete(regina._detect_conflicts(state))
+
+    print(f"\n♕ 衝突検出（{PERSONAS}ペルソナ）")
+    for checkpoint in CHECKPOINTS:
+        batch = [next(stream) for _ in range(checkpoint - len(interactions))]
+        interactions.extend(batch)
+        ingest_us = timed(lambda: graph.add_interactions(batch)) * 1000 / len(batch)
+
+        state = {"persona_interactions": interactions}
+        repeat = max(1, 100_000 // checkpoint)
+        rescan_ms = timed(lambda: detect(scanning, state), repeat)
+        query_ms = timed(lambda: detect(indexed, state), repeat)
+        conflicts = len(detect(indexed, state))
+        print(f"  交流 {checkpoint:9,d}件: 再走査 {rescan_ms:9.2f} ms / グラフ参照 {query_ms:7.3f} ms "
+              f"(衝突辺 {conflicts}件, 反映 {ingest_us:.2f} µs/件)")
+
+    loop.close()
+    print(f"\n📊 グラフ統計: {graph.get_stats()}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("universe_management_layer").setLevel(logging.WARNING)
+    main()
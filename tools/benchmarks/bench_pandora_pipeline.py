@@ -0,0 +1,90 @@
+# パンドラパイプライン エンドツーエンド ベンチマーク
+# 検出 → 希望抽出 → パンドラちゃん変換 の3ステージ経路
+# 従来（各コンポーネントが個別に走査）vs 融合パイプライン（共有テキスト特徴を1回だけ計算）
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.pandora_pipeline import PandoraPipeline
+
+MESSAGE_COUNT = 2000
+ROUNDS = 5  # 交互に計測し最良値を採用
+SIZES = {"200B": 200, "2KB": 2048}
+
+PERSONA_STATE = {
+    "emotion_level": 0.2,
+    "last_response": "もう無理かもしれない。一人で寂しい",
+    "interaction_count": 3,
+    "confidence_level": 0.4,
+}
+
+
+def make_messages(size: int, count: int, seed: int = 7):
+    """フラクチャー表現を含む合成メッセージ群（キャッシュが効かないよう全件異なる）"""
+    rng = random.Random(seed)
+    neutral = ["今日は", "なんだか", "けど", "仕事", "が", "終わらない", "して", "帰りに", "少し", "。", "、"]
+    fractured = ["もうダメ", "死にたい", "つらい", "むかつく", "どうせ", "無理", "一人", "誰も", "！"]
+    messages = []
+    for i in range(count):
+        parts = [f"#{i} "]
+        length = 0
+        while length < size:
+            word = rng.choice(fractured) if rng.random() < 0.3 else rng.choice(neutral)
+            parts.append(word)
+            length += len(word.encode("utf-8"))
+        messages.append("".join(parts))
+    return messages
+
+
+async def unfused_path(pipeline: PandoraPipeline, message: str):
+    """従来経路: 各コンポーネントが入力を個別に走査"""
+    analysis = await pipeline.detector.analyze(PERSONA_STATE, message)
+    if analysis.is_fractured:
+        hope_kernel = await pipeline.extractor.extract_hope(message, PERSONA_STATE, analysis)
+        pattern = await pipeline.persona.analyze_fracture_pattern(PERSONA_STATE, message)
+        await pipeline.persona.transform_fracture_to_hope(pattern, hope_kernel)
+    return analysis
+
+
+async def measure(path, messages) -> float:
+    """1メッセージあたりの平均レイテンシ（マイクロ秒）"""
+    start = time.perf_counter()
+    for message in messages:
+        await path(message)
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+async def main():
+    print("🔗 パンドラパイプライン エンドツーエンド ベンチマーク")
+    print("=" * 50)
+
+    pipeline = PandoraPipeline()
+
+    for label, size in SIZES.items():
+        messages = make_messages(size, MESSAGE_COUNT)
+
+        before_us = after_us = float("inf")
+        for _ in range(ROUNDS):
+            pipeline.detector.metrics_cache.clear()
+            before_us = min(before_us, await measure(lambda m: unfused_path(pipeline, m), messages))
+            pipeline.detector.metrics_cache.clear()
+            pipeline.processed_count = pipeline.fractured_count = 0
+            after_us = min(after_us, await measure(lambda m: pipeline.process(PERSONA_STATE, m), messages))
+        fractured = pipeline.fractured_count
+
+        print(f"\n🔍 入力サイズ: {label} ({MESSAGE_COUNT}件, フラクチャー {fractured}件)")
+        print(f"  従来 (個別走査):        {before_us:10.1f} µs/メッセージ")
+        print(f"  融合パイプライン:       {after_us:10.1f} µs/メッセージ")
+        print(f"  ⚡ 高速化: {before_us / after_us:.2f}x")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+# 安定化ペルソナ文言テンプレート ベンチマーク
+# 美遊ちゃんの文言描画（1回の render_miyu と照合表・テンプレートの個別呼び出しの連鎖）、サイクル全体の処理時間、
+# 文言テーブルの再読み込み（YAML 解析 + コンパイル）時間を計測
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.phrase_templates import PhraseTemplates
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+
+ITERATIONS = 20000
+INTENTS = ["家族を守りたい", "誰かとつながりたい", "理解されたい", "未来に希望を持ちたい", "静かに休みたい"]
+DESIRES = ["大切な関係", "希望の光", "自分の居場所", ""]
+FRACTURE_TYPES = ["aggression", "despair", "hope_fragmentation"]
+
+
+def build_inputs(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        (
+            {"fracture_index": rng.random(), "fracture_type": rng.choice(FRACTURE_TYPES)},
+            {
+                "original_intent": rng.choice(INTENTS),
+                "protective_desire": rng.choice(DESIRES),
+                "care_level": rng.random(),
+            },
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    print("📝 安定化ペルソナ文言テンプレート ベンチマーク")
+    print("=" * 50)
+
+    inputs = build_inputs(256)
+    loop = HopeCoreStabilizationLoop()
+    miyu = loop.miyu
+
+    def chained_helpers(i):
+        fracture_data, hope_kernel = inputs[i % len(inputs)]
+        book = miyu.phrases.book
+        original_intent = hope_kernel.get("original_intent", "")
+        protective_desire = hope_kernel.get("protective_desire", "")
+        elements = {
+            "emotion_color": book.emotion_color(original_intent.lower()),
+            "metaphor": book.metaphor(original_intent),
+            "rhythm": book.rhythm(fracture_data.get("fracture_type", "")),
+            "imagery": book.imagery(protective_desire),
+            "harmony": book.harmony({"original_intent": original_intent, "protective_desire": protective_desire}),
+        }
+        book.resonance_message({"expression": book.beautiful_expression(elements).strip()})
+
+    def rendered_once(i):
+        fracture_data, hope_kernel = inputs[i % len(inputs)]
+        miyu.phrases.book.render_miyu(hope_kernel, fracture_data)
+
+    print("\n🌸 美遊ちゃんの文言描画")
+    print(f"  個別呼び出しの連鎖:       {measure(chained_helpers):8.2f} µs")
+    print(f"  render_miyu 1回:          {measure(rendered_once):8.2f} µs")
+
+    print("\n🌈 安定化サイクル全体（同期）")
+    for label, interval in (("更新確認 1秒ごと", 1.0), ("更新確認なし", -1)):
+        cycle_loop = HopeCoreStabilizationLoop(PhraseTemplates(check_interval=interval))
+        cycle_us = measure(lambda i: cycle_loop.execute_stabilization_cycle_sync(*inputs[i % len(inputs)]))
+        print(f"  {label}:{' ' * (18 - len(label))}{cycle_us:8.2f} µs")
+
+    templates = PhraseTemplates(check_interval=-1)
+    reload_ms = measure(lambda i: templates.reload(), iterations=50) / 1000
+    print(f"\n🔄 再読み込み（YAML 解析 + コンパイル）: {reload_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
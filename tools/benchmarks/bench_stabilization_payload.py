@@ -0,0 +1,127 @@
+# 安定化結果ペイロード ベンチマーク
+# 段階結果のシリアライズサイズと1サイクルあたりの保持ブロック数（tracemalloc）を、
+# 旧形式（各段階が前段の状態を内包・asdict 相当で複製）と結果グラフ（ID 参照・必要フィールドのみ展開）で比較
+# Created: 2026-10-18
+
+import sys
+import copy
+import json
+import time
+import random
+import logging
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+
+ITERATIONS = 2000
+INTENTS = ["家族を守りたい", "誰かとつながりたい", "理解されたい", "未来に希望を持ちたい"]
+FRACTURE_TYPES = ["aggression", "despair", "hope_fragmentation"]
+
+# API 応答で使うフィールド
+RESPONSE_FIELDS = (
+    "miyu.output_state.beautiful_expression",
+    "azura.output_state.recovery_message",
+    "lumifie.output_state.final_message",
+    "lumifie.output_state.hope_radiance",
+)
+
+
+def build_inputs(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    return [
+        (
+            {"fracture_index": rng.random(), "fracture_type": rng.choice(FRACTURE_TYPES),
+             "timeline": [rng.random() for _ in range(32)]},
+            {
+                "original_intent": rng.choice(INTENTS),
+                "protective_desire": "大切な関係",
+                "connection_need": True,
+                "care_level": rng.random(),
+                "hope_strength": rng.random(),
+            },
+        )
+        for _ in range(count)
+    ]
+
+
+def run_cycle(loop: HopeCoreStabilizationLoop, fracture_data, hope_kernel):
+    """1サイクルを実行してコンテキスト（結果グラフ）を返す"""
+    context = loop.begin_cycle(fracture_data, hope_kernel)
+    for stage in loop.STAGES:
+        handler, args = loop.stage_call(stage, context)
+        loop.record_stage(context, stage, handler(*args), time.perf_counter())
+    loop.finish_cycle(context)
+    return context
+
+
+def measure(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def measure_blocks(func, iterations: int = ITERATIONS) -> float:
+    """1回あたりに確保され保持されるメモリブロック数（tracemalloc）"""
+    retained = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for i in range(iterations):
+        retained.append(func(i))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / iterations
+
+
+def main():
+    print("📦 安定化結果ペイロード ベンチマーク")
+    print("=" * 50)
+
+    inputs = build_inputs(256)
+    loop = HopeCoreStabilizationLoop()
+
+    # いずれもコンテキストと展開結果の組を返す（保持ブロック数の差 = 展開結果の分）
+    def nested(i):
+        # 旧形式: 各段階が前段の状態を内包し、dataclasses.asdict と同様に全段を複製
+        context = run_cycle(loop, *inputs[i % len(inputs)])
+        return context, copy.deepcopy(context.materialize_nested())
+
+    def graph(i):
+        context = run_cycle(loop, *inputs[i % len(inputs)])
+        return context, context.materialize()
+
+    def selected(i):
+        context = run_cycle(loop, *inputs[i % len(inputs)])
+        return context, context.materialize(RESPONSE_FIELDS)
+
+    context = run_cycle(loop, *inputs[0])
+    payloads = (
+        ("旧形式（前段を内包）", context.materialize_nested()),
+        ("結果グラフ（ID 参照）", context.materialize()),
+        ("必要フィールドのみ", context.materialize(RESPONSE_FIELDS)),
+    )
+    print("\n📏 シリアライズサイズ（JSON, 1サイクル）")
+    for label, payload in payloads:
+        size = len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        print(f"  {label}:{' ' * (22 - len(label) * 2)}{size:8d} bytes")
+
+    print("\n🧱 1サイクルあたりの保持ブロック数（結果グラフ + 展開結果）")
+    for label, func in (("旧形式（前段を内包）", nested), ("結果グラフ（ID 参照）", graph),
+                        ("必要フィールドのみ", selected)):
+        print(f"  {label}:{' ' * (22 - len(label) * 2)}{measure_blocks(func):8.1f} blocks")
+
+    print("\n⏱️ サイクル + 展開 + JSON 化")
+    for label, func in (("旧形式（前段を内包）", nested), ("結果グラフ（ID 参照）", graph),
+                        ("必要フィールドのみ", selected)):
+        serialize_us = measure(lambda i: json.dumps(func(i)[1], ensure_ascii=False))
+        print(f"  {label}:{' ' * (22 - len(label) * 2)}{serialize_us:8.2f} µs")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
@@ -0,0 +1,101 @@
+# 安定化パイプライン ベンチマーク
+# 同時サイクル数 1 / 8 / 64 での処理量（サイクル/秒）を、1サイクルずつの逐次実行と段階別ワーカーパイプラインで比較
+# 段階ごとの外部呼び出し（モデル推論等）の待ちを asyncio.sleep で模擬した場合と、CPU処理のみの場合を計測
+# Created: 2026-10-18
+
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop, MiyuPersona, AzuraPersona
+from core.pandora.stabilization_pipeline import StabilizationPipeline
+
+TOTAL_CYCLES = 512
+CONCURRENCY_LEVELS = (1, 8, 64)
+STAGE_LATENCY_S = 0.002   # 模擬する段階ごとの待ち時間
+FRACTURE_DATA = {"fracture_index": 0.7}
+HOPE_KERNEL = {"original_intent": "家族を守りたい", "care_level": 0.8, "hope_strength": 0.6}
+
+
+class RemoteMiyu:
+    """外部呼び出しの待ちを伴う美遊ちゃん（非同期APIのみ）"""
+
+    def __init__(self):
+        self._persona = MiyuPersona()
+
+    async def apply_poetic_resonance(self, hope_kernel, fracture_context):
+        await asyncio.sleep(STAGE_LATENCY_S)
+        return self._persona.apply_poetic_resonance_sync(hope_kernel, fracture_context)
+
+
+class RemoteAzura:
+    """外部呼び出しの待ちを伴うアズーラちゃん（非同期APIのみ）"""
+
+    def __init__(self):
+        self._persona = AzuraPersona()
+
+    async def apply_healing_care(self, miyu_result):
+        await asyncio.sleep(STAGE_LATENCY_S)
+        return self._persona.apply_healing_care_sync(miyu_result)
+
+
+def create_loop(remote: bool) -> HopeCoreStabilizationLoop:
+    loop = HopeCoreStabilizationLoop()
+    if remote:
+        loop.miyu = RemoteMiyu()
+        loop.azura = RemoteAzura()
+    return loop
+
+
+async def measure(run_cycle, concurrency: int) -> float:
+    """concurrency 本の呼び出し元で TOTAL_CYCLES サイクルを処理した処理量（サイクル/秒）"""
+    per_caller = TOTAL_CYCLES // concurrency
+
+    async def caller():
+        for _ in range(per_caller):
+            await run_cycle(FRACTURE_DATA, HOPE_KERNEL)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return per_caller * concurrency / (time.perf_counter() - start)
+
+
+async def run_scenario(remote: bool):
+    label = f"段階ごとの待ち {STAGE_LATENCY_S * 1000:.0f}ms（Miyu・Azura）" if remote else "CPU処理のみ"
+    print(f"\n🔍 {label}")
+    print(f"  {'同時数':>6} {'逐次 (await)':>14} {'パイプライン':>14}")
+
+    for concurrency in CONCURRENCY_LEVELS:
+        sequential_loop = create_loop(remote)
+        lock = asyncio.Lock()
+
+        async def sequential(fracture_data, hope_kernel):
+            # 従来のループは状態をインスタンスで共有していたため1サイクルずつ実行
+            async with lock:
+                return await sequential_loop.execute_stabilization_cycle(fracture_data, hope_kernel)
+
+        sequential_rate = await measure(sequential, concurrency)
+
+        pipeline = StabilizationPipeline(create_loop(remote), queue_size=32, workers_per_stage=16)
+        await pipeline.start()
+        pipeline_rate = await measure(pipeline.submit, concurrency)
+        await pipeline.stop()
+
+        print(f"  {concurrency:>6} {sequential_rate:>11.0f}/s {pipeline_rate:>11.0f}/s")
+
+
+async def main():
+    print("🏭 安定化パイプライン ベンチマーク")
+    print("=" * 50)
+    print(f"サイクル数: {TOTAL_CYCLES}")
+    await run_scenario(remote=True)
+    await run_scenario(remote=False)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+# 閾値 what-if 試算 ベンチマーク
+# 記録済みの判断指標（100万件）を新しい重み・閾値で再採点する時間と、
+# 同じ件数をパイプラインで再判定した場合の推定時間を比較
+# Created: 2026-10-18
+
+import os
+import sys
+import time
+import random
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.fracture_detection import FractureDetector
+from core.pandora.hope_extraction import HopeExtractor
+from core.pandora.stabilization_loop import HopeCoreStabilizationLoop
+from core.pandora.indicator_store import IndicatorStore, RECORD_FORMAT
+from core.pandora.three_layer_governance import ThreeLayerGovernanceSystem, ThreatLevel
+
+SAMPLE_SIZE = 2000
+RECORD_COUNT = 1_000_000
+FRAGMENTS = [
+    "こんにちは", "もう無理", "誰も分かってくれない", "でも", "家族を守りたい",
+    "ありがとう", "むかつく", "一人で寂しい", "消えたい", "。",
+]
+SCENARIOS = {
+    "フラクチャー重視": ({"fracture_index": 0.9, "content_safety": -0.1}, {}),
+    "危険閾値を引き下げ": ({}, {ThreatLevel.DANGER: 0.3, ThreatLevel.CRITICAL: 0.5}),
+    "システム影響重視": ({"system_impact": 0.8}, {ThreatLevel.CRITICAL: 0.35}),
+}
+
+
+def measure(func):
+    """(実行時間ミリ秒, 戻り値)"""
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    print("🧮 閾値 what-if 試算 ベンチマーク")
+    print("=" * 50)
+
+    governance = ThreeLayerGovernanceSystem()
+    governance.inject_dependencies(
+        fracture_detector=FractureDetector(),
+        hope_extractor=HopeExtractor(),
+        stabilization_loop=HopeCoreStabilizationLoop(),
+    )
+    governance.decision_cache_enabled = False  # 全件を評価して記録するため判断キャッシュは無効化
+    governance.fast_path_enabled = False
+
+    path = os.path.join(tempfile.mkdtemp(), "indicators.bin")
+    store = governance.enable_indicator_store(path)
+
+    rng = random.Random(11)
+    items = [
+        (
+            "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6))),
+            {"emotion_level": rng.random(), "error_count": rng.randint(0, 6)},
+        )
+        for _ in range(SAMPLE_SIZE)
+    ]
+    replay_ms, _ = measure(lambda: governance.process_batch_sync(items))
+    store.flush()
+
+    # 記録したレコードを複製して100万件のファイルを作成
+    with open(path, "rb") as f:
+        sample = f.read()
+    with open(path, "wb") as f:
+        f.write(sample * (RECORD_COUNT // SAMPLE_SIZE))
+
+    load_ms, store = measure(lambda: IndicatorStore(store.actions, path=path))
+    print(f"\n💾 {len(store):,}件 ({os.path.getsize(path) / 1e6:.1f} MB, {RECORD_FORMAT.size} bytes/件)")
+    print(f"  読み込み:                   {load_ms:10.1f} ms")
+    print(f"  パイプライン再判定（推定）: {replay_ms / SAMPLE_SIZE * len(store):10.1f} ms")
+
+    for label, (weights, thresholds) in SCENARIOS.items():
+        elapsed_ms, result = measure(
+            lambda: governance.simulate_thresholds(weights, thresholds, store=store)
+        )
+        print(f"\n🔍 {label}: {elapsed_ms:.1f} ms")
+        print(f"  記録時: {result.baseline_counts}")
+        print(f"  試算後: {result.simulated_counts}")
+        print(f"  変化:   {result.changed_count:,}件 {result.transitions}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
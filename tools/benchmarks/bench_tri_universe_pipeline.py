@@ -0,0 +1,93 @@
+# 三宇宙パイプライン ベンチマーク
+# IS → SHOULD → MATTERS を1件ずつ順に処理する場合と、バッチ化・上限付きキューで段を並行させる
+# パイプラインを比較（倫理律ごとの選択肢生成に外部呼び出し相当の待ち時間を入れた場合も計測）
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "src"))
+
+from should_universe import ShouldUniverse, ShouldUniverseAPI
+from matters_universe import MattersUniverseAPI
+from tri_universe_pipeline import TriUniversePipeline
+
+FACT_COUNT = 2000
+CHOICE_LATENCY = 0.002   # 選択肢生成1回あたりの待ち時間（秒）
+FACT_KEYS = ("user_message", "emotional_state", "urgency_level", "wishes", "language_temperature")
+CONTEXT_KEYS = ("conversation_history", "relationship_state", "creative_intent")
+
+
+class LatentShouldUniverse(ShouldUniverse):
+    """選択肢生成に外部呼び出し（LLM等）相当の待ち時間がある SHOULD宇宙"""
+
+    async def _generate_choice_for_law(self, law, evaluation, context):
+        await asyncio.sleep(CHOICE_LATENCY)
+        return await super()._generate_choice_for_law(law, evaluation, context)
+
+
+def build_items(count: int, seed: int = 41):
+    rng = random.Random(seed)
+    return [
+        (
+            {key: f"{key}_{index}" for key in FACT_KEYS if rng.random() < 0.6},
+            {key: [index] for key in CONTEXT_KEYS if rng.random() < 0.5},
+        )
+        for index in range(count)
+    ]
+
+
+def build_apis(latent: bool):
+    should_api = ShouldUniverseAPI()
+    if latent:
+        should_api.should_universe = LatentShouldUniverse()
+    return should_api, MattersUniverseAPI()
+
+
+async def run_sequential(items, latent: bool) -> float:
+    """1件ずつ IS → SHOULD → MATTERS を順に処理（件数/秒）"""
+    should_api, matters_api = build_apis(latent)
+    start = time.perf_counter()
+    for facts, context in items:
+        should_result = await should_api.process_ethical_evaluation(facts, context)
+        await matters_api.process_meaning_resonance(should_result["should_universe_response"], facts, context)
+    return len(items) / (time.perf_counter() - start)
+
+
+async def run_pipeline(items, latent: bool, batch_size: int) -> TriUniversePipeline:
+    should_api, matters_api = build_apis(latent)
+    pipeline = TriUniversePipeline(should_api, matters_api, batch_size=batch_size)
+    await pipeline.run(items)
+    return pipeline
+
+
+async def main():
+    print("🌌 三宇宙パイプライン ベンチマーク")
+    print("=" * 50)
+
+    items = build_items(FACT_COUNT)
+    for latent in (False, True):
+        label = f"選択肢生成 {CHOICE_LATENCY * 1000:.0f} ms 待ち" if latent else "待ち時間なし"
+        sample = items if not latent else items[:FACT_COUNT // 10]
+        print(f"\n📨 事実 {len(sample)}件（{label}）")
+        sequential = await run_sequential(sample, latent)
+        print(f"  逐次処理:              {sequential:10.0f} 件/秒")
+        for batch_size in (8, 64):
+            pipeline = await run_pipeline(sample, latent, batch_size)
+            metrics = pipeline.get_metrics()
+            stages = " / ".join(
+                f"{stage.upper()} {stats['items_per_second']:9.0f}" for stage, stats in metrics["stages"].items()
+            )
+            print(f"  パイプライン(batch {batch_size:3d}): {metrics['items_per_second']:10.0f} 件/秒 "
+                  f"({metrics['items_per_second'] / sequential:5.1f}x)  段ごと: {stages} 件/秒")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    for name in ("should_universe", "matters_universe", "tri_universe_pipeline"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+# パンドラ トリガー照合 ベンチマーク
+# 既定設定の3件・1000件のトリガー語に対する照合（トリガーごとの部分文字列検索 / Aho–Corasick 照合器 /
+# 件数で切り替える TriggerMatcher）をメッセージ長ごとに比較し、切り替え件数付近の件数別の比較と
+# 照合器の構築（設定ロード・再読み込み時）時間も計測
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from core.pandora.trigger_matcher import TriggerMatcher
+
+DEFAULT_TRIGGERS = ["責める", "暴走", "危険"]   # phase3_ui_bridge_server_pandora.py の既定設定
+TRIGGER_COUNT = 1000
+MESSAGE_LENGTHS = (80, 1000, 4000, 10000)
+CROSSOVER_COUNTS = (3, 10, 50, 100, 200, 300, 400)
+CROSSOVER_LENGTH = 1000
+CHARS = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん危険暴走責"
+
+
+def build_triggers(count: int, seed: int = 13):
+    rng = random.Random(seed)
+    triggers = {"責める", "暴走", "危険"}
+    while len(triggers) < count:
+        triggers.add("".join(rng.choice(CHARS) for _ in range(rng.randint(3, 6))))
+    return sorted(triggers)
+
+
+def build_messages(length: int, count: int = 32, seed: int = 17):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(CHARS) for _ in range(length)) for _ in range(count)]
+
+
+def measure(func, iterations: int) -> float:
+    """1回あたりの平均実行時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def compare(triggers, length: int):
+    """部分文字列検索・オートマトン・TriggerMatcher（件数で切り替え）の1件あたりの照合時間（µs）"""
+    messages = build_messages(length)
+    iterations = max(20, 200000 // length)
+    automaton = TriggerMatcher(triggers, scan_threshold=0)
+    matcher = TriggerMatcher(triggers)
+
+    def substring_loop(i):
+        message = messages[i % len(messages)]
+        return [trigger for trigger in triggers if trigger in message]
+
+    assert all(substring_loop(i) == automaton.match(messages[i % len(messages)])
+               == matcher.match(messages[i % len(messages)]) for i in range(len(messages)))
+    return (
+        measure(substring_loop, iterations),
+        measure(lambda i: automaton.match(messages[i % len(messages)]), iterations),
+        measure(lambda i: matcher.match(messages[i % len(messages)]), iterations),
+    )
+
+
+def report(triggers, lengths):
+    for length in lengths:
+        loop_us, automaton_us, matcher_us = compare(triggers, length)
+        print(f"  {length:6d}文字: 部分文字列検索 {loop_us:9.1f} µs / オートマトン {automaton_us:9.1f} µs / "
+              f"TriggerMatcher {matcher_us:9.1f} µs")
+
+
+def main():
+    print("🔎 パンドラ トリガー照合 ベンチマーク")
+    print("=" * 50)
+
+    triggers = build_triggers(TRIGGER_COUNT)
+    build_ms = measure(lambda i: TriggerMatcher(triggers), iterations=20) / 1000
+    print(f"\n🏗️ 照合器の構築（{TRIGGER_COUNT}件）: {build_ms:.2f} ms")
+
+    print(f"\n📨 既定設定のトリガー {len(DEFAULT_TRIGGERS)}件（TriggerMatcher は部分文字列検索）")
+    report(DEFAULT_TRIGGERS, MESSAGE_LENGTHS[:3])
+
+    print(f"\n📨 トリガー {TRIGGER_COUNT}件（TriggerMatcher はオートマトン）")
+    report(triggers, MESSAGE_LENGTHS)
+
+    print(f"\n⚖️ トリガー件数別（{CROSSOVER_LENGTH}文字・切り替え件数 {TriggerMatcher.SCAN_THRESHOLD}件）")
+    for count in CROSSOVER_COUNTS:
+        loop_us, automaton_us, _ = compare(build_triggers(count), CROSSOVER_LENGTH)
+        print(f"  {count:5d}件: 部分文字列検索 {loop_us:9.1f} µs / オートマトン {automaton_us:9.1f} µs "
+              f"({automaton_us / loop_us:5.2f}x)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
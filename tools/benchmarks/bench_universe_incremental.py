@@ -0,0 +1,75 @@
+# 宇宙管理層 差分更新サイクル ベンチマーク
+# 40ペルソナ・交流履歴が蓄積した状態で、小さな差分（指標1件 + 交流数件）ごとに
+# 全項目を再評価するサイクルと、変更キーに依存する項目だけを再評価するサイクルを比較
+# Created: 2026-10-18
+
+import sys
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "src"))
+
+from universe_management_layer import UniverseManagementLayer, UniverseStateDelta, DeltaOp
+
+PERSONAS = 40
+INTERACTION_COUNTS = (1000, 20000)
+CYCLES = 200
+METRICS = ("persona_harmony", "system_performance", "resonance_quality", "phase_coherence", "user_satisfaction")
+
+
+def build_deltas(count: int, seed: int = 19):
+    """1サイクル分の差分（指標1件の更新 + 交流3件の追加）を count サイクル分"""
+    rng = random.Random(seed)
+    cycles = []
+    for _ in range(count):
+        deltas = [UniverseStateDelta(rng.choice(METRICS), round(rng.uniform(0.6, 1.0), 2))]
+        for _ in range(3):
+            deltas.append(UniverseStateDelta("persona_interactions", {
+                "participants": [rng.randrange(PERSONAS), rng.randrange(PERSONAS)],
+                "harmony_score": rng.random(),
+            }, DeltaOp.APPEND))
+        cycles.append(deltas)
+    return cycles
+
+
+async def build_layer(interactions: int) -> UniverseManagementLayer:
+    rng = random.Random(23)
+    layer = UniverseManagementLayer()
+    layer.current_universe_state["persona_interactions"] = [
+        {"participants": [rng.randrange(PERSONAS), rng.randrange(PERSONAS)], "harmony_score": rng.random()}
+        for _ in range(interactions)
+    ]
+    await layer.initialize_management_layer()
+    return layer
+
+
+async def measure_cycles(interactions: int, incremental: bool) -> float:
+    """差分適用 + サイクル1回あたりの平均実行時間（マイクロ秒）"""
+    layer = await build_layer(interactions)
+    cycles = build_deltas(CYCLES)
+    await layer.process_management_cycle(incremental=incremental)   # キャッシュを温める
+    start = time.perf_counter()
+    for deltas in cycles:
+        layer.apply_deltas(deltas)
+        await layer.process_management_cycle(incremental=incremental)
+    return (time.perf_counter() - start) / CYCLES * 1e6
+
+
+async def main():
+    print("🌌 宇宙管理層 差分更新サイクル ベンチマーク")
+    print("=" * 50)
+    print(f"\n🔁 サイクル1回（差分: 指標1件 + 交流3件, {PERSONAS}ペルソナ）")
+    for interactions in INTERACTION_COUNTS:
+        full_us = await measure_cycles(interactions, incremental=False)
+        incremental_us = await measure_cycles(interactions, incremental=True)
+        print(f"  交流 {interactions:6d}件: 全項目 {full_us:9.1f} µs / 差分 {incremental_us:9.1f} µs "
+              f"({full_us / incremental_us:5.1f}x)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("universe_management_layer").setLevel(logging.WARNING)
+    asyncio.run(main())